@@ -2,7 +2,7 @@
 Configuration for JSON-native API
 """
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
@@ -22,6 +22,9 @@ class Settings(BaseSettings):
     
     # Data Path
     game_data_path: Path = Path(__file__).parent.parent.parent / "external/city_of_data/raw_data_homecoming-20250617_6916"
+    # Compiled bundle (backend/scripts/compile_game_data_bundle.py); archetype and
+    # boost set lookups read it first and fall back to the JSON files
+    game_data_bundle_path: Optional[Path] = None
     
     # Caching
     cache_ttl: int = 3600  # 1 hour
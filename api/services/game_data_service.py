@@ -3,6 +3,7 @@ Game Data Service - Direct JSON file access with smart caching
 Epic 2.5.5: Demonstrates the power of JSON-native architecture
 """
 import json
+import logging
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from functools import lru_cache
@@ -11,15 +12,49 @@ from datetime import datetime
 
 from ..core.config import settings
 
+try:
+    from backend.app.services.game_data_bundle import BundleFormatError, GameDataBundle
+except ImportError:  # api deployed without the backend tree
+    GameDataBundle = None
+
+logger = logging.getLogger(__name__)
+
 class GameDataService:
     """
     JSON-native data service that directly serves City of Heroes game data.
     No database, no ORM, no transformations - just clean JSON access.
     """
     
-    def __init__(self, data_path: Optional[Path] = None):
+    def __init__(self, data_path: Optional[Path] = None, bundle_path: Optional[Path] = None):
         self.data_path = data_path or settings.game_data_path
+        self.bundle_path = bundle_path or settings.game_data_bundle_path
+        self._bundle = None
+        self._bundle_boost_sets: Dict[str, str] = {}
         self._cache_checksums: Dict[str, str] = {}
+
+    @property
+    def bundle(self):
+        """Compiled game data bundle, or None to read the JSON files."""
+        if self._bundle is None and self.bundle_path and GameDataBundle is not None:
+            if Path(self.bundle_path).exists():
+                try:
+                    self._bundle = GameDataBundle(self.bundle_path)
+                except BundleFormatError as e:
+                    logger.warning(f"Ignoring game data bundle: {e}")
+                    self.bundle_path = None
+                    return None
+                # Boost sets are keyed by name; lookups use lowercase file names
+                self._bundle_boost_sets = {
+                    key.lower(): key for key in self._bundle.keys("boost_sets")
+                }
+        return self._bundle
+
+    def _bundle_boost_set(self, name: str) -> Optional[Dict[str, Any]]:
+        bundle = self.bundle
+        key = self._bundle_boost_sets.get(name.lower())
+        if bundle is None or key is None:
+            return None
+        return bundle.get("boost_sets", key)
         
     def _get_file_checksum(self, file_path: Path) -> str:
         """Calculate file checksum for cache invalidation"""
@@ -43,6 +78,11 @@ class GameDataService:
         Get archetype data by name.
         Example: get_archetype("blaster") returns Blaster archetype data
         """
+        if self.bundle is not None:
+            archetype = self.bundle.get_archetype(name.lower())
+            if archetype is not None:
+                return archetype
+
         file_path = self.data_path / "archetypes" / f"{name.lower()}.json"
         
         if not file_path.exists():
@@ -56,6 +96,13 @@ class GameDataService:
     @lru_cache(maxsize=1)
     def get_all_archetypes(self) -> List[Dict[str, Any]]:
         """Get all available archetypes"""
+        if self.bundle is not None:
+            archetypes = [
+                self.bundle.get_archetype(name)
+                for name in self.bundle.keys("archetypes")
+            ]
+            return sorted(archetypes, key=lambda x: x.get("display_name", ""))
+
         archetype_dir = self.data_path / "archetypes"
         
         if not archetype_dir.exists():
@@ -63,7 +110,7 @@ class GameDataService:
         
         archetypes = []
         for file_path in archetype_dir.glob("*.json"):
-            if file_path.stem != "_index":  # Skip index files
+            if file_path.stem not in ("_index", "index"):  # Skip index files
                 archetype_data = json.loads(file_path.read_text())
                 archetypes.append(archetype_data)
         
@@ -126,6 +173,10 @@ class GameDataService:
         ]
         
         for file_path in possible_paths:
+            if file_path.parent.name == "boost_sets":
+                boost_set = self._bundle_boost_set(name)
+                if boost_set is not None:
+                    return boost_set
             if file_path.exists():
                 if self._should_invalidate_cache(file_path):
                     self.get_enhancement.cache_clear()
@@ -136,6 +187,13 @@ class GameDataService:
     @lru_cache(maxsize=1)
     def get_boost_sets(self) -> List[Dict[str, Any]]:
         """Get all enhancement sets"""
+        if self.bundle is not None:
+            sets = [
+                self.bundle.get("boost_sets", key)
+                for key in self.bundle.keys("boost_sets")
+            ]
+            return sorted(sets, key=lambda x: x.get("display_name", ""))
+
         boost_dir = self.data_path / "boost_sets"
         
         if not boost_dir.exists():
@@ -143,7 +201,7 @@ class GameDataService:
         
         sets = []
         for file_path in boost_dir.glob("*.json"):
-            if file_path.stem != "_index":
+            if file_path.stem not in ("_index", "index"):
                 set_data = json.loads(file_path.read_text())
                 sets.append(set_data)
         
@@ -197,6 +255,7 @@ class GameDataService:
             "enhancement_sets": boost_count,
             "data_path": str(self.data_path),
             "data_exists": self.data_path.exists(),
+            "bundle_path": str(self.bundle_path) if self.bundle is not None else None,
         }
     
     def clear_cache(self):
@@ -209,6 +268,11 @@ class GameDataService:
         self.get_enhancement.cache_clear()
         self.get_boost_sets.cache_clear()
         self._cache_checksums.clear()
+        # Reopen the bundle on next use, in case it was recompiled
+        if self._bundle is not None:
+            self._bundle.close()
+            self._bundle = None
+            self._bundle_boost_sets = {}
 
 # Singleton instance
 game_data_service = GameDataService()
\ No newline at end of file
@@ -0,0 +1,63 @@
+"""add_keyset_and_trigram_search_indexes
+
+Revision ID: 7c1e4a9b2d35
+Revises: 362fd2d09d23
+Create Date: 2026-10-17 09:12:44.318205
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7c1e4a9b2d35"
+down_revision: str | Sequence[str] | None = "362fd2d09d23"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (index name, table, column) for ILIKE '%term%' name search
+TRIGRAM_INDEXES = [
+    ("idx_power_name_trgm", "powers", "name"),
+    ("idx_power_display_name_trgm", "powers", "display_name"),
+    ("idx_enhancement_name_trgm", "enhancements", "name"),
+    ("idx_enhset_name_trgm", "enhancement_sets", "name"),
+]
+
+# (index name, table, columns) for keyset pagination on (level, id)
+KEYSET_INDEXES = [
+    ("idx_power_level_id", "powers", ["available_level", "id"]),
+    ("idx_enhancement_level_id", "enhancements", ["level_min", "id"]),
+    ("idx_enhset_level_id", "enhancement_sets", ["min_level", "id"]),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema - add keyset pagination and pg_trgm name search indexes."""
+    for name, table, columns in KEYSET_INDEXES:
+        op.create_index(name, table, columns, unique=False)
+
+    # Trigram GIN indexes let ILIKE '%term%' avoid a sequential scan
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column in TRIGRAM_INDEXES:
+        op.create_index(
+            name,
+            table,
+            [column],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema - drop the search and pagination indexes."""
+    if op.get_bind().dialect.name == "postgresql":
+        for name, table, _ in reversed(TRIGRAM_INDEXES):
+            op.drop_index(name, table_name=table)
+        # The pg_trgm extension is left installed; other objects may use it
+
+    for name, table, _ in reversed(KEYSET_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,43 @@
+"""drop_duplicate_power_source_metadata
+
+Revision ID: a4d82f6c19e0
+Revises: 7c1e4a9b2d35
+Create Date: 2026-10-17 11:40:05.902417
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a4d82f6c19e0"
+down_revision: str | Sequence[str] | None = "7c1e4a9b2d35"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - clear powers.source_metadata where it copies power_data.
+
+    The filtered_data importer stored the full power document in both
+    columns. Only power_data is kept; run VACUUM afterwards to reclaim the
+    TOAST space on PostgreSQL.
+    """
+    if op.get_bind().dialect.name == "postgresql":
+        # jsonb comparison ignores key order and whitespace
+        same = "source_metadata::jsonb = power_data::jsonb"
+    else:
+        same = "CAST(source_metadata AS TEXT) = CAST(power_data AS TEXT)"
+    op.execute(
+        "UPDATE powers SET source_metadata = NULL "
+        f"WHERE source_metadata IS NOT NULL AND power_data IS NOT NULL AND {same}"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema - restore source_metadata as a copy of power_data."""
+    op.execute(
+        "UPDATE powers SET source_metadata = power_data "
+        "WHERE source_metadata IS NULL AND power_data IS NOT NULL"
+    )
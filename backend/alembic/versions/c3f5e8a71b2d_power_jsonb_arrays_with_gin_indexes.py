@@ -0,0 +1,69 @@
+"""power_jsonb_arrays_with_gin_indexes
+
+Revision ID: c3f5e8a71b2d
+Revises: a4d82f6c19e0
+Create Date: 2026-10-17 14:05:31.447120
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c3f5e8a71b2d"
+down_revision: str | Sequence[str] | None = "a4d82f6c19e0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Power array columns filtered with containment (@>) by /api/powers
+COLUMNS = [
+    "archetypes",
+    "tags",
+    "exclusion_groups",
+    "recharge_groups",
+    "allowed_boostset_cats",
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema - JSONB with GIN jsonb_path_ops indexes for power arrays."""
+    # SQLite has no JSONB or GIN; the columns stay JSON there
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for column in COLUMNS:
+        op.alter_column(
+            "powers",
+            column,
+            type_=postgresql.JSONB(),
+            existing_type=sa.JSON(),
+            existing_nullable=True,
+            postgresql_using=f"{column}::jsonb",
+        )
+        op.create_index(
+            f"idx_power_{column}_gin",
+            "powers",
+            [column],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column: "jsonb_path_ops"},
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema - drop the GIN indexes and restore JSON columns."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for column in reversed(COLUMNS):
+        op.drop_index(f"idx_power_{column}_gin", table_name="powers")
+        op.alter_column(
+            "powers",
+            column,
+            type_=sa.JSON(),
+            existing_type=postgresql.JSONB(),
+            existing_nullable=True,
+            postgresql_using=f"{column}::json",
+        )
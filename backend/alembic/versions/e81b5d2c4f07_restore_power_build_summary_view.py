@@ -0,0 +1,57 @@
+"""restore_power_build_summary_view
+
+Revision ID: e81b5d2c4f07
+Revises: c3f5e8a71b2d
+Create Date: 2026-10-17 16:42:08.913574
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e81b5d2c4f07"
+down_revision: str | Sequence[str] | None = "c3f5e8a71b2d"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - power_build_summary for the current powers/powersets."""
+    # Materialized views are PostgreSQL only; other databases use the join
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS power_build_summary")
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW power_build_summary AS
+        SELECT p.id, p.name, p.full_name, p.display_name, p.powerset_id,
+               ps.name AS powerset_name, ps.archetype_id, p.available_level,
+               p.type, p.target_type, p.accuracy, p.endurance_cost,
+               p.recharge_time, p.activation_time, p.range, p.max_targets_hit,
+               p.icon
+        FROM powers p
+        JOIN powersets ps ON ps.id = p.powerset_id
+        WITH DATA
+        """
+    )
+    # Unique index required by REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.execute(
+        "CREATE UNIQUE INDEX idx_power_build_summary_id ON power_build_summary (id)"
+    )
+    op.execute(
+        "CREATE INDEX idx_power_build_summary_archetype "
+        "ON power_build_summary (archetype_id, available_level)"
+    )
+    op.execute(
+        "CREATE INDEX idx_power_build_summary_powerset "
+        "ON power_build_summary (powerset_id)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS power_build_summary")
@@ -32,6 +32,17 @@ from .build_totals import (
     BuildTotals,
     create_build_totals
 )
+from .build_session import (
+    BuildData,
+    BuildSession,
+    EnhancementInfo,
+    TotalStat
+)
+from .vectorized_totals import (
+    VectorizedBuildTotals,
+    aggregate_build_arrays,
+    score_builds
+)
 
 __all__ = [
     # Defense
@@ -59,4 +70,13 @@ __all__ = [
     # Build Totals
     "BuildTotals",
     "create_build_totals",
+    # Incremental sessions
+    "BuildSession",
+    "BuildData",
+    "EnhancementInfo",
+    "TotalStat",
+    # Vectorized engine
+    "VectorizedBuildTotals",
+    "aggregate_build_arrays",
+    "score_builds",
 ]
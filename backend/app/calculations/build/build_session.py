@@ -0,0 +1,443 @@
+"""
+Build Session - Incremental build recalculation
+
+A planner changes one slot at a time, but BuildTotals recomputes a build
+from every bonus. BuildSession keeps a build's intermediate results and the
+dependencies between them, so a change only recomputes what it touches:
+
+    slot -> power (pre-ED and post-ED aspect totals, set pieces)
+    power -> power contribution to each stat
+    set pieces -> set bonus powers -> Rule of 5 counts (SetBonusCalculator)
+    set bonus power -> set bonus contribution to each stat
+    contributions -> build total per stat (capped for the archetype)
+
+Every total is the sum of per-source contributions (one per power and one per
+set bonus power). A change recomputes the contributions of the sources it
+touches and re-sums only the stats those sources feed; math.fsum makes each
+sum independent of update order, so an updated session equals one built from
+scratch. Each change returns a diff of the totals that changed.
+
+Example:
+    >>> session = BuildSession(ArchetypeType.SCRAPPER, data, slotting)
+    >>> session.add_power(weave)
+    >>> session.slot_enhancement(weave.power_id, 0, Slot(enhancement_id=10))
+    {<DefenseType.MELEE: 'Melee'>: (0.05, 0.0585), ...}
+"""
+
+import math
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from enum import Enum
+
+from app.calculations.core import ArchetypeType, get_archetype_caps
+from app.calculations.core.enhancement_schedules import (
+    EDSchedule,
+    apply_ed,
+    get_schedule,
+)
+from app.calculations.enhancements.set_bonuses import (
+    EnhancementSet,
+    PvMode,
+    SetBonusCalculator,
+    SlottedSet,
+)
+from app.calculations.enhancements.slotting import (
+    ATTUNED_IO_LEVEL_CAP,
+    Slot,
+    SlottedPower,
+    SlottingCalculator,
+)
+
+from .build_totals import BuildTotals
+from .defense_aggregator import DefenseType
+from .resistance_aggregator import ResistanceType
+
+
+class TotalStat(Enum):
+    """Build totals other than defense and resistance."""
+
+    GLOBAL_RECHARGE = "Global Recharge"
+
+
+# A build total: one per DefenseType, ResistanceType and TotalStat
+Stat = DefenseType | ResistanceType | TotalStat
+
+ALL_STATS: tuple[Stat, ...] = (*DefenseType, *ResistanceType, *TotalStat)
+
+# Enhancement aspect that scales a power's own value for each kind of stat;
+# global recharge from powers such as Hasten is not enhanceable
+STAT_ASPECTS: dict[type, str] = {
+    DefenseType: "Defense",
+    ResistanceType: "Resistance",
+}
+
+# Changed totals: stat -> (old value, new value)
+TotalsDiff = dict[Stat, tuple[float, float]]
+
+
+@dataclass(frozen=True)
+class EnhancementInfo:
+    """
+    What a slotted enhancement boosts.
+
+    Attributes:
+        enhancement_id: Enhancement database ID
+        aspects: Enhanced attributes (e.g. "Damage", "Defense"); each gets
+            the slot's value for that attribute's ED schedule
+        set_id: Enhancement set the enhancement belongs to, if any
+    """
+
+    enhancement_id: int
+    aspects: tuple[str, ...]
+    set_id: int | None = None
+
+
+@dataclass
+class BuildData:
+    """
+    Game data a build session reads.
+
+    Attributes:
+        enhancements: Enhancement definitions by ID
+        enhancement_sets: Set definitions by ID
+        power_stats: Unenhanced stat values granted by each power
+        bonus_stats: Stat values granted by each set bonus power
+    """
+
+    enhancements: Mapping[int, EnhancementInfo]
+    enhancement_sets: Mapping[int, EnhancementSet] = field(default_factory=dict)
+    power_stats: Mapping[int, Mapping[Stat, float]] = field(default_factory=dict)
+    bonus_stats: Mapping[int, Mapping[Stat, float]] = field(default_factory=dict)
+
+
+class BuildSession:
+    """
+    A build whose totals are updated incrementally.
+
+    Attributes:
+        archetype: Character archetype for caps
+        data: Game data for the build
+        slotting: Calculator for slot enhancement values
+        character_level: Level for attuned IOs; slots added above it are
+            inactive, as when exemplared
+        set_bonuses: Rule of 5 counts of the build's set bonus powers
+    """
+
+    def __init__(
+        self,
+        archetype: ArchetypeType,
+        data: BuildData,
+        slotting: SlottingCalculator,
+        character_level: int = 50,
+        pv_mode: PvMode = PvMode.PVE,
+    ):
+        self.archetype = archetype
+        self.data = data
+        self.slotting = slotting
+        self.character_level = character_level
+        self.set_bonuses = SetBonusCalculator(pv_mode)
+
+        self._caps = get_archetype_caps(archetype)
+        self._powers: dict[int, SlottedPower] = {}
+        # power_id -> post-ED value per aspect
+        self._enhancement: dict[int, dict[str, float]] = {}
+        # power_id -> set_id -> enhancement IDs of the set slotted in the power
+        self._set_pieces: dict[int, dict[int, list[int]]] = {}
+        # power_id -> set_id -> bonus power IDs counted for those set pieces
+        self._set_bonus_powers: dict[int, dict[int, list[int]]] = {}
+        # stat -> source -> contribution; sources are ("power", power_id) and
+        # ("set_bonus", bonus_power_id)
+        self._contributions: dict[Stat, dict[tuple[str, int], float]] = {
+            stat: {} for stat in ALL_STATS
+        }
+        # source -> stats it contributes to
+        self._source_stats: dict[tuple[str, int], set[Stat]] = {}
+        # enhancement_id -> (info, set level range, (aspect, schedule) pairs)
+        self._slot_info: dict[int, tuple] = {}
+        self._totals: dict[Stat, float] = {
+            stat: self._cap(stat, 0.0) for stat in ALL_STATS
+        }
+
+    # Deltas
+
+    def add_power(self, power: SlottedPower) -> TotalsDiff:
+        """
+        Add a power (with its slots) to the build.
+
+        Raises:
+            ValueError: If the power is already in the build
+        """
+        if power.power_id in self._powers:
+            raise ValueError(f"Power {power.power_id} is already in the build")
+        self._powers[power.power_id] = power
+        return self._update(self._refresh_power(power.power_id))
+
+    def remove_power(self, power_id: int) -> TotalsDiff:
+        """Remove a power and everything its slots contributed."""
+        self._get_power(power_id)
+        return self._update(self._drop_power(power_id))
+
+    def swap_power(self, power_id: int, power: SlottedPower) -> TotalsDiff:
+        """
+        Replace a power with another one, e.g. a different pool power.
+
+        Raises:
+            ValueError: If the new power is already in the build
+        """
+        self._get_power(power_id)
+        if power.power_id != power_id and power.power_id in self._powers:
+            raise ValueError(f"Power {power.power_id} is already in the build")
+        changed = self._drop_power(power_id)
+        self._powers[power.power_id] = power
+        changed |= self._refresh_power(power.power_id)
+        return self._update(changed)
+
+    def slot_enhancement(
+        self, power_id: int, slot_index: int, slot: Slot
+    ) -> TotalsDiff:
+        """
+        Put an enhancement in one of a power's slots, replacing what was there.
+
+        Raises:
+            KeyError: If the power is not in the build or the enhancement is
+                unknown
+            IndexError: If the power has no such slot
+        """
+        power = self._get_power(power_id)
+        if not slot.is_empty and slot.enhancement_id not in self.data.enhancements:
+            raise KeyError(f"Unknown enhancement {slot.enhancement_id}")
+        power.slots[slot_index].enhancement = slot
+        return self._update(self._refresh_power(power_id))
+
+    def unslot_enhancement(self, power_id: int, slot_index: int) -> TotalsDiff:
+        """Empty one of a power's slots."""
+        return self.slot_enhancement(power_id, slot_index, Slot())
+
+    def set_level(self, character_level: int) -> TotalsDiff:
+        """
+        Change the character level.
+
+        Only powers with slots added between the old and new level, or with
+        attuned enhancements whose effective level changes, are recomputed.
+        """
+        old_level = self.character_level
+        low, high = sorted((old_level, character_level))
+        self.character_level = character_level
+
+        changed: set[Stat] = set()
+        for power_id, power in self._powers.items():
+            if any(
+                low < entry.level <= high
+                or self._attuned_level_changes(entry.enhancement, old_level)
+                for entry in power.slots
+            ):
+                changed |= self._refresh_power(power_id)
+        return self._update(changed)
+
+    # Queries
+
+    def totals(self) -> dict[Stat, float]:
+        """Every build total, capped for the archetype."""
+        return dict(self._totals)
+
+    def get_total(self, stat: Stat) -> float:
+        """One build total, capped for the archetype."""
+        return self._totals[stat]
+
+    def get_power_enhancement(self, power_id: int) -> dict[str, float]:
+        """A power's post-ED enhancement value per aspect."""
+        self._get_power(power_id)
+        return dict(self._enhancement[power_id])
+
+    def slot_dependents(self, power_id: int, slot_index: int) -> set[Stat]:
+        """
+        Stats the enhancement in a slot currently feeds.
+
+        Through its power's enhanced values and through the set bonuses its
+        set pieces grant.
+        """
+        slot = self._get_power(power_id).slots[slot_index].enhancement
+        if slot.is_empty:
+            return set()
+
+        info = self.data.enhancements[slot.enhancement_id]
+        stats = {
+            stat
+            for stat in self._source_stats.get(("power", power_id), ())
+            if STAT_ASPECTS.get(type(stat)) in info.aspects
+        }
+        if info.set_id is not None:
+            for bonus_id in self._set_bonus_powers[power_id].get(info.set_id, ()):
+                stats.update(self.data.bonus_stats.get(bonus_id, ()))
+        return stats
+
+    def build_totals(self) -> BuildTotals:
+        """The current totals as a BuildTotals (e.g. for get_summary())."""
+        totals = BuildTotals(archetype=self.archetype)
+        for stat, value in self._totals.items():
+            if isinstance(stat, DefenseType):
+                totals.defense.set_defense(stat, value)
+            elif isinstance(stat, ResistanceType):
+                totals.resistance.set_resistance(stat, value)
+            else:
+                totals.recharge.set_global_recharge(value)
+        return totals
+
+    # Dependency updates
+
+    def _get_power(self, power_id: int) -> SlottedPower:
+        try:
+            return self._powers[power_id]
+        except KeyError:
+            raise KeyError(f"Power {power_id} is not in the build") from None
+
+    def _refresh_power(self, power_id: int) -> set[Stat]:
+        """Recompute one power's aspects, set pieces and contributions."""
+        power = self._powers[power_id]
+        aspect_totals: dict[str, float] = {}
+        set_pieces: dict[int, list[int]] = {}
+
+        for entry in power.slots:
+            slot = entry.enhancement
+            if slot.is_empty or entry.level > self.character_level:
+                continue
+            info, levels, schedules = self._get_slot_info(slot)
+            for aspect, schedule in schedules:
+                value = self.slotting.calculate_slot_value(
+                    slot, schedule.value, self.character_level, *levels
+                )
+                aspect_totals[aspect] = aspect_totals.get(aspect, 0.0) + value
+            if info.set_id is not None:
+                set_pieces.setdefault(info.set_id, []).append(slot.enhancement_id)
+
+        enhancement = {
+            aspect: apply_ed(get_schedule(aspect), total)
+            for aspect, total in aspect_totals.items()
+        }
+        self._enhancement[power_id] = enhancement
+
+        base = self.data.power_stats.get(power_id, {})
+        changed = self._set_source(
+            ("power", power_id),
+            {
+                stat: value * (1.0 + enhancement.get(STAT_ASPECTS.get(type(stat)), 0.0))
+                for stat, value in base.items()
+            },
+        )
+        return changed | self._update_set_pieces(power_id, set_pieces)
+
+    def _get_slot_info(
+        self, slot: Slot
+    ) -> tuple[EnhancementInfo, tuple[int, int], tuple[tuple[str, EDSchedule], ...]]:
+        """An enhancement's info, set level range and aspect schedules."""
+        slot_info = self._slot_info.get(slot.enhancement_id)
+        if slot_info is None:
+            info = self.data.enhancements[slot.enhancement_id]
+            set_def = self.data.enhancement_sets.get(info.set_id)
+            levels = (set_def.level_min, set_def.level_max) if set_def else (1, 53)
+            schedules = tuple((aspect, get_schedule(aspect)) for aspect in info.aspects)
+            slot_info = self._slot_info[slot.enhancement_id] = (info, levels, schedules)
+        return slot_info
+
+    def _attuned_level_changes(self, slot: Slot, old_level: int) -> bool:
+        if not slot.is_attuned or slot.is_empty:
+            return False
+        levels = self._get_slot_info(slot)[1]
+        return _attuned_level(levels, old_level) != _attuned_level(
+            levels, self.character_level
+        )
+
+    def _update_set_pieces(
+        self, power_id: int, set_pieces: dict[int, list[int]]
+    ) -> set[Stat]:
+        """Update the bonus powers granted by a power's set pieces."""
+        if self._set_pieces.get(power_id) == set_pieces:
+            return set()
+        self._set_pieces[power_id] = set_pieces
+
+        old = self._set_bonus_powers.get(power_id, {})
+        new: dict[int, list[int]] = {}
+        for set_id, enhancement_ids in set_pieces.items():
+            set_def = self.data.enhancement_sets.get(set_id)
+            if set_def is None:
+                continue
+            slotted = SlottedSet(
+                power_id=power_id,
+                set_id=set_id,
+                slotted_count=len(enhancement_ids),
+                enhancement_ids=enhancement_ids,
+            )
+            new[set_id] = self.set_bonuses.get_set_bonus_powers(slotted, set_def)
+        self._set_bonus_powers[power_id] = new
+
+        affected: set[int] = set()
+        for set_id in old.keys() | new.keys():
+            lost, gained = old.get(set_id, []), new.get(set_id, [])
+            if lost != gained:
+                affected.update(self.set_bonuses.remove_bonus_powers(lost))
+                affected.update(self.set_bonuses.add_bonus_powers(gained))
+        return self._refresh_bonuses(affected)
+
+    def _refresh_bonuses(self, bonus_ids: Iterable[int]) -> set[Stat]:
+        changed: set[Stat] = set()
+        for bonus_id in bonus_ids:
+            count = self.set_bonuses.get_active_count(bonus_id)
+            stats = self.data.bonus_stats.get(bonus_id, {})
+            changed |= self._set_source(
+                ("set_bonus", bonus_id),
+                {stat: value * count for stat, value in stats.items()} if count else {},
+            )
+        return changed
+
+    def _drop_power(self, power_id: int) -> set[Stat]:
+        changed = self._update_set_pieces(power_id, {})
+        changed |= self._set_source(("power", power_id), {})
+        del self._powers[power_id]
+        del self._enhancement[power_id]
+        del self._set_pieces[power_id]
+        del self._set_bonus_powers[power_id]
+        return changed
+
+    def _set_source(
+        self, source: tuple[str, int], values: dict[Stat, float]
+    ) -> set[Stat]:
+        """Replace a source's contributions; returns the stats that changed."""
+        old_stats = self._source_stats.pop(source, set())
+        for stat in old_stats - values.keys():
+            del self._contributions[stat][source]
+        changed = {stat for stat in old_stats if stat not in values}
+
+        for stat, value in values.items():
+            contributions = self._contributions[stat]
+            if contributions.get(source) != value:
+                contributions[source] = value
+                changed.add(stat)
+        if values:
+            self._source_stats[source] = set(values)
+        return changed
+
+    def _update(self, stats: Iterable[Stat]) -> TotalsDiff:
+        """Re-sum the given stats and return the totals that changed."""
+        diff: TotalsDiff = {}
+        for stat in stats:
+            value = self._cap(stat, math.fsum(self._contributions[stat].values()))
+            old = self._totals[stat]
+            if value != old:
+                self._totals[stat] = value
+                diff[stat] = (old, value)
+        return diff
+
+    def _cap(self, stat: Stat, value: float) -> float:
+        if isinstance(stat, DefenseType):
+            return self._caps.apply_defense_cap(value)
+        if isinstance(stat, ResistanceType):
+            return self._caps.apply_resistance_cap(value)
+        return self._caps.apply_recharge_cap(value)
+
+
+def _attuned_level(levels: tuple[int, int], character_level: int) -> int:
+    """Effective level of an attuned IO (as SlottingCalculator computes it)."""
+    set_min_level, set_max_level = levels
+    effective_level = min(character_level, ATTUNED_IO_LEVEL_CAP)
+    effective_level = max(effective_level, set_min_level)
+    return min(effective_level, set_max_level)
@@ -11,12 +11,16 @@ Based on Spec 25: docs/midsreborn/calculations/25-buff-stacking-rules.md
 """
 
 from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
+import numpy as np
+
 from ..core.effect import Effect
+from ..core.effect_table import Effects, EffectTable
 from ..core.effect_types import EffectType
 from ..core.enums import PvMode, Stacking, ToWho
+from ..core.grouped_fx import FX_IDS, FxGroups, fx_key
 
 
 class StackingMode(Enum):
@@ -56,21 +60,55 @@ class FxIdentifier:
     duration: float
     ignore_scaling: bool
 
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self,
+            "_hash",
+            hash(
+                (
+                    self.effect_type,
+                    self.damage_type,
+                    self.mez_type,
+                    self.modifies_type,
+                    self.target,
+                    self.pv_mode,
+                    self.summon_id,
+                    self.duration,
+                    self.ignore_scaling,
+                )
+            ),
+        )
+
     def __hash__(self) -> int:
-        """Make hashable for use as dict key."""
-        return hash(
-            (
-                self.effect_type,
-                self.damage_type,
-                self.mez_type,
-                self.modifies_type,
-                self.target,
-                self.pv_mode,
-                self.summon_id,
-                self.duration,
-                self.ignore_scaling,
-            )
+        """Make hashable for use as dict key (computed once)."""
+        return self._hash
+
+
+# FxIdentifier per interned FxId code (see grouped_fx.FX_IDS)
+_IDENTIFIERS: dict[int, FxIdentifier] = {}
+
+
+def _identifier(code: int) -> FxIdentifier:
+    identifier = _IDENTIFIERS.get(code)
+    if identifier is None:
+        fx_id = FX_IDS.fx_id(code)
+        identifier = _IDENTIFIERS.setdefault(
+            code,
+            FxIdentifier(
+                effect_type=fx_id.effect_type,
+                damage_type=fx_id.damage_type.value if fx_id.damage_type else None,
+                mez_type=fx_id.mez_type.value if fx_id.mez_type else None,
+                modifies_type=fx_id.et_modifies,
+                target=fx_id.to_who,
+                pv_mode=fx_id.pv_mode,
+                summon_id=fx_id.summon_id,
+                duration=fx_id.duration,
+                ignore_scaling=fx_id.ignore_scaling,
+            ),
         )
+    return identifier
 
 
 @dataclass
@@ -275,7 +313,7 @@ class BuffStackingCalculator:
         # Include if this is instance 1-5, suppress if 6+
         return current_count < 6
 
-    def filter_set_bonuses(self, effects: list[Effect]) -> list[Effect]:
+    def filter_set_bonuses(self, effects: Effects) -> Effects:
         """
         Apply Rule of 5 to set bonus effects.
 
@@ -329,19 +367,9 @@ class BuffStackingCalculator:
             >>> calc.create_identifier(effect)
             FxIdentifier(effect_type=<EffectType.DEFENSE>, ...)
         """
-        return FxIdentifier(
-            effect_type=effect.effect_type,
-            damage_type=effect.damage_type.value if effect.damage_type else None,
-            mez_type=effect.mez_type.value if effect.mez_type else None,
-            modifies_type=effect.et_modifies,
-            target=effect.to_who,
-            pv_mode=effect.pv_mode,
-            summon_id=effect.summon_id,
-            duration=effect.duration,
-            ignore_scaling=effect.ignore_scaling,
-        )
+        return _identifier(FX_IDS.code(fx_key(effect)))
 
-    def group_effects(self, effects: list[Effect]) -> list[GroupedEffect]:
+    def group_effects(self, effects: Effects) -> list[GroupedEffect]:
         """
         Group effects by identifier and apply stacking rules.
 
@@ -349,7 +377,7 @@ class BuffStackingCalculator:
         From GroupedFx.cs GroupEffects() method.
 
         Args:
-            effects: All effects to group and stack
+            effects: All effects to group and stack (list or EffectTable)
 
         Returns:
             List of grouped effects with combined magnitudes
@@ -365,21 +393,24 @@ class BuffStackingCalculator:
             >>> grouped[0].enhanced_magnitude
             0.15
         """
-        if not effects:
+        if not len(effects):
             return []
 
+        if isinstance(effects, EffectTable):
+            return self._group_table(effects)
+
         # Phase 1: Apply Rule of 5 to set bonuses
         filtered_effects = self.filter_set_bonuses(effects)
 
-        # Phase 2: Group by FxIdentifier
-        groups: dict[FxIdentifier, list[Effect]] = defaultdict(list)
+        # Phase 2: Group by interned FxId code
+        groups: dict[int, list[Effect]] = defaultdict(list)
         for effect in filtered_effects:
-            fx_id = self.create_identifier(effect)
-            groups[fx_id].append(effect)
+            groups[FX_IDS.code(fx_key(effect))].append(effect)
 
         # Phase 3: Apply stacking to each group
         grouped_effects = []
-        for fx_id, effect_list in groups.items():
+        for code, effect_list in groups.items():
+            fx_id = _identifier(code)
             # Determine stacking mode (use first effect's flag)
             mode = self.determine_stacking_mode(
                 fx_id.effect_type, effect_list[0].stacking
@@ -407,6 +438,82 @@ class BuffStackingCalculator:
 
         return grouped_effects
 
+    def _group_table(self, table: EffectTable) -> list[GroupedEffect]:
+        """
+        Vectorized group_effects for an EffectTable (same results).
+
+        Rows are grouped with one np.unique over interned FxId codes; the
+        ADDITIVE, MULTIPLICATIVE, BEST_VALUE and REPLACE totals are segmented
+        reductions over every group at once, and each group picks the one
+        matching its mode.
+        """
+        table = self._filter_set_bonus_rows(table)
+        groups = FxGroups.of(table)
+
+        magnitude = table.effective_magnitude
+        buffed = table.buffed_magnitude
+        additive = groups.sum(magnitude).tolist()
+        multiplicative = (groups.prod(1.0 + magnitude) - 1.0).tolist()
+        best = groups.max(magnitude).tolist()
+        last = magnitude[groups.last].tolist()
+        base = groups.sum(table.magnitude).tolist()
+        # apply_stacking returns `buffed_magnitude or magnitude` for one effect
+        single = np.where(np.isnan(buffed) | (buffed == 0), table.magnitude, buffed)[
+            groups.first
+        ].tolist()
+
+        stacked = {
+            StackingMode.ADDITIVE: additive,
+            StackingMode.STACK: additive,
+            StackingMode.MULTIPLICATIVE: multiplicative,
+            StackingMode.BEST_VALUE: best,
+            StackingMode.IGNORE: best,
+            StackingMode.REPLACE: last,
+        }
+
+        grouped_effects = []
+        for i, (code, size, stacking, is_enhancement, effect_ids) in enumerate(
+            zip(
+                groups.codes.tolist(),
+                groups.sizes.tolist(),
+                table.stacking[groups.first].tolist(),
+                table.is_enhancement_effect[groups.first].tolist(),
+                groups.row_lists(table.unique_id),
+                strict=True,
+            )
+        ):
+            fx_id = _identifier(code)
+            mode = self.determine_stacking_mode(fx_id.effect_type, stacking)
+            grouped_effects.append(
+                GroupedEffect(
+                    identifier=fx_id,
+                    base_magnitude=base[i],
+                    enhanced_magnitude=single[i] if size == 1 else stacked[mode][i],
+                    included_effects=effect_ids,
+                    is_enhancement=is_enhancement,
+                    is_aggregated=size > 1,
+                    stacking_mode=mode,
+                )
+            )
+        return grouped_effects
+
+    def _filter_set_bonus_rows(self, table: EffectTable) -> EffectTable:
+        """filter_set_bonuses for a table: only set bonus rows are visited."""
+        if not self.rule_of_5_enabled:
+            return table
+
+        self.set_bonus_counts.clear()
+        candidates = np.flatnonzero(
+            (table.source_type == "set_bonus")
+            & np.not_equal(table.source_power_id, None)
+        )
+        keep = np.ones(len(table), dtype=bool)
+        for row, power_id in zip(
+            candidates.tolist(), table.source_power_id[candidates].tolist(), strict=True
+        ):
+            keep[row] = self.apply_rule_of_five(power_id)
+        return table if keep.all() else table[keep]
+
     def get_stat_total(
         self,
         grouped_effects: list[GroupedEffect],
@@ -442,9 +549,9 @@ class BuffStackingCalculator:
 
     def calculate_build_totals(
         self,
-        power_effects: list[Effect],
-        set_bonus_effects: list[Effect],
-        incarnate_effects: list[Effect] | None = None,
+        power_effects: Effects,
+        set_bonus_effects: Effects,
+        incarnate_effects: Effects | None = None,
     ) -> list[GroupedEffect]:
         """
         Calculate total buffs/debuffs for entire build.
@@ -467,12 +574,16 @@ class BuffStackingCalculator:
             ...     incarnate_effects=[...]
             ... )
         """
-        # Combine all effects
-        all_effects = []
-        all_effects.extend(power_effects)
-        all_effects.extend(set_bonus_effects)
+        # Combine all effects, staying columnar if any source is a table
+        sources = [power_effects, set_bonus_effects]
         if incarnate_effects:
-            all_effects.extend(incarnate_effects)
+            sources.append(incarnate_effects)
+        if any(isinstance(source, EffectTable) for source in sources):
+            all_effects = EffectTable.concat(
+                [EffectTable.from_effects(source) for source in sources]
+            )
+        else:
+            all_effects = [effect for source in sources for effect in source]
 
         # Group and stack
         return self.group_effects(all_effects)
@@ -0,0 +1,438 @@
+"""
+Vectorized Build Totals - NumPy engine for scoring many builds at once
+
+Alternate implementation of the defense/resistance/recharge/damage aggregators
+that stores bonuses as fixed-width float64 matrices instead of enum-keyed dicts.
+
+Layout:
+- Defense:    one column per DefenseType, in enum declaration order (11 columns)
+- Resistance: one column per ResistanceType, in enum declaration order (8 columns)
+- Recharge:   one column (global recharge)
+- Damage:     one column per DamageHeuristic (MAX, AVG, MIN)
+
+A single build is a (bonuses × types) matrix; N builds are stacked and
+zero-padded into an (N × bonuses × types) array, summed along the bonus axis
+and capped against the per-archetype caps in one pass.
+
+Summation adds one bonus row at a time across all N builds and types
+(((0 + b0) + b1) + ...), the same order as the scalar aggregators. ndarray.sum()
+is not used because NumPy may switch to pairwise summation, which changes the
+last bits. Results therefore match BuildTotals.get_summary() exactly.
+
+Example:
+    >>> totals = score_builds(
+    ...     archetypes=[ArchetypeType.SCRAPPER, ArchetypeType.TANKER],
+    ...     defense_bonuses=[[{DefenseType.MELEE: 0.30}], []],
+    ...     resistance_bonuses=[[], [{ResistanceType.FIRE: 0.95}]],
+    ... )
+    >>> totals.resistance[1, RESISTANCE_COLUMN[ResistanceType.FIRE]]
+    0.9
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from app.calculations.core import ArchetypeType, get_archetype_caps
+
+from .damage_aggregator import DamageBuffSource, DamageHeuristic
+from .defense_aggregator import (
+    DEFENSE_SOFT_CAP,
+    POSITIONAL_DEFENSE_TYPES,
+    TYPED_DEFENSE_TYPES,
+    DefenseType,
+)
+from .resistance_aggregator import ResistanceType
+
+# Column order follows enum declaration order
+DEFENSE_COLUMNS: tuple = tuple(DefenseType)
+RESISTANCE_COLUMNS: tuple = tuple(ResistanceType)
+DAMAGE_HEURISTIC_COLUMNS: tuple = (
+    DamageHeuristic.MAX,
+    DamageHeuristic.AVG,
+    DamageHeuristic.MIN,
+)
+
+DEFENSE_COLUMN: dict[DefenseType, int] = {dt: i for i, dt in enumerate(DEFENSE_COLUMNS)}
+RESISTANCE_COLUMN: dict[ResistanceType, int] = {
+    rt: i for i, rt in enumerate(RESISTANCE_COLUMNS)
+}
+DAMAGE_HEURISTIC_COLUMN: dict[DamageHeuristic, int] = {
+    h: i for i, h in enumerate(DAMAGE_HEURISTIC_COLUMNS)
+}
+
+# Summary ordering used by BuildTotals.get_summary()
+_SUMMARY_TYPED = [dt for dt in DEFENSE_COLUMNS if dt in TYPED_DEFENSE_TYPES]
+_SUMMARY_POSITIONAL = [dt for dt in DEFENSE_COLUMNS if dt in POSITIONAL_DEFENSE_TYPES]
+
+# Same tolerance as DefenseValues.is_at_soft_cap / ResistanceValues.is_at_cap
+_CAP_TOLERANCE = 0.001
+
+
+def encode_defense_bonuses(
+    defense_bonuses: list[dict[DefenseType, float]],
+) -> np.ndarray:
+    """
+    Encode a list of defense bonus dicts as a (bonuses × 11) matrix.
+
+    Args:
+        defense_bonuses: List of defense bonus dicts (DefenseType -> value)
+
+    Returns:
+        float64 array with one row per bonus and DEFENSE_COLUMNS columns
+    """
+    matrix = np.zeros((len(defense_bonuses), len(DEFENSE_COLUMNS)), dtype=np.float64)
+    for row, bonus_dict in enumerate(defense_bonuses):
+        for defense_type, value in bonus_dict.items():
+            matrix[row, DEFENSE_COLUMN[defense_type]] += value
+    return matrix
+
+
+def encode_resistance_bonuses(
+    resistance_bonuses: list[dict[ResistanceType, float]],
+) -> np.ndarray:
+    """
+    Encode a list of resistance bonus dicts as a (bonuses × 8) matrix.
+
+    Args:
+        resistance_bonuses: List of resistance bonus dicts (ResistanceType -> value)
+
+    Returns:
+        float64 array with one row per bonus and RESISTANCE_COLUMNS columns
+    """
+    matrix = np.zeros(
+        (len(resistance_bonuses), len(RESISTANCE_COLUMNS)), dtype=np.float64
+    )
+    for row, bonus_dict in enumerate(resistance_bonuses):
+        for resistance_type, value in bonus_dict.items():
+            matrix[row, RESISTANCE_COLUMN[resistance_type]] += value
+    return matrix
+
+
+def encode_damage_buffs(buff_sources: list[DamageBuffSource]) -> np.ndarray:
+    """
+    Encode damage buff sources as a (sources × 3) matrix of per-heuristic contributions.
+
+    Mirrors DamageValues.calculate_total_damage_buff():
+    - MAX: every source contributes its full value
+    - AVG: temporary sources contribute value × avg_multiplier
+    - MIN: temporary sources contribute nothing
+
+    Args:
+        buff_sources: List of damage buff sources
+
+    Returns:
+        float64 array with one row per source and DAMAGE_HEURISTIC_COLUMNS columns
+    """
+    matrix = np.zeros(
+        (len(buff_sources), len(DAMAGE_HEURISTIC_COLUMNS)), dtype=np.float64
+    )
+    for row, source in enumerate(buff_sources):
+        matrix[row, 0] = source.value
+        if source.is_temporary:
+            matrix[row, 1] = source.value * source.avg_multiplier
+        else:
+            matrix[row, 1] = source.value
+            matrix[row, 2] = source.value
+    return matrix
+
+
+def _ordered_sum(stacked: np.ndarray) -> np.ndarray:
+    """Sum (N × rows × width) along the rows axis in row order."""
+    total = np.zeros((stacked.shape[0], stacked.shape[2]), dtype=np.float64)
+    for row in range(stacked.shape[1]):
+        total += stacked[:, row]
+    return total
+
+
+def _encode_keyed_stack(
+    per_build: Sequence[list[dict]], column_index: dict
+) -> np.ndarray:
+    """
+    Encode per-build lists of enum-keyed bonus dicts straight into (N × rows × width).
+
+    Collects (build, row, column, value) coordinates in Python and writes them
+    with a single fancy-index assignment, avoiding per-element NumPy writes.
+    """
+    builds, rows, cols, vals = [], [], [], []
+    depth = 0
+    for b, bonus_list in enumerate(per_build):
+        depth = max(depth, len(bonus_list))
+        for r, bonus_dict in enumerate(bonus_list):
+            for key, value in bonus_dict.items():
+                builds.append(b)
+                rows.append(r)
+                cols.append(column_index[key])
+                vals.append(value)
+    stacked = np.zeros((len(per_build), depth, len(column_index)), dtype=np.float64)
+    stacked[builds, rows, cols] = vals
+    return stacked
+
+
+def _encode_value_stack(per_build: Sequence[list[float]]) -> np.ndarray:
+    """Encode per-build lists of scalar bonuses into (N × rows × 1)."""
+    depth = max((len(values) for values in per_build), default=0)
+    stacked = np.zeros((len(per_build), depth, 1), dtype=np.float64)
+    for b, values in enumerate(per_build):
+        if values:
+            stacked[b, : len(values), 0] = values
+    return stacked
+
+
+def _encode_damage_stack(per_build: Sequence[list[DamageBuffSource]]) -> np.ndarray:
+    """Encode per-build damage buff sources into (N × rows × 3); see encode_damage_buffs()."""
+    depth = max((len(sources) for sources in per_build), default=0)
+    stacked = np.zeros(
+        (len(per_build), depth, len(DAMAGE_HEURISTIC_COLUMNS)), dtype=np.float64
+    )
+    for b, sources in enumerate(per_build):
+        if sources:
+            stacked[b, : len(sources)] = [
+                (s.value, s.value * s.avg_multiplier, 0.0)
+                if s.is_temporary
+                else (s.value, s.value, s.value)
+                for s in sources
+            ]
+    return stacked
+
+
+def _stack(matrices: Sequence[np.ndarray], width: int) -> np.ndarray:
+    """Zero-pad per-build matrices to a common row count and stack to (N × rows × width)."""
+    depth = max((m.shape[0] for m in matrices), default=0)
+    stacked = np.zeros((len(matrices), depth, width), dtype=np.float64)
+    for i, matrix in enumerate(matrices):
+        stacked[i, : matrix.shape[0]] = matrix
+    return stacked
+
+
+@dataclass
+class ArchetypeCapVectors:
+    """
+    Per-build cap columns, looked up once per distinct archetype.
+
+    Attributes:
+        defense: (N,) defense display caps
+        resistance: (N,) resistance caps
+        recharge: (N,) recharge caps
+        damage: (N,) damage buff caps
+    """
+
+    defense: np.ndarray
+    resistance: np.ndarray
+    recharge: np.ndarray
+    damage: np.ndarray
+
+    @classmethod
+    def for_archetypes(
+        cls, archetypes: Sequence[ArchetypeType]
+    ) -> "ArchetypeCapVectors":
+        """
+        Build cap vectors for a list of archetypes.
+
+        Args:
+            archetypes: Archetype of each build
+
+        Returns:
+            ArchetypeCapVectors with one entry per build
+        """
+        distinct = list(dict.fromkeys(archetypes))
+        index = {at: i for i, at in enumerate(distinct)}
+        table = np.array(
+            [
+                [c.defense_cap, c.resistance_cap, c.recharge_cap, c.damage_cap]
+                for c in (get_archetype_caps(at) for at in distinct)
+            ],
+            dtype=np.float64,
+        ).reshape(len(distinct), 4)
+        rows = table[[index[at] for at in archetypes]] if archetypes else table
+        return cls(
+            defense=rows[:, 0],
+            resistance=rows[:, 1],
+            recharge=rows[:, 2],
+            damage=rows[:, 3],
+        )
+
+
+@dataclass
+class VectorizedBuildTotals:
+    """
+    Aggregated, capped totals for N builds.
+
+    Attributes:
+        archetypes: Archetype of each build
+        defense: (N × 11) capped defense, DEFENSE_COLUMNS order
+        resistance: (N × 8) capped resistance, RESISTANCE_COLUMNS order
+        recharge: (N,) capped global recharge
+        damage: (N × 3) capped damage buff, DAMAGE_HEURISTIC_COLUMNS order
+        caps: Per-build cap vectors
+    """
+
+    archetypes: list[ArchetypeType]
+    defense: np.ndarray
+    resistance: np.ndarray
+    recharge: np.ndarray
+    damage: np.ndarray
+    caps: ArchetypeCapVectors
+
+    def __len__(self) -> int:
+        return len(self.archetypes)
+
+    def get_defense(self, index: int, defense_type: DefenseType) -> float:
+        """Get capped defense for one build and type."""
+        return float(self.defense[index, DEFENSE_COLUMN[defense_type]])
+
+    def get_resistance(self, index: int, resistance_type: ResistanceType) -> float:
+        """Get capped resistance for one build and type."""
+        return float(self.resistance[index, RESISTANCE_COLUMN[resistance_type]])
+
+    def get_global_recharge(self, index: int) -> float:
+        """Get capped global recharge for one build."""
+        return float(self.recharge[index])
+
+    def get_damage_buff(
+        self, index: int, heuristic: DamageHeuristic = DamageHeuristic.MAX
+    ) -> float:
+        """Get capped damage buff for one build and heuristic."""
+        return float(self.damage[index, DAMAGE_HEURISTIC_COLUMN[heuristic]])
+
+    def get_summary(self, index: int) -> dict:
+        """
+        Get the summary for one build.
+
+        Output is identical to BuildTotals.get_summary() for the same inputs.
+
+        Args:
+            index: Build index
+
+        Returns:
+            Dict with formatted build statistics
+        """
+        defense_row = self.defense[index].tolist()
+        resistance_row = self.resistance[index].tolist()
+        resistance_cap = float(self.caps.resistance[index])
+
+        def defense_entry(dt: DefenseType) -> dict:
+            value = defense_row[DEFENSE_COLUMN[dt]]
+            return {
+                "value": value,
+                "percentage": f"{value * 100:.2f}%",
+                "at_soft_cap": value >= (DEFENSE_SOFT_CAP - _CAP_TOLERANCE),
+            }
+
+        def resistance_entry(rt: ResistanceType) -> dict:
+            value = resistance_row[RESISTANCE_COLUMN[rt]]
+            return {
+                "value": value,
+                "percentage": f"{value * 100:.2f}%",
+                "at_cap": value >= (resistance_cap - _CAP_TOLERANCE),
+            }
+
+        return {
+            "archetype": self.archetypes[index].value,
+            "defense": {
+                "typed": {dt.value: defense_entry(dt) for dt in _SUMMARY_TYPED},
+                "positional": {
+                    dt.value: defense_entry(dt) for dt in _SUMMARY_POSITIONAL
+                },
+            },
+            "resistance": {rt.value: resistance_entry(rt) for rt in RESISTANCE_COLUMNS},
+        }
+
+
+def score_builds(
+    archetypes: Sequence[ArchetypeType],
+    defense_bonuses: Sequence[list[dict[DefenseType, float]]] | None = None,
+    resistance_bonuses: Sequence[list[dict[ResistanceType, float]]] | None = None,
+    recharge_bonuses: Sequence[list[float]] | None = None,
+    damage_buffs: Sequence[list[DamageBuffSource]] | None = None,
+) -> VectorizedBuildTotals:
+    """
+    Aggregate and cap bonuses for N builds in one vectorized pass.
+
+    Each bonus argument is a per-build list in the same shape the scalar
+    aggregators accept (aggregate_defense_bonuses, aggregate_resistance_bonuses,
+    aggregate_recharge_bonuses, aggregate_damage_buffs). Omitted categories
+    are treated as empty for every build.
+
+    Args:
+        archetypes: Archetype of each build
+        defense_bonuses: Per-build defense bonus dict lists
+        resistance_bonuses: Per-build resistance bonus dict lists
+        recharge_bonuses: Per-build recharge bonus value lists
+        damage_buffs: Per-build damage buff source lists
+
+    Returns:
+        VectorizedBuildTotals with (N × types) arrays
+
+    Raises:
+        ValueError: If a per-build list does not have one entry per archetype
+    """
+    archetypes = list(archetypes)
+    n = len(archetypes)
+    empty: list[list] = [[] for _ in range(n)]
+
+    def per_build(values, name):
+        if values is None:
+            return empty
+        if len(values) != n:
+            raise ValueError(
+                f"{name} has {len(values)} entries, expected {n} (one per build)"
+            )
+        return values
+
+    defense_stack = _encode_keyed_stack(
+        per_build(defense_bonuses, "defense_bonuses"), DEFENSE_COLUMN
+    )
+    resistance_stack = _encode_keyed_stack(
+        per_build(resistance_bonuses, "resistance_bonuses"), RESISTANCE_COLUMN
+    )
+    recharge_stack = _encode_value_stack(
+        per_build(recharge_bonuses, "recharge_bonuses")
+    )
+    damage_stack = _encode_damage_stack(per_build(damage_buffs, "damage_buffs"))
+
+    return aggregate_build_arrays(
+        archetypes, defense_stack, resistance_stack, recharge_stack, damage_stack
+    )
+
+
+def aggregate_build_arrays(
+    archetypes: Sequence[ArchetypeType],
+    defense: np.ndarray,
+    resistance: np.ndarray,
+    recharge: np.ndarray,
+    damage: np.ndarray,
+) -> VectorizedBuildTotals:
+    """
+    Sum and cap pre-encoded (N × bonuses × types) arrays.
+
+    Use this directly when bonuses are already held as arrays (e.g., built once
+    and re-scored with different archetypes) to skip dict encoding.
+
+    Args:
+        archetypes: Archetype of each build
+        defense: (N × B × 11) defense bonuses
+        resistance: (N × B × 8) resistance bonuses
+        recharge: (N × B × 1) recharge bonuses
+        damage: (N × B × 3) per-heuristic damage contributions
+
+    Returns:
+        VectorizedBuildTotals with capped totals
+    """
+    archetypes = list(archetypes)
+    caps = ArchetypeCapVectors.for_archetypes(archetypes)
+
+    defense_total = np.minimum(_ordered_sum(defense), caps.defense[:, None])
+    resistance_total = np.minimum(_ordered_sum(resistance), caps.resistance[:, None])
+    recharge_total = np.minimum(_ordered_sum(recharge)[:, 0], caps.recharge)
+    damage_total = np.minimum(_ordered_sum(damage), caps.damage[:, None])
+
+    return VectorizedBuildTotals(
+        archetypes=archetypes,
+        defense=defense_total,
+        resistance=resistance_total,
+        recharge=recharge_total,
+        damage=damage_total,
+        caps=caps,
+    )
@@ -16,8 +16,15 @@ from .archetype_modifiers import (
     calculate_effect_magnitude,
 )
 from .effect import Effect
+from .effect_table import Effects, EffectTable
 from .effect_types import DamageType, EffectType, MezType
-from .enhancement_schedules import EDSchedule, apply_ed, calculate_ed_loss, get_schedule
+from .enhancement_schedules import (
+    EDSchedule,
+    apply_ed,
+    apply_ed_array,
+    calculate_ed_loss,
+    get_schedule,
+)
 from .enums import PvMode, SpecialCase, Stacking, Suppress, ToWho
 from .grouped_fx import EffectAggregator, FxId, GroupedEffect
 
@@ -34,12 +41,15 @@ __all__ = [
     "Suppress",
     # Core classes
     "Effect",
+    "EffectTable",
+    "Effects",
     "FxId",
     "GroupedEffect",
     "EffectAggregator",
     # Enhancement Diversification
     "EDSchedule",
     "apply_ed",
+    "apply_ed_array",
     "get_schedule",
     "calculate_ed_loss",
     # Archetype Modifiers
@@ -3,16 +3,22 @@ Effect Class - Core game effect representation
 
 Maps to MidsReborn's Effect class implementing IEffect interface.
 Complete property set from Core/IEffect.cs.
+
+Effects are slotted (no per-instance __dict__), so arbitrary attributes can't
+be attached; every property is a declared field. For many effects at once see
+EffectTable in effect_table.py.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import MISSING, dataclass, fields
 from datetime import datetime
+from enum import Enum
+from typing import Any
 
 from .effect_types import DamageType, EffectType, MezType
 from .enums import PvMode, SpecialCase, Stacking, Suppress, ToWho
 
 
-@dataclass
+@dataclass(slots=True)
 class Effect:
     """
     Represents a single game effect (damage, buff, debuff, control, etc.).
@@ -26,6 +32,10 @@ class Effect:
         magnitude: Base (unenhanced) magnitude
 
     All other properties have sensible defaults.
+
+    The constructor validates probabilities, duration and scale; use
+    Effect.trusted() for data that was already validated (e.g. loaded from
+    the game data snapshot).
     """
 
     # Core identification
@@ -71,6 +81,9 @@ class Effect:
     summon_id: int = 0  # Numeric summon ID
     delayed_time: float = 0.0  # Delay before effect applies
     ticks: int = 0  # Number of times effect ticks (for DoTs)
+    cancel_on_miss: bool = False  # DoT stops ticking after a miss
+    is_special_damage: bool = False  # Healing displayed as damage
+    position: Enum | None = None  # PositionType for positional defense
 
     # Enhancement integration
     is_enhancement_effect: bool = False
@@ -106,9 +119,11 @@ class Effect:
     # Source tracking
     effect_id: str | None = None  # Original effect ID from game data
     power_id: int | None = None  # Associated power ID
+    source_type: str | None = None  # "set_bonus" for Rule of 5 filtering
+    source_power_id: int | None = None  # Set bonus power ID (Rule of 5)
 
-    # Metadata
-    created_at: datetime = field(default_factory=datetime.now)
+    # Metadata (not set by default: a clock read per effect adds up)
+    created_at: datetime | None = None
 
     def __post_init__(self):
         """Validate properties after initialization."""
@@ -220,3 +235,43 @@ class Effect:
             f"mag={mag_str}, "
             f"to_who={self.to_who.name})"
         )
+
+
+def _make_trusted() -> Any:
+    """
+    Compile Effect.trusted(): the dataclass __init__ minus __post_init__.
+
+    Generated (as dataclasses generates __init__) so that skipping validation
+    doesn't cost a per-field Python loop.
+    """
+    namespace: dict[str, Any] = {"_new": object.__new__}
+    params = []
+    body = []
+    for f in fields(Effect):
+        if f.default is MISSING:
+            params.append(f.name)
+        else:
+            namespace[f"_default_{f.name}"] = f.default
+            params.append(f"{f.name}=_default_{f.name}")
+        body.append(f"    effect.{f.name} = {f.name}")
+    source = "\n".join(
+        [
+            f"def trusted(cls, *, {', '.join(params)}):",
+            "    effect = _new(cls)",
+            *body,
+            "    return effect",
+        ]
+    )
+    exec(source, namespace)
+    trusted = namespace["trusted"]
+    trusted.__doc__ = """
+    Build an Effect without running __post_init__ validation.
+
+    For values that were validated once when they were loaded, such as game
+    data snapshot rows or EffectTable columns. Takes the same keyword
+    arguments as the constructor.
+    """
+    return classmethod(trusted)
+
+
+Effect.trusted = _make_trusted()
@@ -0,0 +1,284 @@
+"""
+EffectTable - Columnar (struct-of-arrays) effect container
+
+A build recalculation handles thousands of effects. Instead of one Effect
+object per effect, an EffectTable keeps one NumPy array per property:
+
+- float64: magnitude, buffed_magnitude (NaN = not enhanced), duration,
+  probability, base_probability, scale, delayed_time, atr_* values
+- int64: unique_id, modifier_table_id, summon_id, ticks, atr_*_max_targets
+- bool: ignore_scaling, ignore_ed, buffable, resistible, is_enhancement_effect,
+  cancel_on_miss, is_special_damage, atr_*_requires_line_of_sight
+- object: enum, string and optional properties (effect_type, damage_type,
+  procs_per_minute, modifier_table, ...)
+
+Columns are read as attributes (``table.magnitude``) and filtered with masks
+(``table[table.probability > 0]``). Iterating a table yields Effect rows, so
+calculators written against ``list[Effect]`` accept either form; those with a
+vectorized path check ``isinstance(effects, EffectTable)``.
+
+Every Effect field has a column, so ``from_effects`` followed by iteration
+gives back equal Effect objects.
+
+Example:
+    >>> table = EffectTable.from_effects(effects)
+    >>> damage = table.where(effect_type=EffectType.DAMAGE)
+    >>> damage.effective_magnitude.sum()
+"""
+
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import MISSING, fields
+from typing import Any, Union
+
+import numpy as np
+
+from .effect import Effect
+
+# Column name -> dtype, one per Effect field in declaration order
+COLUMN_DTYPES: dict[str, Any] = {
+    "unique_id": np.int64,
+    "effect_type": object,
+    "magnitude": np.float64,
+    "damage_type": object,
+    "mez_type": object,
+    "et_modifies": object,
+    "buffed_magnitude": np.float64,
+    "magnitude_percent": object,
+    "duration": np.float64,
+    "probability": np.float64,
+    "base_probability": np.float64,
+    "procs_per_minute": object,
+    "to_who": object,
+    "pv_mode": object,
+    "scale": np.float64,
+    "modifier_table": object,
+    "modifier_table_id": np.int64,
+    "ignore_scaling": np.bool_,
+    "ignore_ed": np.bool_,
+    "stacking": object,
+    "suppression": object,
+    "buffable": np.bool_,
+    "resistible": np.bool_,
+    "special_case": object,
+    "summon": object,
+    "summon_id": np.int64,
+    "delayed_time": np.float64,
+    "ticks": np.int64,
+    "cancel_on_miss": np.bool_,
+    "is_special_damage": np.bool_,
+    "position": object,
+    "is_enhancement_effect": np.bool_,
+    **{
+        f"atr_{kind}_{name}": dtype
+        for kind in ("orig", "mod")
+        for name, dtype in (
+            ("accuracy", np.float64),
+            ("cast_time", np.float64),
+            ("recharge_time", np.float64),
+            ("endurance_cost", np.float64),
+            ("range", np.float64),
+            ("radius", np.float64),
+            ("arc", np.float64),
+            ("max_targets", np.int64),
+            ("effect_area", object),
+            ("requires_line_of_sight", np.bool_),
+            ("activate_period", np.float64),
+            ("interrupt_time", np.float64),
+        )
+    },
+    "effect_id": object,
+    "power_id": object,
+    "source_type": object,
+    "source_power_id": object,
+    "created_at": object,
+}
+
+_DEFAULTS: dict[str, Any] = {
+    f.name: f.default for f in fields(Effect) if f.name in COLUMN_DTYPES
+}
+# Required Effect fields must be given when building a table
+REQUIRED_COLUMNS: tuple[str, ...] = tuple(
+    name for name, default in _DEFAULTS.items() if default is MISSING
+)
+
+
+class EffectTable:
+    """
+    Parallel arrays holding many effects.
+
+    Tables are treated as immutable: filtering returns a new table and the
+    column arrays must not be modified in place.
+    """
+
+    __slots__ = ("_columns", "_length")
+
+    def __init__(self, columns: Mapping[str, Any], validate: bool = True):
+        """
+        Build a table from column values.
+
+        Args:
+            columns: Column name -> sequence of values; optional columns left
+                out are filled with the Effect default (buffed_magnitude: NaN)
+            validate: Check probabilities, durations and scales like
+                Effect.__post_init__; pass False for trusted data such as
+                the game data snapshot
+
+        Raises:
+            TypeError: If a column name is unknown or a required one is missing
+            ValueError: If column lengths differ, or validation fails
+        """
+        unknown = set(columns) - set(COLUMN_DTYPES)
+        if unknown:
+            raise TypeError(f"Unknown EffectTable columns: {sorted(unknown)}")
+        missing = [name for name in REQUIRED_COLUMNS if name not in columns]
+        if missing:
+            raise TypeError(f"EffectTable missing required columns: {missing}")
+
+        length = len(columns[REQUIRED_COLUMNS[0]])
+        arrays: dict[str, np.ndarray] = {}
+        for name, dtype in COLUMN_DTYPES.items():
+            if name in columns:
+                values = columns[name]
+                if name == "buffed_magnitude":
+                    values = [np.nan if v is None else v for v in values]
+                array = _column(values, dtype)
+                if len(array) != length:
+                    raise ValueError(
+                        f"Column {name!r} has {len(array)} values, expected {length}"
+                    )
+            else:
+                default = np.nan if name == "buffed_magnitude" else _DEFAULTS[name]
+                array = _column([default] * length, dtype)
+            arrays[name] = array
+
+        self._columns = arrays
+        self._length = length
+        if validate:
+            self.validate()
+
+    @classmethod
+    def _from_arrays(cls, arrays: dict[str, np.ndarray], length: int) -> "EffectTable":
+        table = object.__new__(cls)
+        table._columns = arrays
+        table._length = length
+        return table
+
+    @classmethod
+    def from_effects(cls, effects: Iterable[Effect]) -> "EffectTable":
+        """Build a table from Effect objects (already validated)."""
+        if isinstance(effects, EffectTable):
+            return effects
+        effects = list(effects)
+        columns = {
+            name: [getattr(effect, name) for effect in effects]
+            for name in COLUMN_DTYPES
+        }
+        return cls(columns, validate=False)
+
+    @classmethod
+    def concat(cls, tables: Sequence["EffectTable"]) -> "EffectTable":
+        """Join tables end to end, keeping row order."""
+        if not tables:
+            return cls({name: [] for name in REQUIRED_COLUMNS}, validate=False)
+        arrays = {
+            name: np.concatenate([table._columns[name] for table in tables])
+            for name in COLUMN_DTYPES
+        }
+        return cls._from_arrays(arrays, sum(len(table) for table in tables))
+
+    def validate(self) -> None:
+        """
+        Check every row the way Effect.__post_init__ checks one effect.
+
+        Raises:
+            ValueError: For the first offending value of each check
+        """
+        checks = (
+            (
+                "probability",
+                (self.probability < 0) | (self.probability > 1),
+                "Probability must be 0-1",
+            ),
+            (
+                "base_probability",
+                (self.base_probability < 0) | (self.base_probability > 1),
+                "Base probability must be 0-1",
+            ),
+            ("duration", self.duration < 0, "Duration cannot be negative"),
+            ("scale", self.scale <= 0, "Scale must be positive"),
+        )
+        for name, invalid, message in checks:
+            if invalid.any():
+                value = self._columns[name][np.argmax(invalid)]
+                raise ValueError(f"{message}, got {value}")
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self._columns[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __iter__(self) -> Iterator[Effect]:
+        """Yield each row as an Effect."""
+        names = list(COLUMN_DTYPES)
+        columns = [self._columns[name].tolist() for name in names]
+        buffed = names.index("buffed_magnitude")
+        for values in zip(*columns, strict=True):
+            row = dict(zip(names, values, strict=True))
+            if values[buffed] != values[buffed]:  # NaN
+                row["buffed_magnitude"] = None
+            yield Effect.trusted(**row)
+
+    def __getitem__(self, key: Any) -> Union[Effect, "EffectTable"]:
+        """
+        An int returns that row as an Effect; a slice, index array or boolean
+        mask returns a new table.
+        """
+        if isinstance(key, int | np.integer):
+            index = range(self._length)[key]
+            return next(iter(self[index : index + 1]))
+        arrays = {name: array[key] for name, array in self._columns.items()}
+        return self._from_arrays(arrays, len(arrays["unique_id"]))
+
+    def where(self, **conditions: Any) -> "EffectTable":
+        """
+        Rows whose columns equal the given values.
+
+        Example:
+            >>> table.where(effect_type=EffectType.DEFENSE, to_who=ToWho.SELF)
+        """
+        mask = np.ones(self._length, dtype=bool)
+        for name, value in conditions.items():
+            mask &= self._columns[name] == value
+        return self[mask]
+
+    @property
+    def effective_magnitude(self) -> np.ndarray:
+        """buffed_magnitude where set, else magnitude (Effect.get_effective_magnitude)."""
+        buffed = self._columns["buffed_magnitude"]
+        return np.where(np.isnan(buffed), self._columns["magnitude"], buffed)
+
+    def to_effects(self) -> list[Effect]:
+        """Materialize every row as an Effect."""
+        return list(self)
+
+    def __repr__(self) -> str:
+        return f"EffectTable(rows={self._length})"
+
+
+def _column(values: Any, dtype: Any) -> np.ndarray:
+    if dtype is object:
+        # np.asarray would unpack tuple-like values into extra dimensions
+        array = np.empty(len(values), dtype=object)
+        array[:] = list(values)
+        return array
+    return np.asarray(values, dtype=dtype)
+
+
+# Calculators that accept either form
+Effects = Sequence[Effect] | EffectTable
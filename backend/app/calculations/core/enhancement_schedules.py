@@ -6,10 +6,16 @@ Maps to MidsReborn's Enhancement.cs ApplyED() function.
 
 ED was introduced in Issue 5 (September 2005) to prevent "six-slotting" and
 force build diversification.
+
+apply_ed() handles one value; apply_ed_array() applies ED to whole arrays of
+values, each with its own schedule, using the precomputed ED_CURVES tables.
 """
 
+from collections.abc import Sequence
 from enum import Enum
 
+import numpy as np
+
 from .constants import (
     ED_EFFICIENCY_REGION_1,
     ED_EFFICIENCY_REGION_2,
@@ -72,6 +78,61 @@ ED_THRESHOLDS = {
 }
 
 
+def _curve(thresholds: tuple[float, float, float]) -> tuple[float, ...]:
+    """Cumulative post-ED values at each threshold (MidsReborn's edm1-3)."""
+    thresh1, thresh2, thresh3 = thresholds
+    edm1 = thresh1  # Value at end of Region 1
+    edm2 = thresh1 + (thresh2 - thresh1) * ED_EFFICIENCY_REGION_2  # End of Region 2
+    edm3 = edm2 + (thresh3 - thresh2) * ED_EFFICIENCY_REGION_3  # End of Region 3
+    return edm1, edm2, edm3
+
+
+# Post-ED value at each threshold, computed once per schedule
+ED_CURVE_VALUES = {
+    schedule: _curve(thresholds) for schedule, thresholds in ED_THRESHOLDS.items()
+}
+
+# ED_CURVES tables, one row per schedule. Row i is EDSchedule value i, so the
+# NONE row (-1) is last; the NONE and MULTIPLE rows map every value to 0.0.
+_CURVE_ROWS = (
+    EDSchedule.A,
+    EDSchedule.B,
+    EDSchedule.C,
+    EDSchedule.D,
+    EDSchedule.MULTIPLE,
+    EDSchedule.NONE,
+)
+
+
+def _curve_tables() -> dict[str, np.ndarray]:
+    thresholds = np.full((len(_CURVE_ROWS), 3), np.inf)
+    # Per region: post-ED value at the region start, region start, efficiency
+    offsets = np.zeros((len(_CURVE_ROWS), 4))
+    starts = np.zeros((len(_CURVE_ROWS), 4))
+    efficiencies = np.zeros((len(_CURVE_ROWS), 4))
+    for row, schedule in enumerate(_CURVE_ROWS):
+        if schedule not in ED_THRESHOLDS:
+            continue
+        thresholds[row] = ED_THRESHOLDS[schedule]
+        offsets[row] = (0.0, *ED_CURVE_VALUES[schedule])
+        starts[row] = (0.0, *ED_THRESHOLDS[schedule])
+        efficiencies[row] = (
+            ED_EFFICIENCY_REGION_1,
+            ED_EFFICIENCY_REGION_2,
+            ED_EFFICIENCY_REGION_3,
+            ED_EFFICIENCY_REGION_4,
+        )
+    return {
+        "thresholds": thresholds,
+        "offsets": offsets,
+        "starts": starts,
+        "efficiencies": efficiencies,
+    }
+
+
+ED_CURVES = _curve_tables()
+
+
 def apply_ed(schedule: EDSchedule, value: float) -> float:
     """
     Apply Enhancement Diversification to an enhancement value.
@@ -111,11 +172,8 @@ def apply_ed(schedule: EDSchedule, value: float) -> float:
     if value <= thresh1:
         return value
 
-    # Pre-calculate cumulative ED values at each threshold
-    # This matches MidsReborn's approach for efficiency
-    edm1 = thresh1  # Value at end of Region 1
-    edm2 = thresh1 + (thresh2 - thresh1) * ED_EFFICIENCY_REGION_2  # End of Region 2
-    edm3 = edm2 + (thresh3 - thresh2) * ED_EFFICIENCY_REGION_3  # End of Region 3
+    # Cumulative ED values at each threshold (precomputed, as in MidsReborn)
+    edm1, edm2, edm3 = ED_CURVE_VALUES[schedule]
 
     # Region 2: Light ED (90% efficiency)
     if value <= thresh2:
@@ -129,6 +187,71 @@ def apply_ed(schedule: EDSchedule, value: float) -> float:
     return edm3 + (value - thresh3) * ED_EFFICIENCY_REGION_4
 
 
+def apply_ed_array(
+    schedule: EDSchedule | int | Sequence[EDSchedule | int] | np.ndarray,
+    values: float | Sequence[float] | np.ndarray,
+) -> np.ndarray:
+    """
+    Apply Enhancement Diversification to many values at once.
+
+    Vectorized apply_ed() with identical results: each value's region is the
+    number of its schedule's thresholds it exceeds, and the post-ED value is
+    read off the ED_CURVES row for that schedule and region, with no
+    per-value branching.
+
+    Args:
+        schedule: One schedule for every value, or one per value (EDSchedule
+            members or their integer values, e.g. a slotting schedule_index);
+            broadcast against values
+        values: Pre-ED enhancement values
+
+    Returns:
+        float64 array of post-ED values, in the broadcast shape
+
+    Raises:
+        ValueError: If a schedule is not an EDSchedule value
+
+    Examples:
+        >>> apply_ed_array(EDSchedule.A, [0.5, 1.0, 2.0])
+        array([0.5 , 0.95, 1.1 ])
+        >>> apply_ed_array([EDSchedule.A, EDSchedule.B], 1.0)
+        array([0.95, 0.62])
+    """
+    rows = _schedule_rows(schedule)
+    rows, values = np.broadcast_arrays(rows, np.asarray(values, dtype=np.float64))
+    # The NONE and MULTIPLE rows scale by zero, which leaves NaN and inf values
+    # as NaN; apply_ed() returns 0.0 for them, so zero those values first
+    no_ed = (rows == EDSchedule.NONE.value) | (rows == EDSchedule.MULTIPLE.value)
+    values = np.where(no_ed, 0.0, values)
+
+    region = (values[..., np.newaxis] > ED_CURVES["thresholds"][rows]).sum(axis=-1)
+    return (
+        ED_CURVES["offsets"][rows, region]
+        + (values - ED_CURVES["starts"][rows, region])
+        * ED_CURVES["efficiencies"][rows, region]
+    )
+
+
+def _schedule_rows(
+    schedule: EDSchedule | int | Sequence[EDSchedule | int] | np.ndarray,
+) -> np.ndarray:
+    """ED_CURVES row index of each schedule."""
+    if isinstance(schedule, EDSchedule):
+        return np.asarray(schedule.value)
+    if isinstance(schedule, Sequence):
+        schedule = [s.value if isinstance(s, EDSchedule) else s for s in schedule]
+    rows = np.asarray(schedule)
+    if rows.size == 0:
+        # An empty sequence comes back as float64; no schedules is still valid
+        return rows.astype(np.int64)
+    if rows.dtype.kind not in "iu":
+        raise ValueError(f"Invalid ED schedule: {schedule}")
+    invalid = (rows < EDSchedule.NONE.value) | (rows > EDSchedule.MULTIPLE.value)
+    if invalid.any():
+        raise ValueError(f"Invalid ED schedule: {rows[invalid].flat[0]}")
+    return rows
+
+
 def get_schedule(enhance_type: str, enhance_subtype: int | None = None) -> EDSchedule:
     """
     Determine which ED schedule applies to an enhancement type.
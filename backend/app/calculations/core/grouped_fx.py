@@ -3,16 +3,27 @@ GroupedFx - Effect grouping and aggregation system
 
 Maps to MidsReborn's GroupedFx class for aggregating effects from multiple sources.
 Implements FxId composite key and stacking rules.
+
+Composite keys are interned: FX_IDS maps each distinct key to a small integer
+code (and one shared FxId) the first time it is seen. Grouping an EffectTable
+codes every row, then groups with one np.unique plus segmented reductions
+(FxGroups) instead of hashing a key object per effect.
 """
 
-from dataclasses import dataclass
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
 
 from .effect import Effect
+from .effect_table import EffectTable
 from .effect_types import DamageType, EffectType, MezType
 from .enums import PvMode, SpecialCase, Stacking, ToWho
 
 
-@dataclass
+@dataclass(frozen=True)
 class FxId:
     """
     Effect identifier for grouping.
@@ -21,6 +32,7 @@ class FxId:
     Effects with identical FxId values are aggregated together.
 
     This acts as a composite key - effects must match ALL fields to be grouped.
+    The key tuple and its hash are computed once, at construction.
     """
 
     effect_type: EffectType
@@ -33,14 +45,11 @@ class FxId:
     duration: float
     ignore_scaling: bool
 
-    def to_tuple(self) -> tuple:
-        """
-        Convert to hashable tuple for use as dict key.
+    _key: tuple = field(init=False, repr=False, compare=False)
+    _hash: int = field(init=False, repr=False, compare=False)
 
-        Returns:
-            Tuple of all FxId fields
-        """
-        return (
+    def __post_init__(self):
+        key = (
             self.effect_type,
             self.mez_type,
             self.damage_type,
@@ -51,14 +60,25 @@ class FxId:
             self.duration,
             self.ignore_scaling,
         )
+        object.__setattr__(self, "_key", key)
+        object.__setattr__(self, "_hash", hash(key))
+
+    def to_tuple(self) -> tuple:
+        """
+        Convert to hashable tuple for use as dict key.
+
+        Returns:
+            Tuple of all FxId fields
+        """
+        return self._key
 
     def __hash__(self):
-        return hash(self.to_tuple())
+        return self._hash
 
     def __eq__(self, other):
         if not isinstance(other, FxId):
             return False
-        return self.to_tuple() == other.to_tuple()
+        return self._key == other._key
 
     def __repr__(self) -> str:
         return (
@@ -70,6 +90,171 @@ class FxId:
         )
 
 
+# Effect fields making up an FxId, in FxId field order
+FX_KEY_FIELDS: tuple[str, ...] = (
+    "effect_type",
+    "mez_type",
+    "damage_type",
+    "et_modifies",
+    "to_who",
+    "pv_mode",
+    "summon_id",
+    "duration",
+    "ignore_scaling",
+)
+
+
+def fx_key(effect: Effect) -> tuple:
+    """The FxId composite key of an effect, as a plain tuple."""
+    return (
+        effect.effect_type,
+        effect.mez_type,
+        effect.damage_type,
+        effect.et_modifies,
+        effect.to_who,
+        effect.pv_mode,
+        effect.summon_id,
+        effect.duration,
+        effect.ignore_scaling,
+    )
+
+
+class FxIdInterner:
+    """
+    Maps FxId composite keys to small integer codes.
+
+    Each distinct key gets a code (and one FxId) the first time it is seen;
+    after that, coding an effect is one dict lookup on a plain tuple. Codes
+    never change, so codes from different calls compare equal. The number of
+    distinct keys is bounded by the game data.
+    """
+
+    def __init__(self):
+        self._codes: dict[tuple, int] = {}
+        self._fx_ids: list[FxId] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._fx_ids)
+
+    def code(self, key: tuple) -> int:
+        """Code of a composite key (see fx_key), assigned on first use."""
+        code = self._codes.get(key)
+        if code is None:
+            with self._lock:
+                code = self._codes.get(key)
+                if code is None:
+                    code = len(self._fx_ids)
+                    self._fx_ids.append(FxId(*key))
+                    self._codes[key] = code
+        return code
+
+    def fx_id(self, code: int) -> FxId:
+        """The shared FxId for a code."""
+        return self._fx_ids[code]
+
+    def code_table(self, table: EffectTable) -> np.ndarray:
+        """Code of every row of a table (int64 array)."""
+        columns = [getattr(table, name).tolist() for name in FX_KEY_FIELDS]
+        get = self._codes.get
+        keys = list(zip(*columns, strict=True))
+        codes = [get(key) for key in keys]
+        for i, code in enumerate(codes):
+            if code is None:
+                codes[i] = self.code(keys[i])
+        return np.asarray(codes, dtype=np.int64)
+
+
+# Process-wide interner shared by the effect aggregators
+FX_IDS = FxIdInterner()
+
+
+class FxGroups:
+    """
+    Rows of an EffectTable grouped by FxId code.
+
+    Groups are numbered in order of first appearance (the order a dict keyed
+    by FxId would have). The segmented reductions fold each group's values
+    in row order, one operation at a time, so results are bit-identical to
+    the equivalent Python loops.
+
+    Attributes:
+        codes: FxId code of each group
+        first: Row index of each group's first effect
+        row_group: Group number of each row
+        order: Row indices sorted by group (row order kept within a group)
+        sizes: Number of rows in each group
+    """
+
+    def __init__(self, row_codes: np.ndarray):
+        unique, first, inverse = np.unique(
+            row_codes, return_index=True, return_inverse=True
+        )
+        by_appearance = np.argsort(first, kind="stable")
+        rank = np.empty_like(by_appearance)
+        rank[by_appearance] = np.arange(len(by_appearance))
+
+        self.codes: np.ndarray = unique[by_appearance]
+        self.first: np.ndarray = first[by_appearance]
+        self.row_group: np.ndarray = rank[inverse.reshape(-1)]
+        self.order: np.ndarray = np.argsort(self.row_group, kind="stable")
+        self.sizes: np.ndarray = np.bincount(self.row_group, minlength=len(self.codes))
+
+    @classmethod
+    def of(cls, table: EffectTable, interner: FxIdInterner = FX_IDS) -> "FxGroups":
+        """Group a table's rows by FxId."""
+        return cls(interner.code_table(table))
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    @property
+    def last(self) -> np.ndarray:
+        """Row index of each group's last effect."""
+        return self.order[np.cumsum(self.sizes) - 1]
+
+    def sum(self, values: np.ndarray, rows: np.ndarray | None = None) -> np.ndarray:
+        """Per-group sum, added left to right (rows: mask of rows to include)."""
+        out = np.zeros(len(self.codes))
+        if rows is None:
+            np.add.at(out, self.row_group, values)
+        else:
+            np.add.at(out, self.row_group[rows], values[rows])
+        return out
+
+    def prod(self, values: np.ndarray) -> np.ndarray:
+        """Per-group product, multiplied left to right."""
+        out = np.ones(len(self.codes))
+        np.multiply.at(out, self.row_group, values)
+        return out
+
+    def max(self, values: np.ndarray) -> np.ndarray:
+        """Per-group maximum."""
+        out = np.full(len(self.codes), -np.inf)
+        np.maximum.at(out, self.row_group, values)
+        return out
+
+    def row_lists(self, values: np.ndarray) -> list[list[Any]]:
+        """Each group's values in row order, as Python lists."""
+        ordered = values[self.order].tolist()
+        ends = np.cumsum(self.sizes)
+        return [
+            ordered[start:end]
+            for start, end in zip(
+                (ends - self.sizes).tolist(), ends.tolist(), strict=True
+            )
+        ]
+
+    def positions(self) -> np.ndarray:
+        """Position of each row within its group (0 for the first effect)."""
+        starts = np.cumsum(self.sizes) - self.sizes
+        positions = np.empty(len(self.row_group), dtype=np.int64)
+        positions[self.order] = np.arange(len(self.order)) - np.repeat(
+            starts, self.sizes
+        )
+        return positions
+
+
 @dataclass
 class GroupedEffect:
     """
@@ -126,7 +311,7 @@ class EffectAggregator:
     Groups effects by FxId composite key and sums magnitudes.
     """
 
-    def group_effects(self, effects: list[Effect]) -> dict[FxId, GroupedEffect]:
+    def group_effects(self, effects: Iterable[Effect]) -> dict[FxId, GroupedEffect]:
         """
         Group and aggregate effects by FxId.
 
@@ -139,21 +324,26 @@ class EffectAggregator:
         4. Return dictionary of all grouped effects
 
         Args:
-            effects: List of all Effect objects from all sources
+            effects: All Effect objects from all sources (a list or an
+                EffectTable)
 
         Returns:
             Dictionary keyed by FxId, values are GroupedEffect
         """
-        groups: dict[FxId, GroupedEffect] = {}
+        if isinstance(effects, EffectTable):
+            return self._group_table(effects)
+
+        groups: dict[int, GroupedEffect] = {}
 
         for effect in effects:
-            # Create FxId for this effect
-            fx_id = self._create_fx_id(effect)
+            # Interned code for this effect's FxId
+            code = FX_IDS.code(fx_key(effect))
 
-            if fx_id not in groups:
+            group = groups.get(code)
+            if group is None:
                 # First effect of this type - create new group
-                groups[fx_id] = GroupedEffect(
-                    fx_id=fx_id,
+                groups[code] = GroupedEffect(
+                    fx_id=FX_IDS.fx_id(code),
                     magnitude=effect.get_effective_magnitude(),
                     alias=effect.get_display_alias(),
                     included_effects=[effect.unique_id],
@@ -163,9 +353,54 @@ class EffectAggregator:
                 )
             else:
                 # Additional effect of same type - aggregate
-                groups[fx_id].add_effect(effect, effect.stacking)
+                group.add_effect(effect, effect.stacking)
 
-        return groups
+        return {group.fx_id: group for group in groups.values()}
+
+    def _group_table(self, table: EffectTable) -> dict[FxId, GroupedEffect]:
+        """
+        Vectorized group_effects for an EffectTable (same results).
+
+        A group's magnitude restarts at its first effect and at every
+        Stacking.REPLACE effect; YES/STACK effects after the last restart are
+        added to it and Stacking.NO effects are ignored.
+        """
+        groups = FxGroups.of(table)
+        if not len(groups):
+            return {}
+
+        magnitude = table.effective_magnitude
+        stacking = table.stacking
+        positions = groups.positions()
+
+        restart = (positions == 0) | (stacking == Stacking.REPLACE)
+        last_restart = np.zeros(len(groups), dtype=np.int64)
+        np.maximum.at(last_restart, groups.row_group[restart], positions[restart])
+        adds = (positions > last_restart[groups.row_group]) & (
+            (stacking == Stacking.YES) | (stacking == Stacking.STACK)
+        )
+        start_rows = groups.order[np.cumsum(groups.sizes) - groups.sizes + last_restart]
+        totals = magnitude[start_rows]
+        np.add.at(totals, groups.row_group[adds], magnitude[adds])
+
+        firsts = table[groups.first].to_effects()
+        included = groups.row_lists(table.unique_id)
+
+        result: dict[FxId, GroupedEffect] = {}
+        for code, first, total, effect_ids in zip(
+            groups.codes.tolist(), firsts, totals.tolist(), included, strict=True
+        ):
+            fx_id = FX_IDS.fx_id(code)
+            result[fx_id] = GroupedEffect(
+                fx_id=fx_id,
+                magnitude=total,
+                alias=first.get_display_alias(),
+                included_effects=effect_ids,
+                is_enhancement=first.is_enhancement_effect,
+                special_case=first.special_case,
+                is_aggregated=len(effect_ids) > 1,
+            )
+        return result
 
     def _create_fx_id(self, effect: Effect) -> FxId:
         """
@@ -175,19 +410,9 @@ class EffectAggregator:
             effect: Effect to create ID for
 
         Returns:
-            FxId for grouping
+            FxId for grouping (shared with every effect with the same key)
         """
-        return FxId(
-            effect_type=effect.effect_type,
-            mez_type=effect.mez_type,
-            damage_type=effect.damage_type,
-            et_modifies=effect.et_modifies,
-            to_who=effect.to_who,
-            pv_mode=effect.pv_mode,
-            summon_id=effect.summon_id,
-            duration=effect.duration,
-            ignore_scaling=effect.ignore_scaling,
-        )
+        return FX_IDS.fx_id(FX_IDS.code(fx_key(effect)))
 
     def apply_archetype_scaling(
         self, groups: dict[FxId, GroupedEffect], at_scales: dict[EffectType, float]
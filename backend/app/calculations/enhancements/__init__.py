@@ -14,6 +14,7 @@ from .set_bonuses import (
     SlottedSet,
 )
 from .slotting import (
+    SLOT_VALUES,
     EnhancementGrade,
     EnhancementType,
     RelativeLevel,
@@ -21,6 +22,7 @@ from .slotting import (
     SlotEntry,
     SlottedPower,
     SlottingCalculator,
+    SlotValueCache,
 )
 
 __all__ = [
@@ -29,6 +31,8 @@ __all__ = [
     "SlotEntry",
     "SlottedPower",
     "SlottingCalculator",
+    "SlotValueCache",
+    "SLOT_VALUES",
     "EnhancementGrade",
     "EnhancementType",
     "RelativeLevel",
@@ -170,48 +170,66 @@ class SetBonusCalculator:
             if not set_def:
                 continue
 
-            # STEP 1: Check regular bonuses (2-6 piece)
-            # From I9SetData.cs lines 75-98
-            if slotted.slotted_count > 1:
-                for bonus in set_def.bonuses:
-                    # Check if we have enough pieces slotted
-                    if slotted.slotted_count < bonus.slotted_required:
-                        continue
-
-                    # Check PvE/PvP mode
-                    if not self._should_apply_bonus(bonus):
-                        continue
-
-                    # Add bonus powers with Rule of 5
-                    added_powers = self._apply_rule_of_5(bonus.power_ids)
-                    active_bonuses.extend(added_powers)
-
-            # STEP 2: Check special bonuses (per-enhancement)
-            # From I9SetData.cs lines 100-126
-            if slotted.slotted_count > 0:
-                for enh_index, enh_id in enumerate(set_def.enhancement_ids):
-                    # Check if this specific enhancement is slotted
-                    if enh_id not in slotted.enhancement_ids:
-                        continue
-
-                    # Get special bonus for this enhancement (parallel array)
-                    if enh_index >= len(set_def.special_bonuses):
-                        continue
-
-                    special = set_def.special_bonuses[enh_index]
-                    if not special or len(special.power_ids) == 0:
-                        continue
-
-                    # Check PvE/PvP mode
-                    if not self._should_apply_bonus(special):
-                        continue
-
-                    # Add special bonus powers with Rule of 5
-                    added_powers = self._apply_rule_of_5(special.power_ids)
-                    active_bonuses.extend(added_powers)
+            # Add bonus powers with Rule of 5
+            active_bonuses.extend(
+                self._apply_rule_of_5(self.get_set_bonus_powers(slotted, set_def))
+            )
 
         return active_bonuses
 
+    def get_set_bonus_powers(
+        self, slotted: SlottedSet, set_def: EnhancementSet
+    ) -> list[int]:
+        """
+        Bonus power IDs granted by one slotted set, before the Rule of 5.
+
+        Args:
+            slotted: Set pieces slotted in one power
+            set_def: Definition of that set
+
+        Returns:
+            Bonus power IDs, regular bonuses first then special bonuses
+        """
+        power_ids = []
+
+        # STEP 1: Check regular bonuses (2-6 piece)
+        # From I9SetData.cs lines 75-98
+        if slotted.slotted_count > 1:
+            for bonus in set_def.bonuses:
+                # Check if we have enough pieces slotted
+                if slotted.slotted_count < bonus.slotted_required:
+                    continue
+
+                # Check PvE/PvP mode
+                if not self._should_apply_bonus(bonus):
+                    continue
+
+                power_ids.extend(bonus.power_ids)
+
+        # STEP 2: Check special bonuses (per-enhancement)
+        # From I9SetData.cs lines 100-126
+        if slotted.slotted_count > 0:
+            for enh_index, enh_id in enumerate(set_def.enhancement_ids):
+                # Check if this specific enhancement is slotted
+                if enh_id not in slotted.enhancement_ids:
+                    continue
+
+                # Get special bonus for this enhancement (parallel array)
+                if enh_index >= len(set_def.special_bonuses):
+                    continue
+
+                special = set_def.special_bonuses[enh_index]
+                if not special or len(special.power_ids) == 0:
+                    continue
+
+                # Check PvE/PvP mode
+                if not self._should_apply_bonus(special):
+                    continue
+
+                power_ids.extend(special.power_ids)
+
+        return power_ids
+
     def _should_apply_bonus(self, bonus: BonusItem) -> bool:
         """
         Check if bonus applies in current PvE/PvP mode.
@@ -264,6 +282,62 @@ class SetBonusCalculator:
 
         return added
 
+    def add_bonus_powers(self, power_ids: list[int]) -> list[int]:
+        """
+        Count more bonus power instances without resetting the counts.
+
+        Incremental counterpart of calculate_set_bonuses() for builds that
+        change one slot at a time.
+
+        Args:
+            power_ids: Bonus power IDs gained
+
+        Returns:
+            Power IDs whose active count went up (at most 5 instances)
+        """
+        return self._apply_rule_of_5(power_ids)
+
+    def remove_bonus_powers(self, power_ids: list[int]) -> list[int]:
+        """
+        Stop counting bonus power instances previously added.
+
+        Removing one of six or more instances leaves five active, so only
+        power IDs at or below the Rule of 5 limit lose an active instance.
+
+        Args:
+            power_ids: Bonus power IDs lost
+
+        Returns:
+            Power IDs whose active count went down
+        """
+        removed = []
+        for power_id in power_ids:
+            count = self.bonus_power_counts.get(power_id, 0)
+            if count <= 0:
+                raise ValueError(f"Bonus power {power_id} is not counted")
+
+            if count > 1:
+                self.bonus_power_counts[power_id] = count - 1
+            else:
+                del self.bonus_power_counts[power_id]
+
+            if count <= RULE_OF_FIVE_LIMIT:
+                removed.append(power_id)
+
+        return removed
+
+    def get_active_count(self, power_id: int) -> int:
+        """
+        Get how many instances of a bonus power are active (Rule of 5 applied).
+
+        Args:
+            power_id: Bonus power ID
+
+        Returns:
+            Active instances (0-5)
+        """
+        return min(self.bonus_power_counts.get(power_id, 0), RULE_OF_FIVE_LIMIT)
+
     def get_bonus_counts(self) -> dict[int, int]:
         """
         Get count of each bonus power after Rule of 5 applied.
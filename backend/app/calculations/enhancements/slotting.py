@@ -11,10 +11,21 @@ Key features:
 - Enhancement boosters (+0 to +5, each adds ~5.2%)
 - Relative level multipliers for TO/DO/SO
 - Exemplaring and slot availability
+
+Slot values are memoized per process: slots with the same signature (grade,
+level, catalyst, boosters and schedule) share one computed value across every
+calculator using the same multiplier tables.
 """
 
+import threading
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from enum import Enum
+from typing import Any
+
+import numpy as np
+
+from ..core.enhancement_schedules import apply_ed_array
 
 # Constants from MidsReborn
 MAX_SLOTS_PER_POWER = 6
@@ -22,6 +33,9 @@ SUPERIOR_MULTIPLIER = 1.25
 BOOSTER_VALUE_PER_LEVEL = 0.052  # ~5.2% per boost level
 ATTUNED_IO_LEVEL_CAP = 50
 
+# Distinct slot signatures memoized per process
+SLOT_VALUE_CACHE_SIZE = 8192
+
 
 class EnhancementGrade(Enum):
     """Enhancement quality grades (maps to eEnhGrade)."""
@@ -217,6 +231,96 @@ class SlottedPower:
             slot.flip()
 
 
+class SlotValueCache:
+    """
+    Bounded memo of slot values, shared by SlottingCalculator instances.
+
+    Keys are (multiplier tables version, slot signature). Once full, the
+    oldest entries are evicted first; real builds reuse a few hundred
+    signatures, so evictions are rare. Values are plain floats, so a hit
+    returns exactly what the calculation would.
+    """
+
+    def __init__(self, max_entries: int = SLOT_VALUE_CACHE_SIZE):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of memoized slot values
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._values: dict[tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def get(self, key: tuple) -> float | None:
+        """Memoized value for key, or None."""
+        value = self._values.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: tuple, value: float) -> None:
+        """Memoize a value, evicting the oldest entries when full."""
+        with self._lock:
+            values = self._values
+            if key not in values:
+                while values and len(values) >= self.max_entries:
+                    del values[next(iter(values))]
+                    self.evictions += 1
+            values[key] = value
+
+    def clear(self) -> None:
+        """Drop every memoized value (counters are kept)."""
+        with self._lock:
+            self._values.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Entry count and hit/miss/eviction counters."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._values),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups > 0 else 0,
+        }
+
+
+# Process-wide slot value memo
+SLOT_VALUES = SlotValueCache()
+
+# Multiplier tables content -> version number used in SlotValueCache keys
+_table_versions: dict[tuple, int] = {}
+_table_versions_lock = threading.Lock()
+
+
+def _tables_version(mult_tables: dict[str, list[list[float]]]) -> int:
+    """Version of a set of multiplier tables; equal tables share a version."""
+    content = tuple(
+        (name, tuple(tuple(row) for row in rows))
+        for name, rows in sorted(mult_tables.items())
+    )
+    with _table_versions_lock:
+        return _table_versions.setdefault(content, len(_table_versions))
+
+
+# Grades whose value depends on relative level instead of IO level
+_ORIGIN_GRADES = (
+    EnhancementGrade.TRAINING_O,
+    EnhancementGrade.DUAL_O,
+    EnhancementGrade.SINGLE_O,
+)
+
+
 class SlottingCalculator:
     """
     Calculate enhancement values from slotted enhancements.
@@ -226,10 +330,16 @@ class SlottingCalculator:
     them (additively) before ED is applied.
 
     Attributes:
-        mult_tables: Enhancement multiplier tables (TO/DO/SO/IO schedules)
+        mult_tables: Enhancement multiplier tables (TO/DO/SO/IO schedules);
+            assigning new tables invalidates memoized slot values
+        cache: Slot value memo (None disables memoization)
     """
 
-    def __init__(self, mult_tables: dict[str, list[list[float]]]):
+    def __init__(
+        self,
+        mult_tables: dict[str, list[list[float]]],
+        cache: SlotValueCache | None = SLOT_VALUES,
+    ):
         """
         Initialize calculator with multiplier tables.
 
@@ -239,9 +349,24 @@ class SlottingCalculator:
                 - 'MultDO': Dual Origin values [1][4]
                 - 'MultSO': Single Origin values [1][4]
                 - 'MultIO': Invention Origin values [53][4]
+            cache: Slot value memo; defaults to the one shared by the process
         """
+        self.cache = cache
         self.mult_tables = mult_tables
 
+    @property
+    def mult_tables(self) -> dict[str, list[list[float]]]:
+        return self._mult_tables
+
+    @mult_tables.setter
+    def mult_tables(self, mult_tables: dict[str, list[list[float]]]) -> None:
+        self._mult_tables = mult_tables
+        self._tables_version = _tables_version(mult_tables)
+
+    def invalidate_cache(self) -> None:
+        """Stop using memoized values after mult_tables were modified in place."""
+        self._tables_version = _tables_version(self._mult_tables)
+
     def get_relative_level_multiplier(self, relative_level: RelativeLevel) -> float:
         """
         Get enhancement strength multiplier based on relative level.
@@ -301,17 +426,134 @@ class SlottingCalculator:
         if slot.is_empty:
             return 0.0
 
+        if self.cache is None:
+            return self._compute_slot_value(
+                slot, schedule_index, character_level, set_min_level, set_max_level
+            )
+
+        key = self.slot_signature(
+            slot, schedule_index, character_level, set_min_level, set_max_level
+        )
+        value = self.cache.get(key)
+        if value is None:
+            value = self._compute_slot_value(
+                slot, schedule_index, character_level, set_min_level, set_max_level
+            )
+            self.cache.set(key, value)
+        return value
+
+    def slot_signature(
+        self,
+        slot: Slot,
+        schedule_index: int,
+        character_level: int = 50,
+        set_min_level: int = 1,
+        set_max_level: int = 53,
+    ) -> tuple:
+        """
+        Memo key of a slot's value: everything calculate_slot_value reads.
+
+        Slots with equal signatures have equal values, whatever their
+        enhancement ID or the build they are in.
+
+        Returns:
+            (tables version, schedule, grade, relative level, IO level or
+            attuned level, catalyzed, boost level)
+        """
+        if slot.is_attuned:
+            level = self._get_attuned_level(
+                character_level, set_min_level, set_max_level
+            )
+        else:
+            level = slot.io_level
+        return self._slot_key(slot, schedule_index, level)
+
+    def _slot_key(self, slot: Slot, schedule_index: int, level: int) -> tuple:
+        # Raw enum values: Enum.__hash__ is slower than the value calculation
+        return (
+            self._tables_version,
+            schedule_index,
+            slot.grade._value_,
+            slot.relative_level._value_,
+            level,
+            slot.is_catalyzed,
+            slot.boost_level if slot.is_boosted else 0,
+        )
+
+    def calculate_slot_values(
+        self,
+        aspects: Sequence[tuple[SlottedPower, int]],
+        character_level: int = 50,
+        set_min_level: int = 1,
+        set_max_level: int = 53,
+        exemplar_level: int | None = None,
+    ) -> list[list[float]]:
+        """
+        Calculate the value of every slot of a build in one call.
+
+        Values come from the memo; with memoization disabled, equal slots
+        are still only computed once per call.
+
+        Args:
+            aspects: (slotted_power, schedule_index) pairs
+            character_level: Current character level
+            set_min_level: Minimum set level (for attuned)
+            set_max_level: Maximum set level (for attuned)
+            exemplar_level: If exemplared, level to exemplar to
+
+        Returns:
+            Per aspect, the value of each slot in order (0.0 for empty slots
+            and slots inactive at the exemplar level)
+        """
+        cache = self.cache if self.cache is not None else SlotValueCache()
+        attuned_level = self._get_attuned_level(
+            character_level, set_min_level, set_max_level
+        )
+        result = []
+        for slotted_power, schedule_index in aspects:
+            slot_values = []
+            for slot_entry in slotted_power.slots:
+                slot = slot_entry.enhancement
+                if slot.is_empty or (
+                    exemplar_level is not None and slot_entry.level > exemplar_level
+                ):
+                    slot_values.append(0.0)
+                    continue
+                key = self._slot_key(
+                    slot,
+                    schedule_index,
+                    attuned_level if slot.is_attuned else slot.io_level,
+                )
+                value = cache.get(key)
+                if value is None:
+                    value = self._compute_slot_value(
+                        slot,
+                        schedule_index,
+                        character_level,
+                        set_min_level,
+                        set_max_level,
+                    )
+                    cache.set(key, value)
+                slot_values.append(value)
+            result.append(slot_values)
+        return result
+
+    def _compute_slot_value(
+        self,
+        slot: Slot,
+        schedule_index: int,
+        character_level: int,
+        set_min_level: int,
+        set_max_level: int,
+    ) -> float:
+        """Uncached calculate_slot_value for a non-empty slot."""
         # Get base multiplier by enhancement type
         base_mult = self._get_base_multiplier(
             slot, schedule_index, character_level, set_min_level, set_max_level
         )
 
         # Apply relative level multiplier (TO/DO/SO only)
-        if slot.grade in (
-            EnhancementGrade.TRAINING_O,
-            EnhancementGrade.DUAL_O,
-            EnhancementGrade.SINGLE_O,
-        ):
+        if slot.grade in _ORIGIN_GRADES:
             rel_mult = self.get_relative_level_multiplier(slot.relative_level)
             base_mult *= rel_mult
 
@@ -419,6 +661,55 @@ class SlottingCalculator:
 
         return total
 
+    def calculate_enhanced_totals(
+        self,
+        aspects: Sequence[tuple[SlottedPower, int]],
+        character_level: int = 50,
+        set_min_level: int = 1,
+        set_max_level: int = 53,
+        exemplar_level: int | None = None,
+    ) -> np.ndarray:
+        """
+        Calculate post-ED enhancement values for many aspects at once.
+
+        Each aspect is a (slotted power, schedule index) pair, e.g. every
+        enhanced attribute of every power in a build. Pre-ED totals are
+        summed per aspect as in calculate_total_enhancement(), then ED is
+        applied to all of them in one apply_ed_array() call.
+
+        Args:
+            aspects: (slotted_power, schedule_index) pairs
+            character_level: Current character level
+            set_min_level: Minimum set level (for attuned)
+            set_max_level: Maximum set level (for attuned)
+            exemplar_level: If exemplared, level to exemplar to
+
+        Returns:
+            float64 array of post-ED values, one per aspect
+
+        Examples:
+            >>> # Three Level 50 Damage IOs and three Level 50 Defense IOs
+            >>> calculator.calculate_enhanced_totals([(attack, 0), (armor, 1)])
+            array([0.9908, 0.602 ])  # 127.2% and 78% before ED
+        """
+        totals = [
+            self.calculate_total_enhancement(
+                slotted_power,
+                schedule_index,
+                character_level,
+                set_min_level,
+                set_max_level,
+                exemplar_level,
+            )
+            for slotted_power, schedule_index in aspects
+        ]
+        schedules = np.fromiter(
+            (schedule_index for _, schedule_index in aspects),
+            dtype=np.int64,
+            count=len(aspects),
+        )
+        return apply_ed_array(schedules, totals)
+
     def _get_active_slot_indices(
         self, slotted_power: SlottedPower, exemplar_level: int | None
     ) -> list[int]:
@@ -14,6 +14,7 @@ from dataclasses import dataclass
 from enum import Enum
 
 from ..core.effect import Effect
+from ..core.effect_table import Effects, EffectTable
 from ..core.effect_types import DamageType as CoreDamageType
 from ..core.effect_types import EffectType
 from ..core.enums import ToWho
@@ -201,7 +202,7 @@ class DamageCalculator:
 
     def calculate_power_damage(
         self,
-        power_effects: list[Effect],
+        power_effects: Effects,
         power_type: PowerType,
         power_recharge_time: float = 0.0,
         power_cast_time: float = 0.0,
@@ -215,7 +216,7 @@ class DamageCalculator:
         Implementation from Power.cs FXGetDamageValue() lines 861-940.
 
         Args:
-            power_effects: All Effect objects from power
+            power_effects: All Effect objects (or an EffectTable) from power
             power_type: Toggle, Click, Auto, etc.
             power_recharge_time: Base recharge in seconds
             power_cast_time: Animation time in seconds
@@ -231,6 +232,13 @@ class DamageCalculator:
         has_pvp_difference = False
         has_toggle_enhancements = False
 
+        if isinstance(power_effects, EffectTable):
+            # Skip materializing rows that can't contribute damage
+            power_effects = power_effects[
+                (power_effects.effect_type == EffectType.DAMAGE)
+                & (power_effects.probability > 0)
+            ]
+
         for effect in power_effects:
             # STEP 1: Filter to damage effects (line 877)
             if effect.effect_type != EffectType.DAMAGE:
@@ -11,7 +11,7 @@ Implementation from Spec 09 (Power Defense/Resistance).
 from dataclasses import dataclass
 from enum import Enum
 
-from app.calculations.core.effect import Effect
+from app.calculations.core.effect_table import Effects, EffectTable
 from app.calculations.core.effect_types import EffectType
 
 
@@ -140,6 +140,14 @@ class DebuffResistanceValues:
     tohit: float = 0.0  # Reduces tohit debuffs
 
 
+def _contributing_rows(effects: EffectTable, effect_type: EffectType) -> EffectTable:
+    """
+    Rows of effect_type with probability > 0, selected with one vectorized
+    mask so only those rows are materialized as Effects.
+    """
+    return effects[(effects.effect_type == effect_type) & (effects.probability > 0)]
+
+
 class DefenseCalculator:
     """
     Calculates defense and resistance values including debuffs and caps.
@@ -163,7 +171,7 @@ class DefenseCalculator:
         """
         self.resistance_cap = archetype_resistance_cap
 
-    def extract_defense_from_power(self, effects: list[Effect]) -> DefenseValues:
+    def extract_defense_from_power(self, effects: Effects) -> DefenseValues:
         """
         Extract defense values from a power's effects.
 
@@ -171,12 +179,14 @@ class DefenseCalculator:
         Build-level aggregation is handled by build totals calculators.
 
         Args:
-            effects: List of Effect objects from a single power
+            effects: Effect objects or an EffectTable from a single power
 
         Returns:
             DefenseValues with defense from this power
         """
         defense = DefenseValues()
+        if isinstance(effects, EffectTable):
+            effects = _contributing_rows(effects, EffectType.DEFENSE)
 
         for effect in effects:
             # Filter: Only include defense effects
@@ -206,7 +216,7 @@ class DefenseCalculator:
 
         return defense
 
-    def extract_resistance_from_power(self, effects: list[Effect]) -> ResistanceValues:
+    def extract_resistance_from_power(self, effects: Effects) -> ResistanceValues:
         """
         Extract resistance values from a power's effects.
 
@@ -214,12 +224,14 @@ class DefenseCalculator:
         Build-level aggregation is handled by build totals calculators.
 
         Args:
-            effects: List of Effect objects from a single power
+            effects: Effect objects or an EffectTable from a single power
 
         Returns:
             ResistanceValues with resistance from this power
         """
         resistance = ResistanceValues()
+        if isinstance(effects, EffectTable):
+            effects = _contributing_rows(effects, EffectType.RESISTANCE)
 
         for effect in effects:
             # Filter: Only include resistance effects
@@ -243,13 +255,13 @@ class DefenseCalculator:
         return resistance
 
     def extract_debuff_resistance_from_power(
-        self, effects: list[Effect]
+        self, effects: Effects
     ) -> DebuffResistanceValues:
         """
         Extract debuff resistance values from a power's effects.
 
         Args:
-            effects: List of Effect objects from a single power
+            effects: Effect objects or an EffectTable from a single power
 
         Returns:
             DebuffResistanceValues with DDR and other debuff resistances
@@ -14,7 +14,7 @@ Based on:
 from dataclasses import dataclass
 from enum import Enum
 
-from ..core.effect import Effect
+from ..core.effect_table import Effects
 from ..core.effect_types import EffectType
 
 
@@ -143,7 +143,7 @@ class EnduranceCalculator:
         base_end_cost: float,
         activate_period: float,
         power_type: PowerType,
-        end_discount_effects: list[Effect],
+        end_discount_effects: Effects,
     ) -> EnduranceCostResult:
         """
         Calculate modified endurance cost for a power.
@@ -204,7 +204,7 @@ class EnduranceCalculator:
         )
 
     def calculate_recovery_rate(
-        self, recovery_effects: list[Effect], max_endurance: float
+        self, recovery_effects: Effects, max_endurance: float
     ) -> RecoveryResult:
         """
         Calculate endurance recovery rate.
@@ -277,7 +277,7 @@ class EnduranceCalculator:
             uncapped_percentage=uncapped_percentage if is_capped else None,
         )
 
-    def calculate_max_endurance(self, endurance_effects: list[Effect]) -> float:
+    def calculate_max_endurance(self, endurance_effects: Effects) -> float:
         """
         Calculate maximum endurance from Endurance effects.
 
@@ -474,9 +474,7 @@ def validate_power_endurance_config(
         )
 
 
-def validate_recovery_config(
-    max_endurance: float, recovery_effects: list[Effect]
-) -> None:
+def validate_recovery_config(max_endurance: float, recovery_effects: Effects) -> None:
     """
     Validate recovery configuration.
 
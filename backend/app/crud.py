@@ -2,71 +2,279 @@
 CRUD operations for Mids-Web backend.
 """
 
-from sqlalchemy.orm import Session
+import json
+from typing import Any
+
+from sqlalchemy import Select, cast, exists, func, literal, or_, select
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload, undefer, undefer_group
 
 from . import models, schemas
+from .pagination import fetch_page
+
+
+def _contains(column, text: str):
+    """Case-insensitive substring match (served by the pg_trgm GIN indexes)."""
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return column.ilike(f"%{escaped}%", escape="\\")
+
+
+async def _get_by_ids(db: AsyncSession, model: Any, ids: list[int]) -> list[Any]:
+    """Rows of model with the given IDs, in one query (unknown IDs are skipped)."""
+    if not ids:
+        return []
+    result = await db.scalars(select(model).where(model.id.in_(set(ids))))
+    return list(result)
 
 
-def get_archetype(db: Session, archetype_id: int) -> models.Archetype | None:
+async def get_archetype(db: AsyncSession, archetype_id: int) -> models.Archetype | None:
     """Get an archetype by ID."""
-    return (
-        db.query(models.Archetype).filter(models.Archetype.id == archetype_id).first()
-    )
+    return await db.get(models.Archetype, archetype_id)
 
 
-def get_archetypes(
-    db: Session, skip: int = 0, limit: int = 100
+async def get_archetypes(
+    db: AsyncSession, skip: int = 0, limit: int = 100
 ) -> list[models.Archetype]:
     """Get all archetypes."""
-    return db.query(models.Archetype).offset(skip).limit(limit).all()
+    result = await db.scalars(select(models.Archetype).offset(skip).limit(limit))
+    return list(result)
 
 
-def create_archetype(
-    db: Session, archetype: schemas.ArchetypeCreate
+async def create_archetype(
+    db: AsyncSession, archetype: schemas.ArchetypeCreate
 ) -> models.Archetype:
     """Create a new archetype."""
-    db_archetype = models.Archetype(**archetype.dict())
+    db_archetype = models.Archetype(**archetype.model_dump())
     db.add(db_archetype)
-    db.commit()
-    db.refresh(db_archetype)
+    await db.commit()
+    await db.refresh(db_archetype)
     return db_archetype
 
 
-def get_powerset(db: Session, powerset_id: int) -> models.Powerset | None:
-    """Get a powerset by ID."""
-    return db.query(models.Powerset).filter(models.Powerset.id == powerset_id).first()
+async def get_powerset(
+    db: AsyncSession, powerset_id: int, include_powers: bool = False
+) -> models.Powerset | None:
+    """Get a powerset by ID.
+
+    include_powers=True loads Powerset.powers with one extra SELECT ... IN
+    query, so serializing the powers never lazy-loads.
+    """
+    options = [selectinload(models.Powerset.powers)] if include_powers else []
+    return await db.get(models.Powerset, powerset_id, options=options)
+
 
+async def get_powersets_by_ids(
+    db: AsyncSession, powerset_ids: list[int]
+) -> list[models.Powerset]:
+    """Get powersets by ID in one query."""
+    return await _get_by_ids(db, models.Powerset, powerset_ids)
 
-def get_powersets_by_archetype(db: Session, archetype_id: int) -> list[models.Powerset]:
+
+async def get_powersets_by_archetype(
+    db: AsyncSession, archetype_id: int
+) -> list[models.Powerset]:
     """Get all powersets for an archetype."""
-    return (
-        db.query(models.Powerset)
-        .filter(models.Powerset.archetype_id == archetype_id)
-        .all()
+    result = await db.scalars(
+        select(models.Powerset).where(models.Powerset.archetype_id == archetype_id)
     )
+    return list(result)
 
 
-def get_power(db: Session, power_id: int) -> models.Power | None:
-    """Get a power by ID."""
-    return db.query(models.Power).filter(models.Power.id == power_id).first()
+async def get_power(
+    db: AsyncSession, power_id: int, include_blobs: bool = False
+) -> models.Power | None:
+    """Get a power by ID.
 
+    The power_data/source_metadata JSON columns are deferred; pass
+    include_blobs=True to load them in the same query.
+    """
+    options = [undefer_group(models.POWER_BLOBS)] if include_blobs else []
+    return await db.get(models.Power, power_id, options=options)
 
-def get_powers_by_powerset(db: Session, powerset_id: int) -> list[models.Power]:
-    """Get all powers for a powerset."""
-    return db.query(models.Power).filter(models.Power.powerset_id == powerset_id).all()
 
+async def get_powers_by_powerset(
+    db: AsyncSession, powerset_id: int, include_power_data: bool = False
+) -> list[models.Power]:
+    """Get all powers for a powerset (power_data only if requested)."""
+    query = select(models.Power).where(models.Power.powerset_id == powerset_id)
+    if include_power_data:
+        query = query.options(undefer(models.Power.power_data))
+    result = await db.scalars(query)
+    return list(result)
+
+
+def _json_array_contains(column, value: Any, dialect: str):
+    """`column @> '[value]'` on PostgreSQL (GIN jsonb_path_ops); json_each elsewhere."""
+    if dialect == "postgresql":
+        return column.op("@>")(cast(literal(json.dumps([value])), JSONB))
+    elements = func.json_each(column).table_valued("value")
+    return exists().where(elements.c.value == value)
+
+
+def power_search_query(
+    dialect: str,
+    *,
+    name: str | None = None,
+    power_type: str | None = None,
+    min_level: int | None = None,
+    max_level: int | None = None,
+    powerset_id: int | None = None,
+    archetype: str | None = None,
+    tag: str | None = None,
+    boostset_category: str | None = None,
+) -> Select:
+    """Filtered (unordered) Power select for search_powers."""
+    query = select(models.Power)
+    if name:
+        query = query.where(
+            or_(
+                _contains(models.Power.name, name),
+                _contains(models.Power.display_name, name),
+            )
+        )
+    if power_type:
+        query = query.where(models.Power.type == power_type)
+    if min_level is not None:
+        query = query.where(models.Power.available_level >= min_level)
+    if max_level is not None:
+        query = query.where(models.Power.available_level <= max_level)
+    if powerset_id is not None:
+        query = query.where(models.Power.powerset_id == powerset_id)
+    if archetype:
+        # Archetype class names are stored lower case, e.g. "brute"
+        query = query.where(
+            _json_array_contains(models.Power.archetypes, archetype.lower(), dialect)
+        )
+    if tag:
+        query = query.where(_json_array_contains(models.Power.tags, tag, dialect))
+    if boostset_category:
+        query = query.where(
+            _json_array_contains(
+                models.Power.allowed_boostset_cats, boostset_category, dialect
+            )
+        )
+    return query
+
+
+async def search_powers(
+    db: AsyncSession,
+    *,
+    cursor: str | None = None,
+    limit: int = 100,
+    **filters: Any,
+) -> tuple[list[models.Power], str | None]:
+    """Search powers, ordered by (available_level, id).
+
+    Filters are the keyword arguments of power_search_query. Name matches the
+    internal or display name anywhere in the string.
+
+    Returns:
+        The powers and the cursor of the next page
+    """
+    query = power_search_query(db.get_bind().dialect.name, **filters)
+    return await fetch_page(
+        db, query, models.Power.available_level, models.Power.id, cursor, limit
+    )
 
-def get_enhancements(
-    db: Session, skip: int = 0, limit: int = 100
-) -> list[models.Enhancement]:
-    """Get all enhancements."""
-    return db.query(models.Enhancement).offset(skip).limit(limit).all()
 
+async def get_enhancements(
+    db: AsyncSession,
+    *,
+    name: str | None = None,
+    boost_type: str | None = None,
+    set_id: int | None = None,
+    cursor: str | None = None,
+    limit: int = 100,
+) -> tuple[list[models.Enhancement], str | None]:
+    """Get a page of enhancements ordered by (level_min, id).
 
-def get_enhancement(db: Session, enhancement_id: int) -> models.Enhancement | None:
+    Returns:
+        The enhancements and the cursor of the next page
+    """
+    query = select(models.Enhancement)
+    if name:
+        query = query.where(_contains(models.Enhancement.name, name))
+    if boost_type:
+        query = query.where(models.Enhancement.boost_type == boost_type)
+    if set_id is not None:
+        query = query.where(models.Enhancement.set_id == set_id)
+    return await fetch_page(
+        db,
+        query,
+        models.Enhancement.level_min,
+        models.Enhancement.id,
+        cursor,
+        limit,
+    )
+
+
+async def get_enhancement(
+    db: AsyncSession, enhancement_id: int
+) -> models.Enhancement | None:
     """Get an enhancement by ID."""
-    return (
-        db.query(models.Enhancement)
-        .filter(models.Enhancement.id == enhancement_id)
-        .first()
+    return await db.get(models.Enhancement, enhancement_id)
+
+
+async def get_enhancements_by_ids(
+    db: AsyncSession, enhancement_ids: list[int]
+) -> list[models.Enhancement]:
+    """Get enhancements by ID in one query."""
+    return await _get_by_ids(db, models.Enhancement, enhancement_ids)
+
+
+async def get_enhancement_sets(
+    db: AsyncSession,
+    *,
+    name: str | None = None,
+    group_name: str | None = None,
+    cursor: str | None = None,
+    limit: int = 100,
+) -> tuple[list[models.EnhancementSet], str | None]:
+    """Get a page of enhancement sets ordered by (min_level, id).
+
+    Returns:
+        The enhancement sets and the cursor of the next page
+    """
+    query = select(models.EnhancementSet)
+    if name:
+        query = query.where(_contains(models.EnhancementSet.name, name))
+    if group_name:
+        query = query.where(models.EnhancementSet.group_name == group_name)
+    return await fetch_page(
+        db,
+        query,
+        models.EnhancementSet.min_level,
+        models.EnhancementSet.id,
+        cursor,
+        limit,
+    )
+
+
+async def get_enhancement_set(
+    db: AsyncSession, set_id: int, include_enhancements: bool = False
+) -> models.EnhancementSet | None:
+    """Get an enhancement set by ID (and its enhancements, if requested)."""
+    options = (
+        [selectinload(models.EnhancementSet.enhancements)]
+        if include_enhancements
+        else []
+    )
+    return await db.get(models.EnhancementSet, set_id, options=options)
+
+
+async def get_enhancement_sets_by_ids(
+    db: AsyncSession, set_ids: list[int]
+) -> list[models.EnhancementSet]:
+    """Get enhancement sets by ID in one query."""
+    return await _get_by_ids(db, models.EnhancementSet, set_ids)
+
+
+async def get_enhancements_by_set(
+    db: AsyncSession, set_id: int
+) -> list[models.Enhancement]:
+    """Get all enhancements in a set."""
+    result = await db.scalars(
+        select(models.Enhancement).where(models.Enhancement.set_id == set_id)
     )
+    return list(result)
@@ -9,6 +9,7 @@ from sqlalchemy.orm import Session
 
 from app.data_import.importers.archetype_importer import ArchetypeImporter
 from app.data_import.importers.enhancement_importer import EnhancementImporter
+from app.data_import.importers.power_importer import PowerImporter
 from app.database import SessionLocal
 
 logging.basicConfig(level=logging.INFO)
@@ -87,13 +88,52 @@ async def import_enhancements(
             db_session.close()
 
 
+async def import_powers(
+    directory_path: str, db_session: Session = None, workers: int | None = None
+) -> dict[str, Any]:
+    """Import all powersets and powers from a filtered_data/powers directory"""
+    close_session = False
+    if db_session is None:
+        db_session = SessionLocal()
+        close_session = True
+
+    try:
+        directory = Path(directory_path)
+        importer = PowerImporter(db_session)
+
+        logger.info(f"Importing powersets and powers from {directory}")
+        result = await importer.import_all_powersets(directory, workers=workers)
+
+        logger.info(
+            f"Power import complete: {result['powersets_imported']} powersets, "
+            f"{result['powers_imported']} powers, {result['skipped']} skipped, "
+            f"{len(result['errors'])} errors"
+        )
+        for stage, stats in result["stages"].items():
+            logger.info(
+                f"  {stage}: {stats['items']} items in {stats['seconds']}s "
+                f"({stats['items_per_second']}/s, {stats['mb']} MB)"
+            )
+
+        return {
+            "total_powersets": result["powersets_imported"],
+            "total_powers": result["powers_imported"],
+            "total_skipped": result["skipped"],
+            "errors": result["errors"],
+            "stages": result["stages"],
+        }
+    finally:
+        if close_session:
+            db_session.close()
+
+
 def main():
     """Main CLI entry point"""
     import sys
 
     if len(sys.argv) < 3:
         print("Usage: python -m app.data_import.cli <command> <directory>")
-        print("Commands: archetypes, enhancements, all")
+        print("Commands: archetypes, enhancements, powers, all")
         sys.exit(1)
 
     command = sys.argv[1]
@@ -103,8 +143,11 @@ def main():
         asyncio.run(import_archetypes(directory))
     elif command == "enhancements":
         asyncio.run(import_enhancements(directory))
+    elif command == "powers":
+        asyncio.run(import_powers(directory))
     elif command == "all":
         asyncio.run(import_archetypes(f"{directory}/archetypes"))
+        asyncio.run(import_powers(f"{directory}/powers"))
         asyncio.run(import_enhancements(f"{directory}/boost_sets"))
     else:
         print(f"Unknown command: {command}")
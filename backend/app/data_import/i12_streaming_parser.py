@@ -1,5 +1,6 @@
 """Streaming JSON parser for I12 power data (360K+ entries)."""
 
+import codecs
 import json
 import logging
 import time
@@ -11,60 +12,198 @@ import psutil
 from sqlalchemy.orm import Session
 
 from app.models import Archetype, Power, Powerset
+from app.services.build_summary_view import VIEW_NAME, refresh_power_build_summary
 
 from .base_importer import BaseImporter
 
 logger = logging.getLogger(__name__)
 
 
+# Parser states for StreamingJsonReader
+_EXPECT_ARRAY = 0  # before the opening '['
+_EXPECT_FIRST = 1  # after '[': a record or ']'
+_EXPECT_RECORD = 2  # after ',': a record
+_AFTER_RECORD = 3  # after a record: ',' or ']'
+_DONE = 4  # after the closing ']'
+
+_WHITESPACE = " \t\n\r"
+# Characters that can continue a JSON number after a read boundary
+_NUMBER_CHARS = frozenset("0123456789.eE+-")
+
+
 class StreamingJsonReader:
-    """Streaming JSON reader for large files."""
+    """Incremental reader for files holding one top-level JSON array.
 
-    def __init__(self, chunk_size: int = 1000):
+    Records are decoded one at a time from a small sliding buffer, so memory
+    stays constant in the number of records. Progress is reported in bytes,
+    and ``offset`` (the byte position just after the last record handed out)
+    can be passed back as ``start_offset`` to resume after a crash.
+    """
+
+    def __init__(self, chunk_size: int = 1000, read_size: int = 1 << 16):
         """Initialize streaming reader.
 
         Args:
             chunk_size: Number of records to read per chunk
+            read_size: Number of bytes to read from the file at a time
         """
         self.chunk_size = chunk_size
+        self.read_size = read_size
+        self.offset = 0
+        self.total_bytes = 0
+
+    def iter_records(
+        self, file_path: Path, start_offset: int = 0
+    ) -> Generator[tuple[Any, int], None, None]:
+        """Yield (record, end byte offset) pairs from the top-level array.
+
+        Args:
+            file_path: Path to JSON file
+            start_offset: 0, or an end offset previously yielded for this file
+
+        Raises:
+            json.JSONDecodeError: If the file is not a well-formed JSON array
+                (or start_offset is not a record boundary)
+        """
+        decoder = json.JSONDecoder()
+        utf8 = codecs.getincrementaldecoder("utf-8")()
+        state = _EXPECT_ARRAY if start_offset == 0 else _AFTER_RECORD
+
+        with open(file_path, "rb") as f:
+            f.seek(start_offset)
+            buffer = ""
+            pos = 0
+            # Byte offset of buffer[mark], advanced lazily as records complete
+            mark = 0
+            mark_offset = start_offset
+            eof = False
+
+            def fill(min_chars: int) -> bool:
+                """Append at least min_chars bytes; False once the file is done."""
+                nonlocal buffer, pos, mark, eof
+                if eof:
+                    return False
+                # Drop consumed text so the buffer only holds the current record
+                if mark > 0:
+                    buffer = buffer[mark:]
+                    pos -= mark
+                    mark = 0
+                data = f.read(max(self.read_size, min_chars))
+                if not data:
+                    eof = True
+                    buffer += utf8.decode(b"", final=True)
+                    return False
+                buffer += utf8.decode(data)
+                return True
+
+            while state != _DONE:
+                while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                    pos += 1
+                if pos == len(buffer):
+                    if fill(0):
+                        continue
+                    raise json.JSONDecodeError(
+                        "Unexpected end of file in JSON array", buffer, pos
+                    )
+
+                char = buffer[pos]
+                if state == _EXPECT_ARRAY:
+                    if char != "[":
+                        raise json.JSONDecodeError(
+                            "Expecting '[': file must contain an array of records",
+                            buffer,
+                            pos,
+                        )
+                    pos += 1
+                    state = _EXPECT_FIRST
+                elif state == _AFTER_RECORD:
+                    if char not in ",]":
+                        raise json.JSONDecodeError(
+                            "Expecting ',' or ']' after record", buffer, pos
+                        )
+                    pos += 1
+                    state = _EXPECT_RECORD if char == "," else _DONE
+                elif state == _EXPECT_FIRST and char == "]":
+                    pos += 1
+                    state = _DONE
+                else:
+                    try:
+                        record, end = decoder.raw_decode(buffer, pos)
+                    except json.JSONDecodeError:
+                        record, end = None, None
+                    # A record touching the end of the buffer may be truncated
+                    # (a failed decode, or a number cut mid-digit, mid-fraction
+                    # or mid-exponent, e.g. "1500." read as 1500), so read more
+                    if end is None or (
+                        not eof
+                        and (
+                            end == len(buffer)
+                            or (
+                                isinstance(record, int | float)
+                                and _NUMBER_CHARS.issuperset(buffer[end:])
+                            )
+                        )
+                    ):
+                        if fill(len(buffer)):
+                            continue
+                        if end is None:
+                            decoder.raw_decode(buffer, pos)  # re-raise with context
+                    mark_offset += len(buffer[mark:end].encode("utf-8"))
+                    mark = pos = end
+                    state = _AFTER_RECORD
+                    yield record, mark_offset
+
+            # Only whitespace may follow the closing bracket
+            while True:
+                if buffer[pos:].strip(_WHITESPACE):
+                    raise json.JSONDecodeError(
+                        "Extra data after JSON array", buffer, pos
+                    )
+                pos = len(buffer)
+                if not fill(0):
+                    break
 
     def read_chunks(
         self,
         file_path: Path,
         progress_callback: Callable[[int, int, float], None] | None = None,
+        start_offset: int = 0,
     ) -> Generator[list[dict[str, Any]], None, None]:
         """Read JSON file in chunks to control memory usage.
 
+        After each chunk is yielded, ``offset`` is the checkpoint just past
+        its last record.
+
         Args:
             file_path: Path to JSON file
-            progress_callback: Optional callback for progress updates
+            progress_callback: Optional callback receiving
+                (bytes_read, total_bytes, percentage) after each chunk
+            start_offset: Byte offset checkpoint to resume from
 
         Yields:
             Lists of records (chunks)
         """
+        self.offset = start_offset
         try:
-            with open(file_path, encoding="utf-8") as f:
-                # Load the entire JSON first to get total count
-                # This is a trade-off for progress tracking
-                data = json.load(f)
-
-                if not isinstance(data, list):
-                    raise ValueError("JSON file must contain an array of records")
-
-                total_records = len(data)
-                processed = 0
-
-                # Process in chunks
-                for i in range(0, total_records, self.chunk_size):
-                    chunk = data[i : i + self.chunk_size]
-                    processed += len(chunk)
-
-                    # Call progress callback if provided
-                    if progress_callback:
-                        percentage = (processed / total_records) * 100
-                        progress_callback(processed, total_records, percentage)
-
-                    yield chunk
+            self.total_bytes = file_path.stat().st_size
+            if start_offset >= self.total_bytes > 0:
+                return  # checkpoint from a completed read
+
+            chunk: list[dict[str, Any]] = []
+            chunk_end = start_offset
+            for record, end in self.iter_records(file_path, start_offset):
+                chunk.append(record)
+                chunk_end = end
+                if len(chunk) >= self.chunk_size:
+                    yield self._emit(chunk, chunk_end, progress_callback)
+                    chunk = []
+
+            # The array is complete, so the whole file has been read
+            chunk_end = self.total_bytes
+            if chunk:
+                yield self._emit(chunk, chunk_end, progress_callback)
+            else:
+                self.offset = chunk_end
 
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON in file {file_path}: {e}")
@@ -73,6 +212,24 @@ class StreamingJsonReader:
             logger.error(f"Error reading file {file_path}: {e}")
             raise
 
+    def _emit(
+        self,
+        chunk: list[dict[str, Any]],
+        end_offset: int,
+        progress_callback: Callable[[int, int, float], None] | None,
+    ) -> list[dict[str, Any]]:
+        self.offset = end_offset
+        if progress_callback:
+            progress_callback(end_offset, self.total_bytes, self.percentage)
+        return chunk
+
+    @property
+    def percentage(self) -> float:
+        """Share of the file consumed so far."""
+        if self.total_bytes <= 0:
+            return 100.0
+        return (self.offset / self.total_bytes) * 100
+
 
 class PowerDataProcessor:
     """Processor for transforming I12 power data."""
@@ -327,6 +484,8 @@ class I12StreamingParser(BaseImporter):
         self.imported_count = 0
         self.error_count = 0
         self.errors: list[dict[str, Any]] = []
+        self.checkpoint_offset = 0
+        self.summary_refreshed = False
 
     def get_import_type(self) -> str:
         """Get the type of import for logging."""
@@ -349,13 +508,20 @@ class I12StreamingParser(BaseImporter):
         file_path: Path,
         resume_from: int = 0,
         progress_callback: Callable[[int, int, float], None] | None = None,
+        resume_offset: int = 0,
     ) -> None:
         """Import I12 power data with streaming and progress tracking.
 
+        ``checkpoint_offset`` is updated after every chunk; pass it back as
+        ``resume_offset`` to continue an interrupted import without
+        re-reading the records before it.
+
         Args:
             file_path: Path to I12 JSON file
-            resume_from: Record number to resume from (for error recovery)
-            progress_callback: Optional callback for progress updates
+            resume_from: Number of records to skip (counted from resume_offset)
+            progress_callback: Optional callback receiving
+                (bytes_read, total_bytes, percentage) after each chunk
+            resume_offset: Byte offset checkpoint from a previous run
         """
         logger.info(f"Starting I12 power data import from {file_path}")
         start_time = time.time()
@@ -367,26 +533,24 @@ class I12StreamingParser(BaseImporter):
         finally:
             session.close()
 
-        # Initialize progress tracking
-        total_records = self._count_records(file_path)
-        logger.info(f"Found {total_records} total records to process")
+        if resume_offset > 0:
+            logger.info(f"Resuming from byte offset {resume_offset}")
+        self.checkpoint_offset = resume_offset
 
         # Skip to resume point if specified
         records_skipped = 0
+        record_idx = 0
+        imported_before = self.imported_count
 
         try:
             # Process file in chunks
-            for chunk_idx, chunk in enumerate(self.reader.read_chunks(file_path)):
-                # Skip chunks if resuming
-                chunk_start = chunk_idx * self.chunk_size
-                if chunk_start + len(chunk) <= resume_from:
-                    records_skipped += len(chunk)
-                    continue
-
-                # Process records in chunk
+            for chunk_idx, chunk in enumerate(
+                self.reader.read_chunks(file_path, start_offset=resume_offset)
+            ):
                 chunk_records = []
-                for record_idx, raw_record in enumerate(chunk):
-                    global_record_idx = chunk_start + record_idx
+                for raw_record in chunk:
+                    global_record_idx = record_idx
+                    record_idx += 1
 
                     # Skip individual records if resuming
                     if global_record_idx < resume_from:
@@ -417,10 +581,16 @@ class I12StreamingParser(BaseImporter):
                         logger.error(f"Batch insert failed for chunk {chunk_idx}: {e}")
                         self.error_count += len(chunk_records)
 
+                # Everything before this offset has been handled
+                self.checkpoint_offset = self.reader.offset
+
                 # Update progress
                 if progress_callback:
-                    percentage = (self.processed_count / total_records) * 100
-                    progress_callback(self.processed_count, total_records, percentage)
+                    progress_callback(
+                        self.reader.offset,
+                        self.reader.total_bytes,
+                        self.reader.percentage,
+                    )
 
                 # Memory management
                 self._check_memory_usage()
@@ -428,14 +598,24 @@ class I12StreamingParser(BaseImporter):
                 # Log progress
                 if chunk_idx % 10 == 0:
                     logger.info(
-                        f"Processed {self.processed_count}/{total_records} records "
-                        f"({self.imported_count} imported, {self.error_count} errors)"
+                        f"Processed {self.processed_count} records "
+                        f"({self.reader.percentage:.1f}% of file, "
+                        f"{self.imported_count} imported, {self.error_count} errors, "
+                        f"checkpoint offset {self.checkpoint_offset})"
                     )
 
         except Exception as e:
-            logger.error(f"Critical error during import: {e}")
+            logger.error(
+                f"Critical error during import: {e} "
+                f"(resume with resume_offset={self.checkpoint_offset})"
+            )
             raise
 
+        # The summary view only goes stale when rows were actually written
+        self.summary_refreshed = False
+        if self.imported_count > imported_before:
+            self._refresh_summary_view()
+
         # Final statistics
         end_time = time.time()
         duration = end_time - start_time
@@ -451,16 +631,6 @@ class I12StreamingParser(BaseImporter):
         if self.errors:
             logger.warning(f"Import completed with {len(self.errors)} errors")
 
-    def _count_records(self, file_path: Path) -> int:
-        """Count total records in JSON file."""
-        try:
-            with open(file_path, encoding="utf-8") as f:
-                data = json.load(f)
-                return len(data) if isinstance(data, list) else 0
-        except Exception as e:
-            logger.warning(f"Could not count records in {file_path}: {e}")
-            return 0
-
     def _batch_insert(self, records: list[dict[str, Any]]) -> None:
         """Insert a batch of records into the database."""
         session = self.SessionLocal()
@@ -475,6 +645,17 @@ class I12StreamingParser(BaseImporter):
         finally:
             session.close()
 
+    def _refresh_summary_view(self) -> None:
+        """Refresh the power_build_summary view; a failure is logged, not raised."""
+        session = self.SessionLocal()
+        try:
+            self.summary_refreshed = refresh_power_build_summary(session)
+        except Exception as e:
+            session.rollback()
+            logger.error(f"{VIEW_NAME} refresh failed: {e}")
+        finally:
+            session.close()
+
     def _record_error(
         self, record_idx: int, error_msg: str, raw_data: dict[str, Any]
     ) -> None:
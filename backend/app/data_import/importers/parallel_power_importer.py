@@ -0,0 +1,329 @@
+"""Pipelined powerset/power importer for filtered_data/powers.
+
+Parsing ~5,800 JSON files is CPU bound, so a process pool reads and
+transforms one powerset directory per task. The calling process is the only
+writer: it prefetches existing powersets and power names once, then inserts
+new rows in large batches (``INSERT ... ON CONFLICT (full_name) DO NOTHING``
+for powers) instead of one query and one commit per power.
+"""
+
+import json
+import logging
+import os
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.models import Power, Powerset
+from app.services.build_summary_view import (
+    VIEW_NAME,
+    refresh_power_build_summary,
+)
+
+from .power_importer import PowerImporter, power_values, powerset_values
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StageStats:
+    """Throughput counters for one pipeline stage."""
+
+    items: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "items": self.items,
+            "mb": round(self.bytes / (1024 * 1024), 2),
+            "seconds": round(self.seconds, 3),
+            "items_per_second": (
+                round(self.items / self.seconds, 1) if self.seconds > 0 else 0
+            ),
+        }
+
+
+def _parse_powerset_dir(powerset_dir: str) -> dict[str, Any]:
+    """Read and transform one powerset directory (runs in a worker process).
+
+    Archetype and powerset ids are resolved by the writer.
+    """
+    start = time.perf_counter()
+    directory = Path(powerset_dir)
+    result: dict[str, Any] = {
+        "dir": powerset_dir,
+        "powerset": None,
+        "powers": [],
+        "errors": [],
+        "files": 0,
+        "bytes": 0,
+    }
+
+    for path in sorted(directory.glob("*.json")):
+        try:
+            raw = path.read_bytes()
+            data = json.loads(raw)
+            if path.name == "index.json":
+                result["powerset"] = powerset_values(data, None)
+            else:
+                result["powers"].append(power_values(data, None))
+            result["files"] += 1
+            result["bytes"] += len(raw)
+        except Exception as e:
+            result["errors"].append(f"Error parsing {path}: {e}")
+
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def find_powerset_dirs(powers_root: Path) -> list[Path]:
+    """Powerset directories (those with an index.json) under powers_root."""
+    return sorted(
+        path.parent
+        for path in powers_root.glob("*/*/index.json")
+        if not path.parent.parent.name.startswith(".")
+    )
+
+
+def load_power_tags(tags_dir: Path) -> dict[str, list[str]]:
+    """Map lower-case power full names to their tags (filtered_data/tags).
+
+    Each tag file lists the powers that bear it as [display, internal] pairs.
+    """
+    tags: dict[str, list[str]] = {}
+    for path in sorted(tags_dir.glob("*.json")):
+        data = json.loads(path.read_bytes())
+        for _, internal_name in data.get("bears", []):
+            tags.setdefault(internal_name.lower(), []).append(data["tag"])
+    return tags
+
+
+class ParallelPowerImporter:
+    """Import all powersets and powers with parallel parsing and bulk writes."""
+
+    def __init__(
+        self, db_session: Session, workers: int | None = None, batch_size: int = 1000
+    ):
+        """Initialize the importer.
+
+        Args:
+            db_session: Session used by the single writer
+            workers: Parser processes (defaults to the CPU count; 0 or 1 parses
+                in this process)
+            batch_size: Powers per INSERT statement/commit
+        """
+        self.db = db_session
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.batch_size = batch_size
+        self._archetypes = PowerImporter(db_session)
+
+        self.stages = {
+            "prefetch": StageStats(),
+            "parse": StageStats(),
+            "write": StageStats(),
+        }
+        self._powerset_ids: dict[Any, int] = {}
+        self._existing_powers: set[str] = set()
+        self.power_tags: dict[str, list[str]] = {}
+
+    def _prefetch(self) -> None:
+        """Load existing powerset keys and power names in two queries."""
+        start = time.perf_counter()
+        for ps_id, name, archetype_id, source_file in self.db.query(
+            Powerset.id, Powerset.name, Powerset.archetype_id, Powerset.source_file
+        ):
+            if source_file:
+                self._powerset_ids[source_file] = ps_id
+            if archetype_id is not None:
+                self._powerset_ids.setdefault((name, archetype_id), ps_id)
+        self._existing_powers = {
+            full_name for (full_name,) in self.db.query(Power.full_name)
+        }
+        stats = self.stages["prefetch"]
+        stats.items = len(self._powerset_ids) + len(self._existing_powers)
+        stats.seconds = time.perf_counter() - start
+
+    def _powerset_keys(self, values: dict[str, Any]) -> list[Any]:
+        keys: list[Any] = []
+        if values.get("source_file"):
+            keys.append(values["source_file"])
+        if values["archetype_id"] is not None:
+            keys.append((values["name"], values["archetype_id"]))
+        return keys
+
+    def _parse(self, powerset_dirs: list[Path]) -> Iterator[dict[str, Any]]:
+        paths = [str(path) for path in powerset_dirs]
+        if self.workers <= 1:
+            yield from map(_parse_powerset_dir, paths)
+            return
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            yield from pool.map(_parse_powerset_dir, paths, chunksize=8)
+
+    def _insert_powers(self, rows: list[dict[str, Any]]) -> None:
+        dialect = self.db.get_bind().dialect.name
+        if dialect == "postgresql":
+            stmt = postgresql.insert(Power).on_conflict_do_nothing(
+                index_elements=["full_name"]
+            )
+        elif dialect == "sqlite":
+            stmt = sqlite.insert(Power).on_conflict_do_nothing(
+                index_elements=["full_name"]
+            )
+        else:  # Rows were filtered by the prefetch, so a plain insert is safe
+            stmt = insert(Power)
+        self.db.execute(stmt, rows)
+
+    def _flush(self, parsed: list[dict[str, Any]], result: dict[str, Any]) -> None:
+        """Write a batch of parsed powersets and their new powers."""
+        start = time.perf_counter()
+        new_powersets: list[tuple[dict[str, Any], Powerset]] = []
+        rows: list[dict[str, Any]] = []
+        skipped = 0
+        try:
+            # New powersets first, so their powers can reference the ids
+            for item in parsed:
+                keys = self._powerset_keys(item["powerset"])
+                ps_id = next(
+                    (self._powerset_ids[k] for k in keys if k in self._powerset_ids),
+                    None,
+                )
+                if ps_id is None:
+                    powerset = Powerset(**item["powerset"])
+                    new_powersets.append((item, powerset))
+                    self.db.add(powerset)
+                else:
+                    item["powerset_id"] = ps_id
+                    skipped += 1
+            if new_powersets:
+                self.db.flush()
+                for item, powerset in new_powersets:
+                    item["powerset_id"] = powerset.id
+
+            seen: set[str] = set()
+            for item in parsed:
+                for values in item["powers"]:
+                    full_name = values["full_name"]
+                    if full_name in self._existing_powers or full_name in seen:
+                        skipped += 1
+                        continue
+                    seen.add(full_name)
+                    rows.append(
+                        {
+                            **values,
+                            "powerset_id": item["powerset_id"],
+                            "tags": self.power_tags.get(full_name.lower(), []),
+                        }
+                    )
+            if rows:
+                self._insert_powers(rows)
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            error_msg = f"Batch write failed ({len(parsed)} powersets): {e}"
+            logger.error(error_msg)
+            result["errors"].append(error_msg)
+            result["success"] = False
+            return
+
+        # Only remember keys once they are committed
+        for item, powerset in new_powersets:
+            for key in self._powerset_keys(item["powerset"]):
+                self._powerset_ids[key] = powerset.id
+        self._existing_powers.update(seen)
+
+        result["powersets_imported"] += len(new_powersets)
+        result["powers_imported"] += len(rows)
+        result["skipped"] += skipped
+        stats = self.stages["write"]
+        stats.items += len(new_powersets) + len(rows)
+        stats.seconds += time.perf_counter() - start
+
+    def import_powerset_dirs(self, powerset_dirs: Iterable[Path]) -> dict[str, Any]:
+        """Import the given powerset directories and all their powers.
+
+        Returns:
+            Import results plus per-stage throughput under "stages"
+        """
+        start = time.perf_counter()
+        powerset_dirs = list(powerset_dirs)
+        result: dict[str, Any] = {
+            "success": True,
+            "powersets_imported": 0,
+            "powers_imported": 0,
+            "skipped": 0,
+            "errors": [],
+        }
+        self._prefetch()
+
+        parse = self.stages["parse"]
+        pending: list[dict[str, Any]] = []
+        pending_powers = 0
+        for item in self._parse(powerset_dirs):
+            # Parse time is summed across workers, i.e. per-process throughput
+            parse.items += item["files"]
+            parse.bytes += item["bytes"]
+            parse.seconds += item["seconds"]
+            result["errors"].extend(item["errors"])
+            if item["errors"]:
+                result["success"] = False
+            if item["powerset"] is None:
+                continue
+
+            values = item["powerset"]
+            values["archetype_id"] = (
+                self._archetypes._extract_archetype_from_display_fullname(
+                    values["display_fullname"]
+                )
+            )
+            pending.append(item)
+            pending_powers += len(item["powers"])
+            if pending_powers >= self.batch_size:
+                self._flush(pending, result)
+                pending, pending_powers = [], 0
+
+        if pending:
+            self._flush(pending, result)
+
+        # The summary view only goes stale when rows were actually written
+        result["summary_refreshed"] = False
+        if result["powersets_imported"] or result["powers_imported"]:
+            try:
+                result["summary_refreshed"] = refresh_power_build_summary(self.db)
+            except Exception as e:
+                self.db.rollback()
+                error_msg = f"{VIEW_NAME} refresh failed: {e}"
+                logger.error(error_msg)
+                result["errors"].append(error_msg)
+
+        elapsed = time.perf_counter() - start
+        result["stages"] = {name: s.as_dict() for name, s in self.stages.items()}
+        result["stages"]["total"] = StageStats(
+            items=parse.items, bytes=parse.bytes, seconds=elapsed
+        ).as_dict()
+        logger.info(
+            f"Imported {result['powersets_imported']} powersets and "
+            f"{result['powers_imported']} powers from {len(powerset_dirs)} "
+            f"directories in {elapsed:.2f}s ({self.workers} workers, "
+            f"{result['skipped']} skipped, {len(result['errors'])} errors)"
+        )
+        return result
+
+    def import_all(self, powers_root: Path) -> dict[str, Any]:
+        """Import every powerset directory under powers_root.
+
+        Power tags are read from the sibling tags directory when present.
+        """
+        tags_dir = powers_root.parent / "tags"
+        if tags_dir.is_dir():
+            self.power_tags = load_power_tags(tags_dir)
+        powerset_dirs = find_powerset_dirs(powers_root)
+        logger.info(f"Found {len(powerset_dirs)} powersets")
+        return self.import_powerset_dirs(powerset_dirs)
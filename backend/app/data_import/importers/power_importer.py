@@ -12,6 +12,59 @@ from app.models import Archetype, Power, Powerset
 logger = logging.getLogger(__name__)
 
 
+def powerset_values(data: dict[str, Any], archetype_id: int | None) -> dict[str, Any]:
+    """Map a powerset index.json document to Powerset column values"""
+    return {
+        "name": data["name"],
+        "display_name": data.get("display_name", data["name"]),
+        "display_fullname": data.get("display_fullname", ""),
+        "display_help": data.get("display_help", ""),
+        "display_short_help": data.get("display_short_help", ""),
+        "archetype_id": archetype_id,
+        "powerset_type": "primary",  # Will need to determine this properly
+        "icon": data.get("icon", ""),
+        "requires": data.get("requires", ""),
+        "power_names": data.get("power_names", []),
+        "power_display_names": data.get("power_display_names", []),
+        "power_short_helps": data.get("power_short_helps", []),
+        "available_level": data.get("available_level", []),
+        "source_file": data.get("source_file"),
+        "source_metadata": data,
+    }
+
+
+def power_values(data: dict[str, Any], powerset_id: int | None) -> dict[str, Any]:
+    """Map a power JSON document to Power column values"""
+    return {
+        "name": data["name"],
+        "full_name": data.get("full_name", data["name"]),
+        "display_name": data.get("display_name", data["name"]),
+        "display_help": data.get("display_help", ""),
+        "display_short_help": data.get("display_short_help", ""),
+        "powerset_id": powerset_id,
+        "type": data.get("type", ""),
+        "available_level": data.get("available_level", 1),
+        "icon": data.get("icon", ""),
+        "accuracy": data.get("accuracy", 1.0),
+        "activation_time": data.get("activation_time"),
+        "recharge_time": data.get("recharge_time"),
+        "endurance_cost": data.get("endurance_cost"),
+        "range": data.get("range"),
+        "radius": data.get("radius"),
+        "arc": data.get("arc"),
+        "max_targets_hit": data.get("max_targets_hit"),
+        "target_type": data.get("target_type", ""),
+        "requires": data.get("requires", ""),
+        "max_boosts": data.get("max_boosts", 6),
+        "boosts_allowed": data.get("boosts_allowed", []),
+        "allowed_boostset_cats": data.get("allowed_boostset_cats", []),
+        "archetypes": data.get("archetypes", []),
+        "exclusion_groups": data.get("exclusion_groups", []),
+        "recharge_groups": data.get("recharge_groups", []),
+        "power_data": data,  # Store complete JSON (source_metadata stays NULL)
+    }
+
+
 class PowerImporter:
     """Import powers and powersets from City of Data JSON files"""
 
@@ -182,22 +235,7 @@ class PowerImporter:
                     )
 
             # Create powerset
-            powerset = Powerset(
-                name=data["name"],
-                display_name=data.get("display_name", data["name"]),
-                display_fullname=data.get("display_fullname", ""),
-                display_help=data.get("display_help", ""),
-                display_short_help=data.get("display_short_help", ""),
-                archetype_id=archetype_id,
-                powerset_type="primary",  # Will need to determine this properly
-                icon=data.get("icon", ""),
-                requires=data.get("requires", ""),
-                power_names=data.get("power_names", []),
-                power_display_names=data.get("power_display_names", []),
-                power_short_helps=data.get("power_short_helps", []),
-                available_level=data.get("available_level", []),
-                source_metadata=data,
-            )
+            powerset = Powerset(**powerset_values(data, archetype_id))
 
             self.db.add(powerset)
             self.db.commit()
@@ -238,33 +276,7 @@ class PowerImporter:
                 result["success"] = True
                 return result
 
-            # Create power with basic fields
-            power = Power(
-                name=data["name"],
-                full_name=data.get("full_name", data["name"]),
-                display_name=data.get("display_name", data["name"]),
-                display_help=data.get("display_help", ""),
-                display_short_help=data.get("display_short_help", ""),
-                powerset_id=powerset_id,
-                type=data.get("type", ""),
-                available_level=data.get("available_level", 1),
-                icon=data.get("icon", ""),
-                accuracy=data.get("accuracy", 1.0),
-                activation_time=data.get("activation_time"),
-                recharge_time=data.get("recharge_time"),
-                endurance_cost=data.get("endurance_cost"),
-                range=data.get("range"),
-                radius=data.get("radius"),
-                arc=data.get("arc"),
-                max_targets_hit=data.get("max_targets_hit"),
-                target_type=data.get("target_type", ""),
-                requires=data.get("requires", ""),
-                max_boosts=data.get("max_boosts", 6),
-                boosts_allowed=data.get("boosts_allowed", []),
-                allowed_boostset_cats=data.get("allowed_boostset_cats", []),
-                power_data=data,  # Store complete JSON
-                source_metadata=data,  # Also store in source_metadata
-            )
+            power = Power(**power_values(data, powerset_id))
 
             self.db.add(power)
             self.db.commit()
@@ -347,42 +359,22 @@ class PowerImporter:
         )
         return result
 
-    async def import_all_powersets(self, powers_root: Path) -> dict[str, Any]:
-        """Import all powersets from root powers directory
+    async def import_all_powersets(
+        self, powers_root: Path, workers: int | None = None
+    ) -> dict[str, Any]:
+        """Import all powersets and their powers from root powers directory
+
+        Uses the pipelined ParallelPowerImporter: JSON parsing runs in a
+        process pool and rows are written in bulk.
 
         Args:
             powers_root: Root directory containing power category folders
+            workers: Parser processes (defaults to the CPU count)
 
         Returns:
-            Aggregate import results
+            Aggregate import results, including per-stage throughput
         """
-        result = {
-            "success": True,
-            "powersets_imported": 0,
-            "powers_imported": 0,
-            "skipped": 0,
-            "errors": [],
-        }
+        from .parallel_power_importer import ParallelPowerImporter
 
-        # Find all powerset directories (they contain index.json)
-        powerset_dirs = []
-        for category_dir in powers_root.iterdir():
-            if category_dir.is_dir() and not category_dir.name.startswith("."):
-                for powerset_dir in category_dir.iterdir():
-                    if powerset_dir.is_dir() and (powerset_dir / "index.json").exists():
-                        powerset_dirs.append(powerset_dir)
-
-        logger.info(f"Found {len(powerset_dirs)} powersets")
-
-        # For now, import without archetype association (will fix later)
-        for powerset_dir in powerset_dirs:
-            ps_result = await self.import_powerset(powerset_dir, None)
-            result["powersets_imported"] += ps_result["powersets_imported"]
-            result["powers_imported"] += ps_result["powers_imported"]
-            result["skipped"] += ps_result["skipped"]
-            result["errors"].extend(ps_result["errors"])
-
-            if not ps_result["success"]:
-                result["success"] = False
-
-        return result
+        importer = ParallelPowerImporter(self.db, workers=workers)
+        return importer.import_all(powers_root)
@@ -20,10 +20,28 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import deferred, relationship
 
 from .database import Base
 
+# Deferred load group for the raw JSON columns on Power; opt in with
+# undefer_group(POWER_BLOBS) (see crud.get_power)
+POWER_BLOBS = "power_blobs"
+
+# JSON arrays filtered with containment (@>): JSONB with GIN indexes on
+# PostgreSQL, plain JSON elsewhere
+JSON_ARRAY = JSON().with_variant(JSONB(), "postgresql")
+
+# Power columns indexed for containment filters (see crud.power_search_query)
+POWER_JSONB_GIN_COLUMNS = (
+    "archetypes",
+    "tags",
+    "exclusion_groups",
+    "recharge_groups",
+    "allowed_boostset_cats",
+)
+
 
 class Archetype(Base):
     """Archetype model representing character classes."""
@@ -243,24 +261,29 @@ class Power(Base):
     # Enhancement information
     max_boosts = Column(Integer, default=6)
     boosts_allowed = Column(JSON)  # Array of allowed boost types
-    allowed_boostset_cats = Column(JSON)  # Array of allowed boost set categories
+    # Array of allowed boost set categories
+    allowed_boostset_cats = Column(JSON_ARRAY)
 
     # Complete power data stored as JSON (for complex nested structures)
     # This includes: effects, templates, messages, flags, expressions, etc.
-    power_data = Column(JSON)  # Complete power JSON from filtered_data
+    # Deferred: only endpoints that evaluate effects load it.
+    power_data = deferred(Column(JSON), group=POWER_BLOBS)  # Complete power JSON
 
-    # Source metadata from original JSON
-    source_metadata = Column(JSON, nullable=True, comment="Raw JSON from source")
+    # Source metadata from original JSON (NULL for filtered_data imports, where
+    # it would duplicate power_data)
+    source_metadata = deferred(
+        Column(JSON, nullable=True, comment="Raw JSON from source"), group=POWER_BLOBS
+    )
 
     # Archetypes that can use this power
-    archetypes = Column(JSON)  # Array of archetype names
+    archetypes = Column(JSON_ARRAY)  # Array of archetype names
 
     # Tags for power interactions
-    tags = Column(JSON)  # Array of tag names this power has
+    tags = Column(JSON_ARRAY)  # Array of tag names this power has
 
     # Groups
-    exclusion_groups = Column(JSON)  # Array of exclusion group names
-    recharge_groups = Column(JSON)  # Array of recharge group names
+    exclusion_groups = Column(JSON_ARRAY)  # Array of exclusion group names
+    recharge_groups = Column(JSON_ARRAY)  # Array of recharge group names
 
     # Metadata
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -272,8 +295,18 @@ class Power(Base):
 
     __table_args__ = (
         Index("idx_power_level", "available_level"),
+        Index("idx_power_level_id", "available_level", "id"),  # Keyset pages
         Index("idx_power_type", "type"),
         Index("idx_power_powerset", "powerset_name"),
+        *(
+            Index(
+                f"idx_power_{column}_gin",
+                column,
+                postgresql_using="gin",
+                postgresql_ops={column: "jsonb_path_ops"},
+            ).ddl_if(dialect="postgresql")
+            for column in POWER_JSONB_GIN_COLUMNS
+        ),
     )
 
 
@@ -320,6 +353,7 @@ class EnhancementSet(Base):
     __table_args__ = (
         Index("idx_enhset_group", "group_name"),
         Index("idx_enhset_level", "min_level", "max_level"),
+        Index("idx_enhset_level_id", "min_level", "id"),  # Keyset pages
     )
 
 
@@ -397,6 +431,7 @@ class Enhancement(Base):
         Index("idx_enhancement_set", "set_id"),
         Index("idx_enhancement_type", "boost_type"),
         Index("idx_enhancement_level", "level_min", "level_max"),
+        Index("idx_enhancement_level_id", "level_min", "id"),  # Keyset pages
     )
 
 
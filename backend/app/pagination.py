@@ -0,0 +1,129 @@
+"""
+Keyset (cursor) pagination for list endpoints.
+
+Pages are ordered by a level column and the primary key. The cursor encodes
+the (level, id) of the last row served, so the next page starts with an index
+range scan instead of an OFFSET that re-reads every earlier row. NULL levels
+sort last, matching the default btree order in PostgreSQL; they are read by a
+separate query once the non-NULL rows run out, so neither query needs an OR.
+"""
+
+import base64
+import binascii
+import bisect
+import json
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Response header carrying the cursor of the next page (absent on the last page)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(level: int | None, row_id: int) -> str:
+    """Opaque, URL-safe cursor for the row at (level, id)."""
+    raw = json.dumps([level, row_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> tuple[int | None, int]:
+    """Decode a cursor from encode_cursor back to (level, id)."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        level, row_id = json.loads(raw)
+    except (binascii.Error, ValueError, TypeError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}") from e
+    if not isinstance(row_id, int) or not (level is None or isinstance(level, int)):
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}")
+    return level, row_id
+
+
+def keyset_paginate(
+    stmt: Select, level_column: Any, id_column: Any, cursor: str | None
+) -> list[Select]:
+    """Selects for the rows after the cursor, in (level, id) order.
+
+    The first select (absent once the cursor is in the NULL tail) is a plain
+    (level, id) range over non-NULL levels, which the (level, id) index
+    serves with a range scan. The last select reads the NULL-level rows by
+    id. Run them in order until the page is full.
+    """
+    null_tail = stmt.where(level_column.is_(None))
+    if cursor is None:
+        ranged = stmt.where(level_column.is_not(None))
+    else:
+        level, row_id = decode_cursor(cursor)
+        if level is None:
+            ranged = None
+            null_tail = null_tail.where(id_column > row_id)
+        else:
+            ranged = stmt.where(tuple_(level_column, id_column) > tuple_(level, row_id))
+
+    selects = [null_tail.order_by(id_column)]
+    if ranged is not None:
+        selects.insert(0, ranged.order_by(level_column, id_column))
+    return selects
+
+
+async def fetch_page(
+    db: AsyncSession,
+    stmt: Select,
+    level_column: Any,
+    id_column: Any,
+    cursor: str | None,
+    limit: int,
+) -> tuple[list[Any], str | None]:
+    """Run a keyset-paginated select.
+
+    Fetches limit + 1 rows to tell whether another page exists; the NULL-level
+    query only runs if the non-NULL rows did not fill the page.
+
+    Returns:
+        The page of rows and the cursor of the next page (None on the last page)
+    """
+    rows: list[Any] = []
+    for select in keyset_paginate(stmt, level_column, id_column, cursor):
+        rows.extend(await db.scalars(select.limit(limit + 1 - len(rows))))
+        if len(rows) > limit:
+            break
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(
+        getattr(last, level_column.key), getattr(last, id_column.key)
+    )
+
+
+def page_records(
+    records: Sequence[Any],
+    key: Callable[[Any], tuple[bool, int, int]],
+    cursor: str | None,
+    limit: int,
+    level_attr: str = "min_level",
+) -> tuple[list[Any], str | None]:
+    """Same paging as fetch_page over records already sorted by key.
+
+    key must order records by (level is None, level, id), so the page start is
+    a binary search instead of a scan.
+
+    Returns:
+        The page of records and the cursor of the next page (None on the last page)
+    """
+    start = 0
+    if cursor is not None:
+        level, row_id = decode_cursor(cursor)
+        start = bisect.bisect_right(
+            records, (level is None, level or 0, row_id), key=key
+        )
+    page = list(records[start : start + limit])
+    if start + limit >= len(records):
+        return page, None
+    last = page[-1]
+    return page, encode_cursor(getattr(last, level_attr), last.id)
@@ -0,0 +1,106 @@
+"""
+Per-request SQL statement counting.
+
+Engine event hooks record every statement executed while a QueryStats is
+active in the current context. Requests get one from QueryStatsMiddleware
+(``DB_QUERY_HEADER=true`` adds X-DB-Queries/X-DB-Time headers) and tests get
+one from the ``assert_max_queries`` fixture, which catches N+1 patterns such
+as a lazy load per serialized row.
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# Response headers added by QueryStatsMiddleware
+QUERY_COUNT_HEADER = "X-DB-Queries"
+QUERY_TIME_HEADER = "X-DB-Time"
+
+
+class QueryStats:
+    """Statements executed and total database time within one context."""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.statements: list[str] = []
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.seconds += seconds
+        self.statements.append(statement)
+
+
+_current: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def _before_cursor_execute(conn, *_):
+    if _current.get() is not None:
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, _cursor, statement, *_):
+    stats = _current.get()
+    if stats is not None and conn.info.get("query_start"):
+        stats.record(statement, time.perf_counter() - conn.info["query_start"].pop())
+
+
+def instrument_engine(engine: Engine | AsyncEngine) -> None:
+    """Attach the counting hooks to an engine (idempotent)."""
+    if isinstance(engine, AsyncEngine):
+        engine = engine.sync_engine
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Count the statements executed inside the block.
+
+    Work in tasks and threadpool calls started inside the block is counted
+    too, since they inherit the current context.
+    """
+    stats = QueryStats()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+class QueryStatsMiddleware:
+    """ASGI middleware adding statement count and DB time headers."""
+
+    def __init__(self, app: Any):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+
+            async def send_with_stats(message):
+                if message["type"] == "http.response.start":
+                    message["headers"] = [
+                        *message.get("headers", []),
+                        (
+                            QUERY_COUNT_HEADER.lower().encode(),
+                            str(stats.count).encode(),
+                        ),
+                        (
+                            QUERY_TIME_HEADER.lower().encode(),
+                            f"{stats.seconds * 1000:.3f}ms".encode(),
+                        ),
+                    ]
+                await send(message)
+
+            await self.app(scope, receive, send_with_stats)
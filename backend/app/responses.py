@@ -0,0 +1,107 @@
+"""
+Fast JSON responses and precomputed bodies for immutable payloads.
+
+Endpoints returning plain dicts are encoded with orjson when it is installed
+(the ``json`` extra) instead of ``jsonable_encoder`` plus ``json.dumps``.
+Payloads that only change when game data is re-imported (constants, archetype
+caps, snapshot-backed lists) are serialized once into a PrecomputedJSON and
+served as bytes with a strong ETag; a matching If-None-Match gets a 304.
+"""
+
+import datetime
+import hashlib
+import json
+from decimal import Decimal
+from typing import Any
+
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+from pydantic import TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# Precomputed bodies are immutable per ETag, but clients must revalidate so a
+# re-import is picked up on the next request
+DEFAULT_CACHE_CONTROL = "no-cache"
+
+
+def _default(value: Any) -> Any:
+    """Encode types the JSON encoders don't handle natively."""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, datetime.datetime | datetime.date):
+        return value.isoformat()
+    if hasattr(value, "item"):  # NumPy scalars
+        return value.item()
+    raise TypeError(f"Cannot serialize {type(value).__name__} to JSON")
+
+
+def dumps(value: Any) -> bytes:
+    """Serialize value to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(
+            value,
+            default=_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+    return json.dumps(
+        value, default=_default, ensure_ascii=False, separators=(",", ":")
+    ).encode()
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with dumps() (orjson when available)."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """True if an If-None-Match header value covers etag."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+class PrecomputedJSON:
+    """A JSON body serialized once, with its ETag."""
+
+    __slots__ = ("body", "etag", "cache_control")
+
+    def __init__(self, body: bytes, cache_control: str = DEFAULT_CACHE_CONTROL):
+        self.body = body
+        self.etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        self.cache_control = cache_control
+
+    @classmethod
+    def from_content(cls, content: Any, **kwargs: Any) -> "PrecomputedJSON":
+        """Serialize plain JSON-compatible content."""
+        return cls(dumps(content), **kwargs)
+
+    @classmethod
+    def from_model(cls, type_: Any, value: Any, **kwargs: Any) -> "PrecomputedJSON":
+        """Validate value as type_ (ORM objects and records included) and
+        serialize it the way FastAPI serializes a response_model."""
+        adapter = TypeAdapter(type_)
+        validated = adapter.validate_python(value, from_attributes=True)
+        return cls(adapter.dump_json(validated, by_alias=True), **kwargs)
+
+    def response(
+        self, request: Request, headers: dict[str, str] | None = None
+    ) -> Response:
+        """The body, or a 304 if the client already has this version."""
+        headers = {
+            **(headers or {}),
+            "ETag": self.etag,
+            "Cache-Control": self.cache_control,
+        }
+        if etag_matches(request.headers.get("if-none-match"), self.etag):
+            return Response(status_code=304, headers=headers)
+        return Response(self.body, media_type="application/json", headers=headers)
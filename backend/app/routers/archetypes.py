@@ -2,41 +2,61 @@
 Archetype API endpoints for Mids-Web backend.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from .. import crud, schemas
-from ..database import get_db
+from ..database import get_async_db
+from ..responses import PrecomputedJSON
+from ..services.game_data_snapshot import get_game_data_snapshot
+from ..services.lookup_repository import get_lookup_repository
 
 router = APIRouter()
 
 
 @router.get("/archetypes", response_model=list[schemas.Archetype])
 async def get_archetypes(
+    request: Request,
     skip: int = Query(0, ge=0, description="Number of items to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of items to return"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Get all archetypes.
 
     Returns a list of all character archetypes (classes) with pagination support.
+    With the game data snapshot loaded, the body is serialized once per page
+    and carries an ETag.
     """
-    archetypes = crud.get_archetypes(db, skip=skip, limit=limit)
+    snapshot = get_game_data_snapshot()
+    if snapshot is not None:
+        body = snapshot.precomputed(
+            f"archetypes:{skip}:{limit}",
+            lambda: PrecomputedJSON.from_model(
+                list[schemas.Archetype], snapshot.archetypes[skip : skip + limit]
+            ),
+        )
+        return body.response(request)
+
+    archetypes = await crud.get_archetypes(db, skip=skip, limit=limit)
     return archetypes
 
 
 @router.get("/archetypes/{archetype_id}", response_model=schemas.Archetype)
 async def get_archetype(
     archetype_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Get a specific archetype by ID.
 
     Returns detailed information about a single archetype.
     """
-    archetype = crud.get_archetype(db, archetype_id=archetype_id)
+    snapshot = get_game_data_snapshot()
+    if snapshot is not None:
+        archetype = snapshot.archetypes_by_id.get(archetype_id)
+    else:
+        archetype = await crud.get_archetype(db, archetype_id=archetype_id)
     if archetype is None:
         raise HTTPException(status_code=404, detail="Archetype not found")
     return archetype
@@ -50,7 +70,7 @@ async def get_archetype_powersets(
     powerset_type: str | None = Query(
         None, description="Filter by powerset type (primary, secondary, pool, epic)"
     ),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Get all powersets for a specific archetype.
@@ -58,13 +78,29 @@ async def get_archetype_powersets(
     Returns a list of powersets available to the specified archetype.
     Optionally filter by powerset type.
     """
+    snapshot = get_game_data_snapshot()
+    repository = get_lookup_repository()
+    if snapshot is None and repository is not None:
+        powersets = await repository.get_archetype_powersets(
+            archetype_id, powerset_type=powerset_type
+        )
+        if powersets is None:
+            raise HTTPException(status_code=404, detail="Archetype not found")
+        return powersets
+
     # First check if archetype exists
-    archetype = crud.get_archetype(db, archetype_id=archetype_id)
+    if snapshot is not None:
+        archetype = snapshot.archetypes_by_id.get(archetype_id)
+    else:
+        archetype = await crud.get_archetype(db, archetype_id=archetype_id)
     if archetype is None:
         raise HTTPException(status_code=404, detail="Archetype not found")
 
     # Get powersets
-    powersets = crud.get_powersets_by_archetype(db, archetype_id=archetype_id)
+    if snapshot is not None:
+        powersets = snapshot.powersets_by_archetype.get(archetype_id, ())
+    else:
+        powersets = await crud.get_powersets_by_archetype(db, archetype_id=archetype_id)
 
     # Filter by type if specified
     if powerset_type:
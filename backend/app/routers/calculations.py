@@ -13,9 +13,11 @@ Endpoints:
 
     Build Calculations:
         - POST /api/v1/calculations/build/totals
+        - POST /api/v1/calculations/build/batch (NDJSON stream)
         - POST /api/v1/calculations/build/defense
         - POST /api/v1/calculations/build/resistance
         - GET /api/v1/calculations/constants
+        - GET /api/v1/calculations/caps
 
     Enhancement Calculations:
         - POST /api/v1/calculations/enhancements/procs
@@ -23,7 +25,14 @@ Endpoints:
         - POST /api/v1/calculations/enhancements/set-bonuses (TODO)
 """
 
-from fastapi import APIRouter, HTTPException
+import asyncio
+import json
+from collections import deque
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 
 from app.calculations.build.defense_aggregator import (
     DefenseType,
@@ -36,7 +45,7 @@ from app.calculations.build.resistance_aggregator import (
 
 # Import calculation modules
 from app.calculations.core import constants
-from app.calculations.core.archetype_caps import ArchetypeType
+from app.calculations.core.archetype_caps import ArchetypeType, get_archetype_caps
 from app.calculations.core.effect import Effect
 from app.calculations.core.effect_types import DamageType, EffectType
 from app.calculations.core.enums import PvMode, ToWho
@@ -48,12 +57,17 @@ from app.calculations.powers.damage_calculator import (
     DamageReturnMode,
     PowerType,
 )
+from app.responses import PrecomputedJSON
 from app.schemas.calculations import (  # Request/Response models; Enums
+    ArchetypeCapsResponse,
+    ArchetypeEnum,
+    BuildTotalsBatchRequest,
     BuildTotalsRequest,
     BuildTotalsResponse,
     DamageCalculationRequest,
     DamageCalculationResponse,
     DamageTypeEnum,
+    DefenseBonusInput,
     DefenseCalculationRequest,
     DefenseCalculationResponse,
     DefenseTypeEnum,
@@ -61,13 +75,21 @@ from app.schemas.calculations import (  # Request/Response models; Enums
     GameConstantsResponse,
     ProcCalculationRequest,
     ProcCalculationResponse,
+    ResistanceBonusInput,
     ResistanceCalculationRequest,
     ResistanceCalculationResponse,
     ResistanceTypeEnum,
 )
+from app.services.calc_executor import (
+    RETRY_AFTER_SECONDS,
+    ExecutorSaturatedError,
+    get_calc_executor,
+)
 
 router = APIRouter()
 
+T = TypeVar("T")
+
 
 # ============================================================================
 # Helper Functions
@@ -129,93 +151,207 @@ def convert_effect_request_to_effect(effect_request, unique_id: int = 0) -> Effe
     )
 
 
+# Lookup tables for API <-> internal enum conversion. Built once at import time
+# so per-request conversion is a plain dict lookup.
+_ARCHETYPE_MAP = {
+    "Blaster": ArchetypeType.BLASTER,
+    "Controller": ArchetypeType.CONTROLLER,
+    "Defender": ArchetypeType.DEFENDER,
+    "Scrapper": ArchetypeType.SCRAPPER,
+    "Tanker": ArchetypeType.TANKER,
+    "Peacebringer": ArchetypeType.PEACEBRINGER,
+    "Warshade": ArchetypeType.WARSHADE,
+    "Brute": ArchetypeType.BRUTE,
+    "Stalker": ArchetypeType.STALKER,
+    "Mastermind": ArchetypeType.MASTERMIND,
+    "Dominator": ArchetypeType.DOMINATOR,
+    "Corruptor": ArchetypeType.CORRUPTOR,
+    "Arachnos Soldier": ArchetypeType.ARACHNOS_SOLDIER,
+    "Arachnos Widow": ArchetypeType.ARACHNOS_WIDOW,
+}
+
+_DEFENSE_TYPE_MAP = {
+    "smashing": DefenseType.SMASHING,
+    "lethal": DefenseType.LETHAL,
+    "fire": DefenseType.FIRE,
+    "cold": DefenseType.COLD,
+    "energy": DefenseType.ENERGY,
+    "negative": DefenseType.NEGATIVE_ENERGY,
+    "toxic": DefenseType.TOXIC,
+    "psionic": DefenseType.PSIONIC,
+    "melee": DefenseType.MELEE,
+    "ranged": DefenseType.RANGED,
+    "aoe": DefenseType.AOE,
+}
+
+_RESISTANCE_TYPE_MAP = {
+    "smashing": ResistanceType.SMASHING,
+    "lethal": ResistanceType.LETHAL,
+    "fire": ResistanceType.FIRE,
+    "cold": ResistanceType.COLD,
+    "energy": ResistanceType.ENERGY,
+    "negative": ResistanceType.NEGATIVE_ENERGY,
+    "toxic": ResistanceType.TOXIC,
+    "psionic": ResistanceType.PSIONIC,
+}
+
+_DEFENSE_TYPE_TO_API = {
+    DefenseType.SMASHING: DefenseTypeEnum.SMASHING,
+    DefenseType.LETHAL: DefenseTypeEnum.LETHAL,
+    DefenseType.FIRE: DefenseTypeEnum.FIRE,
+    DefenseType.COLD: DefenseTypeEnum.COLD,
+    DefenseType.ENERGY: DefenseTypeEnum.ENERGY,
+    DefenseType.NEGATIVE_ENERGY: DefenseTypeEnum.NEGATIVE,
+    DefenseType.TOXIC: DefenseTypeEnum.TOXIC,
+    DefenseType.PSIONIC: DefenseTypeEnum.PSIONIC,
+    DefenseType.MELEE: DefenseTypeEnum.MELEE,
+    DefenseType.RANGED: DefenseTypeEnum.RANGED,
+    DefenseType.AOE: DefenseTypeEnum.AOE,
+}
+
+_RESISTANCE_TYPE_TO_API = {
+    ResistanceType.SMASHING: ResistanceTypeEnum.SMASHING,
+    ResistanceType.LETHAL: ResistanceTypeEnum.LETHAL,
+    ResistanceType.FIRE: ResistanceTypeEnum.FIRE,
+    ResistanceType.COLD: ResistanceTypeEnum.COLD,
+    ResistanceType.ENERGY: ResistanceTypeEnum.ENERGY,
+    ResistanceType.NEGATIVE_ENERGY: ResistanceTypeEnum.NEGATIVE,
+    ResistanceType.TOXIC: ResistanceTypeEnum.TOXIC,
+    ResistanceType.PSIONIC: ResistanceTypeEnum.PSIONIC,
+}
+
+
 def convert_archetype_enum(archetype_enum) -> ArchetypeType:
     """Convert API archetype enum to internal ArchetypeType."""
-    archetype_map = {
-        "Blaster": ArchetypeType.BLASTER,
-        "Controller": ArchetypeType.CONTROLLER,
-        "Defender": ArchetypeType.DEFENDER,
-        "Scrapper": ArchetypeType.SCRAPPER,
-        "Tanker": ArchetypeType.TANKER,
-        "Peacebringer": ArchetypeType.PEACEBRINGER,
-        "Warshade": ArchetypeType.WARSHADE,
-        "Brute": ArchetypeType.BRUTE,
-        "Stalker": ArchetypeType.STALKER,
-        "Mastermind": ArchetypeType.MASTERMIND,
-        "Dominator": ArchetypeType.DOMINATOR,
-        "Corruptor": ArchetypeType.CORRUPTOR,
-        "Arachnos Soldier": ArchetypeType.ARACHNOS_SOLDIER,
-        "Arachnos Widow": ArchetypeType.ARACHNOS_WIDOW,
-    }
-    return archetype_map.get(archetype_enum.value, ArchetypeType.SCRAPPER)
+    return _ARCHETYPE_MAP.get(archetype_enum.value, ArchetypeType.SCRAPPER)
 
 
 def convert_defense_type_enum(defense_enum: DefenseTypeEnum) -> DefenseType:
     """Convert API defense type enum to internal DefenseType."""
-    defense_map = {
-        "smashing": DefenseType.SMASHING,
-        "lethal": DefenseType.LETHAL,
-        "fire": DefenseType.FIRE,
-        "cold": DefenseType.COLD,
-        "energy": DefenseType.ENERGY,
-        "negative": DefenseType.NEGATIVE_ENERGY,
-        "toxic": DefenseType.TOXIC,
-        "psionic": DefenseType.PSIONIC,
-        "melee": DefenseType.MELEE,
-        "ranged": DefenseType.RANGED,
-        "aoe": DefenseType.AOE,
-    }
-    return defense_map.get(defense_enum.value.lower(), DefenseType.SMASHING)
+    return _DEFENSE_TYPE_MAP.get(defense_enum.value.lower(), DefenseType.SMASHING)
 
 
 def convert_resistance_type_enum(resistance_enum: ResistanceTypeEnum) -> ResistanceType:
     """Convert API resistance type enum to internal ResistanceType."""
-    resistance_map = {
-        "smashing": ResistanceType.SMASHING,
-        "lethal": ResistanceType.LETHAL,
-        "fire": ResistanceType.FIRE,
-        "cold": ResistanceType.COLD,
-        "energy": ResistanceType.ENERGY,
-        "negative": ResistanceType.NEGATIVE_ENERGY,
-        "toxic": ResistanceType.TOXIC,
-        "psionic": ResistanceType.PSIONIC,
-    }
-    return resistance_map.get(resistance_enum.value.lower(), ResistanceType.SMASHING)
+    return _RESISTANCE_TYPE_MAP.get(
+        resistance_enum.value.lower(), ResistanceType.SMASHING
+    )
 
 
 def convert_defense_type_to_api(internal_dtype: DefenseType) -> DefenseTypeEnum:
     """Convert internal DefenseType to API DefenseTypeEnum."""
-    reverse_map = {
-        DefenseType.SMASHING: DefenseTypeEnum.SMASHING,
-        DefenseType.LETHAL: DefenseTypeEnum.LETHAL,
-        DefenseType.FIRE: DefenseTypeEnum.FIRE,
-        DefenseType.COLD: DefenseTypeEnum.COLD,
-        DefenseType.ENERGY: DefenseTypeEnum.ENERGY,
-        DefenseType.NEGATIVE_ENERGY: DefenseTypeEnum.NEGATIVE,
-        DefenseType.TOXIC: DefenseTypeEnum.TOXIC,
-        DefenseType.PSIONIC: DefenseTypeEnum.PSIONIC,
-        DefenseType.MELEE: DefenseTypeEnum.MELEE,
-        DefenseType.RANGED: DefenseTypeEnum.RANGED,
-        DefenseType.AOE: DefenseTypeEnum.AOE,
-    }
-    return reverse_map.get(internal_dtype, DefenseTypeEnum.SMASHING)
+    return _DEFENSE_TYPE_TO_API.get(internal_dtype, DefenseTypeEnum.SMASHING)
 
 
 def convert_resistance_type_to_api(
     internal_rtype: ResistanceType,
 ) -> ResistanceTypeEnum:
     """Convert internal ResistanceType to API ResistanceTypeEnum."""
-    reverse_map = {
-        ResistanceType.SMASHING: ResistanceTypeEnum.SMASHING,
-        ResistanceType.LETHAL: ResistanceTypeEnum.LETHAL,
-        ResistanceType.FIRE: ResistanceTypeEnum.FIRE,
-        ResistanceType.COLD: ResistanceTypeEnum.COLD,
-        ResistanceType.ENERGY: ResistanceTypeEnum.ENERGY,
-        ResistanceType.NEGATIVE_ENERGY: ResistanceTypeEnum.NEGATIVE,
-        ResistanceType.TOXIC: ResistanceTypeEnum.TOXIC,
-        ResistanceType.PSIONIC: ResistanceTypeEnum.PSIONIC,
+    return _RESISTANCE_TYPE_TO_API.get(internal_rtype, ResistanceTypeEnum.SMASHING)
+
+
+def _defense_totals(
+    archetype: ArchetypeType, defense_bonuses: list[DefenseBonusInput]
+) -> dict[str, Any]:
+    """Aggregate defense bonuses into a JSON-native DefenseCalculationResponse body."""
+    bonuses_list = [
+        {
+            convert_defense_type_enum(dtype_enum): value
+            for dtype_enum, value in bonus_input.bonuses.items()
+        }
+        for bonus_input in defense_bonuses
+    ]
+
+    defense_values = aggregate_defense_bonuses(bonuses_list, archetype)
+
+    return {
+        "typed": {
+            convert_defense_type_to_api(dtype).value: value
+            for dtype, value in defense_values.typed.items()
+        },
+        "positional": {
+            convert_defense_type_to_api(dtype).value: value
+            for dtype, value in defense_values.positional.items()
+        },
+        "ddr": 0.0,  # TODO: Add DDR tracking to DefenseValues
+        "elusivity": 0.0,  # TODO: Add elusivity tracking to DefenseValues
     }
-    return reverse_map.get(internal_rtype, ResistanceTypeEnum.SMASHING)
+
+
+def _resistance_totals(
+    archetype: ArchetypeType, resistance_bonuses: list[ResistanceBonusInput]
+) -> dict[str, Any]:
+    """Aggregate resistance bonuses into a JSON-native ResistanceCalculationResponse body."""
+    bonuses_list = [
+        {
+            convert_resistance_type_enum(rtype_enum): value
+            for rtype_enum, value in bonus_input.bonuses.items()
+        }
+        for bonus_input in resistance_bonuses
+    ]
+
+    resistance_values = aggregate_resistance_bonuses(bonuses_list, archetype)
+
+    return {
+        "values": {
+            convert_resistance_type_to_api(rtype).value: value
+            for rtype, value in resistance_values.values.items()
+        },
+        "resistance_debuff_resistance": 0.0,  # TODO: Add RDR tracking to ResistanceValues
+    }
+
+
+def _build_totals(
+    archetype: ArchetypeType, build: BuildTotalsRequest
+) -> dict[str, Any]:
+    """Compute a JSON-native BuildTotalsResponse body for one build."""
+    return {
+        "defense": _defense_totals(archetype, build.defense_bonuses),
+        "resistance": _resistance_totals(archetype, build.resistance_bonuses),
+    }
+
+
+def _build_totals_line(
+    index: int, archetype: ArchetypeType, build: BuildTotalsRequest
+) -> str:
+    """Evaluate one build of a batch and encode it as a single NDJSON line.
+
+    Failures are reported inline so one bad build does not abort the stream.
+    """
+    try:
+        payload = {"index": index, **_build_totals(archetype, build)}
+    except Exception as e:
+        payload = {"index": index, "error": str(e)}
+    return json.dumps(payload) + "\n"
+
+
+def _build_totals_lines(
+    start: int, builds: list[tuple[ArchetypeType, BuildTotalsRequest]]
+) -> list[str]:
+    """NDJSON lines for a window of a batch, starting at index start.
+
+    Runs on the calculation process pool, so one call covers a whole window.
+    """
+    return [
+        _build_totals_line(index, archetype, build)
+        for index, (archetype, build) in enumerate(builds, start=start)
+    ]
+
+
+def _saturated(e: ExecutorSaturatedError) -> HTTPException:
+    return HTTPException(
+        status_code=503,
+        detail=str(e),
+        headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+    )
+
+
+async def _offload(endpoint: str, fn: Callable[..., T], *args: Any) -> T:
+    """Run a light calculation on the executor's thread pool (503 if saturated)."""
+    try:
+        return await get_calc_executor().run_light(endpoint, fn, *args)
+    except ExecutorSaturatedError as e:
+        raise _saturated(e) from e
 
 
 # ============================================================================
@@ -248,6 +384,10 @@ async def calculate_power_damage(
     request: DamageCalculationRequest,
 ) -> DamageCalculationResponse:
     """Calculate damage from a power's effects."""
+    return await _offload("power/damage", _power_damage, request)
+
+
+def _power_damage(request: DamageCalculationRequest) -> DamageCalculationResponse:
     try:
         # Convert request effects to internal Effect objects
         effects = [
@@ -327,38 +467,14 @@ async def calculate_build_defense(
     request: DefenseCalculationRequest,
 ) -> DefenseCalculationResponse:
     """Calculate build defense totals."""
-    try:
-        # Convert archetype
-        archetype = convert_archetype_enum(request.archetype)
+    return await _offload("build/defense", _build_defense, request)
 
-        # Convert defense bonuses
-        bonuses_list = []
-        for bonus_input in request.defense_bonuses:
-            bonus_dict = {}
-            for dtype_enum, value in bonus_input.bonuses.items():
-                internal_dtype = convert_defense_type_enum(dtype_enum)
-                bonus_dict[internal_dtype] = value
-            bonuses_list.append(bonus_dict)
-
-        # Aggregate bonuses
-        defense_values = aggregate_defense_bonuses(bonuses_list, archetype)
-
-        # Convert back to API enums
-        typed_api = {}
-        for dtype, value in defense_values.typed.items():
-            api_dtype = convert_defense_type_to_api(dtype)
-            typed_api[api_dtype] = value
-
-        positional_api = {}
-        for dtype, value in defense_values.positional.items():
-            api_dtype = convert_defense_type_to_api(dtype)
-            positional_api[api_dtype] = value
 
+def _build_defense(request: DefenseCalculationRequest) -> DefenseCalculationResponse:
+    try:
+        archetype = convert_archetype_enum(request.archetype)
         return DefenseCalculationResponse(
-            typed=typed_api,
-            positional=positional_api,
-            ddr=0.0,  # TODO: Add DDR tracking to DefenseValues
-            elusivity=0.0,  # TODO: Add elusivity tracking to DefenseValues
+            **_defense_totals(archetype, request.defense_bonuses)
         )
 
     except Exception as e:
@@ -388,31 +504,16 @@ async def calculate_build_resistance(
     request: ResistanceCalculationRequest,
 ) -> ResistanceCalculationResponse:
     """Calculate build resistance totals."""
-    try:
-        # Convert archetype
-        archetype = convert_archetype_enum(request.archetype)
+    return await _offload("build/resistance", _build_resistance, request)
 
-        # Convert resistance bonuses
-        bonuses_list = []
-        for bonus_input in request.resistance_bonuses:
-            bonus_dict = {}
-            for rtype_enum, value in bonus_input.bonuses.items():
-                internal_rtype = convert_resistance_type_enum(rtype_enum)
-                bonus_dict[internal_rtype] = value
-            bonuses_list.append(bonus_dict)
-
-        # Aggregate bonuses
-        resistance_values = aggregate_resistance_bonuses(bonuses_list, archetype)
-
-        # Convert back to API enums
-        values_api = {}
-        for rtype, value in resistance_values.values.items():
-            api_rtype = convert_resistance_type_to_api(rtype)
-            values_api[api_rtype] = value
 
+def _build_resistance(
+    request: ResistanceCalculationRequest,
+) -> ResistanceCalculationResponse:
+    try:
+        archetype = convert_archetype_enum(request.archetype)
         return ResistanceCalculationResponse(
-            values=values_api,
-            resistance_debuff_resistance=0.0,  # TODO: Add RDR tracking to ResistanceValues
+            **_resistance_totals(archetype, request.resistance_bonuses)
         )
 
     except Exception as e:
@@ -442,30 +543,96 @@ async def calculate_build_totals(
     request: BuildTotalsRequest,
 ) -> BuildTotalsResponse:
     """Calculate complete build totals."""
-    try:
-        # Calculate defense
-        defense_req = DefenseCalculationRequest(
-            archetype=request.archetype,
-            defense_bonuses=request.defense_bonuses,
-        )
-        defense_resp = await calculate_build_defense(defense_req)
+    return await _offload("build/totals", _build_totals_response, request)
 
-        # Calculate resistance
-        resistance_req = ResistanceCalculationRequest(
-            archetype=request.archetype,
-            resistance_bonuses=request.resistance_bonuses,
-        )
-        resistance_resp = await calculate_build_resistance(resistance_req)
 
-        return BuildTotalsResponse(
-            defense=defense_resp,
-            resistance=resistance_resp,
-        )
+def _build_totals_response(request: BuildTotalsRequest) -> BuildTotalsResponse:
+    try:
+        archetype = convert_archetype_enum(request.archetype)
+        return BuildTotalsResponse(**_build_totals(archetype, request))
 
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post(
+    "/v1/calculations/build/batch",
+    response_class=StreamingResponse,
+    summary="Calculate build totals for many builds",
+    description="""
+    Score an array of builds in a single round trip.
+
+    Each build is evaluated exactly like `/v1/calculations/build/totals`.
+    Results are streamed back as NDJSON (`application/x-ndjson`), one line per
+    build in request order, each tagged with its `index`. A build that fails
+    produces `{"index": i, "error": "..."}` instead of aborting the stream.
+
+    - `builds` is limited to `BUILD_BATCH_MAX_SIZE` entries
+    - `concurrency` is the number of builds sent to a calculation worker at
+      a time (up to `BUILD_BATCH_MAX_CONCURRENCY`)
+    - Returns 503 when the calculation workers are saturated
+    """,
+    responses={
+        200: {
+            "description": "NDJSON stream of build totals",
+            "content": {"application/x-ndjson": {}},
+        },
+        422: {"description": "Batch too large or invalid builds"},
+    },
+)
+async def calculate_build_totals_batch(
+    request: BuildTotalsBatchRequest,
+) -> StreamingResponse:
+    """Calculate build totals for a batch of builds, streamed as NDJSON."""
+    # Archetype conversion happens once per distinct archetype, not per build
+    archetypes: dict[ArchetypeEnum, ArchetypeType] = {}
+    for build in request.builds:
+        if build.archetype not in archetypes:
+            archetypes[build.archetype] = convert_archetype_enum(build.archetype)
+
+    builds = request.builds
+    window = request.concurrency
+    executor = get_calc_executor()
+    # Reject before the 200 status line goes out
+    try:
+        executor.check_capacity(heavy=True)
+    except ExecutorSaturatedError as e:
+        raise _saturated(e) from e
+
+    async def run_window(start: int) -> list[str]:
+        chunk = [
+            (archetypes[build.archetype], build)
+            for build in builds[start : start + window]
+        ]
+        try:
+            return await executor.run_heavy(
+                "build/batch", _build_totals_lines, start, chunk
+            )
+        except ExecutorSaturatedError as e:
+            return [
+                json.dumps({"index": index, "error": str(e)}) + "\n"
+                for index in range(start, start + len(chunk))
+            ]
+
+    async def stream_lines():
+        # Keep one window in flight per worker; lines still go out in order
+        in_flight: deque[asyncio.Task] = deque()
+        try:
+            for start in range(0, len(builds), window):
+                in_flight.append(asyncio.ensure_future(run_window(start)))
+                if len(in_flight) >= executor.heavy_workers:
+                    for line in await in_flight.popleft():
+                        yield line
+            while in_flight:
+                for line in await in_flight.popleft():
+                    yield line
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+    return StreamingResponse(stream_lines(), media_type="application/x-ndjson")
+
+
 @router.get(
     "/v1/calculations/constants",
     response_model=GameConstantsResponse,
@@ -487,45 +654,81 @@ async def calculate_build_totals(
         200: {"description": "Constants retrieved successfully"},
     },
 )
-async def get_game_constants() -> GameConstantsResponse:
+async def get_game_constants(request: Request) -> Response:
     """Get all game constants."""
-    return GameConstantsResponse(
-        base_magic=constants.BASE_MAGIC,
-        ed_schedule_a_thresholds=[
-            constants.ED_SCHEDULE_A_THRESH_1,
-            constants.ED_SCHEDULE_A_THRESH_2,
-            constants.ED_SCHEDULE_A_THRESH_3,
-        ],
-        ed_schedule_b_thresholds=[
-            constants.ED_SCHEDULE_B_THRESH_1,
-            constants.ED_SCHEDULE_B_THRESH_2,
-            constants.ED_SCHEDULE_B_THRESH_3,
-        ],
-        ed_schedule_c_thresholds=[
-            constants.ED_SCHEDULE_C_THRESH_1,
-            constants.ED_SCHEDULE_C_THRESH_2,
-            constants.ED_SCHEDULE_C_THRESH_3,
-        ],
-        ed_schedule_d_thresholds=[
-            constants.ED_SCHEDULE_D_THRESH_1,
-            constants.ED_SCHEDULE_D_THRESH_2,
-            constants.ED_SCHEDULE_D_THRESH_3,
-        ],
-        ed_efficiencies=[
-            constants.ED_EFFICIENCY_REGION_1,
-            constants.ED_EFFICIENCY_REGION_2,
-            constants.ED_EFFICIENCY_REGION_3,
-            constants.ED_EFFICIENCY_REGION_4,
-        ],
-        game_tick_seconds=constants.GAME_TICK_SECONDS,
-        rule_of_five_limit=constants.RULE_OF_FIVE_LIMIT,
-        training_origin_value=constants.TRAINING_ORIGIN_VALUE,
-        dual_origin_value=constants.DUAL_ORIGIN_VALUE,
-        single_origin_value=constants.SINGLE_ORIGIN_VALUE,
-        invention_origin_l50_value=constants.INVENTION_ORIGIN_L50_VALUE,
+    return _GAME_CONSTANTS.response(request)
+
+
+def _build_game_constants() -> PrecomputedJSON:
+    return PrecomputedJSON.from_model(
+        GameConstantsResponse,
+        GameConstantsResponse(
+            base_magic=constants.BASE_MAGIC,
+            ed_schedule_a_thresholds=[
+                constants.ED_SCHEDULE_A_THRESH_1,
+                constants.ED_SCHEDULE_A_THRESH_2,
+                constants.ED_SCHEDULE_A_THRESH_3,
+            ],
+            ed_schedule_b_thresholds=[
+                constants.ED_SCHEDULE_B_THRESH_1,
+                constants.ED_SCHEDULE_B_THRESH_2,
+                constants.ED_SCHEDULE_B_THRESH_3,
+            ],
+            ed_schedule_c_thresholds=[
+                constants.ED_SCHEDULE_C_THRESH_1,
+                constants.ED_SCHEDULE_C_THRESH_2,
+                constants.ED_SCHEDULE_C_THRESH_3,
+            ],
+            ed_schedule_d_thresholds=[
+                constants.ED_SCHEDULE_D_THRESH_1,
+                constants.ED_SCHEDULE_D_THRESH_2,
+                constants.ED_SCHEDULE_D_THRESH_3,
+            ],
+            ed_efficiencies=[
+                constants.ED_EFFICIENCY_REGION_1,
+                constants.ED_EFFICIENCY_REGION_2,
+                constants.ED_EFFICIENCY_REGION_3,
+                constants.ED_EFFICIENCY_REGION_4,
+            ],
+            game_tick_seconds=constants.GAME_TICK_SECONDS,
+            rule_of_five_limit=constants.RULE_OF_FIVE_LIMIT,
+            training_origin_value=constants.TRAINING_ORIGIN_VALUE,
+            dual_origin_value=constants.DUAL_ORIGIN_VALUE,
+            single_origin_value=constants.SINGLE_ORIGIN_VALUE,
+            invention_origin_l50_value=constants.INVENTION_ORIGIN_L50_VALUE,
+        ),
     )
 
 
+def _build_archetype_caps() -> PrecomputedJSON:
+    return PrecomputedJSON.from_model(
+        dict[str, ArchetypeCapsResponse],
+        {archetype.value: get_archetype_caps(archetype) for archetype in ArchetypeType},
+    )
+
+
+# Constants and caps are fixed at import time, so serialize them once
+_GAME_CONSTANTS = _build_game_constants()
+_ARCHETYPE_CAPS = _build_archetype_caps()
+
+
+@router.get(
+    "/v1/calculations/caps",
+    response_model=dict[str, ArchetypeCapsResponse],
+    summary="Get archetype caps",
+    description="""
+    Retrieve the cap values (damage, resistance, defense, HP, recovery,
+    regeneration, recharge, perception) of every archetype, keyed by name.
+    """,
+    responses={
+        200: {"description": "Caps retrieved successfully"},
+    },
+)
+async def get_all_archetype_caps(request: Request) -> Response:
+    """Get the caps of every archetype."""
+    return _ARCHETYPE_CAPS.response(request)
+
+
 # ============================================================================
 # Enhancement Calculation Endpoints
 # ============================================================================
@@ -2,53 +2,71 @@
 Enhancement API endpoints for Mids-Web backend.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-
-from .. import crud, models, schemas
-from ..database import get_db
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .. import crud, schemas
+from ..database import get_async_db
+from ..pagination import NEXT_CURSOR_HEADER, InvalidCursorError, page_records
+from ..responses import PrecomputedJSON
+from ..services.game_data_snapshot import (
+    GameDataSnapshot,
+    get_game_data_snapshot,
+    level_key,
+)
 
 router = APIRouter()
 
 
 @router.get("/enhancements", response_model=list[schemas.Enhancement])
 async def get_enhancements(
-    skip: int = Query(0, ge=0, description="Number of items to skip"),
-    limit: int = Query(100, ge=1, le=1000, description="Number of items to return"),
-    enhancement_type: str | None = Query(
-        None,
-        description="Filter by enhancement type (IO, SO, DO, TO, HamiO, set_piece)",
+    response: Response,
+    name: str | None = Query(None, description="Search by enhancement name"),
+    boost_type: str | None = Query(
+        None, description="Filter by boost type (e.g. Enhance Damage)"
+    ),
+    set_id: int | None = Query(None, description="Filter by enhancement set"),
+    cursor: str | None = Query(
+        None, description=f"Page cursor from the {NEXT_CURSOR_HEADER} header"
     ),
-    db: Session = Depends(get_db),
+    limit: int = Query(100, ge=1, le=1000, description="Number of items to return"),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Get all enhancements.
 
-    Returns a list of all enhancements with pagination support.
-    Optionally filter by enhancement type.
+    Returns a page of enhancements ordered by minimum level. Filters are
+    applied before paging; pass the X-Next-Cursor response header back as
+    `cursor` to get the next page.
     """
-    enhancements = crud.get_enhancements(db, skip=skip, limit=limit)
-
-    # Filter by type if specified
-    if enhancement_type:
-        enhancements = [
-            e for e in enhancements if e.enhancement_type == enhancement_type
-        ]
+    try:
+        enhancements, next_cursor = await crud.get_enhancements(
+            db,
+            name=name,
+            boost_type=boost_type,
+            set_id=set_id,
+            cursor=cursor,
+            limit=limit,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
     return enhancements
 
 
 @router.get("/enhancements/{enhancement_id}", response_model=schemas.Enhancement)
 async def get_enhancement(
     enhancement_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Get a specific enhancement by ID.
 
     Returns detailed information about a single enhancement.
     """
-    enhancement = crud.get_enhancement(db, enhancement_id=enhancement_id)
+    enhancement = await crud.get_enhancement(db, enhancement_id=enhancement_id)
     if enhancement is None:
         raise HTTPException(status_code=404, detail="Enhancement not found")
     return enhancement
@@ -56,19 +74,57 @@ async def get_enhancement(
 
 @router.get("/enhancement-sets", response_model=list[schemas.EnhancementSet])
 async def get_enhancement_sets(
-    skip: int = Query(0, ge=0, description="Number of items to skip"),
+    request: Request,
+    response: Response,
+    name: str | None = Query(None, description="Search by set name"),
+    group_name: str | None = Query(None, description="Filter by set group"),
+    cursor: str | None = Query(
+        None, description=f"Page cursor from the {NEXT_CURSOR_HEADER} header"
+    ),
     limit: int = Query(100, ge=1, le=1000, description="Number of items to return"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Get all enhancement sets.
 
-    Returns a list of all enhancement sets with pagination support.
+    Returns a page of enhancement sets ordered by minimum level; pass the
+    X-Next-Cursor response header back as `cursor` to get the next page.
     """
-    sets = db.query(models.EnhancementSet).offset(skip).limit(limit).all()
+    snapshot = get_game_data_snapshot()
+    if snapshot is not None and not name:
+        try:
+            body, next_cursor = snapshot.precomputed(
+                f"enhancement_sets:{group_name!r}:{cursor!r}:{limit}",
+                lambda: _snapshot_set_page(snapshot, group_name, cursor, limit),
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+        return body.response(request, headers=headers)
+
+    try:
+        sets, next_cursor = await crud.get_enhancement_sets(
+            db, name=name, group_name=group_name, cursor=cursor, limit=limit
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
     return sets
 
 
+def _snapshot_set_page(
+    snapshot: GameDataSnapshot, group_name: str | None, cursor: str | None, limit: int
+) -> tuple[PrecomputedJSON, str | None]:
+    """Serialize one page of enhancement sets from the snapshot."""
+    records = snapshot.enhancement_sets_by_level
+    if group_name:
+        records = tuple(r for r in records if r.group_name == group_name)
+    sets, next_cursor = page_records(records, level_key, cursor, limit)
+    return PrecomputedJSON.from_model(list[schemas.EnhancementSet], sets), next_cursor
+
+
 class EnhancementSetWithBonuses(schemas.EnhancementSet):
     """Enhancement set schema with bonuses and enhancements."""
 
@@ -80,7 +136,7 @@ async def get_enhancement_set(
     set_id: int,
     include_enhancements: bool = True,
     include_bonuses: bool = True,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Get a specific enhancement set by ID.
@@ -90,10 +146,8 @@ async def get_enhancement_set(
 
     Note: Set bonuses are stored in the 'bonuses' JSON field on the EnhancementSet model.
     """
-    enhancement_set = (
-        db.query(models.EnhancementSet)
-        .filter(models.EnhancementSet.id == set_id)
-        .first()
+    enhancement_set = await crud.get_enhancement_set(
+        db, set_id=set_id, include_enhancements=include_enhancements
     )
 
     if enhancement_set is None:
@@ -102,14 +156,9 @@ async def get_enhancement_set(
     # Convert to dict to add related data
     set_data = enhancement_set.__dict__.copy()
 
-    # Include enhancements if requested
+    # Enhancements were loaded with the set if requested
     if include_enhancements:
-        enhancements = (
-            db.query(models.Enhancement)
-            .filter(models.Enhancement.set_id == set_id)
-            .all()
-        )
-        set_data["enhancements"] = enhancements
+        set_data["enhancements"] = enhancement_set.enhancements
     else:
         set_data["enhancements"] = []
 
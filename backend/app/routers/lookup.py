@@ -0,0 +1,28 @@
+"""
+Batched lookup API endpoints for Mids-Web backend.
+"""
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .. import schemas
+from ..database import get_async_db
+from ..services import batch_lookup
+
+router = APIRouter()
+
+
+@router.post("/lookup", response_model=schemas.LookupResponse)
+async def lookup(
+    request: schemas.LookupRequest,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Resolve powers, powersets, enhancements and enhancement sets by ID.
+
+    Returns each entity type as a map keyed by ID, using one query per type,
+    so a build page needs one request instead of one per entity. IDs that do
+    not exist are listed under `missing`. Set `include_power_data` to get
+    each power's full JSON document as well.
+    """
+    return await batch_lookup.lookup(db, request)
@@ -2,11 +2,19 @@
 Power API endpoints for Mids-Web backend.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-
-from .. import crud, models, schemas
-from ..database import get_db
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .. import crud, schemas
+from ..database import get_async_db
+from ..models import Power
+from ..pagination import NEXT_CURSOR_HEADER, InvalidCursorError
+from ..responses import FastJSONResponse
+from ..services import batch_lookup
+from ..services.batch_lookup import InvalidIdListError
+from ..services.game_data_snapshot import get_game_data_snapshot
+from ..services.lookup_repository import get_lookup_repository
+from ..services.power_cache import POWER_NUMERIC_COLUMNS
 
 router = APIRouter()
 
@@ -14,11 +22,11 @@ router = APIRouter()
 @router.get("/powers/test/{power_id}")
 async def test_power(
     power_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Test endpoint to debug power retrieval."""
     try:
-        power = crud.get_power(db, power_id=power_id)
+        power = await crud.get_power(db, power_id=power_id, include_blobs=True)
         if power is None:
             return {"error": "Power not found"}
 
@@ -43,35 +51,44 @@ async def test_power(
 @router.get("/powers/{power_id}")
 async def get_power(
     power_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Get a specific power by ID.
 
     Returns detailed information about a power.
     """
-    power = crud.get_power(db, power_id=power_id)
+    snapshot = get_game_data_snapshot()
+    if snapshot is not None:
+        power = snapshot.powers_by_id.get(power_id)
+        if power is None:
+            raise HTTPException(status_code=404, detail="Power not found")
+        # Numeric columns were converted to floats when the snapshot loaded
+        return FastJSONResponse(power.as_dict())
+
+    repository = get_lookup_repository()
+    if repository is not None:
+        power = await repository.get_power(power_id)
+        if power is None:
+            raise HTTPException(status_code=404, detail="Power not found")
+        return FastJSONResponse(power)
+
+    power = await crud.get_power(db, power_id=power_id, include_blobs=True)
     if power is None:
         raise HTTPException(status_code=404, detail="Power not found")
 
-    # Convert decimals to floats manually
-    result = {}
-    for col in power.__table__.columns:
-        val = getattr(power, col.name)
-        if (
-            val is not None
-            and hasattr(val, "__class__")
-            and "Decimal" in str(val.__class__)
-        ):
-            result[col.name] = float(val)
-        else:
-            result[col.name] = val
-
-    return result
+    result = {
+        column.key: getattr(power, column.key) for column in Power.__table__.columns
+    }
+    for key in POWER_NUMERIC_COLUMNS:
+        if result[key] is not None:
+            result[key] = float(result[key])
+    return FastJSONResponse(result)
 
 
 @router.get("/powers", response_model=list[schemas.Power])
 async def search_powers(
+    response: Response,
     name: str | None = Query(None, description="Search by power name"),
     power_type: str | None = Query(None, description="Filter by power type"),
     min_level: int | None = Query(
@@ -80,30 +97,62 @@ async def search_powers(
     max_level: int | None = Query(
         None, ge=1, le=50, description="Maximum level available"
     ),
-    skip: int = Query(0, ge=0),
+    powerset_id: int | None = Query(None, description="Filter by powerset"),
+    archetype: str | None = Query(
+        None, description="Only powers usable by this archetype (e.g. brute)"
+    ),
+    tag: str | None = Query(None, description="Only powers with this tag"),
+    boostset_category: str | None = Query(
+        None, description="Only powers accepting this enhancement set category"
+    ),
+    cursor: str | None = Query(
+        None, description=f"Page cursor from the {NEXT_CURSOR_HEADER} header"
+    ),
     limit: int = Query(100, ge=1, le=1000),
-    db: Session = Depends(get_db),
+    ids: str | None = Query(
+        None,
+        description="Comma-separated power ids to fetch in one request "
+        "(other filters and paging are ignored)",
+    ),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Search and filter powers.
 
-    Supports searching by name and filtering by various criteria.
+    Supports searching by name and filtering by various criteria. Results are
+    ordered by level; pass the X-Next-Cursor response header back as `cursor`
+    to get the next page. With `ids`, returns those powers in the given order
+    (unknown ids are left out).
     """
-    query = db.query(models.Power)
-
-    # Apply filters
-    if name:
-        query = query.filter(models.Power.name.ilike(f"%{name}%"))
-
-    if power_type:
-        query = query.filter(models.Power.power_type == power_type)
+    if ids is not None:
+        try:
+            power_ids = batch_lookup.parse_id_list(ids)
+        except InvalidIdListError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        found = await batch_lookup.get_powers(db, power_ids)
+        return [
+            found[power_id]
+            for power_id in dict.fromkeys(power_ids)
+            if power_id in found
+        ]
 
-    if min_level is not None:
-        query = query.filter(models.Power.level_available >= min_level)
-
-    if max_level is not None:
-        query = query.filter(models.Power.level_available <= max_level)
-
-    # Apply pagination
-    powers = query.offset(skip).limit(limit).all()
+    try:
+        powers, next_cursor = await crud.search_powers(
+            db,
+            name=name,
+            power_type=power_type,
+            min_level=min_level,
+            max_level=max_level,
+            powerset_id=powerset_id,
+            archetype=archetype,
+            tag=tag,
+            boostset_category=boostset_category,
+            cursor=cursor,
+            limit=limit,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
     return powers
@@ -3,10 +3,12 @@ Powerset API endpoints for Mids-Web backend.
 """
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from .. import crud, schemas
-from ..database import get_db
+from ..database import get_async_db
+from ..services.game_data_snapshot import get_game_data_snapshot
+from ..services.lookup_repository import get_lookup_repository
 
 router = APIRouter()
 
@@ -14,14 +16,21 @@ router = APIRouter()
 @router.get("/powersets/{powerset_id}", response_model=schemas.Powerset)
 async def get_powerset(
     powerset_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Get a specific powerset by ID.
 
     Returns detailed information about a powerset.
     """
-    powerset = crud.get_powerset(db, powerset_id=powerset_id)
+    snapshot = get_game_data_snapshot()
+    repository = get_lookup_repository()
+    if snapshot is not None:
+        powerset = snapshot.powersets_by_id.get(powerset_id)
+    elif repository is not None:
+        powerset = await repository.get_powerset(powerset_id)
+    else:
+        powerset = await crud.get_powerset(db, powerset_id=powerset_id)
     if powerset is None:
         raise HTTPException(status_code=404, detail="Powerset not found")
 
@@ -33,19 +42,28 @@ async def get_powerset(
 )
 async def get_powerset_detailed(
     powerset_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Get a specific powerset by ID with all its powers.
 
     Returns detailed information about a powerset including all associated powers.
     """
-    powerset = crud.get_powerset(db, powerset_id=powerset_id)
+    snapshot = get_game_data_snapshot()
+    if snapshot is not None:
+        powerset = snapshot.powersets_by_id.get(powerset_id)
+    else:
+        powerset = await crud.get_powerset(
+            db, powerset_id=powerset_id, include_powers=True
+        )
     if powerset is None:
         raise HTTPException(status_code=404, detail="Powerset not found")
 
     # Get powers for this powerset
-    powers = crud.get_powers_by_powerset(db, powerset_id=powerset_id)
+    if snapshot is not None:
+        powers = snapshot.powers_by_powerset.get(powerset_id, ())
+    else:
+        powers = powerset.powers
 
     # Create response with powers
     powerset_dict = {
@@ -67,17 +85,59 @@ async def get_powerset_detailed(
 @router.get("/powersets/{powerset_id}/powers", response_model=list[schemas.Power])
 async def get_powerset_powers(
     powerset_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Get all powers in a specific powerset.
 
     Returns a list of powers that belong to the specified powerset.
     """
+    snapshot = get_game_data_snapshot()
+    if snapshot is not None:
+        if powerset_id not in snapshot.powersets_by_id:
+            raise HTTPException(status_code=404, detail="Powerset not found")
+        return snapshot.powers_by_powerset.get(powerset_id, ())
+
+    repository = get_lookup_repository()
+    if repository is not None:
+        powers = await repository.get_powers_by_powerset(powerset_id)
+        if powers is None:
+            raise HTTPException(status_code=404, detail="Powerset not found")
+        return powers
+
     # First check if powerset exists
-    powerset = crud.get_powerset(db, powerset_id=powerset_id)
+    powerset = await crud.get_powerset(db, powerset_id=powerset_id)
     if powerset is None:
         raise HTTPException(status_code=404, detail="Powerset not found")
 
-    powers = crud.get_powers_by_powerset(db, powerset_id=powerset_id)
+    powers = await crud.get_powers_by_powerset(db, powerset_id=powerset_id)
     return powers
+
+
+@router.get(
+    "/powersets/{powerset_id}/powers/details",
+    response_model=list[schemas.PowerWithDetails],
+)
+async def get_powerset_power_details(
+    powerset_id: int,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Get all powers in a specific powerset, including power_data.
+
+    Same as /powersets/{id}/powers plus each power's full JSON document
+    (effects, templates, ...), for clients that evaluate effects.
+    """
+    snapshot = get_game_data_snapshot()
+    if snapshot is not None:
+        if powerset_id not in snapshot.powersets_by_id:
+            raise HTTPException(status_code=404, detail="Powerset not found")
+        return snapshot.powers_by_powerset.get(powerset_id, ())
+
+    powerset = await crud.get_powerset(db, powerset_id=powerset_id)
+    if powerset is None:
+        raise HTTPException(status_code=404, detail="Powerset not found")
+
+    return await crud.get_powers_by_powerset(
+        db, powerset_id=powerset_id, include_power_data=True
+    )
@@ -1,6 +1,7 @@
 """Pydantic schemas for API requests and responses."""
 
 from .base import (  # Archetype schemas; Build schemas; Enhancement schemas; Import log schemas; Power schemas; Powerset schemas
+    MAX_LOOKUP_IDS,
     Archetype,
     ArchetypeBase,
     ArchetypeCreate,
@@ -30,6 +31,8 @@ from .base import (  # Archetype schemas; Build schemas; Enhancement schemas; Im
     ImportLog,
     ImportLogBase,
     ImportLogCreate,
+    LookupRequest,
+    LookupResponse,
     Power,
     PowerBase,
     PowerCreate,
@@ -42,7 +45,9 @@ from .base import (  # Archetype schemas; Build schemas; Enhancement schemas; Im
     PowerWithDetails,
 )
 from .calculations import (  # Enums; Build totals; Damage calculation; Defense calculation; Effect models; Enhancement calculation; Error handling; Constants; Resistance calculation
+    ArchetypeCapsResponse,
     ArchetypeEnum,
+    BuildTotalsBatchRequest,
     BuildTotalsRequest,
     BuildTotalsResponse,
     DamageCalculationRequest,
@@ -101,6 +106,10 @@ __all__ = [
     "ImportLog",
     "ImportLogBase",
     "ImportLogCreate",
+    # Base schemas - Batched lookup
+    "MAX_LOOKUP_IDS",
+    "LookupRequest",
+    "LookupResponse",
     # Base schemas - Powers
     "Power",
     "PowerBase",
@@ -137,8 +146,10 @@ __all__ = [
     # Calculation schemas - Build totals
     "BuildTotalsRequest",
     "BuildTotalsResponse",
+    "BuildTotalsBatchRequest",
     # Calculation schemas - Constants
     "GameConstantsResponse",
+    "ArchetypeCapsResponse",
     # Calculation schemas - Enhancement calculation
     "EnhancementSlotRequest",
     "ProcCalculationRequest",
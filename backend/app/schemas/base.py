@@ -9,7 +9,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, field_serializer
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
 
 
 # Base classes for common patterns
@@ -102,10 +102,10 @@ class PowersetBase(BaseModel):
     source_file: str | None = None
     icon: str | None = None
     requires: str | None = None
-    power_names: dict[str, Any] | None = None
-    power_display_names: dict[str, Any] | None = None
-    power_short_helps: dict[str, Any] | None = None
-    available_level: dict[str, Any] | None = None
+    power_names: list[Any] | None = None
+    power_display_names: list[Any] | None = None
+    power_short_helps: list[Any] | None = None
+    available_level: list[Any] | None = None
 
 
 class PowersetCreate(PowersetBase):
@@ -122,10 +122,10 @@ class PowersetUpdate(BaseModel):
     source_file: str | None = None
     icon: str | None = None
     requires: str | None = None
-    power_names: dict[str, Any] | None = None
-    power_display_names: dict[str, Any] | None = None
-    power_short_helps: dict[str, Any] | None = None
-    available_level: dict[str, Any] | None = None
+    power_names: list[Any] | None = None
+    power_display_names: list[Any] | None = None
+    power_short_helps: list[Any] | None = None
+    available_level: list[Any] | None = None
 
 
 class Powerset(PowersetBase, TimestampedBase, BaseEntitySchema):
@@ -166,17 +166,17 @@ class PowerBase(BaseModel):
     activate_requires: str | None = None
     confirm_requires: str | None = None
     max_boosts: int | None = None
-    boosts_allowed: dict[str, Any] | None = None
-    allowed_boostset_cats: dict[str, Any] | None = None
-    power_data: dict[str, Any] | None = None
-    archetypes: dict[str, Any] | None = None
-    tags: dict[str, Any] | None = None
-    exclusion_groups: dict[str, Any] | None = None
-    recharge_groups: dict[str, Any] | None = None
+    boosts_allowed: list[Any] | None = None
+    allowed_boostset_cats: list[Any] | None = None
+    archetypes: list[Any] | None = None
+    tags: list[Any] | None = None
+    exclusion_groups: list[Any] | None = None
+    recharge_groups: list[Any] | None = None
 
 
 class PowerCreate(PowerBase):
     powerset_id: int
+    power_data: dict[str, Any] | None = None
 
 
 class PowerUpdate(BaseModel):
@@ -211,13 +211,13 @@ class PowerUpdate(BaseModel):
     activate_requires: str | None = None
     confirm_requires: str | None = None
     max_boosts: int | None = None
-    boosts_allowed: dict[str, Any] | None = None
-    allowed_boostset_cats: dict[str, Any] | None = None
+    boosts_allowed: list[Any] | None = None
+    allowed_boostset_cats: list[Any] | None = None
     power_data: dict[str, Any] | None = None
-    archetypes: dict[str, Any] | None = None
-    tags: dict[str, Any] | None = None
-    exclusion_groups: dict[str, Any] | None = None
-    recharge_groups: dict[str, Any] | None = None
+    archetypes: list[Any] | None = None
+    tags: list[Any] | None = None
+    exclusion_groups: list[Any] | None = None
+    recharge_groups: list[Any] | None = None
 
 
 class Power(PowerBase, TimestampedBase, BaseEntitySchema):
@@ -446,9 +446,9 @@ class PowersetWithPowers(Powerset):
 
 
 class PowerWithDetails(Power):
-    """Power with full details."""
+    """Power with full details, including the raw power_data document."""
 
-    pass
+    power_data: dict[str, Any] | None = None
 
 
 class EnhancementSetWithDetails(EnhancementSet):
@@ -476,3 +476,27 @@ class BuildStats(BaseModel):
     set_bonuses: list[str] = []
     total_endurance_cost: Decimal = Decimal("0.0")
     recharge_reduction: Decimal = Decimal("0.0")
+
+
+# Batched lookup (POST /api/lookup)
+MAX_LOOKUP_IDS = 1000
+
+
+class LookupRequest(BaseModel):
+    """IDs to resolve in one request, per entity type."""
+
+    powers: list[int] = Field(default=[], max_length=MAX_LOOKUP_IDS)
+    powersets: list[int] = Field(default=[], max_length=MAX_LOOKUP_IDS)
+    enhancements: list[int] = Field(default=[], max_length=MAX_LOOKUP_IDS)
+    enhancement_sets: list[int] = Field(default=[], max_length=MAX_LOOKUP_IDS)
+    include_power_data: bool = False
+
+
+class LookupResponse(BaseModel):
+    """Entities keyed by ID; IDs that were not found are listed in missing."""
+
+    powers: dict[int, PowerWithDetails] = {}
+    powersets: dict[int, Powerset] = {}
+    enhancements: dict[int, Enhancement] = {}
+    enhancement_sets: dict[int, EnhancementSet] = {}
+    missing: dict[str, list[int]] = {}
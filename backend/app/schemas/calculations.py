@@ -4,10 +4,15 @@ Pydantic schemas for Calculation API endpoints.
 Defines request/response models for all calculation endpoints in Phase 5.
 """
 
+import os
 from enum import Enum
 
 from pydantic import BaseModel, Field
 
+# Batch evaluation limits (overridable per deployment)
+BUILD_BATCH_MAX_SIZE = int(os.getenv("BUILD_BATCH_MAX_SIZE", "1000"))
+BUILD_BATCH_MAX_CONCURRENCY = int(os.getenv("BUILD_BATCH_MAX_CONCURRENCY", "16"))
+
 # ============================================================================
 # Core Enums and Types
 # ============================================================================
@@ -378,6 +383,45 @@ class BuildTotalsResponse(BaseModel):
         }
 
 
+class BuildTotalsBatchRequest(BaseModel):
+    """Request for scoring many builds in a single call.
+
+    Results are streamed back as NDJSON, one line per build, in request order.
+    """
+
+    builds: list[BuildTotalsRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=BUILD_BATCH_MAX_SIZE,
+        description="Builds to evaluate",
+    )
+    concurrency: int = Field(
+        default=4,
+        ge=1,
+        le=BUILD_BATCH_MAX_CONCURRENCY,
+        description="Maximum number of builds evaluated concurrently",
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "builds": [
+                    {
+                        "archetype": "Scrapper",
+                        "defense_bonuses": [{"bonuses": {"melee": 0.30}}],
+                        "resistance_bonuses": [{"bonuses": {"smashing": 0.20}}],
+                    },
+                    {
+                        "archetype": "Tanker",
+                        "defense_bonuses": [],
+                        "resistance_bonuses": [{"bonuses": {"fire": 0.45}}],
+                    },
+                ],
+                "concurrency": 4,
+            }
+        }
+
+
 # ============================================================================
 # Constants Response
 # ============================================================================
@@ -428,6 +472,19 @@ class GameConstantsResponse(BaseModel):
         }
 
 
+class ArchetypeCapsResponse(BaseModel):
+    """Cap values for one archetype (multipliers, not percentages)."""
+
+    damage_cap: float = Field(..., description="Damage buff cap (4.0 = 400%)")
+    resistance_cap: float = Field(..., description="Resistance cap (0.75 = 75%)")
+    defense_cap: float = Field(..., description="Defense display cap")
+    hp_cap: float = Field(..., description="Max hit points cap")
+    recovery_cap: float = Field(..., description="Endurance recovery cap")
+    regeneration_cap: float = Field(..., description="HP regeneration cap")
+    recharge_cap: float = Field(..., description="Recharge speed cap")
+    perception_cap: float = Field(..., description="Perception range cap (feet)")
+
+
 # ============================================================================
 # Enhancement Calculation
 # ============================================================================
@@ -0,0 +1,96 @@
+"""
+Batched entity lookups for build pages.
+
+A build page needs ~24 powers, 100+ enhancements and their sets. Instead of
+one request (and one query) per entity, the client sends every ID at once and
+each entity type is resolved with a single query: powers through the power
+cache multi-get (memory, then one L2 mget, then one IN query), the others
+with one IN query each. The in-memory game data snapshot is used when loaded.
+"""
+
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud, schemas
+from app.services.game_data_snapshot import get_game_data_snapshot
+from app.services.power_cache import get_power_cache
+
+
+class InvalidIdListError(ValueError):
+    """Raised when a comma-separated ID list cannot be parsed."""
+
+
+def parse_id_list(ids: str) -> list[int]:
+    """Parse "1,2, 3" into [1, 2, 3]."""
+    try:
+        parsed = [int(part) for part in ids.split(",") if part.strip()]
+    except ValueError as e:
+        raise InvalidIdListError(f"Invalid id list: {ids!r}") from e
+    if len(parsed) > schemas.MAX_LOOKUP_IDS:
+        raise InvalidIdListError(
+            f"At most {schemas.MAX_LOOKUP_IDS} ids per request, got {len(parsed)}"
+        )
+    return parsed
+
+
+async def get_powers(db: AsyncSession, power_ids: list[int]) -> dict[int, Any]:
+    """Powers by ID (cached detail dicts or snapshot records, with power_data)."""
+    snapshot = get_game_data_snapshot()
+    if snapshot is not None:
+        return {
+            power_id: snapshot.powers_by_id[power_id].as_dict()
+            for power_id in power_ids
+            if power_id in snapshot.powers_by_id
+        }
+    return await get_power_cache().get_powers_by_ids(db, power_ids)
+
+
+async def lookup(db: AsyncSession, request: schemas.LookupRequest) -> dict[str, Any]:
+    """Resolve every requested ID; the result validates as LookupResponse."""
+    snapshot = get_game_data_snapshot()
+    result: dict[str, Any] = {}
+
+    powers = await get_powers(db, request.powers) if request.powers else {}
+    if not request.include_power_data:
+        # Copies, so cached entries keep their power_data
+        powers = {
+            power_id: {**power, "power_data": None}
+            for power_id, power in powers.items()
+        }
+    result["powers"] = powers
+
+    if snapshot is not None:
+        result["powersets"] = _from_index(snapshot.powersets_by_id, request.powersets)
+        result["enhancement_sets"] = _from_index(
+            snapshot.enhancement_sets_by_id, request.enhancement_sets
+        )
+    else:
+        result["powersets"] = _by_id(
+            await crud.get_powersets_by_ids(db, request.powersets)
+        )
+        result["enhancement_sets"] = _by_id(
+            await crud.get_enhancement_sets_by_ids(db, request.enhancement_sets)
+        )
+    result["enhancements"] = _by_id(
+        await crud.get_enhancements_by_ids(db, request.enhancements)
+    )
+
+    missing = {}
+    for name in ("powers", "powersets", "enhancements", "enhancement_sets"):
+        requested = dict.fromkeys(getattr(request, name))
+        unknown = [
+            entity_id for entity_id in requested if entity_id not in result[name]
+        ]
+        if unknown:
+            missing[name] = unknown
+    result["missing"] = missing
+    return result
+
+
+def _by_id(rows: list[Any]) -> dict[int, Any]:
+    return {row.id: row for row in rows}
+
+
+def _from_index(index: Any, ids: list[int]) -> dict[int, Any]:
+    return {entity_id: index[entity_id] for entity_id in ids if entity_id in index}
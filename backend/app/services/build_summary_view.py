@@ -0,0 +1,50 @@
+"""The power_build_summary materialized view (PostgreSQL only).
+
+One row per power with its powerset name and archetype, read by
+PowerCacheService.get_build_summary_data. The view is defined only by Alembic
+migration e81b5d2c4f07 and is refreshed after imports that change powers or
+powersets; the unique index on id lets ``REFRESH MATERIALIZED VIEW
+CONCURRENTLY`` run without blocking readers. Other databases use the
+equivalent join instead.
+"""
+
+import logging
+import time
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+VIEW_NAME = "power_build_summary"
+
+
+def view_state(session: Session) -> bool | None:
+    """None if the view does not exist, else whether it has been populated."""
+    if session.get_bind().dialect.name != "postgresql":
+        return None
+    return session.execute(
+        text("SELECT ispopulated FROM pg_matviews WHERE matviewname = :name"),
+        {"name": VIEW_NAME},
+    ).scalar()
+
+
+def refresh_power_build_summary(session: Session, concurrently: bool = True) -> bool:
+    """Refresh the view and commit.
+
+    Returns:
+        False if there is no view to refresh (e.g. SQLite), True otherwise
+    """
+    state = view_state(session)
+    if state is None:
+        return False
+
+    # CONCURRENTLY needs a populated view (and the unique index on id)
+    mode = "CONCURRENTLY " if concurrently and state else ""
+    start = time.perf_counter()
+    session.execute(text(f"REFRESH MATERIALIZED VIEW {mode}{VIEW_NAME}"))
+    session.commit()
+    logger.info(
+        f"Refreshed {VIEW_NAME} {mode.lower()}in {time.perf_counter() - start:.2f}s"
+    )
+    return True
@@ -0,0 +1,181 @@
+"""Async second-level (shared) cache backends for PowerCacheService.
+
+Backends store opaque bytes; serialization is the caller's concern. Batch
+operations (``mget``/``mset``) cost one round trip regardless of key count, and
+pattern invalidation walks the keyspace incrementally with SCAN rather than
+the blocking KEYS command.
+"""
+
+import fnmatch
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Mapping, Sequence
+
+
+class CacheBackend(ABC):
+    """Interface for an async key/value cache with per-key TTL."""
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        """Return the value for key, or None."""
+
+    @abstractmethod
+    async def mget(self, keys: Sequence[str]) -> list[bytes | None]:
+        """Return values for keys in order (None for misses), in one round trip."""
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        """Store value under key for ttl seconds."""
+
+    @abstractmethod
+    async def mset(self, items: Mapping[str, bytes], ttl: int) -> None:
+        """Store several values with the same TTL in one round trip."""
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> int:
+        """Delete keys. Returns the number removed."""
+
+    @abstractmethod
+    async def delete_pattern(self, pattern: str, batch_size: int = 500) -> int:
+        """Delete every key matching a glob pattern without blocking the server."""
+
+    async def close(self) -> None:  # noqa: B027 - optional hook
+        """Release connections held by the backend."""
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """In-process stand-in for Redis, used in tests and single-node development.
+
+    Mirrors Redis semantics closely enough for the cache service: per-key TTL,
+    glob-style pattern deletes, and a ``round_trips`` counter so callers can
+    check that batch operations really are batched.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._data: dict[str, tuple[bytes, float]] = {}
+        self._clock = clock
+        self.round_trips = 0
+
+    def _live(self, key: str) -> bytes | None:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        value, expires_at = item
+        if expires_at <= self._clock():
+            del self._data[key]
+            return None
+        return value
+
+    async def get(self, key: str) -> bytes | None:
+        self.round_trips += 1
+        return self._live(key)
+
+    async def mget(self, keys: Sequence[str]) -> list[bytes | None]:
+        self.round_trips += 1
+        return [self._live(key) for key in keys]
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        self.round_trips += 1
+        self._data[key] = (value, self._clock() + ttl)
+
+    async def mset(self, items: Mapping[str, bytes], ttl: int) -> None:
+        self.round_trips += 1
+        expires_at = self._clock() + ttl
+        for key, value in items.items():
+            self._data[key] = (value, expires_at)
+
+    async def delete(self, *keys: str) -> int:
+        self.round_trips += 1
+        return sum(self._data.pop(key, None) is not None for key in keys)
+
+    async def delete_pattern(self, pattern: str, batch_size: int = 500) -> int:
+        self.round_trips += 1
+        keys = [key for key in self._data if fnmatch.fnmatchcase(key, pattern)]
+        for key in keys:
+            del self._data[key]
+        return len(keys)
+
+    def __len__(self) -> int:
+        """Number of live (unexpired) keys."""
+        now = self._clock()
+        return sum(expires_at > now for _, expires_at in self._data.values())
+
+
+class RedisCacheBackend(CacheBackend):
+    """Backend on top of a ``redis.asyncio.Redis`` client."""
+
+    def __init__(self, client):
+        """Initialize the backend.
+
+        Args:
+            client: A redis.asyncio.Redis instance (decode_responses must be off)
+        """
+        self.client = client
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> "RedisCacheBackend":
+        """Create a backend from a redis:// URL (requires the ``redis`` package)."""
+        try:
+            from redis import asyncio as aioredis
+        except ImportError as e:
+            raise ImportError(
+                "Redis cache backend requires the 'redis' package "
+                "(pip install 'mids-web-backend[cache]')"
+            ) from e
+
+        return cls(aioredis.from_url(url, **kwargs))
+
+    async def get(self, key: str) -> bytes | None:
+        return await self.client.get(key)
+
+    async def mget(self, keys: Sequence[str]) -> list[bytes | None]:
+        if not keys:
+            return []
+        return await self.client.mget(keys)
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        await self.client.set(key, value, ex=ttl)
+
+    async def mset(self, items: Mapping[str, bytes], ttl: int) -> None:
+        if not items:
+            return
+        # MSET has no TTL, so pipeline SET EX commands instead
+        async with self.client.pipeline(transaction=False) as pipe:
+            for key, value in items.items():
+                pipe.set(key, value, ex=ttl)
+            await pipe.execute()
+
+    async def delete(self, *keys: str) -> int:
+        if not keys:
+            return 0
+        return await self.client.delete(*keys)
+
+    async def delete_pattern(self, pattern: str, batch_size: int = 500) -> int:
+        deleted = 0
+        batch: list[str] = []
+        async for key in self.client.scan_iter(match=pattern, count=batch_size):
+            batch.append(key)
+            if len(batch) >= batch_size:
+                deleted += await self.client.unlink(*batch)
+                batch.clear()
+        if batch:
+            deleted += await self.client.unlink(*batch)
+        return deleted
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+
+def create_cache_backend(url: str | None) -> CacheBackend | None:
+    """Build a backend from a URL.
+
+    ``memory://`` gives the in-process backend, ``redis://``/``rediss://``
+    a Redis backend, and an empty value disables the shared tier.
+    """
+    if not url:
+        return None
+    if url.startswith("memory://"):
+        return InMemoryCacheBackend()
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisCacheBackend.from_url(url)
+    raise ValueError(f"Unsupported cache backend URL: {url}")
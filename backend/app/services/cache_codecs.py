@@ -0,0 +1,269 @@
+"""Serialization codecs for the power cache's shared (L2) tier.
+
+Every encoded payload starts with a two-byte header (serializer id,
+compression id), so any worker can decode entries written by another worker
+with different settings, as long as it has the libraries installed.
+"""
+
+import datetime
+import json
+import time
+import zlib
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+
+def _normalize(value: Any) -> Any:
+    """Map non-native types to stable JSON/msgpack types.
+
+    Decimals always become floats (never strings), so a Numeric column decodes
+    to the same type regardless of which serializer wrote it.
+    """
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, datetime.datetime | datetime.date):
+        return value.isoformat()
+    if isinstance(value, set | frozenset):
+        return sorted(value)
+    if hasattr(value, "item"):  # NumPy scalars
+        return value.item()
+    raise TypeError(f"Cannot serialize {type(value).__name__} for the cache")
+
+
+class Serializer(ABC):
+    """Turns cacheable values into bytes and back."""
+
+    format_id: int
+    name: str
+
+    @abstractmethod
+    def dumps(self, value: Any) -> bytes:
+        """Serialize value."""
+
+    @abstractmethod
+    def loads(self, data: bytes) -> Any:
+        """Deserialize data."""
+
+
+class JsonSerializer(Serializer):
+    """Compact UTF-8 JSON."""
+
+    format_id = 1
+    name = "json"
+
+    def dumps(self, value: Any) -> bytes:
+        return json.dumps(value, default=_normalize, separators=(",", ":")).encode()
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class MsgpackSerializer(Serializer):
+    """MessagePack binary encoding (requires the ``msgpack`` package).
+
+    Floats are always written as float64 so values round-trip exactly.
+    """
+
+    format_id = 2
+    name = "msgpack"
+
+    def __init__(self):
+        if msgpack is None:
+            raise ImportError(
+                "msgpack codec requires the 'msgpack' package "
+                "(pip install 'mids-web-backend[cache]')"
+            )
+
+    def dumps(self, value: Any) -> bytes:
+        return msgpack.packb(
+            value, default=_normalize, use_bin_type=True, use_single_float=False
+        )
+
+    def loads(self, data: bytes) -> Any:
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+
+_SERIALIZERS: dict[int, type[Serializer]] = {
+    JsonSerializer.format_id: JsonSerializer,
+    MsgpackSerializer.format_id: MsgpackSerializer,
+}
+
+# Compression ids stored in the header
+_NO_COMPRESSION = 0
+_ZSTD = 1
+_ZLIB = 2
+
+
+@dataclass
+class PrefixCodecStats:
+    """Encode/decode counters for one key prefix."""
+
+    encodes: int = 0
+    decodes: int = 0
+    encode_seconds: float = 0.0
+    decode_seconds: float = 0.0
+    raw_bytes: int = 0
+    encoded_bytes: int = 0
+    compressed: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "encodes": self.encodes,
+            "decodes": self.decodes,
+            "encode_ms": round(self.encode_seconds * 1000, 3),
+            "decode_ms": round(self.decode_seconds * 1000, 3),
+            "avg_encoded_bytes": (
+                self.encoded_bytes / self.encodes if self.encodes > 0 else 0
+            ),
+            "raw_bytes": self.raw_bytes,
+            "encoded_bytes": self.encoded_bytes,
+            "compression_ratio": (
+                self.raw_bytes / self.encoded_bytes if self.encoded_bytes > 0 else 0
+            ),
+            "compressed": self.compressed,
+        }
+
+
+class CacheCodec:
+    """Serializer plus optional compression, with per-prefix timing stats."""
+
+    def __init__(
+        self,
+        serializer: Serializer | None = None,
+        compression: str | None = "auto",
+        compress_threshold: int = 1024,
+        compression_level: int = 3,
+    ):
+        """Initialize the codec.
+
+        Args:
+            serializer: Serializer for new entries (defaults to msgpack when
+                installed, JSON otherwise)
+            compression: "zstd", "zlib", None, or "auto" (zstd when installed,
+                zlib otherwise)
+            compress_threshold: Only payloads at least this many bytes are
+                compressed
+            compression_level: Level passed to the compressor
+        """
+        if serializer is None:
+            serializer = (
+                MsgpackSerializer() if msgpack is not None else JsonSerializer()
+            )
+        if compression == "auto":
+            compression = "zstd" if zstandard is not None else "zlib"
+        if compression == "zstd" and zstandard is None:
+            raise ImportError(
+                "zstd compression requires the 'zstandard' package "
+                "(pip install 'mids-web-backend[cache]')"
+            )
+        if compression not in ("zstd", "zlib", None):
+            raise ValueError(f"Unsupported compression: {compression}")
+
+        self.serializer = serializer
+        self.compression = compression
+        self.compress_threshold = compress_threshold
+        self.compression_level = compression_level
+        self._serializers: dict[int, Serializer] = {serializer.format_id: serializer}
+        self._stats: dict[str, PrefixCodecStats] = {}
+
+        if compression == "zstd":
+            self._compression_id = _ZSTD
+            # Not thread-safe; the L2 tier is only used from the event loop
+            self._compressor = zstandard.ZstdCompressor(level=compression_level)
+        elif compression == "zlib":
+            self._compression_id = _ZLIB
+        else:
+            self._compression_id = _NO_COMPRESSION
+
+    def _stats_for(self, prefix: str) -> PrefixCodecStats:
+        stats = self._stats.get(prefix)
+        if stats is None:
+            stats = self._stats[prefix] = PrefixCodecStats()
+        return stats
+
+    def _serializer_for(self, format_id: int) -> Serializer:
+        serializer = self._serializers.get(format_id)
+        if serializer is None:
+            serializer_cls = _SERIALIZERS.get(format_id)
+            if serializer_cls is None:
+                raise ValueError(f"Unknown cache payload format {format_id}")
+            serializer = self._serializers[format_id] = serializer_cls()
+        return serializer
+
+    def encode(self, value: Any, prefix: str = "") -> bytes:
+        """Serialize (and compress if large enough) value."""
+        start = time.perf_counter()
+        payload = self.serializer.dumps(value)
+        raw_size = len(payload)
+
+        compression_id = _NO_COMPRESSION
+        if (
+            self._compression_id != _NO_COMPRESSION
+            and raw_size >= self.compress_threshold
+        ):
+            if self._compression_id == _ZSTD:
+                compressed = self._compressor.compress(payload)
+            else:
+                compressed = zlib.compress(payload, self.compression_level)
+            # Keep the raw payload when compression does not help
+            if len(compressed) < raw_size:
+                payload = compressed
+                compression_id = self._compression_id
+
+        data = bytes((self.serializer.format_id, compression_id)) + payload
+
+        stats = self._stats_for(prefix)
+        stats.encodes += 1
+        stats.encode_seconds += time.perf_counter() - start
+        stats.raw_bytes += raw_size
+        stats.encoded_bytes += len(data)
+        if compression_id != _NO_COMPRESSION:
+            stats.compressed += 1
+        return data
+
+    def decode(self, data: bytes, prefix: str = "") -> Any:
+        """Decode a payload produced by any CacheCodec configuration."""
+        start = time.perf_counter()
+        if len(data) < 2:
+            raise ValueError("Cache payload is missing its header")
+
+        format_id, compression_id = data[0], data[1]
+        payload = data[2:]
+        if compression_id == _ZSTD:
+            if zstandard is None:
+                raise ValueError("zstd payload but 'zstandard' is not installed")
+            payload = zstandard.ZstdDecompressor().decompress(payload)
+        elif compression_id == _ZLIB:
+            payload = zlib.decompress(payload)
+        elif compression_id != _NO_COMPRESSION:
+            raise ValueError(f"Unknown cache payload compression {compression_id}")
+
+        value = self._serializer_for(format_id).loads(payload)
+
+        stats = self._stats_for(prefix)
+        stats.decodes += 1
+        stats.decode_seconds += time.perf_counter() - start
+        return value
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return codec settings and per-prefix timings and sizes."""
+        return {
+            "serializer": self.serializer.name,
+            "compression": self.compression,
+            "compress_threshold": self.compress_threshold,
+            "by_prefix": {
+                prefix: stats.as_dict() for prefix, stats in sorted(self._stats.items())
+            },
+        }
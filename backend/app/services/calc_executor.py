@@ -0,0 +1,260 @@
+"""
+Executor layer for CPU-bound calculation endpoints.
+
+Calculations are pure Python, so running them on the event loop stalls every
+other request until they finish. Handlers hand them to this layer instead:
+
+- light calls (one power, one build) run on a thread pool
+- heavy calls (build batches) run on a process pool whose workers import the
+  calculation modules and warm their lookup tables once at start-up
+
+Each pool accepts at most ``workers + CALC_QUEUE_SIZE`` outstanding calls;
+beyond that, calls fail fast with ExecutorSaturatedError (a 503 for clients)
+rather than queueing without bound. Queue and run times are recorded per
+endpoint.
+"""
+
+import asyncio
+import importlib
+import multiprocessing
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+CALC_THREAD_WORKERS = int(os.getenv("CALC_THREAD_WORKERS", "4"))
+# 0 runs heavy calls on the thread pool as well
+CALC_PROCESS_WORKERS = int(os.getenv("CALC_PROCESS_WORKERS", str(os.cpu_count() or 1)))
+# Calls allowed to wait per pool once every worker is busy
+CALC_QUEUE_SIZE = int(os.getenv("CALC_QUEUE_SIZE", "64"))
+
+# Seconds clients are asked to wait before retrying a rejected call
+RETRY_AFTER_SECONDS = 1
+
+
+class ExecutorSaturatedError(RuntimeError):
+    """Raised when a pool already has its maximum number of outstanding calls."""
+
+
+class EndpointMetrics:
+    """Call counters and queue/run times for one endpoint."""
+
+    def __init__(self):
+        self.calls = 0
+        self.rejected = 0
+        self.total_queue_seconds = 0.0
+        self.max_queue_seconds = 0.0
+        self.total_run_seconds = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "rejected": self.rejected,
+            "avg_queue_ms": (
+                round(self.total_queue_seconds / self.calls * 1000, 3)
+                if self.calls
+                else 0.0
+            ),
+            "max_queue_ms": round(self.max_queue_seconds * 1000, 3),
+            "avg_run_ms": (
+                round(self.total_run_seconds / self.calls * 1000, 3)
+                if self.calls
+                else 0.0
+            ),
+        }
+
+
+def _timed_call(fn: Callable[..., T], args: tuple) -> tuple[float, float, T]:
+    """Run fn in a worker and report when it started and finished.
+
+    Wall-clock time, since the caller may be in another process.
+    """
+    started = time.time()
+    result = fn(*args)
+    return started, time.time(), result
+
+
+def _init_process_worker(preload: tuple[str, ...]) -> None:
+    """Import and warm calculation state once per worker process."""
+    from app.calculations.core.archetype_caps import (
+        ArchetypeType,
+        get_archetype_caps,
+    )
+
+    for archetype in ArchetypeType:
+        get_archetype_caps(archetype)
+    for module in preload:
+        importlib.import_module(module)
+
+
+def _noop() -> None:
+    pass
+
+
+class CalcExecutor:
+    """Thread pool for light calls and process pool for heavy ones."""
+
+    def __init__(
+        self,
+        thread_workers: int = CALC_THREAD_WORKERS,
+        process_workers: int = CALC_PROCESS_WORKERS,
+        queue_size: int = CALC_QUEUE_SIZE,
+        preload: Iterable[str] = (),
+    ):
+        """Initialize the executor (pools start on first use or prewarm()).
+
+        Args:
+            thread_workers: Threads for light calls
+            process_workers: Processes for heavy calls; 0 uses the thread pool
+            queue_size: Calls allowed to wait per pool when all workers are busy
+            preload: Modules each worker process imports at start-up (e.g. the
+                module defining the heavy functions)
+        """
+        self.thread_workers = thread_workers
+        self.process_workers = process_workers
+        self.queue_size = queue_size
+        self.preload = tuple(preload)
+
+        self._threads: ThreadPoolExecutor | None = None
+        self._processes: ProcessPoolExecutor | None = None
+        self._pending = {"thread": 0, "process": 0}
+
+        self._lock = threading.Lock()
+        self._metrics: dict[str, EndpointMetrics] = {}
+
+    @property
+    def heavy_workers(self) -> int:
+        """Workers available to heavy calls."""
+        return self.process_workers or self.thread_workers
+
+    def _pool(self, kind: str) -> Executor:
+        if kind == "thread":
+            if self._threads is None:
+                self._threads = ThreadPoolExecutor(
+                    max_workers=self.thread_workers, thread_name_prefix="calc"
+                )
+            return self._threads
+        if self._processes is None:
+            # spawn: forking a server process with live threads is unsafe
+            self._processes = ProcessPoolExecutor(
+                max_workers=self.process_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_process_worker,
+                initargs=(self.preload,),
+            )
+        return self._processes
+
+    def _endpoint(self, endpoint: str) -> EndpointMetrics:
+        metrics = self._metrics.get(endpoint)
+        if metrics is None:
+            metrics = self._metrics.setdefault(endpoint, EndpointMetrics())
+        return metrics
+
+    def _capacity(self, kind: str) -> int:
+        workers = self.thread_workers if kind == "thread" else self.process_workers
+        return workers + self.queue_size
+
+    def _kind(self, heavy: bool) -> str:
+        return "process" if heavy and self.process_workers else "thread"
+
+    def check_capacity(self, heavy: bool = False) -> None:
+        """Raise ExecutorSaturatedError if a call would be rejected right now."""
+        kind = self._kind(heavy)
+        if self._pending[kind] >= self._capacity(kind):
+            raise ExecutorSaturatedError(f"Calculation {kind} pool is saturated")
+
+    async def _run(
+        self, heavy: bool, endpoint: str, fn: Callable[..., T], args: tuple
+    ) -> T:
+        try:
+            self.check_capacity(heavy)
+        except ExecutorSaturatedError:
+            with self._lock:
+                self._endpoint(endpoint).rejected += 1
+            raise
+
+        kind = self._kind(heavy)
+        loop = asyncio.get_running_loop()
+        self._pending[kind] += 1
+        submitted = time.time()
+        try:
+            started, finished, result = await loop.run_in_executor(
+                self._pool(kind), _timed_call, fn, args
+            )
+        finally:
+            self._pending[kind] -= 1
+
+        queued = max(0.0, started - submitted)
+        with self._lock:
+            metrics = self._endpoint(endpoint)
+            metrics.calls += 1
+            metrics.total_queue_seconds += queued
+            metrics.max_queue_seconds = max(metrics.max_queue_seconds, queued)
+            metrics.total_run_seconds += finished - started
+        return result
+
+    async def run_light(self, endpoint: str, fn: Callable[..., T], *args: Any) -> T:
+        """Run fn(*args) on the thread pool."""
+        return await self._run(False, endpoint, fn, args)
+
+    async def run_heavy(self, endpoint: str, fn: Callable[..., T], *args: Any) -> T:
+        """Run fn(*args) on the process pool (fn and args must be picklable)."""
+        return await self._run(True, endpoint, fn, args)
+
+    def prewarm(self) -> None:
+        """Start every worker process now instead of on the first heavy call."""
+        if self.process_workers:
+            pool = self._pool("process")
+            for _ in range(self.process_workers):
+                pool.submit(_noop)
+
+    def shutdown(self) -> None:
+        """Stop both pools (queued calls are cancelled)."""
+        for pool in (self._threads, self._processes):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+        self._threads = self._processes = None
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            endpoints = {name: m.as_dict() for name, m in self._metrics.items()}
+        return {
+            "thread_workers": self.thread_workers,
+            "process_workers": self.process_workers,
+            "queue_size": self.queue_size,
+            "pending": dict(self._pending),
+            "endpoints": endpoints,
+        }
+
+
+# Global executor instance
+_calc_executor: CalcExecutor | None = None
+
+
+def get_calc_executor() -> CalcExecutor:
+    """Get the global calculation executor, creating it on first use."""
+    global _calc_executor
+    if _calc_executor is None:
+        _calc_executor = CalcExecutor()
+    return _calc_executor
+
+
+def init_calc_executor(**kwargs: Any) -> CalcExecutor:
+    """Replace the global executor (application startup)."""
+    global _calc_executor
+    if _calc_executor is not None:
+        _calc_executor.shutdown()
+    _calc_executor = CalcExecutor(**kwargs)
+    return _calc_executor
+
+
+def shutdown_calc_executor() -> None:
+    """Stop the global executor's pools (application shutdown)."""
+    global _calc_executor
+    if _calc_executor is not None:
+        _calc_executor.shutdown()
+        _calc_executor = None
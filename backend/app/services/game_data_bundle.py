@@ -0,0 +1,415 @@
+"""Memory-mapped binary bundle of the filtered_data game files.
+
+``filtered_data/`` is ~120 MB of pretty-printed JSON spread over thousands of
+files; reading one power means opening and parsing its file. The bundle packs
+everything into a single versioned file:
+
+- ``strings``: interned UTF-8 strings (names, keys, table names)
+- ``<collection>.index`` / ``<collection>.data``: compact JSON documents for
+  powers, powersets, archetypes and boost sets, located through a
+  fixed-size index sorted by key
+- ``powers.stats``: fixed-layout float64 rows of the commonly used numeric
+  power fields, in index order
+- ``tables.index`` / ``tables.data``: archetype named tables as contiguous
+  float64 arrays; the archetype document keeps only their key -> name map
+- ``meta``: build metadata (format version, source revision, counts)
+
+``GameDataBundle`` mmaps the file. Document lookups return a memoryview into
+the mapping (or the parsed dict), and tables come back as zero-copy float64
+views, so opening the bundle costs almost nothing no matter how large it is.
+Every number is stored little-endian and the table views use native byte
+order, so bundles can only be opened on little-endian hosts.
+``get_archetype`` restores the named tables, so it returns the source document.
+"""
+
+import bisect
+import json
+import mmap
+import struct
+import sys
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+MAGIC = b"MIDSBNDL"
+FORMAT_VERSION = 2
+
+# magic, format version, section count, reserved
+_HEADER = struct.Struct("<8sIII")
+# section name, offset, length
+_SECTION = struct.Struct("<16sQQ")
+# key string id, data offset, data length
+_DOC_INDEX = struct.Struct("<IQI")
+# archetype string id, table string id, float offset, float count
+_TABLE_INDEX = struct.Struct("<IIQI")
+
+# Numeric power fields stored in powers.stats (NaN when missing)
+POWER_STAT_FIELDS = (
+    "accuracy",
+    "activation_time",
+    "recharge_time",
+    "endurance_cost",
+    "range",
+    "radius",
+    "arc",
+    "max_targets_hit",
+)
+_POWER_STATS = struct.Struct("<" + "d" * len(POWER_STAT_FIELDS))
+
+COLLECTIONS = ("powers", "powersets", "archetypes", "boost_sets")
+
+
+class BundleFormatError(ValueError):
+    """Raised when a file is not a bundle this reader understands."""
+
+
+def _compact_json(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def _align(buffer: bytearray, alignment: int = 8) -> None:
+    buffer.extend(b"\0" * (-len(buffer) % alignment))
+
+
+class _StringTable:
+    def __init__(self):
+        self.ids: dict[str, int] = {}
+        self.strings: list[str] = []
+
+    def intern(self, value: str) -> int:
+        sid = self.ids.get(value)
+        if sid is None:
+            sid = self.ids[value] = len(self.strings)
+            self.strings.append(value)
+        return sid
+
+    def to_bytes(self) -> bytes:
+        encoded = [s.encode() for s in self.strings]
+        offsets = [0]
+        for item in encoded:
+            offsets.append(offsets[-1] + len(item))
+        header = struct.pack(f"<I{len(offsets)}I", len(encoded), *offsets)
+        return header + b"".join(encoded)
+
+
+def _load_json(path: Path) -> Any:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _iter_source_documents(
+    data_dir: Path,
+) -> Iterator[tuple[str, str, dict[str, Any]]]:
+    """Yield (collection, key, document) for every source file."""
+    for path in sorted((data_dir / "powers").rglob("*.json")):
+        doc = _load_json(path)
+        if path.name == "index.json":
+            names = doc.get("power_names") or []
+            if names:
+                key = names[0].rsplit(".", 1)[0]
+            else:
+                key = f"{path.parent.parent.name}.{doc.get('name', path.parent.name)}"
+            yield "powersets", key, doc
+        elif "full_name" in doc:
+            yield "powers", doc["full_name"], doc
+
+    for path in sorted((data_dir / "archetypes").glob("*.json")):
+        if path.name != "index.json":
+            doc = _load_json(path)
+            yield "archetypes", doc.get("name", path.stem), doc
+
+    for path in sorted((data_dir / "boost_sets").glob("*.json")):
+        if path.name != "index.json":
+            doc = _load_json(path)
+            yield "boost_sets", doc.get("name", path.stem), doc
+
+
+def _power_stats(doc: dict[str, Any]) -> bytes:
+    values = []
+    for name in POWER_STAT_FIELDS:
+        value = doc.get(name)
+        values.append(float(value) if isinstance(value, int | float) else float("nan"))
+    return _POWER_STATS.pack(*values)
+
+
+def compile_bundle(data_dir: Path, output_path: Path) -> dict[str, Any]:
+    """Compile a filtered_data directory into a bundle file.
+
+    Returns build statistics (source/bundle sizes, counts, elapsed time).
+    """
+    start = time.perf_counter()
+    data_dir = Path(data_dir)
+    strings = _StringTable()
+    documents: dict[str, dict[str, bytes]] = {name: {} for name in COLLECTIONS}
+    power_stats: dict[str, bytes] = {}
+    tables: list[tuple[str, str, list[float]]] = []
+
+    for collection, key, doc in _iter_source_documents(data_dir):
+        if collection == "archetypes" and isinstance(doc.get("named_tables"), dict):
+            # Named tables go to the numeric tables section, not the JSON blob
+            named_tables = doc["named_tables"]
+            for table in named_tables.values():
+                tables.append((key, table["name"], table.get("values") or []))
+            doc["named_tables"] = {
+                table_key: table["name"] for table_key, table in named_tables.items()
+            }
+        if collection == "powers":
+            power_stats[key] = _power_stats(doc)
+        documents[collection][key] = _compact_json(doc)
+
+    sections: dict[str, bytes] = {}
+    for collection, docs in documents.items():
+        index = bytearray()
+        data = bytearray()
+        for key in sorted(docs):
+            payload = docs[key]
+            index += _DOC_INDEX.pack(strings.intern(key), len(data), len(payload))
+            data += payload
+        sections[f"{collection}.index"] = bytes(index)
+        sections[f"{collection}.data"] = bytes(data)
+    sections["powers.stats"] = b"".join(
+        power_stats[key] for key in sorted(documents["powers"])
+    )
+
+    table_index = bytearray()
+    table_data = bytearray()
+    for archetype, name, values in sorted(tables, key=lambda t: (t[0], t[1])):
+        table_index += _TABLE_INDEX.pack(
+            strings.intern(archetype),
+            strings.intern(name),
+            len(table_data),
+            len(values),
+        )
+        table_data += struct.pack(f"<{len(values)}d", *values)
+    sections["tables.index"] = bytes(table_index)
+    sections["tables.data"] = bytes(table_data)
+
+    revision = None
+    archetype_index = data_dir / "archetypes" / "index.json"
+    if archetype_index.exists():
+        revision = _load_json(archetype_index).get("revision")
+    meta = {
+        "format_version": FORMAT_VERSION,
+        "revision": revision,
+        "compiled_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "counts": {name: len(docs) for name, docs in documents.items()},
+        "tables": len(tables),
+        "power_stat_fields": list(POWER_STAT_FIELDS),
+    }
+    sections["meta"] = _compact_json(meta)
+    sections["strings"] = strings.to_bytes()
+
+    names = sorted(sections)
+    body_start = _HEADER.size + _SECTION.size * len(names)
+    out = bytearray(_HEADER.pack(MAGIC, FORMAT_VERSION, len(names), 0))
+    out += b"\0" * (_SECTION.size * len(names))
+    _align(out)
+
+    table_entries = []
+    for name in names:
+        _align(out)
+        table_entries.append(
+            _SECTION.pack(name.encode(), len(out), len(sections[name]))
+        )
+        out += sections[name]
+    out[_HEADER.size : body_start] = b"".join(table_entries)
+
+    output_path = Path(output_path)
+    tmp_path = output_path.with_suffix(output_path.suffix + ".tmp")
+    tmp_path.write_bytes(out)
+    tmp_path.replace(output_path)  # atomic, so readers never see a partial file
+
+    source_bytes = sum(p.stat().st_size for p in data_dir.rglob("*.json"))
+    return {
+        **meta,
+        "source_bytes": source_bytes,
+        "bundle_bytes": len(out),
+        "compile_seconds": time.perf_counter() - start,
+    }
+
+
+class GameDataBundle:
+    """Read-only, memory-mapped view of a compiled bundle.
+
+    Opening only parses the header; per-collection key indexes are built the
+    first time a collection is used.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        try:
+            section_count = self._read_header()
+        except BundleFormatError:
+            self._view.release()
+            self._mmap.close()
+            raise
+
+        self._sections: dict[str, memoryview] = {}
+        for i in range(section_count):
+            raw_name, offset, length = _SECTION.unpack_from(
+                self._view, _HEADER.size + i * _SECTION.size
+            )
+            name = raw_name.rstrip(b"\0").decode()
+            self._sections[name] = self._view[offset : offset + length]
+
+        self._string_offsets: tuple[int, ...] | None = None
+        self._keys: dict[str, list[str]] = {}
+        self._positions: dict[str, dict[str, int]] = {}
+        self._tables: dict[tuple[str, str], tuple[int, int]] | None = None
+        self.meta: dict[str, Any] = json.loads(bytes(self._sections["meta"]))
+
+    def _read_header(self) -> int:
+        if sys.byteorder != "little":
+            # get_table() casts little-endian data to native float64
+            raise BundleFormatError(
+                f"{self.path} is little-endian and needs a little-endian host"
+            )
+        if len(self._view) < _HEADER.size:
+            raise BundleFormatError(f"{self.path} is too small to be a bundle")
+        magic, version, section_count, _ = _HEADER.unpack_from(self._view, 0)
+        if magic != MAGIC:
+            raise BundleFormatError(f"{self.path} is not a game data bundle")
+        if version != FORMAT_VERSION:
+            raise BundleFormatError(
+                f"{self.path} has bundle format {version}, expected {FORMAT_VERSION}"
+            )
+        return section_count
+
+    def close(self) -> None:
+        """Release the mapping.
+
+        Views returned by ``get_json``/``get_table`` must be released first.
+        """
+        for view in self._sections.values():
+            view.release()
+        self._sections.clear()
+        self._view.release()
+        self._mmap.close()
+
+    def __enter__(self) -> "GameDataBundle":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # Strings
+
+    def _string(self, sid: int) -> str:
+        section = self._sections["strings"]
+        if self._string_offsets is None:
+            (count,) = struct.unpack_from("<I", section, 0)
+            self._string_offsets = struct.unpack_from(f"<{count + 1}I", section, 4)
+        base = 4 + 4 * len(self._string_offsets)
+        start, end = self._string_offsets[sid], self._string_offsets[sid + 1]
+        return bytes(section[base + start : base + end]).decode()
+
+    # Documents
+
+    def keys(self, collection: str) -> list[str]:
+        """Sorted keys of a collection (power full names, archetype names, ...)."""
+        keys = self._keys.get(collection)
+        if keys is None:
+            index = self._sections[f"{collection}.index"]
+            keys = [self._string(sid) for sid, _, _ in _DOC_INDEX.iter_unpack(index)]
+            self._keys[collection] = keys
+            self._positions[collection] = {key: i for i, key in enumerate(keys)}
+        return keys
+
+    def _position(self, collection: str, key: str) -> int | None:
+        if collection not in self._positions:
+            self.keys(collection)
+        return self._positions[collection].get(key)
+
+    def _document_view(self, collection: str, position: int) -> memoryview:
+        _, offset, length = _DOC_INDEX.unpack_from(
+            self._sections[f"{collection}.index"], position * _DOC_INDEX.size
+        )
+        return self._sections[f"{collection}.data"][offset : offset + length]
+
+    def get_json(self, collection: str, key: str) -> memoryview | None:
+        """Return a document's compact JSON as a zero-copy view, or None."""
+        position = self._position(collection, key)
+        if position is None:
+            return None
+        return self._document_view(collection, position)
+
+    def get(self, collection: str, key: str) -> dict[str, Any] | None:
+        """Return a parsed document, or None."""
+        view = self.get_json(collection, key)
+        return None if view is None else json.loads(bytes(view))
+
+    def get_power(self, full_name: str) -> dict[str, Any] | None:
+        """Return a power document by full name."""
+        return self.get("powers", full_name)
+
+    def get_archetype(self, name: str) -> dict[str, Any] | None:
+        """Return an archetype document with its named tables restored."""
+        doc = self.get("archetypes", name)
+        if doc is not None and isinstance(doc.get("named_tables"), dict):
+            doc["named_tables"] = {
+                table_key: {
+                    "name": table_name,
+                    "values": self.get_table(name, table_name).tolist(),
+                }
+                for table_key, table_name in doc["named_tables"].items()
+            }
+        return doc
+
+    def get_power_stats(self, full_name: str) -> dict[str, float] | None:
+        """Return the fixed numeric fields of a power without parsing its JSON."""
+        position = self._position("powers", full_name)
+        if position is None:
+            return None
+        values = _POWER_STATS.unpack_from(
+            self._sections["powers.stats"], position * _POWER_STATS.size
+        )
+        return dict(zip(POWER_STAT_FIELDS, values, strict=True))
+
+    def powerset_power_names(self, powerset_full_name: str) -> list[str]:
+        """Full names of all powers in a powerset (contiguous in the sorted index)."""
+        keys = self.keys("powers")
+        prefix = powerset_full_name + "."
+        start = bisect.bisect_left(keys, prefix)
+        end = bisect.bisect_left(keys, powerset_full_name + "/")  # '/' follows '.'
+        return [key for key in keys[start:end] if "." not in key[len(prefix) :]]
+
+    # Tables
+
+    def _table_positions(self) -> dict[tuple[str, str], tuple[int, int]]:
+        if self._tables is None:
+            self._tables = {
+                (self._string(at_sid), self._string(name_sid)): (offset, count)
+                for at_sid, name_sid, offset, count in _TABLE_INDEX.iter_unpack(
+                    self._sections["tables.index"]
+                )
+            }
+        return self._tables
+
+    def table_names(self, archetype: str) -> list[str]:
+        """Named tables available for an archetype."""
+        return sorted(name for at, name in self._table_positions() if at == archetype)
+
+    def get_table(self, archetype: str, table_name: str) -> memoryview | None:
+        """Return an archetype table as a zero-copy float64 memoryview.
+
+        The view is in native byte order, which opening the bundle checked is
+        little-endian; ``numpy.frombuffer(view, dtype=np.float64)`` wraps it
+        without copying.
+        """
+        entry = self._table_positions().get((archetype, table_name))
+        if entry is None:
+            return None
+        offset, count = entry
+        return self._sections["tables.data"][offset : offset + count * 8].cast("d")
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return bundle metadata and section sizes."""
+        return {
+            **self.meta,
+            "path": str(self.path),
+            "bundle_bytes": len(self._view),
+            "sections": {name: len(view) for name, view in self._sections.items()},
+        }
@@ -0,0 +1,273 @@
+"""Immutable in-memory snapshot of the read-only game data.
+
+Game data only changes when an import runs, so the API can serve archetypes,
+powersets, powers, enhancement sets and archetype modifier tables from an
+indexed snapshot loaded once at startup instead of querying on every request.
+After a re-import, POST /admin/game-data-snapshot/reload builds a new snapshot
+and swaps it in atomically; requests that already hold the old snapshot keep a
+consistent view until they finish.
+"""
+
+import logging
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from decimal import Decimal
+from types import MappingProxyType
+from typing import Any, TypeVar
+
+from sqlalchemy.orm import Session, undefer_group
+
+from app.models import (
+    POWER_BLOBS,
+    Archetype,
+    ArchetypeModifierTable,
+    EnhancementSet,
+    Power,
+    Powerset,
+)
+from app.services.memory_cache import LRUCache, estimate_size
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Serialized response bodies kept per snapshot (one per distinct page/filter)
+MAX_PRECOMPUTED_RESPONSES = 256
+
+
+class SnapshotRecord:
+    """Read-only row: column values exposed as attributes.
+
+    Compatible with the ``from_attributes`` response schemas, so routers can
+    return records in place of ORM objects. Nested JSON values are shared with
+    the snapshot and must not be mutated.
+    """
+
+    __slots__ = ("_values",)
+
+    def __init__(self, values: Mapping[str, Any]):
+        object.__setattr__(self, "_values", MappingProxyType(dict(values)))
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self._values[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("SnapshotRecord is read-only")
+
+    def __repr__(self) -> str:
+        return f"SnapshotRecord(id={self._values.get('id')!r})"
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a shallow copy of the column values."""
+        return dict(self._values)
+
+
+def _freeze_value(value: Any) -> Any:
+    # Numeric columns: convert once here rather than in every response
+    return float(value) if isinstance(value, Decimal) else value
+
+
+def _freeze_rows(rows: Iterable[Any]) -> tuple[SnapshotRecord, ...]:
+    """Copy ORM rows' column values into records, ordered by id.
+
+    Decimal values become floats.
+    """
+    records = []
+    for row in rows:
+        columns = row.__table__.columns
+        records.append(
+            SnapshotRecord({c.key: _freeze_value(getattr(row, c.key)) for c in columns})
+        )
+    records.sort(key=lambda r: r.id)
+    return tuple(records)
+
+
+def level_key(record: SnapshotRecord) -> tuple[bool, int, int]:
+    """Sort key for (min_level, id) ordering with NULL levels last."""
+    return (record.min_level is None, record.min_level or 0, record.id)
+
+
+def _index(
+    records: Iterable[SnapshotRecord], attr: str
+) -> Mapping[Any, SnapshotRecord]:
+    return MappingProxyType({getattr(r, attr): r for r in records})
+
+
+def _group(
+    records: Iterable[SnapshotRecord], key: Callable[[SnapshotRecord], Any]
+) -> Mapping[Any, tuple[SnapshotRecord, ...]]:
+    groups: dict[Any, list[SnapshotRecord]] = {}
+    for record in records:
+        groups.setdefault(key(record), []).append(record)
+    return MappingProxyType({k: tuple(v) for k, v in groups.items()})
+
+
+@dataclass(frozen=True)
+class GameDataSnapshot:
+    """Indexed, immutable view of all game data."""
+
+    archetypes: tuple[SnapshotRecord, ...]
+    powersets: tuple[SnapshotRecord, ...]
+    powers: tuple[SnapshotRecord, ...]
+    enhancement_sets: tuple[SnapshotRecord, ...]
+
+    # archetype_id -> {table_name: values}
+    modifier_tables: Mapping[int, Mapping[str, tuple[float, ...]]]
+
+    version: int = 0
+    load_seconds: float = 0.0
+    memory_bytes: int = 0
+
+    archetypes_by_id: Mapping[int, SnapshotRecord] = field(init=False)
+    archetypes_by_name: Mapping[str, SnapshotRecord] = field(init=False)
+    powersets_by_id: Mapping[int, SnapshotRecord] = field(init=False)
+    powersets_by_archetype: Mapping[int, tuple[SnapshotRecord, ...]] = field(init=False)
+    powers_by_id: Mapping[int, SnapshotRecord] = field(init=False)
+    powers_by_full_name: Mapping[str, SnapshotRecord] = field(init=False)
+    powers_by_powerset: Mapping[int, tuple[SnapshotRecord, ...]] = field(init=False)
+    powers_by_archetype: Mapping[int, tuple[SnapshotRecord, ...]] = field(init=False)
+    enhancement_sets_by_id: Mapping[int, SnapshotRecord] = field(init=False)
+    enhancement_sets_by_name: Mapping[str, SnapshotRecord] = field(init=False)
+    # Ordered by (min_level, id), NULL levels last, like the paginated endpoint
+    enhancement_sets_by_level: tuple[SnapshotRecord, ...] = field(init=False)
+
+    _responses: LRUCache = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        def put(name: str, value: Any) -> None:
+            object.__setattr__(self, name, value)
+
+        put("archetypes_by_id", _index(self.archetypes, "id"))
+        put("archetypes_by_name", _index(self.archetypes, "name"))
+        put("powersets_by_id", _index(self.powersets, "id"))
+        put(
+            "powersets_by_archetype",
+            _group(self.powersets, lambda ps: ps.archetype_id),
+        )
+        put("powers_by_id", _index(self.powers, "id"))
+        put("powers_by_full_name", _index(self.powers, "full_name"))
+        put("powers_by_powerset", _group(self.powers, lambda p: p.powerset_id))
+
+        powerset_archetype = {ps.id: ps.archetype_id for ps in self.powersets}
+        put(
+            "powers_by_archetype",
+            _group(self.powers, lambda p: powerset_archetype.get(p.powerset_id)),
+        )
+        put("enhancement_sets_by_id", _index(self.enhancement_sets, "id"))
+        put("enhancement_sets_by_name", _index(self.enhancement_sets, "name"))
+        put(
+            "enhancement_sets_by_level",
+            tuple(sorted(self.enhancement_sets, key=level_key)),
+        )
+        put("_responses", LRUCache(max_entries=MAX_PRECOMPUTED_RESPONSES))
+
+    def precomputed(self, key: str, build: Callable[[], T]) -> T:
+        """Return the value cached under key, building it on first use.
+
+        For serialized response bodies derived from this snapshot; they are
+        dropped along with it when a re-import swaps in a new one.
+        """
+        value = self._responses.get(key)
+        if value is None:
+            value = build()
+            self._responses.set(key, value)
+        return value
+
+    @classmethod
+    def load(cls, session: Session, version: int = 0) -> "GameDataSnapshot":
+        """Read all game data from the database and build the indexes."""
+        start = time.perf_counter()
+
+        tables: dict[int, dict[str, tuple[float, ...]]] = {}
+        for table in session.query(ArchetypeModifierTable).all():
+            tables.setdefault(table.archetype_id, {})[table.table_name] = tuple(
+                table.values or ()
+            )
+
+        snapshot = cls(
+            archetypes=_freeze_rows(session.query(Archetype).all()),
+            powersets=_freeze_rows(session.query(Powerset).all()),
+            powers=_freeze_rows(
+                session.query(Power).options(undefer_group(POWER_BLOBS)).all()
+            ),
+            enhancement_sets=_freeze_rows(session.query(EnhancementSet).all()),
+            modifier_tables=MappingProxyType(
+                {at: MappingProxyType(t) for at, t in tables.items()}
+            ),
+            version=version,
+        )
+        object.__setattr__(snapshot, "load_seconds", time.perf_counter() - start)
+        object.__setattr__(snapshot, "memory_bytes", snapshot._estimate_memory())
+        return snapshot
+
+    def _estimate_memory(self) -> int:
+        groups = (self.archetypes, self.powersets, self.powers, self.enhancement_sets)
+        records = [record for group in groups for record in group]
+        # Records are opaque to estimate_size, so count their shells separately
+        shells = sum(sys.getsizeof(record) for record in records)
+        values = [record._values for record in records]
+        return shells + estimate_size((groups, values, self.modifier_tables))
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return counts, load time and estimated memory footprint."""
+        return {
+            "version": self.version,
+            "archetypes": len(self.archetypes),
+            "powersets": len(self.powersets),
+            "powers": len(self.powers),
+            "enhancement_sets": len(self.enhancement_sets),
+            "modifier_tables": sum(len(t) for t in self.modifier_tables.values()),
+            "load_ms": round(self.load_seconds * 1000, 1),
+            "memory_mb": round(self.memory_bytes / (1024 * 1024), 2),
+            "precomputed_responses": len(self._responses),
+        }
+
+
+# Current snapshot. Readers take one reference per request; reloads replace it
+# with a single assignment, so no reader ever sees a half-built snapshot.
+_snapshot: GameDataSnapshot | None = None
+_reload_lock = threading.Lock()
+
+
+def get_game_data_snapshot() -> GameDataSnapshot | None:
+    """Return the current snapshot, or None if it has not been loaded."""
+    return _snapshot
+
+
+def set_game_data_snapshot(snapshot: GameDataSnapshot | None) -> None:
+    """Install a snapshot (None disables snapshot reads)."""
+    global _snapshot
+    _snapshot = snapshot
+
+
+def load_game_data_snapshot(
+    session_factory: Callable[[], Session] | None = None,
+) -> GameDataSnapshot:
+    """Build a fresh snapshot and atomically swap it in.
+
+    Safe to call after a re-import while requests are being served; concurrent
+    reloads are serialized.
+    """
+    if session_factory is None:
+        from app.database import SessionLocal
+
+        session_factory = SessionLocal
+
+    with _reload_lock:
+        version = _snapshot.version + 1 if _snapshot is not None else 1
+        session = session_factory()
+        try:
+            snapshot = GameDataSnapshot.load(session, version=version)
+        finally:
+            session.close()
+
+        set_game_data_snapshot(snapshot)
+
+    logger.info(f"Loaded game data snapshot: {snapshot.get_stats()}")
+    return snapshot
@@ -0,0 +1,142 @@
+"""Prepared-statement lookups for the hottest read endpoints.
+
+The ORM path builds, compiles and hydrates a full query on every request.
+These lookups run fixed SQL directly on the asyncpg pool
+(``database._connection_pool``) instead. asyncpg prepares each statement once
+per connection and keeps it in the connection's statement cache as a named
+server-side statement, so repeat calls only bind and execute. The SQL below is
+built once at import time, which keeps the query text (the cache key) stable.
+
+Rows come back as plain dicts holding exactly the columns of the response
+schema; ``init_connection`` in ``database.py`` decodes JSON and NUMERIC
+columns, so no further conversion is needed.
+"""
+
+from typing import Any
+
+import asyncpg
+
+from .. import database, models, schemas
+
+
+def _columns(model: type, fields: Any = None) -> str:
+    """Quoted column list for model, limited to the given field names."""
+    return ", ".join(
+        f'"{column.name}"'
+        for column in model.__table__.columns
+        if fields is None or column.name in fields
+    )
+
+
+_ARCHETYPES = models.Archetype.__tablename__
+_POWERSETS = models.Powerset.__tablename__
+_POWERS = models.Power.__tablename__
+
+# GET /api/powers/{id} returns every column; list endpoints use schemas.Power
+_POWER_ROW = _columns(models.Power)
+_POWER_FIELDS = _columns(models.Power, schemas.Power.model_fields)
+_POWERSET_FIELDS = _columns(models.Powerset, schemas.Powerset.model_fields)
+
+POWER_BY_ID = f"SELECT {_POWER_ROW} FROM {_POWERS} WHERE id = $1"
+POWERS_BY_IDS = (
+    f"SELECT {_POWER_FIELDS} FROM {_POWERS} WHERE id = ANY($1::int[]) ORDER BY id"
+)
+POWERS_BY_POWERSET = (
+    f"SELECT {_POWER_FIELDS} FROM {_POWERS} WHERE powerset_id = $1 ORDER BY id"
+)
+POWERSET_BY_ID = f"SELECT {_POWERSET_FIELDS} FROM {_POWERSETS} WHERE id = $1"
+POWERSETS_BY_IDS = (
+    f"SELECT {_POWERSET_FIELDS} FROM {_POWERSETS} "
+    "WHERE id = ANY($1::int[]) ORDER BY id"
+)
+POWERSETS_BY_ARCHETYPE = (
+    f"SELECT {_POWERSET_FIELDS} FROM {_POWERSETS} "
+    "WHERE archetype_id = $1 ORDER BY id"
+)
+POWERSETS_BY_ARCHETYPE_AND_TYPE = (
+    f"SELECT {_POWERSET_FIELDS} FROM {_POWERSETS} "
+    "WHERE archetype_id = $1 AND powerset_type = $2 ORDER BY id"
+)
+ARCHETYPE_EXISTS = f"SELECT EXISTS (SELECT 1 FROM {_ARCHETYPES} WHERE id = $1)"
+POWERSET_EXISTS = f"SELECT EXISTS (SELECT 1 FROM {_POWERSETS} WHERE id = $1)"
+
+
+class LookupRepository:
+    """Hot read queries on an asyncpg pool, returning response-shaped dicts."""
+
+    def __init__(self, pool: asyncpg.Pool):
+        self.pool = pool
+
+    async def _fetch(self, query: str, *args: Any) -> list[dict[str, Any]]:
+        async with self.pool.acquire() as conn:
+            return [dict(row) for row in await conn.fetch(query, *args)]
+
+    async def _fetchrow(self, query: str, *args: Any) -> dict[str, Any] | None:
+        async with self.pool.acquire() as conn:
+            row = await conn.fetchrow(query, *args)
+        return dict(row) if row is not None else None
+
+    async def _fetchval(self, query: str, *args: Any) -> Any:
+        async with self.pool.acquire() as conn:
+            return await conn.fetchval(query, *args)
+
+    async def get_power(self, power_id: int) -> dict[str, Any] | None:
+        """Full power row, as served by GET /api/powers/{id}."""
+        return await self._fetchrow(POWER_BY_ID, power_id)
+
+    async def get_powers(self, power_ids: list[int]) -> list[dict[str, Any]]:
+        """Powers for a list of ids in one round trip (missing ids are skipped)."""
+        if not power_ids:
+            return []
+        return await self._fetch(POWERS_BY_IDS, list(power_ids))
+
+    async def get_powers_by_powerset(
+        self, powerset_id: int
+    ) -> list[dict[str, Any]] | None:
+        """Powers in a powerset, or None if the powerset does not exist."""
+        powers = await self._fetch(POWERS_BY_POWERSET, powerset_id)
+        # Only empty results need a second query to tell "empty" from "missing"
+        if not powers and not await self._fetchval(POWERSET_EXISTS, powerset_id):
+            return None
+        return powers
+
+    async def get_powerset(self, powerset_id: int) -> dict[str, Any] | None:
+        """A powerset by id."""
+        return await self._fetchrow(POWERSET_BY_ID, powerset_id)
+
+    async def get_powersets(self, powerset_ids: list[int]) -> list[dict[str, Any]]:
+        """Powersets for a list of ids in one round trip."""
+        if not powerset_ids:
+            return []
+        return await self._fetch(POWERSETS_BY_IDS, list(powerset_ids))
+
+    async def get_archetype_powersets(
+        self, archetype_id: int, powerset_type: str | None = None
+    ) -> list[dict[str, Any]] | None:
+        """Powersets for an archetype, or None if the archetype does not exist."""
+        if powerset_type:
+            powersets = await self._fetch(
+                POWERSETS_BY_ARCHETYPE_AND_TYPE, archetype_id, powerset_type
+            )
+        else:
+            powersets = await self._fetch(POWERSETS_BY_ARCHETYPE, archetype_id)
+        if not powersets and not await self._fetchval(ARCHETYPE_EXISTS, archetype_id):
+            return None
+        return powersets
+
+
+_repository: LookupRepository | None = None
+
+
+def get_lookup_repository() -> LookupRepository | None:
+    """Repository on the asyncpg pool, or None while no pool is open.
+
+    Routers fall back to the ORM path when this returns None (e.g. SQLite).
+    """
+    global _repository
+    pool = database._connection_pool
+    if pool is None:
+        return None
+    if _repository is None or _repository.pool is not pool:
+        _repository = LookupRepository(pool)
+    return _repository
@@ -0,0 +1,264 @@
+"""In-process LRU cache with per-entry TTL and optional byte budget."""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+
+def estimate_size(value: Any, _seen: set[int] | None = None) -> int:
+    """Estimate the in-memory footprint of a cached value in bytes.
+
+    Walks mappings, lists, tuples and sets recursively and sums ``sys.getsizeof``
+    of every distinct object. Only called once per insert, never on a hit.
+    """
+    if _seen is None:
+        _seen = set()
+    if id(value) in _seen:
+        return 0
+    _seen.add(id(value))
+
+    size = sys.getsizeof(value)
+    if isinstance(value, Mapping):
+        for k, v in value.items():
+            size += estimate_size(k, _seen) + estimate_size(v, _seen)
+    elif isinstance(value, list | tuple | set | frozenset):
+        for item in value:
+            size += estimate_size(item, _seen)
+    return size
+
+
+def key_prefix(key: str) -> str:
+    """Return the stats bucket for a cache key (text before the first ':')."""
+    return key.split(":", 1)[0]
+
+
+@dataclass(slots=True)
+class _Entry:
+    value: Any
+    expires_at: float | None
+    stale_until: float | None
+    size: int
+
+
+@dataclass
+class PrefixStats:
+    """Hit/miss/eviction counters for one key prefix."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    stale_hits: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "stale_hits": self.stale_hits,
+            "hit_rate": self.hits / lookups if lookups > 0 else 0,
+        }
+
+
+class LRUCache:
+    """Least-recently-used cache with per-entry TTL.
+
+    Capacity is bounded by entry count, by an estimated byte budget, or both.
+    A hit moves the entry to the most-recently-used position and returns the
+    stored object itself (no copy, no re-serialization), so callers must treat
+    cached values as read-only.
+
+    With ``stale_ttl`` set, expired entries are kept for that many extra seconds.
+    ``get`` reports them as misses, but ``get_stale`` still returns them so a
+    caller can serve the old value while it refreshes the entry.
+    """
+
+    def __init__(
+        self,
+        max_entries: int | None = 1000,
+        max_bytes: int | None = None,
+        default_ttl: float | None = None,
+        stale_ttl: float | None = None,
+        sizeof: Callable[[Any], int] = estimate_size,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries (None for no count limit)
+            max_bytes: Maximum estimated total size in bytes (None for no byte limit)
+            default_ttl: TTL in seconds for entries set without one (None = no expiry)
+            stale_ttl: Seconds an expired entry stays available to get_stale
+            sizeof: Size estimator, only called when max_bytes is set
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.stale_ttl = stale_ttl
+        self._sizeof = sizeof
+        self._clock = clock
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._lock = threading.RLock()
+        self._prefix_stats: dict[str, PrefixStats] = {}
+        self.current_bytes = 0
+
+    def _stats_for(self, key: str) -> PrefixStats:
+        prefix = key_prefix(key)
+        stats = self._prefix_stats.get(prefix)
+        if stats is None:
+            stats = self._prefix_stats[prefix] = PrefixStats()
+        return stats
+
+    def _is_expired(self, entry: _Entry, now: float) -> bool:
+        return entry.expires_at is not None and entry.expires_at <= now
+
+    def _is_dead(self, entry: _Entry, now: float) -> bool:
+        return entry.stale_until is not None and entry.stale_until <= now
+
+    def _remove(self, key: str) -> _Entry:
+        entry = self._entries.pop(key)
+        self.current_bytes -= entry.size
+        return entry
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value for key, or default on a miss or expiry."""
+        with self._lock:
+            stats = self._stats_for(key)
+            entry = self._entries.get(key)
+            if entry is None:
+                stats.misses += 1
+                return default
+
+            now = self._clock()
+            if self._is_dead(entry, now):
+                self._remove(key)
+                stats.expirations += 1
+                stats.misses += 1
+                return default
+
+            if self._is_expired(entry, now):
+                # Kept around for get_stale until stale_until
+                stats.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            stats.hits += 1
+            return entry.value
+
+    def get_stale(self, key: str, default: Any = None) -> Any:
+        """Return an expired value that is still inside its stale window.
+
+        Fresh and missing entries both return default; this is meant to be
+        called after ``get`` has already missed.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+
+            now = self._clock()
+            if not self._is_expired(entry, now) or self._is_dead(entry, now):
+                return default
+
+            self._entries.move_to_end(key)
+            self._stats_for(key).stale_hits += 1
+            return entry.value
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """Store value under key, evicting least-recently-used entries as needed.
+
+        Args:
+            key: Cache key
+            value: Value to store (stored by reference)
+            ttl: Seconds until expiry; falls back to default_ttl
+        """
+        ttl = self.default_ttl if ttl is None else ttl
+        size = self._sizeof(value) if self.max_bytes is not None else 0
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            # Values that can never fit are not cached at all
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+
+            expires_at = self._clock() + ttl if ttl is not None else None
+            stale_until = expires_at
+            if expires_at is not None and self.stale_ttl is not None:
+                stale_until = expires_at + self.stale_ttl
+            self._entries[key] = _Entry(value, expires_at, stale_until, size)
+            self.current_bytes += size
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop least-recently-used entries until within both limits."""
+        now = None
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self.current_bytes > self.max_bytes)
+        ):
+            oldest_key, oldest = next(iter(self._entries.items()))
+            self._remove(oldest_key)
+            if now is None:
+                now = self._clock()
+            if self._is_expired(oldest, now):
+                self._stats_for(oldest_key).expirations += 1
+            else:
+                self._stats_for(oldest_key).evictions += 1
+
+    def delete(self, key: str) -> bool:
+        """Remove key if present. Returns True if an entry was removed."""
+        with self._lock:
+            if key not in self._entries:
+                return False
+            self._remove(key)
+            return True
+
+    def delete_prefix(self, prefix: str) -> int:
+        """Remove every key starting with prefix. Returns the number removed."""
+        with self._lock:
+            keys = [k for k in self._entries if k.startswith(prefix)]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def clear(self) -> None:
+        """Remove all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def __contains__(self, key: object) -> bool:
+        """Membership test; does not touch recency or counters."""
+        with self._lock:
+            entry = self._entries.get(key)  # type: ignore[arg-type]
+            return entry is not None and not self._is_expired(entry, self._clock())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter(list(self._entries))
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return size accounting and per-prefix counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "bytes": self.current_bytes if self.max_bytes is not None else None,
+                "max_bytes": self.max_bytes,
+                "by_prefix": {
+                    prefix: stats.as_dict()
+                    for prefix, stats in sorted(self._prefix_stats.items())
+                },
+            }
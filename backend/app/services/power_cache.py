@@ -1,43 +1,134 @@
 """Caching service for power data optimization."""
 
+import asyncio
+import functools
 import hashlib
-import json
+import inspect
 import logging
+import threading
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, undefer
 
 from app.models import Power, Powerset
+from app.services.build_summary_view import VIEW_NAME, view_state
+from app.services.cache_backends import CacheBackend
+from app.services.cache_codecs import CacheCodec
+from app.services.memory_cache import LRUCache, key_prefix
+from app.services.single_flight import AsyncSingleFlight, SingleFlight
 
 logger = logging.getLogger(__name__)
 
+# Key patterns owned by this service (used by clear_all_cache)
+CACHE_KEY_PATTERNS = ("power:*", "powerset_powers:*", "build_summary:*", "query:*")
+
+
+# Numeric columns of the build summary rows, returned as floats
+SUMMARY_NUMERIC_COLUMNS = (
+    "accuracy",
+    "endurance_cost",
+    "recharge_time",
+    "activation_time",
+    "range",
+)
+
+
+# Power detail entries hold every API field plus power_data (source_metadata
+# is deferred and only used by the importer)
+POWER_CACHE_COLUMNS = tuple(
+    column.key for column in Power.__table__.columns if column.key != "source_metadata"
+)
+POWER_NUMERIC_COLUMNS = (
+    "accuracy",
+    "activation_time",
+    "recharge_time",
+    "endurance_cost",
+    "range",
+    "radius",
+    "arc",
+)
+
+
+def _to_float(value: Decimal | float | None) -> float | None:
+    """Convert a Numeric column value for JSON-friendly caching."""
+    return float(value) if value is not None else None
+
 
 class PowerCacheService:
     """Multi-tier caching service for power data."""
 
-    def __init__(self, redis_client=None, max_memory_cache_size: int = 1000):
+    def __init__(
+        self,
+        backend: CacheBackend | None = None,
+        max_memory_cache_size: int = 1000,
+        max_memory_bytes: int | None = None,
+        stale_ttl: int | None = None,
+        session_factory: Callable[[], Session] | None = None,
+        codec: CacheCodec | None = None,
+    ):
         """Initialize caching service.
 
         Args:
-            redis_client: Optional Redis client for distributed caching
-            max_memory_cache_size: Maximum size of in-memory LRU cache
+            backend: Optional async L2 backend shared between workers
+                (Redis, or InMemoryCacheBackend for tests/development)
+            max_memory_cache_size: Maximum number of entries in the in-memory LRU
+                cache (ignored when max_memory_bytes is set)
+            max_memory_bytes: Optional byte budget for the in-memory LRU cache,
+                used instead of the entry count
+            stale_ttl: If set, serve expired memory entries for up to this many
+                seconds while a single background refresh reloads them
+            session_factory: Session factory for background refreshes (defaults
+                to app.database.SessionLocal)
+            codec: Serialization for L2 entries (defaults to msgpack with
+                compression above 1 KiB, or JSON if msgpack is not installed)
         """
-        self.redis_client = redis_client
+        self.backend = backend
+        self.codec = codec or CacheCodec()
         self.max_memory_cache_size = max_memory_cache_size
-        self._memory_cache: dict[str, Any] = {}
+        self.max_memory_bytes = max_memory_bytes
+        self.stale_ttl = stale_ttl
+        self.session_factory = session_factory
 
         # Cache TTL settings (in seconds)
         self.ttl_power_detail = 3600  # 1 hour
         self.ttl_powerset_list = 1800  # 30 minutes
         self.ttl_build_summary = 600  # 10 minutes
 
+        self._memory_cache = LRUCache(
+            max_entries=None if max_memory_bytes is not None else max_memory_cache_size,
+            max_bytes=max_memory_bytes,
+            default_ttl=self.ttl_power_detail,
+            stale_ttl=stale_ttl,
+        )
+
+        # Concurrent misses for one key share a single load
+        self._single_flight = SingleFlight()
+        self._async_single_flight = AsyncSingleFlight()
+
+        # Stale-while-revalidate refreshes: worker threads for sync callers
+        # (executor created on first use), tasks for async callers
+        self._refresh_executor: ThreadPoolExecutor | None = None
+        self._refresh_lock = threading.Lock()
+        self._refreshing: set[str] = set()
+        self._refresh_tasks: dict[str, asyncio.Task] = {}
+
+        # power_build_summary availability: None until first checked
+        self._summary_view: bool | None = None
+
         # Cache hit/miss statistics
         self.stats = {
             "memory_hits": 0,
             "memory_misses": 0,
-            "redis_hits": 0,
-            "redis_misses": 0,
+            "l2_hits": 0,
+            "l2_misses": 0,
             "db_queries": 0,
+            "stale_hits": 0,
+            "background_refreshes": 0,
         }
 
     def _generate_cache_key(self, prefix: str, *args, **kwargs) -> str:
@@ -54,117 +145,362 @@ class PowerCacheService:
         return key_data
 
     def _get_from_memory(self, key: str) -> Any | None:
-        """Get value from in-memory cache."""
-        if key in self._memory_cache:
+        """Get value from in-memory cache.
+
+        Returns the cached object itself; callers must not mutate it.
+        """
+        value = self._memory_cache.get(key)
+        if value is not None:
             self.stats["memory_hits"] += 1
-            return self._memory_cache[key]
+            return value
 
         self.stats["memory_misses"] += 1
         return None
 
-    def _set_to_memory(self, key: str, value: Any) -> None:
-        """Set value in in-memory cache with LRU eviction."""
-        # Simple LRU: remove oldest if at capacity
-        if len(self._memory_cache) >= self.max_memory_cache_size:
-            # Remove the first item (oldest in insertion order)
-            oldest_key = next(iter(self._memory_cache))
-            del self._memory_cache[oldest_key]
+    def _set_to_memory(self, key: str, value: Any, ttl: int | None = None) -> None:
+        """Set value in in-memory cache with LRU eviction and TTL."""
+        self._memory_cache.set(key, value, ttl)
 
-        self._memory_cache[key] = value
+    def _encode(self, key: str, value: Any) -> bytes:
+        return self.codec.encode(value, key_prefix(key))
 
-    def _get_from_redis(self, key: str) -> Any | None:
-        """Get value from Redis cache."""
-        if not self.redis_client:
+    def _decode(self, key: str, data: bytes) -> Any | None:
+        try:
+            return self.codec.decode(data, key_prefix(key))
+        except Exception as e:
+            # Treat undecodable entries (e.g. written by a newer format) as misses
+            logger.warning(f"L2 cache decode error for key {key}: {e}")
+            return None
+
+    async def _get_from_l2(self, key: str) -> Any | None:
+        """Get value from the shared (L2) cache backend."""
+        if self.backend is None:
             return None
 
         try:
-            cached_data = self.redis_client.get(key)
-            if cached_data:
-                self.stats["redis_hits"] += 1
-                return json.loads(cached_data)
+            cached_data = await self.backend.get(key)
+        except Exception as e:
+            logger.warning(f"L2 cache get error for key {key}: {e}")
+            return None
 
-            self.stats["redis_misses"] += 1
+        value = None if cached_data is None else self._decode(key, cached_data)
+        if value is None:
+            self.stats["l2_misses"] += 1
             return None
 
+        self.stats["l2_hits"] += 1
+        return value
+
+    async def _set_to_l2(self, key: str, value: Any, ttl: int) -> None:
+        """Set value in the shared (L2) cache backend with TTL."""
+        if self.backend is None:
+            return
+
+        try:
+            await self.backend.set(key, self._encode(key, value), ttl)
         except Exception as e:
-            logger.warning(f"Redis get error for key {key}: {e}")
-            return None
+            logger.warning(f"L2 cache set error for key {key}: {e}")
+
+    async def _mget_from_l2(self, keys: list[str]) -> dict[str, Any]:
+        """Fetch several keys from L2 in one round trip. Returns only the hits."""
+        if self.backend is None or not keys:
+            return {}
+
+        try:
+            values = await self.backend.mget(keys)
+        except Exception as e:
+            logger.warning(f"L2 cache mget error for {len(keys)} keys: {e}")
+            return {}
+
+        found = {}
+        for key, data in zip(keys, values, strict=True):
+            if data is not None:
+                value = self._decode(key, data)
+                if value is not None:
+                    found[key] = value
+        self.stats["l2_hits"] += len(found)
+        self.stats["l2_misses"] += len(keys) - len(found)
+        return found
+
+    async def _mset_to_l2(self, items: dict[str, Any], ttl: int) -> None:
+        """Store several values in L2 in one round trip."""
+        if self.backend is None or not items:
+            return
+
+        try:
+            await self.backend.mset(
+                {key: self._encode(key, value) for key, value in items.items()}, ttl
+            )
+        except Exception as e:
+            logger.warning(f"L2 cache mset error for {len(items)} keys: {e}")
+
+    async def _delete_pattern_from_l2(self, pattern: str) -> None:
+        if self.backend is None:
+            return
+
+        try:
+            await self.backend.delete_pattern(pattern)
+        except Exception as e:
+            logger.warning(f"L2 cache delete error for pattern {pattern}: {e}")
+
+    def _get_or_load(
+        self,
+        key: str,
+        ttl: int,
+        load: Callable[[], Any],
+        refresh: Callable[[], Any] | None = None,
+    ) -> Any:
+        """Return the cached value for key, loading it at most once (sync callers).
+
+        Concurrent misses for the same key are coalesced so only one caller
+        runs load; the rest wait for its result. If stale-while-revalidate is
+        enabled and refresh is given, an expired memory entry is returned
+        immediately while refresh repopulates it on a worker thread. Sync
+        callers cannot await the L2 backend, so only the memory tier is used.
+        """
+        value = self._get_from_memory(key)
+        if value is not None:
+            return value
+
+        if refresh is not None and self.stale_ttl is not None:
+            value = self._memory_cache.get_stale(key)
+            if value is not None:
+                self.stats["stale_hits"] += 1
+                self._schedule_refresh(key, ttl, refresh)
+                return value
+
+        return self._single_flight.do(key, lambda: self._load(key, ttl, load))
+
+    def _load(self, key: str, ttl: int, load: Callable[[], Any]) -> Any:
+        value = load()
+        if value is not None:
+            self._set_to_memory(key, value, ttl)
+        return value
+
+    def _schedule_refresh(self, key: str, ttl: int, refresh: Callable[[], Any]) -> None:
+        """Refresh key on a worker thread unless a refresh is already running."""
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(
+                    max_workers=2, thread_name_prefix="power-cache-refresh"
+                )
+
+        self.stats["background_refreshes"] += 1
+        self._refresh_executor.submit(self._run_refresh, key, ttl, refresh)
+
+    def _run_refresh(self, key: str, ttl: int, refresh: Callable[[], Any]) -> None:
+        try:
+            self._single_flight.do(key, lambda: self._load(key, ttl, refresh))
+        except Exception as e:
+            logger.warning(f"Background refresh failed for key {key}: {e}")
+        finally:
+            with self._refresh_lock:
+                self._refreshing.discard(key)
+
+    async def _aget_or_load(
+        self,
+        key: str,
+        ttl: int,
+        load: Callable[[], Awaitable[Any]],
+        refresh: Callable[[], Awaitable[Any]] | None = None,
+    ) -> Any:
+        """Return the cached value for key, loading it at most once.
+
+        Checks memory, then L2, then runs load. Concurrent misses for the same
+        key are coalesced so only one coroutine does the L2 lookup and load;
+        the rest await its result. If stale-while-revalidate is enabled and
+        refresh is given, an expired memory entry is returned immediately
+        while a background task repopulates it.
+        """
+        value = self._get_from_memory(key)
+        if value is not None:
+            return value
+
+        if refresh is not None and self.stale_ttl is not None:
+            value = self._memory_cache.get_stale(key)
+            if value is not None:
+                self.stats["stale_hits"] += 1
+                self._schedule_async_refresh(key, ttl, refresh)
+                return value
+
+        return await self._async_single_flight.do(
+            key, lambda: self._aload(key, ttl, load)
+        )
 
-    def _set_to_redis(self, key: str, value: Any, ttl: int) -> None:
-        """Set value in Redis cache with TTL."""
-        if not self.redis_client:
+    async def _aload(
+        self, key: str, ttl: int, load: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Fill key from L2 or, failing that, from load."""
+        value = await self._get_from_l2(key)
+        if value is not None:
+            self._set_to_memory(key, value, ttl)
+            return value
+
+        return await self._store(key, ttl, load)
+
+    async def _store(
+        self, key: str, ttl: int, load: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        value = await load()
+        if value is not None:
+            self._set_to_memory(key, value, ttl)
+            await self._set_to_l2(key, value, ttl)
+        return value
+
+    def _schedule_async_refresh(
+        self, key: str, ttl: int, refresh: Callable[[], Awaitable[Any]]
+    ) -> None:
+        """Start a background refresh task unless one is already running."""
+        if key in self._refresh_tasks or self._async_single_flight.in_flight(key):
             return
 
+        self.stats["background_refreshes"] += 1
+        task = asyncio.create_task(self._run_async_refresh(key, ttl, refresh))
+        self._refresh_tasks[key] = task
+        task.add_done_callback(lambda _: self._refresh_tasks.pop(key, None))
+
+    async def _run_async_refresh(
+        self, key: str, ttl: int, refresh: Callable[[], Awaitable[Any]]
+    ) -> None:
         try:
-            self.redis_client.setex(key, ttl, json.dumps(value, default=str))
+            # Skip L2: it expires alongside memory, so go straight to the source
+            await self._async_single_flight.do(
+                key, lambda: self._store(key, ttl, refresh)
+            )
         except Exception as e:
-            logger.warning(f"Redis set error for key {key}: {e}")
+            logger.warning(f"Background refresh failed for key {key}: {e}")
+
+    def _db_loaders(
+        self, session: Session, query: Callable[[Session], Any]
+    ) -> tuple[Callable[[], Awaitable[Any]], Callable[[], Awaitable[Any]]]:
+        """Build (load, refresh) coroutines for a query.
+
+        load runs on the caller's session; refresh opens its own session on a
+        worker thread, since the request session may be gone by the time a
+        background refresh runs.
+        """
+
+        async def load():
+            return query(session)
+
+        def run_with_new_session():
+            session_factory = self.session_factory
+            if session_factory is None:
+                from app.database import SessionLocal
+
+                session_factory = SessionLocal
+
+            refresh_session = session_factory()
+            try:
+                return query(refresh_session)
+            finally:
+                refresh_session.close()
+
+        async def refresh():
+            return await asyncio.to_thread(run_with_new_session)
 
-    def get_power_by_id(self, session: Session, power_id: int) -> dict[str, Any] | None:
+        return load, refresh
+
+    async def get_power_by_id(
+        self, session: Session, power_id: int
+    ) -> dict[str, Any] | None:
         """Get power details by ID with caching."""
         cache_key = self._generate_cache_key("power", power_id)
 
-        # Try memory cache first
-        cached_power = self._get_from_memory(cache_key)
-        if cached_power:
-            return cached_power
+        def query(s: Session) -> dict[str, Any] | None:
+            return self._query_power(s, power_id)
+
+        return await self._aget_or_load(
+            cache_key, self.ttl_power_detail, *self._db_loaders(session, query)
+        )
+
+    async def get_powers_by_ids(
+        self, session: Session | AsyncSession, power_ids: list[int]
+    ) -> dict[int, dict[str, Any]]:
+        """Get details for many powers (e.g. every power in a build) at once.
+
+        Memory hits are served directly, the remaining keys are fetched from L2
+        with a single mget, and whatever is still missing is loaded with one
+        ``IN`` query and written back with a single mset. Unknown IDs are
+        omitted from the result. Works with a sync Session or an AsyncSession.
+        """
+        keys = {
+            power_id: self._generate_cache_key("power", power_id)
+            for power_id in dict.fromkeys(power_ids)
+        }
 
-        # Try Redis cache
-        cached_power = self._get_from_redis(cache_key)
-        if cached_power:
-            # Store in memory cache for faster access
-            self._set_to_memory(cache_key, cached_power)
-            return cached_power
+        found: dict[int, dict[str, Any]] = {}
+        missing: dict[int, str] = {}
+        for power_id, key in keys.items():
+            value = self._get_from_memory(key)
+            if value is not None:
+                found[power_id] = value
+            else:
+                missing[power_id] = key
+
+        if missing:
+            l2_hits = await self._mget_from_l2(list(missing.values()))
+            for power_id, key in list(missing.items()):
+                if key in l2_hits:
+                    value = l2_hits[key]
+                    self._set_to_memory(key, value, self.ttl_power_detail)
+                    found[power_id] = value
+                    del missing[power_id]
+
+        if missing:
+            self.stats["db_queries"] += 1
+            if isinstance(session, AsyncSession):
+                powers = await session.run_sync(self._query_powers, list(missing))
+            else:
+                powers = self._query_powers(session, list(missing))
+            loaded = {}
+            for power in powers:
+                value = self._power_to_dict(power)
+                key = missing[power.id]
+                self._set_to_memory(key, value, self.ttl_power_detail)
+                loaded[key] = value
+                found[power.id] = value
+            await self._mset_to_l2(loaded, self.ttl_power_detail)
+
+        return found
+
+    def _query_powers(self, session: Session, power_ids: list[int]) -> list[Power]:
+        return (
+            session.query(Power)
+            .options(undefer(Power.power_data))
+            .filter(Power.id.in_(power_ids))
+            .all()
+        )
 
-        # Query database
+    def _query_power(self, session: Session, power_id: int) -> dict[str, Any] | None:
         self.stats["db_queries"] += 1
-        power = session.query(Power).filter(Power.id == power_id).first()
+        power = (
+            session.query(Power)
+            .options(undefer(Power.power_data))
+            .filter(Power.id == power_id)
+            .first()
+        )
 
         if not power:
             return None
 
-        # Convert to dictionary for caching
-        power_dict = {
-            "id": power.id,
-            "name": power.name,
-            "display_name": power.display_name,
-            "description": power.description,
-            "powerset_id": power.powerset_id,
-            "level_available": power.level_available,
-            "power_type": power.power_type,
-            "target_type": power.target_type,
-            "accuracy": float(power.accuracy) if power.accuracy else None,
-            "damage_scale": float(power.damage_scale) if power.damage_scale else None,
-            "endurance_cost": (
-                float(power.endurance_cost) if power.endurance_cost else None
-            ),
-            "recharge_time": (
-                float(power.recharge_time) if power.recharge_time else None
-            ),
-            "activation_time": (
-                float(power.activation_time) if power.activation_time else None
-            ),
-            "range_feet": power.range_feet,
-            "radius_feet": power.radius_feet,
-            "max_targets": power.max_targets,
-            "effects": power.effects,
-            "effect_groups": power.effect_groups,
-            "icon_path": power.icon_path,
-            "internal_name": power.internal_name,
-            "requires_line_of_sight": power.requires_line_of_sight,
-            "modes_required": power.modes_required,
-            "modes_disallowed": power.modes_disallowed,
-            "ai_report": power.ai_report,
-            "display_info": power.display_info,
-        }
-
-        # Cache the result
-        self._set_to_memory(cache_key, power_dict)
-        self._set_to_redis(cache_key, power_dict, self.ttl_power_detail)
+        return self._power_to_dict(power)
 
-        return power_dict
+    def _power_to_dict(self, power: Power) -> dict[str, Any]:
+        """Convert a Power row to a dictionary for caching."""
+        values = {key: getattr(power, key) for key in POWER_CACHE_COLUMNS}
+        for key in POWER_NUMERIC_COLUMNS:
+            values[key] = _to_float(values[key])
+        # Same form as after an L2 round trip
+        for key in ("created_at", "updated_at"):
+            if values[key] is not None:
+                values[key] = values[key].isoformat()
+        return values
 
-    def get_powers_by_powerset(
+    async def get_powers_by_powerset(
         self, session: Session, powerset_id: int, level_filter: int | None = None
     ) -> list[dict[str, Any]]:
         """Get powers by powerset with optional level filtering."""
@@ -172,56 +508,42 @@ class PowerCacheService:
             "powerset_powers", powerset_id, level=level_filter
         )
 
-        # Try cache layers
-        cached_powers = self._get_from_memory(cache_key)
-        if cached_powers:
-            return cached_powers
+        def query(s: Session) -> list[dict[str, Any]]:
+            return self._query_powerset_powers(s, powerset_id, level_filter)
 
-        cached_powers = self._get_from_redis(cache_key)
-        if cached_powers:
-            self._set_to_memory(cache_key, cached_powers)
-            return cached_powers
+        return await self._aget_or_load(
+            cache_key, self.ttl_powerset_list, *self._db_loaders(session, query)
+        )
 
-        # Query database
+    def _query_powerset_powers(
+        self, session: Session, powerset_id: int, level_filter: int | None
+    ) -> list[dict[str, Any]]:
         self.stats["db_queries"] += 1
         query = session.query(Power).filter(Power.powerset_id == powerset_id)
 
         if level_filter:
-            query = query.filter(Power.level_available <= level_filter)
+            query = query.filter(Power.available_level <= level_filter)
 
-        powers = query.order_by(Power.level_available, Power.display_order).all()
+        powers = query.order_by(Power.available_level, Power.id).all()
 
         # Convert to list of dictionaries
-        powers_list = []
-        for power in powers:
-            power_dict = {
+        return [
+            {
                 "id": power.id,
                 "name": power.name,
                 "display_name": power.display_name,
-                "level_available": power.level_available,
-                "power_type": power.power_type,
+                "available_level": power.available_level,
+                "type": power.type,
                 "target_type": power.target_type,
-                "accuracy": float(power.accuracy) if power.accuracy else None,
-                "damage_scale": (
-                    float(power.damage_scale) if power.damage_scale else None
-                ),
-                "endurance_cost": (
-                    float(power.endurance_cost) if power.endurance_cost else None
-                ),
-                "recharge_time": (
-                    float(power.recharge_time) if power.recharge_time else None
-                ),
-                "icon_path": power.icon_path,
+                "accuracy": _to_float(power.accuracy),
+                "endurance_cost": _to_float(power.endurance_cost),
+                "recharge_time": _to_float(power.recharge_time),
+                "icon": power.icon,
             }
-            powers_list.append(power_dict)
-
-        # Cache the result
-        self._set_to_memory(cache_key, powers_list)
-        self._set_to_redis(cache_key, powers_list, self.ttl_powerset_list)
-
-        return powers_list
+            for power in powers
+        ]
 
-    def get_build_summary_data(
+    async def get_build_summary_data(
         self,
         session: Session,
         archetype_id: int | None = None,
@@ -236,190 +558,188 @@ class PowerCacheService:
             max_level=max_level,
         )
 
-        # Try cache layers
-        cached_data = self._get_from_memory(cache_key)
-        if cached_data:
-            return cached_data
+        def query(s: Session) -> list[dict[str, Any]]:
+            return self._query_build_summary(s, archetype_id, powerset_id, max_level)
 
-        cached_data = self._get_from_redis(cache_key)
-        if cached_data:
-            self._set_to_memory(cache_key, cached_data)
-            return cached_data
+        return await self._aget_or_load(
+            cache_key, self.ttl_build_summary, *self._db_loaders(session, query)
+        )
 
-        # Query materialized view if available, otherwise regular query
-        self.stats["db_queries"] += 1
-        try:
-            # Try materialized view first
-            query = """
-                SELECT * FROM power_build_summary
-                WHERE 1=1
-            """
-            params = {}
+    def _use_summary_view(self, session: Session) -> bool:
+        """Whether to read power_build_summary (remembered until a view query fails)."""
+        if self._summary_view is None:
+            state = view_state(session)
+            self._summary_view = bool(state)
+            if not self._summary_view:
+                reason = "is not populated" if state is False else "does not exist"
+                logger.warning(
+                    f"{VIEW_NAME} {reason}; build summaries use the "
+                    "powers/powersets join"
+                )
+        return self._summary_view
 
-            if archetype_id:
-                query += " AND archetype_id = :archetype_id"
-                params["archetype_id"] = archetype_id
+    def _query_build_summary_view(
+        self,
+        session: Session,
+        archetype_id: int | None,
+        powerset_id: int | None,
+        max_level: int | None,
+    ) -> list[dict[str, Any]]:
+        query = f"SELECT * FROM {VIEW_NAME} WHERE 1=1"
+        params = {}
 
-            if powerset_id:
-                query += " AND powerset_id = :powerset_id"
-                params["powerset_id"] = powerset_id
+        if archetype_id:
+            query += " AND archetype_id = :archetype_id"
+            params["archetype_id"] = archetype_id
 
-            if max_level:
-                query += " AND level_available <= :max_level"
-                params["max_level"] = max_level
+        if powerset_id:
+            query += " AND powerset_id = :powerset_id"
+            params["powerset_id"] = powerset_id
 
-            query += " ORDER BY level_available, display_order"
+        if max_level:
+            query += " AND available_level <= :max_level"
+            params["max_level"] = max_level
 
-            result = session.execute(query, params)
-            summary_data = [dict(row) for row in result]
+        query += " ORDER BY available_level, id"
 
-        except Exception as e:
-            logger.warning(
-                f"Materialized view query failed, falling back to regular query: {e}"
-            )
+        rows = [dict(row) for row in session.execute(text(query), params).mappings()]
+        for row in rows:
+            for column in SUMMARY_NUMERIC_COLUMNS:
+                row[column] = _to_float(row[column])
+        return rows
 
-            # Fallback to regular query
-            query = session.query(
-                Power.id,
-                Power.name,
-                Power.internal_name,
-                Power.display_name,
-                Power.powerset_id,
-                Powerset.name.label("powerset_name"),
-                Powerset.archetype_id,
-                Power.level_available,
-                Power.power_type,
-                Power.target_type,
-                Power.accuracy,
-                Power.damage_scale,
-                Power.endurance_cost,
-                Power.recharge_time,
-                Power.activation_time,
-                Power.range_feet,
-                Power.max_targets,
-                Power.icon_path,
-                Power.display_order,
-            ).join(Powerset)
-
-            if archetype_id:
-                query = query.filter(Powerset.archetype_id == archetype_id)
-
-            if powerset_id:
-                query = query.filter(Power.powerset_id == powerset_id)
-
-            if max_level:
-                query = query.filter(Power.level_available <= max_level)
-
-            results = query.order_by(Power.level_available, Power.display_order).all()
-
-            summary_data = []
-            for row in results:
-                summary_data.append(
-                    {
-                        "id": row.id,
-                        "name": row.name,
-                        "internal_name": row.internal_name,
-                        "display_name": row.display_name,
-                        "powerset_id": row.powerset_id,
-                        "powerset_name": row.powerset_name,
-                        "archetype_id": row.archetype_id,
-                        "level_available": row.level_available,
-                        "power_type": row.power_type,
-                        "target_type": row.target_type,
-                        "accuracy": float(row.accuracy) if row.accuracy else None,
-                        "damage_scale": (
-                            float(row.damage_scale) if row.damage_scale else None
-                        ),
-                        "endurance_cost": (
-                            float(row.endurance_cost) if row.endurance_cost else None
-                        ),
-                        "recharge_time": (
-                            float(row.recharge_time) if row.recharge_time else None
-                        ),
-                        "activation_time": (
-                            float(row.activation_time) if row.activation_time else None
-                        ),
-                        "range_feet": row.range_feet,
-                        "max_targets": row.max_targets,
-                        "icon_path": row.icon_path,
-                        "display_order": row.display_order,
-                    }
+    def _query_build_summary(
+        self,
+        session: Session,
+        archetype_id: int | None,
+        powerset_id: int | None,
+        max_level: int | None,
+    ) -> list[dict[str, Any]]:
+        self.stats["db_queries"] += 1
+        if self._use_summary_view(session):
+            try:
+                # A savepoint, so a failure leaves the caller's transaction alone
+                with session.begin_nested():
+                    return self._query_build_summary_view(
+                        session, archetype_id, powerset_id, max_level
+                    )
+            except Exception as e:
+                # Possibly transient (lock timeout, refresh in progress): use the
+                # join this time and check the view again on the next query
+                logger.warning(
+                    f"{VIEW_NAME} query failed, using the powers/powersets join: {e}"
                 )
+                self._summary_view = None
+
+        # Fallback to regular query
+        query = session.query(
+            Power.id,
+            Power.name,
+            Power.full_name,
+            Power.display_name,
+            Power.powerset_id,
+            Powerset.name.label("powerset_name"),
+            Powerset.archetype_id,
+            Power.available_level,
+            Power.type,
+            Power.target_type,
+            Power.accuracy,
+            Power.endurance_cost,
+            Power.recharge_time,
+            Power.activation_time,
+            Power.range,
+            Power.max_targets_hit,
+            Power.icon,
+        ).join(Powerset)
+
+        if archetype_id:
+            query = query.filter(Powerset.archetype_id == archetype_id)
+
+        if powerset_id:
+            query = query.filter(Power.powerset_id == powerset_id)
+
+        if max_level:
+            query = query.filter(Power.available_level <= max_level)
+
+        results = query.order_by(Power.available_level, Power.id).all()
+
+        return [
+            {
+                "id": row.id,
+                "name": row.name,
+                "full_name": row.full_name,
+                "display_name": row.display_name,
+                "powerset_id": row.powerset_id,
+                "powerset_name": row.powerset_name,
+                "archetype_id": row.archetype_id,
+                "available_level": row.available_level,
+                "type": row.type,
+                "target_type": row.target_type,
+                "accuracy": _to_float(row.accuracy),
+                "endurance_cost": _to_float(row.endurance_cost),
+                "recharge_time": _to_float(row.recharge_time),
+                "activation_time": _to_float(row.activation_time),
+                "range": _to_float(row.range),
+                "max_targets_hit": row.max_targets_hit,
+                "icon": row.icon,
+            }
+            for row in results
+        ]
 
-        # Cache the result
-        self._set_to_memory(cache_key, summary_data)
-        self._set_to_redis(cache_key, summary_data, self.ttl_build_summary)
-
-        return summary_data
-
-    def invalidate_power_cache(self, power_id: int) -> None:
+    async def invalidate_power_cache(self, power_id: int) -> None:
         """Invalidate cache for a specific power."""
         cache_key = self._generate_cache_key("power", power_id)
 
         # Remove from memory cache
-        if cache_key in self._memory_cache:
-            del self._memory_cache[cache_key]
+        self._memory_cache.delete(cache_key)
 
-        # Remove from Redis
-        if self.redis_client:
+        # Remove from L2
+        if self.backend is not None:
             try:
-                self.redis_client.delete(cache_key)
+                await self.backend.delete(cache_key)
             except Exception as e:
-                logger.warning(f"Redis delete error for key {cache_key}: {e}")
+                logger.warning(f"L2 cache delete error for key {cache_key}: {e}")
 
-    def invalidate_powerset_cache(self, powerset_id: int) -> None:
+    async def invalidate_powerset_cache(self, powerset_id: int) -> None:
         """Invalidate all cache entries for a powerset."""
-        # This is a simplified approach - in production you might want
-        # more sophisticated cache invalidation
-        if self.redis_client:
-            try:
-                # Get all keys matching the pattern
-                pattern = f"powerset_powers:{powerset_id}:*"
-                keys = self.redis_client.keys(pattern)
-                if keys:
-                    self.redis_client.delete(*keys)
-            except Exception as e:
-                logger.warning(f"Redis batch delete error: {e}")
+        await self._delete_pattern_from_l2(f"powerset_powers:{powerset_id}:*")
 
-        # Clear memory cache entries (simple approach: clear all)
-        keys_to_remove = [
-            k
-            for k in self._memory_cache
-            if k.startswith(f"powerset_powers:{powerset_id}:")
-        ]
-        for key in keys_to_remove:
-            del self._memory_cache[key]
+        # Clear memory cache entries for this powerset
+        self._memory_cache.delete_prefix(f"powerset_powers:{powerset_id}:")
 
-    def clear_all_cache(self) -> None:
+    async def clear_all_cache(self) -> None:
         """Clear all cache layers."""
         self._memory_cache.clear()
 
-        if self.redis_client:
-            try:
-                # Clear all power-related keys
-                patterns = ["power:*", "powerset_powers:*", "build_summary:*"]
-                for pattern in patterns:
-                    keys = self.redis_client.keys(pattern)
-                    if keys:
-                        self.redis_client.delete(*keys)
-            except Exception as e:
-                logger.warning(f"Redis clear error: {e}")
+        # Clear all power-related keys
+        for pattern in CACHE_KEY_PATTERNS:
+            await self._delete_pattern_from_l2(pattern)
 
     def get_cache_stats(self) -> dict[str, Any]:
         """Get cache performance statistics."""
         total_requests = self.stats["memory_hits"] + self.stats["memory_misses"]
 
-        redis_requests = self.stats["redis_hits"] + self.stats["redis_misses"]
+        l2_requests = self.stats["l2_hits"] + self.stats["l2_misses"]
 
         return {
             "memory_cache_size": len(self._memory_cache),
+            "memory": self._memory_cache.get_stats(),
             "memory_hit_rate": (
                 self.stats["memory_hits"] / total_requests if total_requests > 0 else 0
             ),
-            "redis_hit_rate": (
-                self.stats["redis_hits"] / redis_requests if redis_requests > 0 else 0
+            "l2_backend": type(self.backend).__name__ if self.backend else None,
+            "codec": self.codec.get_stats(),
+            "l2_hit_rate": (
+                self.stats["l2_hits"] / l2_requests if l2_requests > 0 else 0
             ),
             "total_db_queries": self.stats["db_queries"],
+            "coalesced_loads": (
+                self._single_flight.coalesced + self._async_single_flight.coalesced
+            ),
+            "single_flight": {
+                "sync": self._single_flight.get_stats(),
+                "async": self._async_single_flight.get_stats(),
+            },
             "stats": self.stats,
         }
 
@@ -433,51 +753,74 @@ def get_power_cache() -> PowerCacheService:
     global _power_cache_instance
 
     if _power_cache_instance is None:
-        # Initialize with default settings
-        # In production, you'd pass Redis client here
+        # Memory-only until init_power_cache() configures an L2 backend
         _power_cache_instance = PowerCacheService()
 
     return _power_cache_instance
 
 
-def init_power_cache(redis_client=None, max_memory_cache_size: int = 1000) -> None:
+def init_power_cache(
+    backend: CacheBackend | None = None,
+    max_memory_cache_size: int = 1000,
+    max_memory_bytes: int | None = None,
+    stale_ttl: int | None = None,
+) -> None:
     """Initialize the global power cache with custom settings."""
     global _power_cache_instance
-    _power_cache_instance = PowerCacheService(redis_client, max_memory_cache_size)
+    _power_cache_instance = PowerCacheService(
+        backend, max_memory_cache_size, max_memory_bytes, stale_ttl
+    )
 
 
 # Decorator for caching function results
-def cached_power_query(ttl: int = 300):
-    """Decorator for caching power query results."""
+def cached_power_query(ttl: int = 300, stale_while_revalidate: bool = False):
+    """Decorator for caching power query results.
+
+    Works on both coroutine functions (memory + L2) and plain functions
+    (memory only). Concurrent calls with the same arguments share one
+    execution. With stale_while_revalidate, an expired result is returned while
+    the function is re-run in the background; only enable it for functions
+    whose arguments stay valid outside the request (e.g. no request-scoped
+    session).
+    """
 
     def decorator(func):
-        def wrapper(*args, **kwargs):
+        def make_key(args, kwargs) -> str:
             # Generate cache key from function name and arguments
-            cache_key = (
+            return (
                 f"query:{func.__name__}:"
                 + hashlib.md5(
                     str(args + tuple(sorted(kwargs.items()))).encode()
                 ).hexdigest()
             )
 
-            cache = get_power_cache()
+        if inspect.iscoroutinefunction(func):
 
-            # Try to get from cache
-            result = cache._get_from_memory(cache_key)
-            if result is not None:
-                return result
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                def load():
+                    return func(*args, **kwargs)
 
-            result = cache._get_from_redis(cache_key)
-            if result is not None:
-                cache._set_to_memory(cache_key, result)
-                return result
+                return await get_power_cache()._aget_or_load(
+                    make_key(args, kwargs),
+                    ttl,
+                    load,
+                    load if stale_while_revalidate else None,
+                )
 
-            # Execute function and cache result
-            result = func(*args, **kwargs)
-            cache._set_to_memory(cache_key, result)
-            cache._set_to_redis(cache_key, result, ttl)
+            return async_wrapper
 
-            return result
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            def load():
+                return func(*args, **kwargs)
+
+            return get_power_cache()._get_or_load(
+                make_key(args, kwargs),
+                ttl,
+                load,
+                load if stale_while_revalidate else None,
+            )
 
         return wrapper
 
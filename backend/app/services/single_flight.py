@@ -0,0 +1,142 @@
+"""Single-flight request coalescing for cache loaders."""
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    """One in-flight load that concurrent callers wait on."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Run at most one loader per key at a time.
+
+    The first caller for a key runs the loader; callers that arrive while it
+    is still running block until it finishes and receive the same result (or
+    the same exception). Nothing is remembered once the load completes, so
+    caching the result is left to the caller.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call] = {}
+        self.loads = 0
+        self.coalesced = 0
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """Run fn for key, or wait for the load already in flight."""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self.loads += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result
+
+    def in_flight(self, key: str) -> bool:
+        """Return True if a load for key is currently running."""
+        with self._lock:
+            return key in self._calls
+
+    def get_stats(self) -> dict[str, int]:
+        """Return load and coalescing counters."""
+        with self._lock:
+            return {
+                "loads": self.loads,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._calls),
+            }
+
+
+class AsyncSingleFlight:
+    """asyncio counterpart of SingleFlight for coroutine loaders.
+
+    Followers await the leader's future instead of blocking a thread. If the
+    leader is cancelled (e.g. its client disconnected), its followers are
+    not: the first of them takes over the load. Must be used from a single
+    event loop.
+    """
+
+    def __init__(self):
+        self._calls: dict[str, asyncio.Future] = {}
+        self.loads = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await fn for key, or await the load already in flight."""
+        while (future := self._calls.get(key)) is not None:
+            try:
+                # shield: a cancelled follower must not cancel the shared load
+                result = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # The leader was cancelled, not this caller: retry the load
+                if future.cancelled() and not asyncio.current_task().cancelling():
+                    continue
+                raise
+            except BaseException:
+                self.coalesced += 1
+                raise
+            # Counted only once the shared load has delivered
+            self.coalesced += 1
+            return result
+
+        future = self._calls[key] = asyncio.get_running_loop().create_future()
+        self.loads += 1
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an unobserved failure is not logged as a leak
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
+
+    def in_flight(self, key: str) -> bool:
+        """Return True if a load for key is currently running."""
+        return key in self._calls
+
+    def get_stats(self) -> dict[str, int]:
+        """Return load and coalescing counters."""
+        return {
+            "loads": self.loads,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._calls),
+        }
@@ -3,22 +3,51 @@ Mids-Web Backend API
 FastAPI application for serving City of Heroes build planning data and calculations.
 """
 
+import logging
 import os
+import secrets
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Header, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
-from app.database import close_database_pool, create_database_pool
+from app.database import (
+    close_database_pool,
+    create_database_pool,
+    dispose_async_engine,
+    get_pool_stats,
+)
+from app.pagination import NEXT_CURSOR_HEADER
+from app.query_stats import (
+    QUERY_COUNT_HEADER,
+    QUERY_TIME_HEADER,
+    QueryStatsMiddleware,
+)
 from app.routers import (
     archetypes,
     builds,
     calculations,
     enhancements,
+    lookup,
     powers,
     powersets,
 )
+from app.services.cache_backends import create_cache_backend
+from app.services.calc_executor import (
+    get_calc_executor,
+    init_calc_executor,
+    shutdown_calc_executor,
+)
+from app.services.game_data_snapshot import (
+    get_game_data_snapshot,
+    load_game_data_snapshot,
+    set_game_data_snapshot,
+)
+from app.services.power_cache import init_power_cache
+
+logger = logging.getLogger(__name__)
 
 # Disabled (removed models): from app.routers import misc_data
 
@@ -32,11 +61,35 @@ async def lifespan(app: FastAPI):
     await create_database_pool()
     print("Database connection pool created")
 
+    # Shared L2 cache, e.g. CACHE_BACKEND_URL=redis://localhost:6379/0
+    cache_backend = create_cache_backend(os.getenv("CACHE_BACKEND_URL"))
+    if cache_backend is not None:
+        init_power_cache(backend=cache_backend)
+        print(f"Power cache L2 backend: {type(cache_backend).__name__}")
+
+    # Calculation workers; start the processes now so the first batch
+    # doesn't pay for spawning them
+    executor = init_calc_executor(preload=["app.routers.calculations"])
+    executor.prewarm()
+
+    # Read-only game data served from memory (reload after each re-import)
+    if os.getenv("GAME_DATA_SNAPSHOT", "false").lower() == "true":
+        try:
+            snapshot = await run_in_threadpool(load_game_data_snapshot)
+            print(f"Game data snapshot loaded: {snapshot.get_stats()}")
+        except Exception:
+            logger.exception("Game data snapshot failed to load; using database")
+
     yield
 
     # Shutdown
     print("Shutting down Mids-Web backend...")
+    if cache_backend is not None:
+        await cache_backend.close()
+    set_game_data_snapshot(None)
+    shutdown_calc_executor()
     await close_database_pool()
+    await dispose_async_engine()
     print("Database connection pool closed")
 
 
@@ -60,8 +113,13 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, QUERY_COUNT_HEADER, QUERY_TIME_HEADER],
 )
 
+# Debug headers with the statement count and DB time of each request
+if os.getenv("DB_QUERY_HEADER", "false").lower() == "true":
+    app.add_middleware(QueryStatsMiddleware)
+
 # Include API routers
 app.include_router(archetypes.router, prefix="/api", tags=["archetypes"])
 app.include_router(powersets.router, prefix="/api", tags=["powersets"])
@@ -69,6 +127,7 @@ app.include_router(powers.router, prefix="/api", tags=["powers"])
 app.include_router(enhancements.router, prefix="/api", tags=["enhancements"])
 app.include_router(builds.router, prefix="/api", tags=["builds"])
 app.include_router(calculations.router, prefix="/api", tags=["calculations"])
+app.include_router(lookup.router, prefix="/api", tags=["lookup"])
 # Disabled (removed models): app.include_router(misc_data.router, prefix="/api", tags=["misc"])
 
 
@@ -79,6 +138,40 @@ async def ping():
     return {"message": "pong"}
 
 
+@app.get("/ping/db-pool")
+async def db_pool_stats():
+    """Database pool usage: connections in use and checkout wait times."""
+    return get_pool_stats()
+
+
+@app.get("/ping/calc-executor")
+async def calc_executor_stats():
+    """Calculation worker pools: pending calls and per-endpoint queue times."""
+    return get_calc_executor().get_stats()
+
+
+@app.post("/admin/game-data-snapshot/reload")
+async def reload_game_data_snapshot(x_admin_token: str | None = Header(None)):
+    """Rebuild the game data snapshot after a re-import and swap it in.
+
+    Requires ADMIN_TOKEN to be set and sent as X-Admin-Token.
+    """
+    admin_token = os.getenv("ADMIN_TOKEN")
+    if not admin_token:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if x_admin_token is None or not secrets.compare_digest(x_admin_token, admin_token):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+    if os.getenv("GAME_DATA_SNAPSHOT", "false").lower() != "true":
+        raise HTTPException(status_code=409, detail="Game data snapshot is disabled")
+
+    previous = get_game_data_snapshot()
+    snapshot = await run_in_threadpool(load_game_data_snapshot)
+    return {
+        "previous_version": previous.version if previous is not None else None,
+        **snapshot.get_stats(),
+    }
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Benchmark: incremental BuildSession updates vs rebuilding the build
+
+A 24-power, 100-slot build (set IOs with 2-6 piece bonuses and Rule of 5
+overlap, SOs and attuned IOs) is edited with random slot, unslot, swap power
+and level changes. Each edit is timed through the session, and against
+building a new session with the same powers from scratch.
+
+Usage:
+    python scripts/benchmark_build_session.py [--edits 2000] [--seed 42]
+"""
+import argparse
+import copy
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.calculations.build import (
+    BuildData,
+    BuildSession,
+    DefenseType,
+    EnhancementInfo,
+    ResistanceType,
+    TotalStat,
+)
+from app.calculations.core import ArchetypeType
+from app.calculations.enhancements import (
+    BonusItem,
+    EnhancementGrade,
+    EnhancementSet,
+    Slot,
+    SlottedPower,
+    SlottingCalculator,
+)
+
+POWERS = 24
+SLOTS = 100
+SETS = 20
+ASPECTS = ("Damage", "Accuracy", "Recharge", "Endurance", "Defense", "Resistance")
+STATS = (*DefenseType, *ResistanceType, TotalStat.GLOBAL_RECHARGE)
+
+MULT_TABLES = {
+    "MultTO": [[0.053, 0.035, 0.026, 0.020]],
+    "MultDO": [[0.157, 0.104, 0.078, 0.059]],
+    "MultSO": [[0.333, 0.222, 0.166, 0.125]],
+    "MultIO": [[0.18 + 0.005 * i, 0.11 + 0.003 * i, 0.07, 0.05] for i in range(53)],
+}
+
+
+def generate_data(rng):
+    """Sets of six pieces with five bonus tiers, plus one SO per aspect."""
+    enhancements = {}
+    sets = {}
+    bonus_stats = {}
+    for set_id in range(SETS):
+        pieces = [1000 + set_id * 10 + i for i in range(6)]
+        for piece in pieces:
+            aspects = tuple(rng.sample(ASPECTS, rng.randint(1, 3)))
+            enhancements[piece] = EnhancementInfo(piece, aspects, set_id=set_id)
+        bonuses = []
+        for required in range(2, 7):
+            # Shared bonus IDs so the Rule of 5 kicks in
+            bonus_id = rng.randrange(40)
+            bonus_stats[bonus_id] = {rng.choice(STATS): rng.uniform(0.01, 0.05)}
+            bonuses.append(BonusItem(slotted_required=required, power_ids=[bonus_id]))
+        sets[set_id] = EnhancementSet(
+            id=set_id,
+            uid=f"Set_{set_id}",
+            name=f"Set {set_id}",
+            short_name=f"S{set_id}",
+            set_type="Mixed",
+            level_min=10,
+            level_max=50,
+            enhancement_ids=pieces,
+            bonuses=bonuses,
+        )
+    for i, aspect in enumerate(ASPECTS):
+        enhancements[i] = EnhancementInfo(i, (aspect,))
+    power_stats = {
+        power_id: {stat: rng.uniform(0.01, 0.1) for stat in rng.sample(STATS, 3)}
+        for power_id in range(POWERS * 2)
+    }
+    return BuildData(enhancements, sets, power_stats, bonus_stats)
+
+
+def random_slot(rng, data):
+    enhancement_id = rng.choice(list(data.enhancements))
+    if enhancement_id < len(ASPECTS):
+        return Slot(enhancement_id=enhancement_id, grade=EnhancementGrade.SINGLE_O)
+    return Slot(
+        enhancement_id=enhancement_id, io_level=50, is_attuned=rng.random() < 0.2
+    )
+
+
+def random_power(rng, data, power_id, slots):
+    power = SlottedPower(power_id=power_id)
+    for _ in range(slots):
+        power.add_slot(rng.randint(1, 49))
+        power.slots[-1].enhancement = random_slot(rng, data)
+    return power
+
+
+def generate_build(rng, data):
+    # 24 powers, 100 slots: 4 powers with 6 slots, 20 with 3-4
+    slot_counts = [6] * 4 + [4] * 16 + [3] * 4
+    return [random_power(rng, data, i, n) for i, n in enumerate(slot_counts)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--edits", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    data = generate_data(rng)
+    slotting = SlottingCalculator(MULT_TABLES)
+    session = BuildSession(ArchetypeType.SCRAPPER, data, slotting)
+    for power in generate_build(rng, data):
+        session.add_power(power)
+
+    timings = {"slot": [], "unslot": [], "swap power": [], "level": []}
+    rebuilds = []
+    for _ in range(args.edits):
+        power_id = rng.choice(list(session._powers))
+        power = session._powers[power_id]
+        action = rng.random()
+        start = time.perf_counter()
+        if action < 0.6:
+            session.slot_enhancement(
+                power_id, rng.randrange(power.slot_count), random_slot(rng, data)
+            )
+            kind = "slot"
+        elif action < 0.85:
+            session.unslot_enhancement(power_id, rng.randrange(power.slot_count))
+            kind = "unslot"
+        elif action < 0.95:
+            free = [i for i in range(POWERS * 2) if i not in session._powers]
+            replacement = random_power(rng, data, rng.choice(free), power.slot_count)
+            start = time.perf_counter()
+            session.swap_power(power_id, replacement)
+            kind = "swap power"
+        else:
+            session.set_level(rng.randint(1, 50))
+            kind = "level"
+        timings[kind].append(time.perf_counter() - start)
+
+        if len(rebuilds) < 50:
+            powers = [copy.deepcopy(p) for p in session._powers.values()]
+            start = time.perf_counter()
+            fresh = BuildSession(
+                ArchetypeType.SCRAPPER,
+                data,
+                slotting,
+                character_level=session.character_level,
+            )
+            for p in powers:
+                fresh.add_power(p)
+            rebuilds.append(time.perf_counter() - start)
+            if fresh.totals() != session.totals():
+                raise SystemExit("Incremental totals differ from a rebuild")
+
+    print(f"{'edit':>12} {'count':>6} {'median ms':>10} {'p99 ms':>8} {'max ms':>8}")
+    for kind, times in timings.items():
+        if not times:
+            continue
+        times.sort()
+        p99 = times[min(len(times) - 1, int(len(times) * 0.99))]
+        print(
+            f"{kind:>12} {len(times):>6} {statistics.median(times) * 1000:>10.3f} "
+            f"{p99 * 1000:>8.3f} {times[-1] * 1000:>8.3f}"
+        )
+    print(f"{'rebuild':>12} {len(rebuilds):>6} {statistics.median(rebuilds) * 1000:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
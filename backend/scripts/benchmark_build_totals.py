@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Benchmark: scalar BuildTotals vs the vectorized NumPy engine
+
+Scores the same randomly generated builds (~24 defense, ~24 resistance,
+~12 recharge and ~6 damage bonuses each) with:
+- scalar:      BuildTotals per build (dict-based aggregators)
+- vectorized:  score_builds() end to end, including dict -> matrix encoding
+- pre-encoded: aggregate_build_arrays() on already-encoded arrays
+
+Usage:
+    python scripts/benchmark_build_totals.py [--sizes 1 100 10000] [--repeat 5]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+
+from app.calculations.build import BuildTotals, DamageBuffSource
+from app.calculations.build.vectorized_totals import (
+    DAMAGE_HEURISTIC_COLUMNS,
+    DEFENSE_COLUMNS,
+    RESISTANCE_COLUMNS,
+    _stack,
+    aggregate_build_arrays,
+    encode_damage_buffs,
+    encode_defense_bonuses,
+    encode_resistance_bonuses,
+    score_builds,
+)
+from app.calculations.core import ArchetypeType
+
+ARCHETYPES = [at for at in ArchetypeType if at is not ArchetypeType.SENTINEL]
+
+
+def generate_builds(count, seed=42):
+    """Generate random builds as (archetype, defense, resistance, recharge, damage)."""
+    rng = random.Random(seed)
+    builds = []
+    for _ in range(count):
+        builds.append(
+            (
+                rng.choice(ARCHETYPES),
+                [
+                    {
+                        dt: rng.uniform(0.0, 0.05)
+                        for dt in rng.sample(DEFENSE_COLUMNS, 2)
+                    }
+                    for _ in range(24)
+                ],
+                [
+                    {
+                        rt: rng.uniform(0.0, 0.05)
+                        for rt in rng.sample(RESISTANCE_COLUMNS, 2)
+                    }
+                    for _ in range(24)
+                ],
+                [rng.uniform(0.0, 0.1) for _ in range(12)],
+                [
+                    DamageBuffSource(
+                        f"src{i}", rng.uniform(0.0, 0.5), rng.random() < 0.5, 0.5
+                    )
+                    for i in range(6)
+                ],
+            )
+        )
+    return builds
+
+
+def run_scalar(builds):
+    for archetype, defense, resistance, recharge, damage in builds:
+        totals = BuildTotals(archetype=archetype)
+        totals.add_defense_bonuses(defense)
+        totals.add_resistance_bonuses(resistance)
+        totals.add_recharge_bonuses(recharge)
+        for source in damage:
+            totals.add_damage_buff(
+                source.name, source.value, source.is_temporary, source.avg_multiplier
+            )
+        totals.get_damage_buff()
+
+
+def run_vectorized(builds):
+    score_builds(
+        archetypes=[b[0] for b in builds],
+        defense_bonuses=[b[1] for b in builds],
+        resistance_bonuses=[b[2] for b in builds],
+        recharge_bonuses=[b[3] for b in builds],
+        damage_buffs=[b[4] for b in builds],
+    )
+
+
+def encode(builds):
+    return (
+        [b[0] for b in builds],
+        _stack([encode_defense_bonuses(b[1]) for b in builds], len(DEFENSE_COLUMNS)),
+        _stack(
+            [encode_resistance_bonuses(b[2]) for b in builds], len(RESISTANCE_COLUMNS)
+        ),
+        _stack([np.asarray(b[3], dtype=np.float64).reshape(-1, 1) for b in builds], 1),
+        _stack(
+            [encode_damage_buffs(b[4]) for b in builds], len(DAMAGE_HEURISTIC_COLUMNS)
+        ),
+    )
+
+
+def best_of(fn, arg, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(arg)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 100, 10_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        f"{'builds':>8} {'scalar ms':>12} {'vector ms':>12} {'pre-enc ms':>12} "
+        f"{'speedup':>9} {'pre-enc speedup':>16}"
+    )
+    for size in args.sizes:
+        builds = generate_builds(size)
+        encoded = encode(builds)
+
+        scalar = best_of(run_scalar, builds, args.repeat)
+        vector = best_of(run_vectorized, builds, args.repeat)
+        pre_encoded = best_of(
+            lambda e: aggregate_build_arrays(*e), encoded, args.repeat
+        )
+
+        print(
+            f"{size:>8} {scalar * 1000:>12.3f} {vector * 1000:>12.3f} "
+            f"{pre_encoded * 1000:>12.3f} {scalar / vector:>8.1f}x "
+            f"{scalar / pre_encoded:>15.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
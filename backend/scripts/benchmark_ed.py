@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark: scalar apply_ed loop vs apply_ed_array
+
+Applies ED to the same random pre-ED totals (0-250%, schedules A-D mixed, as
+for every enhanced aspect of many builds) with:
+- scalar:  apply_ed() per value, in a Python loop
+- array:   one apply_ed_array() call with a schedule per value
+
+Usage:
+    python scripts/benchmark_ed.py [--sizes 10 1000 100000] [--repeat 5]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+
+from app.calculations.core import EDSchedule, apply_ed, apply_ed_array
+
+SCHEDULES = (EDSchedule.A, EDSchedule.B, EDSchedule.C, EDSchedule.D)
+
+
+def generate_totals(count, seed=42):
+    """Random (schedule indices, pre-ED totals) for count aspects."""
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, len(SCHEDULES), count), rng.uniform(0.0, 2.5, count)
+
+
+def run_scalar(totals):
+    schedules, values = totals
+    return [
+        apply_ed(SCHEDULES[s], v)
+        for s, v in zip(schedules.tolist(), values.tolist(), strict=True)
+    ]
+
+
+def run_array(totals):
+    return apply_ed_array(*totals)
+
+
+def best_of(fn, arg, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(arg)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000, 100_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'values':>8} {'scalar ms':>12} {'array ms':>12} {'speedup':>9}")
+    for size in args.sizes:
+        totals = generate_totals(size)
+        if run_array(totals).tolist() != run_scalar(totals):
+            raise SystemExit("apply_ed_array does not match apply_ed")
+
+        scalar = best_of(run_scalar, totals, args.repeat)
+        array = best_of(run_array, totals, args.repeat)
+
+        print(
+            f"{size:>8} {scalar * 1000:>12.3f} {array * 1000:>12.3f} "
+            f"{scalar / array:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
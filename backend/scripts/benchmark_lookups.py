@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Benchmark: ORM AsyncSession lookups vs the prepared-statement repository
+
+Runs the hot read paths against a local PostgreSQL database (DATABASE_URL)
+with imported game data:
+- orm:      crud.* on an AsyncSession plus response-model validation
+- prepared: LookupRepository on the asyncpg pool (rows are already payloads)
+
+Lookups: power by id, powers by powerset, powerset by id, archetype powersets
+and a batch of powers by id list (IN (...) vs = ANY($1)).
+
+Usage:
+    python scripts/benchmark_lookups.py [--iterations 2000] [--batch 50]
+"""
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import asyncpg
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.engine import make_url
+
+from app import crud, models, schemas
+from app.database import (
+    DATABASE_URL,
+    dispose_async_engine,
+    get_async_session_factory,
+    init_connection,
+)
+from app.services.lookup_repository import LookupRepository
+
+POWER_LIST = TypeAdapter(list[schemas.Power])
+POWERSET_LIST = TypeAdapter(list[schemas.Powerset])
+
+
+async def sample_ids(pool, count, seed=42):
+    """Random power, powerset and archetype ids from the database."""
+    async with pool.acquire() as conn:
+        power_ids = [r["id"] for r in await conn.fetch("SELECT id FROM powers")]
+        powerset_ids = [
+            r["powerset_id"]
+            for r in await conn.fetch("SELECT DISTINCT powerset_id FROM powers")
+        ]
+        archetype_ids = [
+            r["archetype_id"]
+            for r in await conn.fetch(
+                "SELECT DISTINCT archetype_id FROM powersets "
+                "WHERE archetype_id IS NOT NULL"
+            )
+        ]
+    if not power_ids or not archetype_ids:
+        sys.exit("No game data found; import filtered_data first")
+    rng = random.Random(seed)
+    return (
+        [rng.choice(power_ids) for _ in range(count)],
+        [rng.choice(powerset_ids) for _ in range(count)],
+        [rng.choice(archetype_ids) for _ in range(count)],
+        power_ids,
+    )
+
+
+async def timed(fn, args):
+    """Mean microseconds per call of ``await fn(arg)``."""
+    await fn(args[0])  # warm up (prepares the statement on this connection)
+    start = time.perf_counter()
+    for arg in args:
+        await fn(arg)
+    return (time.perf_counter() - start) / len(args) * 1e6
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--batch", type=int, default=50, help="ids per batch lookup")
+    args = parser.parse_args()
+
+    url = make_url(DATABASE_URL).set(drivername="postgresql")
+    # One connection each, so both paths reuse a warm connection
+    pool = await asyncpg.create_pool(
+        url.render_as_string(hide_password=False),
+        min_size=1,
+        max_size=1,
+        init=init_connection,
+    )
+    repository = LookupRepository(pool)
+    session_factory = get_async_session_factory()
+
+    power_ids, powerset_ids, archetype_ids, all_power_ids = await sample_ids(
+        pool, args.iterations
+    )
+    rng = random.Random(7)
+    batches = [
+        rng.sample(all_power_ids, min(args.batch, len(all_power_ids)))
+        for _ in range(max(1, args.iterations // 10))
+    ]
+
+    async with session_factory() as db:
+
+        async def orm_power(power_id):
+            # Fresh identity map per call, like one request per session
+            db.expunge_all()
+            power = await crud.get_power(db, power_id)
+            return {c.name: getattr(power, c.name) for c in power.__table__.columns}
+
+        async def orm_powerset_powers(powerset_id):
+            db.expunge_all()
+            await crud.get_powerset(db, powerset_id)
+            powers = await crud.get_powers_by_powerset(db, powerset_id)
+            return POWER_LIST.validate_python(powers, from_attributes=True)
+
+        async def orm_powerset(powerset_id):
+            db.expunge_all()
+            powerset = await crud.get_powerset(db, powerset_id)
+            return schemas.Powerset.model_validate(powerset)
+
+        async def orm_archetype_powersets(archetype_id):
+            db.expunge_all()
+            await crud.get_archetype(db, archetype_id)
+            powersets = await crud.get_powersets_by_archetype(db, archetype_id)
+            return POWERSET_LIST.validate_python(powersets, from_attributes=True)
+
+        async def orm_batch(ids):
+            db.expunge_all()
+            powers = await db.scalars(
+                select(models.Power).where(models.Power.id.in_(ids))
+            )
+            return POWER_LIST.validate_python(list(powers), from_attributes=True)
+
+        cases = [
+            ("power by id", orm_power, repository.get_power, power_ids),
+            (
+                "powers by powerset",
+                orm_powerset_powers,
+                repository.get_powers_by_powerset,
+                powerset_ids,
+            ),
+            ("powerset by id", orm_powerset, repository.get_powerset, powerset_ids),
+            (
+                "archetype powersets",
+                orm_archetype_powersets,
+                repository.get_archetype_powersets,
+                archetype_ids,
+            ),
+            (f"powers by {args.batch} ids", orm_batch, repository.get_powers, batches),
+        ]
+
+        print(f"{'lookup':<22} {'orm us':>10} {'prepared us':>12} {'speedup':>9}")
+        for name, orm_fn, prepared_fn, inputs in cases:
+            orm = await timed(orm_fn, inputs)
+            prepared = await timed(prepared_fn, inputs)
+            print(f"{name:<22} {orm:>10.1f} {prepared:>12.1f} {orm / prepared:>8.1f}x")
+
+    await pool.close()
+    await dispose_async_engine()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
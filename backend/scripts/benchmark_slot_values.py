@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark: memoized slot values vs computing every slot
+
+Computes every slot value of many random builds (24 powers, 100 slots of
+level 10-50 IOs, attuned and catalyzed IOs, boosters and SOs, two schedules
+per power) with:
+- uncached: calculate_slot_value() per slot, memo disabled
+- memo:     calculate_slot_value() per slot through the shared memo
+- batch:    one calculate_slot_values() call per build
+
+Usage:
+    python scripts/benchmark_slot_values.py [--builds 200] [--repeat 5]
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.calculations.enhancements import (
+    EnhancementGrade,
+    RelativeLevel,
+    Slot,
+    SlottedPower,
+    SlottingCalculator,
+    SlotValueCache,
+)
+
+MULT_TABLES = {
+    "MultTO": [[0.053, 0.035, 0.026, 0.020]],
+    "MultDO": [[0.157, 0.104, 0.078, 0.059]],
+    "MultSO": [[0.333, 0.222, 0.166, 0.125]],
+    "MultIO": [[0.18 + 0.005 * i, 0.11 + 0.003 * i, 0.07, 0.05] for i in range(53)],
+}
+
+
+def random_slot(rng):
+    if rng.random() < 0.15:
+        return Slot(
+            enhancement_id=1,
+            grade=EnhancementGrade.SINGLE_O,
+            relative_level=rng.choice(list(RelativeLevel)),
+        )
+    boost_level = rng.choice([0, 0, 0, 5])
+    return Slot(
+        enhancement_id=2,
+        io_level=rng.choice([10, 20, 25, 30, 35, 40, 45, 50, 50, 50]),
+        is_attuned=rng.random() < 0.2,
+        is_catalyzed=rng.random() < 0.1,
+        is_boosted=boost_level > 0,
+        boost_level=boost_level,
+    )
+
+
+def generate_builds(count, seed=42):
+    """Lists of (slotted power, schedule index) aspects, one per build."""
+    rng = random.Random(seed)
+    builds = []
+    for _ in range(count):
+        aspects = []
+        # 24 powers, 100 slots: 4 powers with 6 slots, 20 with 3-4
+        for slots in [6] * 4 + [4] * 16 + [3] * 4:
+            power = SlottedPower(power_id=0)
+            for i in range(slots):
+                power.add_slot(rng.randint(1, 49))
+                power.slots[i].enhancement = random_slot(rng)
+            aspects.extend((power, schedule) for schedule in rng.sample(range(4), 2))
+        builds.append(aspects)
+    return builds
+
+
+def per_slot(calculator, builds):
+    return [
+        [
+            [
+                calculator.calculate_slot_value(slot.enhancement, schedule, 40, 10, 50)
+                for slot in power.slots
+            ]
+            for power, schedule in aspects
+        ]
+        for aspects in builds
+    ]
+
+
+def batch(calculator, builds):
+    return [
+        calculator.calculate_slot_values(aspects, 40, 10, 50) for aspects in builds
+    ]
+
+
+def best_of(fn, calculator, builds, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(calculator, builds)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--builds", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    builds = generate_builds(args.builds)
+    cache = SlotValueCache()
+    uncached = SlottingCalculator(MULT_TABLES, cache=None)
+    memo = SlottingCalculator(MULT_TABLES, cache=cache)
+    expected = per_slot(uncached, builds)
+    if per_slot(memo, builds) != expected or batch(memo, builds) != expected:
+        raise SystemExit("Memoized slot values differ from computed ones")
+
+    baseline = best_of(per_slot, uncached, builds, args.repeat)
+    print(f"{'mode':>10} {'ms/build':>10} {'speedup':>9}")
+    print(f"{'uncached':>10} {baseline * 1000 / len(builds):>10.3f} {1.0:>8.1f}x")
+    for name, fn in (("memo", per_slot), ("batch", batch)):
+        elapsed = best_of(fn, memo, builds, args.repeat)
+        print(
+            f"{name:>10} {elapsed * 1000 / len(builds):>10.3f} "
+            f"{baseline / elapsed:>8.1f}x"
+        )
+    stats = cache.get_stats()
+    print(f"memo: {stats['entries']} entries, hit rate {stats['hit_rate']:.1%}")
+
+
+if __name__ == "__main__":
+    main()
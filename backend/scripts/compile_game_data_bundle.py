@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Compile filtered_data into a memory-mapped game data bundle
+
+Packs the filtered_data JSON tree into one versioned binary file (see
+app/services/game_data_bundle.py) and compares it with reading the JSON files
+directly:
+- startup:  opening the bundle vs parsing every power JSON file
+- lookup:   bundle get_power / get_json / get_power_stats vs reading and
+            parsing one power file
+- tables:   zero-copy archetype table view vs loading the archetype file
+
+Usage:
+    python scripts/compile_game_data_bundle.py [--data-dir ../filtered_data]
+        [--output game_data.bundle] [--lookups 2000] [--skip-startup-json]
+"""
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.game_data_bundle import GameDataBundle, compile_bundle
+
+DEFAULT_DATA_DIR = Path(__file__).parent.parent.parent / "filtered_data"
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def load_all_power_json(data_dir):
+    powers = {}
+    for path in (data_dir / "powers").rglob("*.json"):
+        if path.name != "index.json":
+            doc = json.loads(path.read_text(encoding="utf-8"))
+            powers[doc.get("full_name", path.stem)] = doc
+    return powers
+
+
+def power_paths(data_dir):
+    """Map power full names to their source files."""
+    paths = {}
+    for path in (data_dir / "powers").rglob("*.json"):
+        if path.name != "index.json":
+            doc = json.loads(path.read_text(encoding="utf-8"))
+            paths[doc["full_name"]] = path
+    return paths
+
+
+def per_lookup_us(fn, keys):
+    start = time.perf_counter()
+    for key in keys:
+        fn(key)
+    return (time.perf_counter() - start) / len(keys) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--data-dir", type=Path, default=DEFAULT_DATA_DIR)
+    parser.add_argument("--output", type=Path, default=Path("game_data.bundle"))
+    parser.add_argument("--lookups", type=int, default=2000)
+    parser.add_argument(
+        "--skip-startup-json",
+        action="store_true",
+        help="Skip timing a full JSON load (slow on cold disks)",
+    )
+    args = parser.parse_args()
+
+    stats = compile_bundle(args.data_dir, args.output)
+    print(f"Compiled {args.output} in {stats['compile_seconds']:.2f}s")
+    print(f"  counts: {stats['counts']}, tables: {stats['tables']}")
+    print(
+        f"  size: {stats['bundle_bytes'] / 1e6:.1f} MB bundle vs "
+        f"{stats['source_bytes'] / 1e6:.1f} MB JSON "
+        f"({stats['source_bytes'] / stats['bundle_bytes']:.1f}x smaller)"
+    )
+
+    print("\nStartup")
+    bundle, open_seconds = timed(GameDataBundle, args.output)
+    _, index_seconds = timed(bundle.keys, "powers")
+    print(f"  bundle open:             {open_seconds * 1000:10.3f} ms")
+    print(f"  bundle power index:      {index_seconds * 1000:10.3f} ms (first use)")
+    if not args.skip_startup_json:
+        _, json_seconds = timed(load_all_power_json, args.data_dir)
+        print(f"  parse all power JSON:    {json_seconds * 1000:10.3f} ms")
+
+    rng = random.Random(42)
+    paths = power_paths(args.data_dir)
+    keys = rng.choices(sorted(paths), k=args.lookups)
+
+    print(f"\nPer power lookup ({args.lookups} random powers)")
+    json_us = per_lookup_us(
+        lambda key: json.loads(paths[key].read_text(encoding="utf-8")), keys
+    )
+    print(f"  json.loads(file):        {json_us:10.2f} us")
+    for name, fn in (
+        ("bundle.get_power", bundle.get_power),
+        ("bundle.get_json", lambda key: bundle.get_json("powers", key)),
+        ("bundle.get_power_stats", bundle.get_power_stats),
+    ):
+        us = per_lookup_us(fn, keys)
+        print(f"  {name + ':':<24} {us:10.2f} us ({json_us / us:8.1f}x)")
+
+    archetype = next(iter(bundle.keys("archetypes")), None)
+    if archetype and bundle.table_names(archetype):
+        table = bundle.table_names(archetype)[0]
+        archetype_path = args.data_dir / "archetypes" / f"{archetype.lower()}.json"
+        print(f"\nArchetype table lookup ({archetype} / {table})")
+        if archetype_path.exists():
+            json_us = per_lookup_us(
+                lambda _: json.loads(archetype_path.read_text())["named_tables"],
+                range(200),
+            )
+            print(f"  json.loads(file):        {json_us:10.2f} us")
+        us = per_lookup_us(lambda _: bundle.get_table(archetype, table), range(200))
+        print(f"  bundle.get_table:        {us:10.2f} us")
+        us = per_lookup_us(lambda _: bundle.get_archetype(archetype), range(200))
+        print(f"  bundle.get_archetype:    {us:10.2f} us (whole document)")
+
+    bundle.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@
 """CLI script for importing I12 power data using the streaming parser."""
 
 import argparse
+import asyncio
 import logging
 import os
 import sys
@@ -45,6 +46,9 @@ Examples:
   # Resume import from specific record
   python import_i12_data.py /path/to/i12_data.json --resume-from 50000
 
+  # Resume from the byte offset checkpoint logged by an interrupted run
+  python import_i12_data.py /path/to/i12_data.json --resume-offset 123456789
+
   # Test run with validation only (no database writes)
   python import_i12_data.py /path/to/i12_data.json --validate-only
         """,
@@ -87,6 +91,13 @@ Examples:
         help="Record number to resume import from (default: 0)",
     )
 
+    parser.add_argument(
+        "--resume-offset",
+        type=int,
+        default=0,
+        help="Byte offset checkpoint to resume import from (default: 0)",
+    )
+
     parser.add_argument(
         "--validate-only",
         action="store_true",
@@ -124,6 +135,8 @@ Examples:
 
     if args.resume_from > 0:
         logger.info(f"Resuming from record {args.resume_from}")
+    if args.resume_offset > 0:
+        logger.info(f"Resuming from byte offset {args.resume_offset}")
 
     if args.validate_only:
         logger.info("Validation mode: No data will be written to database")
@@ -132,7 +145,7 @@ Examples:
     if args.clear_cache:
         logger.info("Clearing power cache")
         cache = get_power_cache()
-        cache.clear_all_cache()
+        asyncio.run(cache.clear_all_cache())
 
     # Create parser
     parser = I12StreamingParser(
@@ -143,9 +156,11 @@ Examples:
     )
 
     # Progress callback
-    def progress_callback(processed: int, total: int, percentage: float):
-        if processed % 10000 == 0 or percentage == 100.0:
-            logger.info(f"Progress: {processed}/{total} ({percentage:.1f}%)")
+    def progress_callback(bytes_read: int, total_bytes: int, percentage: float):
+        logger.info(
+            f"Progress: {bytes_read}/{total_bytes} bytes ({percentage:.1f}%), "
+            f"{parser.processed_count} records"
+        )
 
     try:
         if args.validate_only:
@@ -159,6 +174,7 @@ Examples:
                 file_path=args.json_file,
                 resume_from=args.resume_from,
                 progress_callback=progress_callback,
+                resume_offset=args.resume_offset,
             )
 
         # Display final statistics
@@ -166,6 +182,7 @@ Examples:
         logger.info(f"Records processed: {parser.processed_count}")
         logger.info(f"Records imported: {parser.imported_count}")
         logger.info(f"Errors encountered: {parser.error_count}")
+        logger.info(f"Build summary view refreshed: {parser.summary_refreshed}")
 
         if parser.errors:
             logger.warning("Errors details (first 10):")
@@ -186,11 +203,13 @@ Examples:
     except KeyboardInterrupt:
         logger.info("Import interrupted by user")
         logger.info(f"Progress: {parser.processed_count} records processed")
+        logger.info(f"Resume with --resume-offset {parser.checkpoint_offset}")
         sys.exit(1)
 
     except Exception as e:
         logger.error(f"Import failed with error: {e}")
         logger.error(f"Progress: {parser.processed_count} records processed")
+        logger.error(f"Resume with --resume-offset {parser.checkpoint_offset}")
         sys.exit(1)
 
 
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Measure bytes per /api/powersets/{id}/powers call with deferred power blobs
+
+Imports powersets from filtered_data into a scratch SQLite database and
+compares, per powerset:
+- list:     GET /api/powersets/{id}/powers (power_data deferred, not returned)
+- details:  GET /api/powersets/{id}/powers/details (the previous list payload,
+            which always carried power_data)
+- db blobs: JSON the ORM no longer fetches per call (power_data plus the
+            duplicate source_metadata copy the importer used to store)
+
+Usage:
+    python scripts/measure_powerset_payloads.py [--data-dir ../filtered_data] [--limit 100]
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Point both engines at a scratch database before the app is imported
+_scratch = tempfile.TemporaryDirectory()
+os.environ["DATABASE_URL"] = f"sqlite:///{_scratch.name}/payloads.db"
+os.environ.pop("ASYNC_DATABASE_URL", None)
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.data_import.importers.parallel_power_importer import (  # noqa: E402
+    ParallelPowerImporter,
+    find_powerset_dirs,
+)
+from app.database import Base, SessionLocal, engine  # noqa: E402
+from app.models import Power  # noqa: E402
+from main import app  # noqa: E402
+
+
+def kb(values):
+    return f"{statistics.mean(values) / 1024:>9.1f} {max(values) / 1024:>9.1f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--data-dir",
+        type=Path,
+        default=Path(__file__).parent.parent.parent / "filtered_data",
+    )
+    parser.add_argument("--limit", type=int, default=100, help="powersets to import")
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        dirs = find_powerset_dirs(args.data_dir / "powers")[: args.limit]
+        ParallelPowerImporter(db, workers=0).import_powerset_dirs(dirs)
+        blob_bytes: dict[int, int] = {}
+        for powerset_id, power_data in db.query(Power.powerset_id, Power.power_data):
+            # Previously stored twice: power_data and source_metadata
+            size = 2 * len(json.dumps(power_data, separators=(",", ":")))
+            blob_bytes[powerset_id] = blob_bytes.get(powerset_id, 0) + size
+
+    client = TestClient(app)  # no lifespan: the asyncpg pool is not needed
+    list_bytes, detail_bytes = [], []
+    for powerset_id in sorted(blob_bytes):
+        base = f"/api/powersets/{powerset_id}/powers"
+        list_bytes.append(len(client.get(base).content))
+        detail_bytes.append(len(client.get(f"{base}/details").content))
+
+    print(f"{len(blob_bytes)} powersets, one call per endpoint each\n")
+    print(f"{'per call':<24} {'mean KB':>9} {'max KB':>9}")
+    print(f"{'response (list)':<24} {kb(list_bytes)}")
+    print(f"{'response (details)':<24} {kb(detail_bytes)}")
+    print(f"{'db blobs no longer read':<24} {kb(list(blob_bytes.values()))}")
+    saved = 1 - sum(list_bytes) / sum(detail_bytes)
+    print(f"\nresponse bytes saved: {saved:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,8 @@ Unit tests for Calculation API endpoints.
 Tests all Phase 5 calculation endpoints with exact values from specs.
 """
 
+import json
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -351,6 +353,73 @@ class TestBuildTotals:
         assert data["resistance"]["values"]["lethal"] == pytest.approx(0.15, rel=1e-3)
 
 
+class TestBuildTotalsBatch:
+    """Tests for POST /api/v1/calculations/build/batch endpoint."""
+
+    @staticmethod
+    def _parse_ndjson(response) -> list[dict]:
+        return [json.loads(line) for line in response.text.splitlines() if line]
+
+    def test_batch_matches_single_build_totals(self):
+        """Each streamed line matches the single-build totals endpoint."""
+        builds = [
+            {
+                "archetype": "Scrapper",
+                "defense_bonuses": [{"bonuses": {"melee": 0.30}}],
+                "resistance_bonuses": [{"bonuses": {"smashing": 0.20}}],
+            },
+            {
+                "archetype": "Tanker",
+                "resistance_bonuses": [
+                    {"bonuses": {"fire": 0.60}},
+                    {"bonuses": {"fire": 0.50}},
+                ],
+            },
+            {
+                "archetype": "Scrapper",
+                "defense_bonuses": [{"bonuses": {"ranged": 0.45, "fire": 0.10}}],
+            },
+        ]
+
+        response = client.post(
+            "/api/v1/calculations/build/batch",
+            json={"builds": builds, "concurrency": 2},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = self._parse_ndjson(response)
+        assert [line["index"] for line in lines] == [0, 1, 2]
+
+        for build, line in zip(builds, lines, strict=True):
+            single = client.post("/api/v1/calculations/build/totals", json=build)
+            assert single.status_code == 200
+            expected = single.json()
+            assert line["defense"] == expected["defense"]
+            assert line["resistance"] == expected["resistance"]
+
+        # Tanker fire resistance capped at 90%
+        assert lines[1]["resistance"]["values"]["fire"] == pytest.approx(0.90)
+
+    def test_batch_size_limit(self):
+        """Batches over BUILD_BATCH_MAX_SIZE are rejected."""
+        from app.schemas.calculations import BUILD_BATCH_MAX_SIZE
+
+        builds = [{"archetype": "Scrapper"}] * (BUILD_BATCH_MAX_SIZE + 1)
+        response = client.post(
+            "/api/v1/calculations/build/batch", json={"builds": builds}
+        )
+        assert response.status_code == 422
+
+    def test_batch_concurrency_limit(self):
+        """Concurrency outside the allowed range is rejected."""
+        response = client.post(
+            "/api/v1/calculations/build/batch",
+            json={"builds": [{"archetype": "Scrapper"}], "concurrency": 0},
+        )
+        assert response.status_code == 422
+
+
 # ============================================================================
 # Game Constants Tests
 # ============================================================================
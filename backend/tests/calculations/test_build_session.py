@@ -0,0 +1,322 @@
+"""
+Tests for BuildSession - incremental build recalculation
+
+An updated session must always equal a session built from scratch with the
+same powers, and each change must report exactly the totals that changed.
+"""
+
+import copy
+import random
+
+import pytest
+
+from app.calculations.build import (
+    BuildData,
+    BuildSession,
+    DefenseType,
+    EnhancementInfo,
+    ResistanceType,
+    TotalStat,
+    aggregate_defense_bonuses,
+)
+from app.calculations.core import ArchetypeType, EDSchedule, apply_ed
+from app.calculations.enhancements import (
+    BonusItem,
+    EnhancementGrade,
+    EnhancementSet,
+    Slot,
+    SlottedPower,
+    SlottingCalculator,
+)
+
+MULT_TABLES = {
+    "MultTO": [[0.053, 0.035, 0.026, 0.020]],
+    "MultDO": [[0.157, 0.104, 0.078, 0.059]],
+    "MultSO": [[0.333, 0.222, 0.166, 0.125]],
+    "MultIO": [
+        [0.2 + 0.004 * level, 0.12 + 0.003 * level, 0.1, 0.1] for level in range(53)
+    ],
+}
+
+DEFENSE_SO = 1
+RESIST_SO = 2
+RECHARGE_IO = 3
+# Kinetic Crash-like set: +recharge at 2 pieces, +melee/ranged defense at 4
+KINETIC = 10
+KINETIC_PIECES = (11, 12, 13, 14, 15)
+RECHARGE_BONUS = 500
+DEFENSE_BONUS = 501
+# Luck of the Gambler-like special bonus on one piece
+GAMBLER = 20
+GAMBLER_PIECES = (21, 22)
+GAMBLER_BONUS = 502
+
+DATA = BuildData(
+    enhancements={
+        DEFENSE_SO: EnhancementInfo(DEFENSE_SO, ("Defense",)),
+        RESIST_SO: EnhancementInfo(RESIST_SO, ("Resistance",)),
+        RECHARGE_IO: EnhancementInfo(RECHARGE_IO, ("Recharge",)),
+        **{
+            piece: EnhancementInfo(piece, ("Defense", "Recharge"), set_id=KINETIC)
+            for piece in KINETIC_PIECES
+        },
+        **{
+            piece: EnhancementInfo(piece, ("Defense",), set_id=GAMBLER)
+            for piece in GAMBLER_PIECES
+        },
+    },
+    enhancement_sets={
+        KINETIC: EnhancementSet(
+            id=KINETIC,
+            uid="Kinetic_Crash",
+            name="Kinetic Crash",
+            short_name="KinCrsh",
+            set_type="Knockback",
+            level_min=10,
+            level_max=50,
+            enhancement_ids=list(KINETIC_PIECES),
+            bonuses=[
+                BonusItem(slotted_required=2, power_ids=[RECHARGE_BONUS]),
+                BonusItem(slotted_required=4, power_ids=[DEFENSE_BONUS]),
+            ],
+        ),
+        GAMBLER: EnhancementSet(
+            id=GAMBLER,
+            uid="Luck_of_the_Gambler",
+            name="Luck of the Gambler",
+            short_name="LotG",
+            set_type="Defense",
+            level_min=25,
+            level_max=50,
+            enhancement_ids=list(GAMBLER_PIECES),
+            special_bonuses=[
+                BonusItem(slotted_required=1, power_ids=[]),
+                BonusItem(slotted_required=1, power_ids=[GAMBLER_BONUS]),
+            ],
+        ),
+    },
+    power_stats={
+        1: {DefenseType.MELEE: 0.05, DefenseType.RANGED: 0.05, DefenseType.AOE: 0.05},
+        2: {ResistanceType.SMASHING: 0.3, ResistanceType.LETHAL: 0.3},
+        3: {TotalStat.GLOBAL_RECHARGE: 0.7},
+        4: {ResistanceType.FIRE: 0.2, DefenseType.FIRE: 0.1},
+    },
+    bonus_stats={
+        RECHARGE_BONUS: {TotalStat.GLOBAL_RECHARGE: 0.0625},
+        DEFENSE_BONUS: {DefenseType.MELEE: 0.025, DefenseType.RANGED: 0.025},
+        GAMBLER_BONUS: {TotalStat.GLOBAL_RECHARGE: 0.075},
+    },
+)
+
+ALL_ENHANCEMENTS = list(DATA.enhancements)
+
+
+def slotted_power(power_id: int, enhancement_ids=(), slot_levels=None) -> SlottedPower:
+    levels = slot_levels or [1 + 2 * i for i in range(6)]
+    power = SlottedPower(power_id=power_id)
+    for level in levels:
+        power.add_slot(level)
+    for entry, enhancement_id in zip(power.slots, enhancement_ids, strict=False):
+        entry.enhancement = make_slot(enhancement_id)
+    return power
+
+
+def make_slot(enhancement_id: int, **kwargs) -> Slot:
+    if enhancement_id in (DEFENSE_SO, RESIST_SO):
+        return Slot(enhancement_id=enhancement_id, grade=EnhancementGrade.SINGLE_O)
+    return Slot(enhancement_id=enhancement_id, io_level=50, **kwargs)
+
+
+def new_session(**kwargs) -> BuildSession:
+    return BuildSession(
+        ArchetypeType.SCRAPPER, DATA, SlottingCalculator(MULT_TABLES), **kwargs
+    )
+
+
+def rebuilt(session: BuildSession) -> BuildSession:
+    """A fresh session with the same powers and level."""
+    fresh = new_session(character_level=session.character_level)
+    for power in session._powers.values():
+        fresh.add_power(copy.deepcopy(power))
+    return fresh
+
+
+class TestBuildSession:
+    def test_slotting_returns_changed_totals(self):
+        session = new_session()
+        session.add_power(slotted_power(1))
+
+        diff = session.slot_enhancement(1, 0, make_slot(DEFENSE_SO))
+
+        enhanced = 0.05 * (1.0 + apply_ed(EDSchedule.B, 0.222))
+        assert diff == {
+            DefenseType.MELEE: (0.05, enhanced),
+            DefenseType.RANGED: (0.05, enhanced),
+            DefenseType.AOE: (0.05, enhanced),
+        }
+        assert session.get_power_enhancement(1) == {"Defense": 0.222}
+        # A resistance enhancement does nothing for a defense power
+        assert session.slot_enhancement(1, 1, make_slot(RESIST_SO)) == {}
+
+    def test_set_bonuses(self):
+        session = new_session()
+        session.add_power(slotted_power(1, [KINETIC_PIECES[0]]))
+
+        diff = session.slot_enhancement(1, 1, make_slot(KINETIC_PIECES[1]))
+
+        assert diff[TotalStat.GLOBAL_RECHARGE] == (0.0, 0.0625)
+        assert session.slot_dependents(1, 1) == {
+            DefenseType.MELEE,
+            DefenseType.RANGED,
+            DefenseType.AOE,
+            TotalStat.GLOBAL_RECHARGE,
+        }
+
+        session.slot_enhancement(1, 2, make_slot(KINETIC_PIECES[2]))
+        diff = session.slot_enhancement(1, 3, make_slot(KINETIC_PIECES[3]))
+        assert diff[DefenseType.MELEE][1] - diff[DefenseType.MELEE][0] > 0.025
+
+        diff = session.unslot_enhancement(1, 0)
+        assert set(diff) >= {DefenseType.MELEE, DefenseType.RANGED}
+        assert session.get_total(TotalStat.GLOBAL_RECHARGE) == 0.0625
+
+    def test_special_set_bonus(self):
+        session = new_session()
+        session.add_power(slotted_power(4, [GAMBLER_PIECES[0]]))
+
+        diff = session.slot_enhancement(4, 1, make_slot(GAMBLER_PIECES[1]))
+
+        assert diff[TotalStat.GLOBAL_RECHARGE] == (0.0, 0.075)
+
+    def test_rule_of_five(self):
+        session = new_session()
+        for power_id in range(100, 106):
+            session.add_power(slotted_power(power_id, KINETIC_PIECES[:2]))
+
+        assert session.set_bonuses.get_bonus_counts() == {RECHARGE_BONUS: 6}
+        assert session.get_total(TotalStat.GLOBAL_RECHARGE) == 0.0625 * 5
+
+        # Dropping the sixth instance changes nothing
+        assert session.unslot_enhancement(100, 0) == {}
+        diff = session.unslot_enhancement(101, 0)
+        assert diff == {TotalStat.GLOBAL_RECHARGE: (0.0625 * 5, 0.0625 * 4)}
+
+    def test_swap_and_remove_power(self):
+        session = new_session()
+        session.add_power(
+            slotted_power(1, [DEFENSE_SO, KINETIC_PIECES[0], KINETIC_PIECES[1]])
+        )
+
+        diff = session.swap_power(1, slotted_power(3, [RECHARGE_IO]))
+
+        assert diff[DefenseType.MELEE][1] == 0.0
+        assert diff[TotalStat.GLOBAL_RECHARGE] == (0.0625, 0.7)
+        assert session.set_bonuses.get_bonus_counts() == {}
+
+        assert session.remove_power(3) == {TotalStat.GLOBAL_RECHARGE: (0.7, 0.0)}
+        assert session.totals() == new_session().totals()
+
+    def test_level_change(self):
+        session = new_session(character_level=50)
+        session.add_power(
+            slotted_power(
+                1,
+                [DEFENSE_SO, KINETIC_PIECES[0], KINETIC_PIECES[1]],
+                slot_levels=[1, 10, 40, 3],
+            )
+        )
+        session.slot_enhancement(1, 3, make_slot(KINETIC_PIECES[2], is_attuned=True))
+        before = session.get_power_enhancement(1)
+
+        diff = session.set_level(5)
+
+        # Slots added at 10 and 40 are inactive: the 2-piece bonus is lost
+        assert diff[TotalStat.GLOBAL_RECHARGE] == (0.0625, 0.0)
+        assert session.get_power_enhancement(1)["Defense"] < before["Defense"]
+        assert session.totals() == rebuilt(session).totals()
+
+        session.set_level(50)
+        assert session.get_power_enhancement(1) == before
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_random_edits_match_rebuild(self, seed):
+        rng = random.Random(seed)
+        session = new_session()
+        for power_id in range(24):
+            session.add_power(
+                slotted_power(
+                    power_id, rng.choices(ALL_ENHANCEMENTS, k=rng.randint(0, 6))
+                )
+            )
+
+        for _ in range(200):
+            power_id = rng.choice(list(session._powers))
+            action = rng.random()
+            if action < 0.6:
+                slot_index = rng.randrange(len(session._powers[power_id].slots))
+                enhancement_id = rng.choice(ALL_ENHANCEMENTS)
+                before = session.totals()
+                diff = session.slot_enhancement(
+                    power_id, slot_index, make_slot(enhancement_id)
+                )
+                after = session.totals()
+                assert diff == {
+                    stat: (before[stat], after[stat])
+                    for stat in after
+                    if after[stat] != before[stat]
+                }
+            elif action < 0.8:
+                session.unslot_enhancement(power_id, 0)
+            elif action < 0.9:
+                new_id = rng.choice([1, 2, 3, 4, 1000 + rng.randrange(1000)])
+                if new_id == power_id or new_id not in session._powers:
+                    session.swap_power(
+                        power_id,
+                        slotted_power(new_id, rng.choices(ALL_ENHANCEMENTS, k=3)),
+                    )
+            else:
+                session.set_level(rng.randint(1, 50))
+
+        fresh = rebuilt(session)
+        assert session.totals() == fresh.totals()
+        assert session.set_bonuses.get_bonus_counts() == (
+            fresh.set_bonuses.get_bonus_counts()
+        )
+
+    def test_matches_aggregators(self):
+        session = new_session()
+        session.add_power(slotted_power(1, [DEFENSE_SO, DEFENSE_SO]))
+        session.add_power(slotted_power(4, [DEFENSE_SO]))
+
+        positional = 0.05 * (1.0 + apply_ed(EDSchedule.B, 0.444))
+        defense_bonuses = [
+            {
+                DefenseType.MELEE: positional,
+                DefenseType.RANGED: positional,
+                DefenseType.AOE: positional,
+            },
+            {DefenseType.FIRE: 0.1 * (1.0 + apply_ed(EDSchedule.B, 0.222))},
+        ]
+        expected = aggregate_defense_bonuses(defense_bonuses, ArchetypeType.SCRAPPER)
+        summary = session.build_totals().get_summary()
+
+        for defense_type in DefenseType:
+            assert session.get_total(defense_type) == pytest.approx(
+                expected.get_defense(defense_type)
+            )
+        assert summary["defense"]["typed"]["Fire"]["value"] == (
+            session.get_total(DefenseType.FIRE)
+        )
+
+    def test_errors(self):
+        session = new_session()
+        session.add_power(slotted_power(1))
+
+        with pytest.raises(ValueError):
+            session.add_power(slotted_power(1))
+        with pytest.raises(KeyError):
+            session.slot_enhancement(2, 0, make_slot(DEFENSE_SO))
+        with pytest.raises(KeyError):
+            session.slot_enhancement(1, 0, Slot(enhancement_id=999))
+        with pytest.raises(IndexError):
+            session.slot_enhancement(1, 6, make_slot(DEFENSE_SO))
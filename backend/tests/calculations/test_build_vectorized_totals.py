@@ -0,0 +1,124 @@
+"""
+Test Vectorized Build Totals
+
+The NumPy engine must reproduce the scalar aggregators exactly, not approximately.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from app.calculations.build import (
+    BuildTotals,
+    DamageBuffSource,
+    DamageHeuristic,
+    DefenseType,
+    ResistanceType,
+    score_builds,
+)
+from app.calculations.build.vectorized_totals import (
+    DEFENSE_COLUMNS,
+    RESISTANCE_COLUMNS,
+    encode_defense_bonuses,
+)
+from app.calculations.core import ArchetypeType
+
+
+def _random_build(rng: random.Random):
+    """Generate random bonuses in the shape the scalar aggregators take."""
+    archetype = rng.choice(
+        [at for at in ArchetypeType if at is not ArchetypeType.SENTINEL]
+    )
+    defense = [
+        {dt: rng.uniform(-0.05, 0.25) for dt in rng.sample(DEFENSE_COLUMNS, 3)}
+        for _ in range(rng.randint(0, 20))
+    ]
+    resistance = [
+        {rt: rng.uniform(0.0, 0.30) for rt in rng.sample(RESISTANCE_COLUMNS, 2)}
+        for _ in range(rng.randint(0, 20))
+    ]
+    recharge = [rng.uniform(0.0, 0.7) for _ in range(rng.randint(0, 12))]
+    damage = [
+        DamageBuffSource(
+            name=f"src{i}",
+            value=rng.uniform(0.0, 1.5),
+            is_temporary=rng.random() < 0.5,
+            avg_multiplier=rng.uniform(0.0, 1.0),
+        )
+        for i in range(rng.randint(0, 10))
+    ]
+    return archetype, defense, resistance, recharge, damage
+
+
+def _scalar_totals(archetype, defense, resistance, recharge, damage) -> BuildTotals:
+    totals = BuildTotals(archetype=archetype)
+    totals.add_defense_bonuses(defense)
+    totals.add_resistance_bonuses(resistance)
+    totals.add_recharge_bonuses(recharge)
+    for source in damage:
+        totals.add_damage_buff(
+            source.name, source.value, source.is_temporary, source.avg_multiplier
+        )
+    return totals
+
+
+class TestVectorizedBuildTotals:
+    """Equivalence between the vectorized engine and BuildTotals."""
+
+    def test_columns_follow_enum_order(self):
+        assert DEFENSE_COLUMNS == tuple(DefenseType)
+        assert RESISTANCE_COLUMNS == tuple(ResistanceType)
+
+        matrix = encode_defense_bonuses([{DefenseType.AOE: 0.1}])
+        assert matrix.shape == (1, 11)
+        assert matrix.dtype == np.float64
+        assert matrix[0, -1] == 0.1
+
+    def test_summary_matches_build_totals_exactly(self):
+        rng = random.Random(1234)
+        builds = [_random_build(rng) for _ in range(200)]
+
+        vectorized = score_builds(
+            archetypes=[b[0] for b in builds],
+            defense_bonuses=[b[1] for b in builds],
+            resistance_bonuses=[b[2] for b in builds],
+            recharge_bonuses=[b[3] for b in builds],
+            damage_buffs=[b[4] for b in builds],
+        )
+
+        assert len(vectorized) == len(builds)
+        for i, build in enumerate(builds):
+            scalar = _scalar_totals(*build)
+            assert vectorized.get_summary(i) == scalar.get_summary()
+            assert vectorized.get_global_recharge(i) == scalar.get_global_recharge()
+            for heuristic in DamageHeuristic:
+                assert vectorized.get_damage_buff(
+                    i, heuristic
+                ) == scalar.get_damage_buff(heuristic)
+
+    def test_caps_applied_per_archetype(self):
+        result = score_builds(
+            archetypes=[ArchetypeType.TANKER, ArchetypeType.SCRAPPER],
+            resistance_bonuses=[
+                [{ResistanceType.FIRE: 0.60}, {ResistanceType.FIRE: 0.50}],
+                [{ResistanceType.FIRE: 0.60}, {ResistanceType.FIRE: 0.50}],
+            ],
+        )
+
+        assert result.get_resistance(0, ResistanceType.FIRE) == 0.90
+        assert result.get_resistance(1, ResistanceType.FIRE) == 0.75
+
+    def test_empty_build(self):
+        result = score_builds(archetypes=[ArchetypeType.BLASTER])
+        scalar = BuildTotals(archetype=ArchetypeType.BLASTER)
+
+        assert result.get_summary(0) == scalar.get_summary()
+        assert result.get_global_recharge(0) == 0.0
+
+    def test_mismatched_lengths_rejected(self):
+        with pytest.raises(ValueError):
+            score_builds(
+                archetypes=[ArchetypeType.BLASTER],
+                defense_bonuses=[[], []],
+            )
@@ -0,0 +1,323 @@
+"""
+Test EffectTable - columnar effect container
+
+Tables must behave exactly like the equivalent list of Effect objects, in
+the container itself and in every calculator that accepts either form.
+"""
+
+import pickle
+from dataclasses import fields
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from app.calculations.build.stacking_rules import BuffStackingCalculator
+from app.calculations.core import (
+    DamageType,
+    Effect,
+    EffectAggregator,
+    EffectTable,
+    EffectType,
+    Stacking,
+    Suppress,
+    ToWho,
+)
+from app.calculations.core.effect_table import COLUMN_DTYPES
+from app.calculations.powers.damage_calculator import (
+    DamageCalculator,
+    DamageMathMode,
+    PowerType,
+)
+from app.calculations.powers.defense_calculator import DefenseCalculator
+from app.calculations.powers.endurance_calculator import EnduranceCalculator
+
+
+@pytest.fixture
+def effects():
+    """A mixed bag of damage, defense, resistance and recovery effects."""
+    return [
+        Effect(
+            unique_id=1,
+            effect_type=EffectType.DAMAGE,
+            magnitude=50.0,
+            damage_type=DamageType.FIRE,
+        ),
+        Effect(
+            unique_id=2,
+            effect_type=EffectType.DAMAGE,
+            magnitude=10.0,
+            damage_type=DamageType.FIRE,
+            probability=0.5,
+            ticks=4,
+            cancel_on_miss=True,
+        ),
+        Effect(
+            unique_id=3,
+            effect_type=EffectType.DEFENSE,
+            magnitude=0.05,
+            buffed_magnitude=0.075,
+            damage_type=DamageType.SMASHING,
+            to_who=ToWho.SELF,
+        ),
+        Effect(
+            unique_id=4,
+            effect_type=EffectType.DEFENSE,
+            magnitude=0.03,
+            buffed_magnitude=0.03,
+            damage_type=DamageType.SMASHING,
+            to_who=ToWho.SELF,
+        ),
+        Effect(
+            unique_id=5,
+            effect_type=EffectType.RESISTANCE,
+            magnitude=0.2,
+            buffed_magnitude=0.25,
+            damage_type=DamageType.COLD,
+            stacking=Stacking.NO,
+        ),
+        Effect(
+            unique_id=6,
+            effect_type=EffectType.DEFENSE,
+            magnitude=0.1,
+            buffed_magnitude=0.1,
+            damage_type=DamageType.SMASHING,
+            probability=0.0,
+        ),
+        Effect(
+            unique_id=7,
+            effect_type=EffectType.RECOVERY,
+            magnitude=0.25,
+            source_type="set_bonus",
+            source_power_id=99,
+        ),
+    ]
+
+
+class TestSlottedEffect:
+    def test_no_instance_dict(self, effects):
+        with pytest.raises(AttributeError):
+            effects[0].not_a_field = True
+        assert not hasattr(effects[0], "__dict__")
+
+    def test_created_at_not_set_by_default(self, effects):
+        assert effects[0].created_at is None
+
+    def test_trusted_matches_constructor(self):
+        values = {
+            "unique_id": 1,
+            "effect_type": EffectType.DEFENSE,
+            "magnitude": 0.1,
+            "to_who": ToWho.SELF,
+        }
+
+        assert Effect.trusted(**values) == Effect(**values)
+
+    def test_trusted_skips_validation(self):
+        with pytest.raises(ValueError, match="Probability"):
+            Effect(
+                unique_id=1, effect_type=EffectType.DAMAGE, magnitude=1, probability=2
+            )
+
+        effect = Effect.trusted(
+            unique_id=1, effect_type=EffectType.DAMAGE, magnitude=1, probability=2
+        )
+        assert effect.probability == 2
+
+    def test_trusted_rejects_bad_fields(self):
+        with pytest.raises(TypeError):
+            Effect.trusted(unique_id=1, effect_type=EffectType.DAMAGE)
+        with pytest.raises(TypeError):
+            Effect.trusted(
+                unique_id=1, effect_type=EffectType.DAMAGE, magnitude=1, bogus=1
+            )
+
+    def test_pickle(self, effects):
+        assert pickle.loads(pickle.dumps(effects)) == effects
+
+
+class TestEffectTable:
+    def test_round_trip(self, effects):
+        table = EffectTable.from_effects(effects)
+
+        assert len(table) == len(effects)
+        assert list(table) == effects
+        assert table[2] == effects[2]
+        assert table[-1] == effects[-1]
+
+    def test_every_field_is_a_column(self):
+        assert list(COLUMN_DTYPES) == [f.name for f in fields(Effect)]
+
+    def test_round_trip_keeps_non_default_fields(self):
+        effect = Effect(
+            unique_id=1,
+            effect_type=EffectType.DAMAGE,
+            magnitude=20.0,
+            magnitude_percent=2000.0,
+            procs_per_minute=3.5,
+            modifier_table="Melee_Damage",
+            modifier_table_id=7,
+            suppression=Suppress.COMBAT,
+            summon="Pets_Fire_Imp",
+            atr_orig_recharge_time=8.0,
+            atr_mod_max_targets=10,
+            atr_mod_effect_area="Cone",
+            atr_mod_requires_line_of_sight=True,
+            effect_id="x",
+            created_at=datetime(2024, 1, 1),
+        )
+
+        assert list(EffectTable.from_effects([effect])) == [effect]
+
+    def test_columns(self, effects):
+        table = EffectTable.from_effects(effects)
+
+        assert table.magnitude.dtype == np.float64
+        assert table.unique_id.tolist() == [1, 2, 3, 4, 5, 6, 7]
+        assert np.isnan(table.buffed_magnitude[0])
+        assert table.effective_magnitude.tolist() == [
+            e.get_effective_magnitude() for e in effects
+        ]
+
+    def test_filtering(self, effects):
+        table = EffectTable.from_effects(effects)
+
+        defense = table.where(effect_type=EffectType.DEFENSE, to_who=ToWho.SELF)
+        assert defense.unique_id.tolist() == [3, 4]
+        assert table[table.probability < 1].unique_id.tolist() == [2, 6]
+        assert table[1:3].to_effects() == effects[1:3]
+
+    def test_from_columns_defaults(self):
+        table = EffectTable(
+            {
+                "unique_id": [1, 2],
+                "effect_type": [EffectType.DEFENSE, EffectType.RESISTANCE],
+                "magnitude": [0.1, 0.2],
+                "buffed_magnitude": [None, 0.3],
+            }
+        )
+
+        assert table.to_effects() == [
+            Effect(unique_id=1, effect_type=EffectType.DEFENSE, magnitude=0.1),
+            Effect(
+                unique_id=2,
+                effect_type=EffectType.RESISTANCE,
+                magnitude=0.2,
+                buffed_magnitude=0.3,
+            ),
+        ]
+
+    @pytest.mark.parametrize(
+        "column, value, message",
+        [
+            ("probability", 1.5, "Probability must be 0-1"),
+            ("base_probability", -0.1, "Base probability must be 0-1"),
+            ("duration", -1.0, "Duration cannot be negative"),
+            ("scale", 0.0, "Scale must be positive"),
+        ],
+    )
+    def test_validation(self, column, value, message):
+        columns = {
+            "unique_id": [1, 2],
+            "effect_type": [EffectType.DAMAGE] * 2,
+            "magnitude": [1.0, 2.0],
+            column: [0.5, value],
+        }
+
+        with pytest.raises(ValueError, match=message):
+            EffectTable(columns)
+        # Trusted data skips the check
+        assert len(EffectTable(columns, validate=False)) == 2
+
+    def test_bad_columns(self):
+        with pytest.raises(TypeError, match="missing"):
+            EffectTable({"unique_id": [1], "magnitude": [1.0]})
+        with pytest.raises(TypeError, match="Unknown"):
+            EffectTable(
+                {
+                    "unique_id": [1],
+                    "effect_type": [EffectType.DAMAGE],
+                    "magnitude": [1.0],
+                    "range": [2.0],
+                }
+            )
+        with pytest.raises(ValueError, match="expected 2"):
+            EffectTable(
+                {
+                    "unique_id": [1, 2],
+                    "effect_type": [EffectType.DAMAGE],
+                    "magnitude": [1.0, 2.0],
+                }
+            )
+
+    def test_concat(self, effects):
+        table = EffectTable.concat(
+            [
+                EffectTable.from_effects(effects[:3]),
+                EffectTable.from_effects(effects[3:]),
+            ]
+        )
+
+        assert table.to_effects() == effects
+        assert len(EffectTable.concat([])) == 0
+
+
+class TestCalculatorsAcceptTables:
+    """Every calculator gives the same result for a table as for a list."""
+
+    def test_defense_and_resistance(self, effects):
+        calc = DefenseCalculator()
+        table = EffectTable.from_effects(effects)
+
+        assert calc.extract_defense_from_power(table) == (
+            calc.extract_defense_from_power(effects)
+        )
+        assert calc.extract_resistance_from_power(table) == (
+            calc.extract_resistance_from_power(effects)
+        )
+
+    @pytest.mark.parametrize("mode", list(DamageMathMode))
+    def test_damage(self, effects, mode):
+        calc = DamageCalculator(damage_math_mode=mode)
+        table = EffectTable.from_effects(effects)
+
+        assert calc.calculate_power_damage(table, PowerType.CLICK) == (
+            calc.calculate_power_damage(effects, PowerType.CLICK)
+        )
+
+    def test_stacking(self, effects):
+        table = EffectTable.from_effects(effects)
+
+        assert BuffStackingCalculator().group_effects(table) == (
+            BuffStackingCalculator().group_effects(effects)
+        )
+        assert EffectAggregator().group_effects(table) == (
+            EffectAggregator().group_effects(effects)
+        )
+
+    def test_build_totals(self, effects, monkeypatch):
+        calc = BuffStackingCalculator()
+        expected = calc.calculate_build_totals(effects[:3], effects[3:5], effects[5:])
+        tables = []
+        group_table = calc._group_table
+        monkeypatch.setattr(
+            calc,
+            "_group_table",
+            lambda table: tables.append(table) or group_table(table),
+        )
+
+        # One table among the inputs keeps the whole build columnar
+        result = calc.calculate_build_totals(
+            effects[:3], EffectTable.from_effects(effects[3:5]), effects[5:]
+        )
+
+        assert result == expected
+        assert len(tables) == 1 and list(tables[0]) == effects
+
+    def test_endurance(self, effects):
+        calc = EnduranceCalculator()
+        table = EffectTable.from_effects(effects)
+
+        assert calc.calculate_recovery_rate(table, 100.0) == (
+            calc.calculate_recovery_rate(effects, 100.0)
+        )
@@ -5,9 +5,13 @@ Tests based on Spec 10 test cases from the plan.
 Validates ED curve calculations for all 4 schedules (A, B, C, D).
 """
 
+import numpy as np
+import pytest
+
 from app.calculations.core import (
     EDSchedule,
     apply_ed,
+    apply_ed_array,
     calculate_ed_loss,
     constants,
     get_schedule,
@@ -318,3 +322,64 @@ class TestConstants:
     def test_rule_of_five(self):
         """Verify Rule of 5 constant"""
         assert constants.RULE_OF_FIVE_LIMIT == 5
+
+
+class TestApplyEDArray:
+    """apply_ed_array must match apply_ed exactly, value by value."""
+
+    VALUES = np.concatenate(
+        [
+            np.linspace(-0.5, 3.0, 701),
+            [
+                constants.ED_SCHEDULE_A_THRESH_1,
+                constants.ED_SCHEDULE_B_THRESH_2,
+                constants.ED_SCHEDULE_C_THRESH_3,
+                constants.ED_SCHEDULE_D_THRESH_3,
+            ],
+        ]
+    )
+
+    @pytest.mark.parametrize("schedule", list(EDSchedule))
+    def test_matches_scalar(self, schedule):
+        result = apply_ed_array(schedule, self.VALUES)
+
+        assert result.tolist() == [apply_ed(schedule, v) for v in self.VALUES]
+
+    def test_schedule_per_value(self):
+        schedules = [EDSchedule.A, EDSchedule.B, EDSchedule.C, EDSchedule.D] * 3
+        values = [0.5, 1.0, 1.5] * 4
+
+        result = apply_ed_array(schedules, values)
+        # Integer schedule indices (SlottingCalculator's schedule_index) work too
+        by_index = apply_ed_array(np.array([s.value for s in schedules]), values)
+
+        expected = [apply_ed(s, v) for s, v in zip(schedules, values, strict=True)]
+        assert result.tolist() == expected
+        assert by_index.tolist() == expected
+
+    def test_broadcasts(self):
+        result = apply_ed_array(np.array([[0], [1]]), [0.5, 1.0])
+
+        assert result.shape == (2, 2)
+        assert result[1, 1] == apply_ed(EDSchedule.B, 1.0)
+
+    @pytest.mark.parametrize("schedule", [5, -2, [0, 7], "A", 0.5])
+    def test_invalid_schedule(self, schedule):
+        with pytest.raises(ValueError, match="Invalid ED schedule"):
+            apply_ed_array(schedule, 1.0)
+
+    @pytest.mark.parametrize("schedule", [[], (), np.array([], dtype=np.int64)])
+    def test_empty(self, schedule):
+        # e.g. a power with no enhanced aspects
+        result = apply_ed_array(schedule, [])
+
+        assert result.shape == (0,)
+        assert result.dtype == np.float64
+
+    @pytest.mark.parametrize("schedule", [EDSchedule.NONE, EDSchedule.MULTIPLE])
+    def test_unscheduled_non_finite_values(self, schedule):
+        values = [np.nan, np.inf, -np.inf]
+
+        result = apply_ed_array(schedule, values)
+
+        assert result.tolist() == [apply_ed(schedule, v) for v in values]
@@ -6,6 +6,7 @@ Implements all 7 test cases from the specification with exact expected values.
 
 import pytest
 
+from app.calculations.core import EDSchedule, apply_ed
 from app.calculations.enhancements.slotting import (
     EnhancementGrade,
     InvalidSlotCountError,
@@ -15,6 +16,7 @@ from app.calculations.enhancements.slotting import (
     SlotEntry,
     SlottedPower,
     SlottingCalculator,
+    SlotValueCache,
     safe_add_slot,
     validate_slotted_power,
 )
@@ -608,3 +610,141 @@ class TestCase7_DualBuilds:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class TestBatchEnhancedTotals:
+    """calculate_enhanced_totals() applies ED to many aspects in one call."""
+
+    def test_matches_per_aspect_ed(self, calculator):
+        attack = SlottedPower(power_id=100)
+        armor = SlottedPower(power_id=200)
+        for level in (1, 12, 25, 30):
+            attack.add_slot(slot_level=level)
+            armor.add_slot(slot_level=level)
+        for i in range(4):
+            attack.slots[i].enhancement = Slot(enhancement_id=100, io_level=50)
+            armor.slots[i].enhancement = Slot(
+                enhancement_id=200, grade=EnhancementGrade.SINGLE_O
+            )
+        aspects = [(attack, 0), (attack, 1), (armor, 1), (armor, 2), (armor, 3)]
+
+        result = calculator.calculate_enhanced_totals(aspects, exemplar_level=20)
+
+        assert result.tolist() == [
+            apply_ed(
+                EDSchedule(schedule_index),
+                calculator.calculate_total_enhancement(
+                    power, schedule_index, exemplar_level=20
+                ),
+            )
+            for power, schedule_index in aspects
+        ]
+
+    def test_empty(self, calculator):
+        assert calculator.calculate_enhanced_totals([]).tolist() == []
+
+
+class TestSlotValueMemo:
+    """Slot values are memoized by slot signature and multiplier tables."""
+
+    SLOTS = [
+        Slot(enhancement_id=1, io_level=50),
+        Slot(enhancement_id=2, io_level=50, is_catalyzed=True),
+        Slot(enhancement_id=3, io_level=30, is_attuned=True),
+        Slot(enhancement_id=4, io_level=50, is_boosted=True, boost_level=3),
+        Slot(
+            enhancement_id=5,
+            grade=EnhancementGrade.SINGLE_O,
+            relative_level=RelativeLevel.PLUS_TWO,
+        ),
+        Slot(enhancement_id=6, grade=EnhancementGrade.DUAL_O),
+    ]
+
+    def test_matches_uncached(self):
+        cached = SlottingCalculator(MULT_TABLES, cache=SlotValueCache())
+        uncached = SlottingCalculator(MULT_TABLES, cache=None)
+
+        for _ in range(2):
+            for slot in self.SLOTS:
+                for schedule_index in range(4):
+                    for level in (10, 35, 50):
+                        assert cached.calculate_slot_value(
+                            slot, schedule_index, level, 10, 50
+                        ) == uncached.calculate_slot_value(
+                            slot, schedule_index, level, 10, 50
+                        )
+
+    def test_shared_between_calculators(self):
+        cache = SlotValueCache()
+        first = SlottingCalculator(MULT_TABLES, cache=cache)
+        second = SlottingCalculator(
+            {name: [list(row) for row in rows] for name, rows in MULT_TABLES.items()},
+            cache=cache,
+        )
+
+        first.calculate_slot_value(Slot(enhancement_id=1, io_level=50), 0)
+        # Same tables and an equivalent slot: served from the memo
+        second.calculate_slot_value(Slot(enhancement_id=9, io_level=50), 0)
+
+        stats = cache.get_stats()
+        assert (stats["entries"], stats["hits"], stats["misses"]) == (1, 1, 1)
+        assert stats["hit_rate"] == 0.5
+
+    def test_invalidated_by_table_change(self):
+        cache = SlotValueCache()
+        tables = {
+            name: [list(row) for row in rows] for name, rows in MULT_TABLES.items()
+        }
+        calculator = SlottingCalculator(tables, cache=cache)
+        slot = Slot(enhancement_id=1, grade=EnhancementGrade.SINGLE_O)
+        assert calculator.calculate_slot_value(slot, 0) == pytest.approx(0.333)
+
+        calculator.mult_tables = {**tables, "MultSO": [[0.5, 0.3, 0.2, 0.1]]}
+        assert calculator.calculate_slot_value(slot, 0) == pytest.approx(0.5)
+
+        # In-place edits need an explicit invalidation
+        calculator.mult_tables["MultSO"][0][0] = 0.4
+        calculator.invalidate_cache()
+        assert calculator.calculate_slot_value(slot, 0) == pytest.approx(0.4)
+        assert cache.get_stats()["hits"] == 0
+
+    def test_bounded(self):
+        cache = SlotValueCache(max_entries=4)
+        calculator = SlottingCalculator(MULT_TABLES, cache=cache)
+
+        for io_level in range(1, 11):
+            calculator.calculate_slot_value(
+                Slot(enhancement_id=1, io_level=io_level), 0
+            )
+
+        stats = cache.get_stats()
+        assert (stats["entries"], stats["evictions"]) == (4, 6)
+
+    def test_batch_slot_values(self):
+        calculator = SlottingCalculator(MULT_TABLES, cache=SlotValueCache())
+        power = SlottedPower(power_id=100)
+        for i, level in enumerate((1, 12, 25, 30, 33, 40, 45)):
+            if power.add_slot(slot_level=level):
+                power.slots[i].enhancement = self.SLOTS[i]
+        power.slots[3].enhancement = Slot()
+        aspects = [(power, 0), (power, 2)]
+
+        result = calculator.calculate_slot_values(
+            aspects, character_level=40, set_min_level=10, exemplar_level=30
+        )
+
+        assert result == [
+            [
+                calculator.calculate_slot_value(slot.enhancement, schedule, 40, 10)
+                if i < 4
+                else 0.0
+                for i, slot in enumerate(power.slots)
+            ]
+            for _, schedule in aspects
+        ]
+        assert result[0][3] == 0.0
+        assert sum(result[1]) == pytest.approx(
+            calculator.calculate_total_enhancement(
+                power, 2, 40, set_min_level=10, exemplar_level=30
+            )
+        )
@@ -0,0 +1,137 @@
+"""
+Test interned FxId codes and segmented grouping
+
+The EffectTable paths of BuffStackingCalculator.group_effects and
+EffectAggregator.group_effects must match the per-effect list paths exactly,
+for every stacking flag and stacking mode.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from app.calculations.build.stacking_rules import BuffStackingCalculator, StackingMode
+from app.calculations.core import (
+    DamageType,
+    Effect,
+    EffectAggregator,
+    EffectTable,
+    EffectType,
+    Stacking,
+    ToWho,
+)
+from app.calculations.core.grouped_fx import FX_IDS, FxGroups, FxIdInterner, fx_key
+
+EFFECT_TYPES = [
+    EffectType.DEFENSE,
+    EffectType.RESISTANCE,
+    EffectType.DAMAGE_BUFF,  # multiplicative
+    EffectType.RECHARGE_TIME,
+    EffectType.MEZ_RESIST,  # best value
+]
+
+
+def random_effects(seed: int, count: int = 300) -> list[Effect]:
+    rng = random.Random(seed)
+    effects = []
+    for unique_id in range(count):
+        set_bonus = rng.random() < 0.3
+        effects.append(
+            Effect(
+                unique_id=unique_id,
+                effect_type=rng.choice(EFFECT_TYPES),
+                magnitude=round(rng.uniform(-0.1, 0.5), 3),
+                buffed_magnitude=rng.choice([None, 0.0, round(rng.random(), 3)]),
+                damage_type=rng.choice([DamageType.FIRE, DamageType.COLD, None]),
+                to_who=rng.choice([ToWho.SELF, ToWho.TARGET]),
+                duration=rng.choice([0.0, 10.0]),
+                stacking=rng.choice(list(Stacking)),
+                is_enhancement_effect=rng.random() < 0.2,
+                source_type="set_bonus" if set_bonus else None,
+                source_power_id=rng.randint(1, 4) if set_bonus else None,
+            )
+        )
+    return effects
+
+
+class TestFxIdInterner:
+    def test_codes_are_stable(self, effects_for_interner):
+        interner = FxIdInterner()
+        codes = [interner.code(fx_key(effect)) for effect in effects_for_interner]
+
+        assert codes == [0, 0, 1, 0]
+        assert len(interner) == 2
+        assert interner.code(fx_key(effects_for_interner[2])) == 1
+        fx_id = interner.fx_id(0)
+        assert fx_id.to_tuple() == fx_key(effects_for_interner[0])
+        # Equal keys share one FxId
+        assert interner.fx_id(codes[1]) is fx_id
+
+    def test_code_table_matches_code(self, effects_for_interner):
+        table = EffectTable.from_effects(effects_for_interner)
+
+        assert FX_IDS.code_table(table).tolist() == [
+            FX_IDS.code(fx_key(effect)) for effect in effects_for_interner
+        ]
+
+
+@pytest.fixture
+def effects_for_interner():
+    defense = {"effect_type": EffectType.DEFENSE, "damage_type": DamageType.FIRE}
+    return [
+        Effect(unique_id=1, magnitude=0.1, **defense),
+        Effect(unique_id=2, magnitude=0.2, **defense),
+        Effect(
+            unique_id=3,
+            effect_type=EffectType.DEFENSE,
+            magnitude=0.1,
+            damage_type=DamageType.COLD,
+        ),
+        Effect(unique_id=4, magnitude=0.3, **defense),
+    ]
+
+
+class TestFxGroups:
+    def test_groups_in_first_appearance_order(self):
+        groups = FxGroups(np.array([7, 3, 7, 5, 3, 7]))
+
+        assert groups.codes.tolist() == [7, 3, 5]
+        assert groups.first.tolist() == [0, 1, 3]
+        assert groups.last.tolist() == [5, 4, 3]
+        assert groups.sizes.tolist() == [3, 2, 1]
+        assert groups.positions().tolist() == [0, 0, 1, 0, 1, 2]
+        values = np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+        assert groups.sum(values).tolist() == [10.0, 7.0, 4.0]
+        assert groups.prod(values).tolist() == [18.0, 10.0, 4.0]
+        assert groups.max(values).tolist() == [6.0, 5.0, 4.0]
+        assert groups.row_lists(values) == [[1.0, 3.0, 6.0], [2.0, 5.0], [4.0]]
+
+    def test_empty(self):
+        groups = FxGroups(np.array([], dtype=np.int64))
+
+        assert len(groups) == 0
+        assert groups.row_lists(np.array([])) == []
+
+
+@pytest.mark.parametrize("seed", range(5))
+class TestTableGroupingMatchesList:
+    def test_buff_stacking(self, seed):
+        effects = random_effects(seed)
+        table = EffectTable.from_effects(effects)
+
+        from_list = BuffStackingCalculator().group_effects(effects)
+        from_table = BuffStackingCalculator().group_effects(table)
+
+        assert from_table == from_list
+        modes = {grouped.stacking_mode for grouped in from_list}
+        assert {StackingMode.ADDITIVE, StackingMode.MULTIPLICATIVE} <= modes
+        assert {StackingMode.BEST_VALUE, StackingMode.REPLACE} <= modes
+
+    def test_effect_aggregator(self, seed):
+        effects = random_effects(seed)
+        table = EffectTable.from_effects(effects)
+
+        assert EffectAggregator().group_effects(table) == (
+            EffectAggregator().group_effects(effects)
+        )
@@ -7,21 +7,30 @@ Shared test fixtures for API tests.
 import os
 import sys
 
+from contextlib import contextmanager
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool, StaticPool
+
+# Calculation batches run on threads unless a test asks for worker processes
+os.environ.setdefault("CALC_PROCESS_WORKERS", "0")
 
 
-# Mock asyncpg before importing anything that uses it
+# Mock asyncpg before importing anything that uses it (when not installed)
 class MockAsyncpg:
     class Pool:
         pass
 
 
-mock_asyncpg = MockAsyncpg()
-sys.modules["asyncpg"] = mock_asyncpg
+try:
+    import asyncpg  # noqa: F401
+except ImportError:
+    mock_asyncpg = MockAsyncpg()
+    sys.modules["asyncpg"] = mock_asyncpg
 
 
 # Mock the async database functions
@@ -40,7 +49,12 @@ database.create_database_pool = mock_create_database_pool
 database.close_database_pool = mock_close_database_pool
 
 # Now import models - this will use the same Base from database module
-from app.database import Base, get_db  # Use the same Base instance  # noqa: E402
+from app.database import (  # Use the same Base instance  # noqa: E402
+    Base,
+    get_async_database_url,
+    get_async_db,
+    get_db,
+)
 from app.models import (  # noqa: E402, I001
     Archetype,
     Enhancement,
@@ -49,6 +63,9 @@ from app.models import (  # noqa: E402, I001
     Powerset,
 )
 
+from app.query_stats import instrument_engine, track_queries  # noqa: E402
+from app.services import power_cache  # noqa: E402
+
 # Import the app last
 from main import app  # noqa: E402
 
@@ -59,8 +76,12 @@ if "DATABASE_URL" in os.environ and "test" in os.environ.get("DATABASE_URL", "")
     SQLALCHEMY_DATABASE_URL = os.environ["DATABASE_URL"]
     engine = create_engine(SQLALCHEMY_DATABASE_URL, poolclass=StaticPool)
 else:
-    # Use in-memory SQLite for local tests
-    SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+    # Use a named in-memory SQLite database for local tests. Shared cache lets
+    # the async (aiosqlite) engine see the same database; the StaticPool
+    # connection keeps it alive between tests.
+    SQLALCHEMY_DATABASE_URL = (
+        "sqlite:///file:mids_test?mode=memory&cache=shared&uri=true"
+    )
     engine = create_engine(
         SQLALCHEMY_DATABASE_URL,
         connect_args={"check_same_thread": False},
@@ -69,6 +90,17 @@ else:
 
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine for routers on the AsyncSession layer. NullPool, because each
+# TestClient runs its own event loop.
+async_engine = create_async_engine(
+    get_async_database_url(SQLALCHEMY_DATABASE_URL), poolclass=NullPool
+)
+AsyncTestingSessionLocal = async_sessionmaker(
+    async_engine, expire_on_commit=False, autoflush=False
+)
+instrument_engine(engine)
+instrument_engine(async_engine)
+
 
 @pytest.fixture(scope="function")
 def db():
@@ -76,17 +108,13 @@ def db():
     # Create all tables
     Base.metadata.create_all(bind=engine)
 
-    # Create a new session for this test
-    connection = engine.connect()
-    transaction = connection.begin()
-    session = TestingSessionLocal(bind=connection)
+    # Create a new session for this test. Commits are real, so the async
+    # routers can see fixture data; dropping the tables below isolates tests.
+    session = TestingSessionLocal()
 
     yield session
 
-    # Rollback the transaction and close everything
     session.close()
-    transaction.rollback()
-    connection.close()
 
     # Drop all tables after test
     # Handle circular dependencies by dropping tables in the correct order
@@ -118,14 +146,21 @@ def db():
 
 
 @pytest.fixture
-def client(db):
+def client(db, monkeypatch):
     """Create a test client with a fresh database."""
+    # Database IDs are reused between tests, so start with an empty power cache
+    monkeypatch.setattr(power_cache, "_power_cache_instance", None)
 
     # Override the get_db dependency to use our test db
     def override_get_db():
         yield db
 
+    async def override_get_async_db():
+        async with AsyncTestingSessionLocal() as session:
+            yield session
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
 
     with TestClient(app) as test_client:
         yield test_client
@@ -134,6 +169,26 @@ def client(db):
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def assert_max_queries():
+    """Fail if the block runs more than n SQL statements (N+1 guard).
+
+    Usage: ``with assert_max_queries(2): client.get(...)``
+    """
+
+    @contextmanager
+    def check(n: int):
+        with track_queries() as stats:
+            yield stats
+        assert (
+            stats.count <= n
+        ), f"{stats.count} queries, expected at most {n}:\n" + "\n".join(
+            stats.statements
+        )
+
+    return check
+
+
 # Keep db_session as alias for backward compatibility
 @pytest.fixture
 def db_session(db):
@@ -223,13 +278,11 @@ def sample_enhancement(db_session, sample_enhancement_set):
     enhancement = Enhancement(
         name="Devastation: Accuracy/Damage",
         display_name="Devastation: Accuracy/Damage",
-        enhancement_type="set_piece",
+        boost_type="Enhance Accuracy",
         set_id=sample_enhancement_set.id,
         level_min=30,
         level_max=50,
-        accuracy_bonus=26.5,
-        damage_bonus=26.5,
-        unique_enhancement=False,
+        is_unique=False,
     )
     db_session.add(enhancement)
     db_session.commit()
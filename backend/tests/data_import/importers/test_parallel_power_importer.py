@@ -0,0 +1,213 @@
+import json
+
+import pytest
+
+from app.data_import.importers import parallel_power_importer
+from app.data_import.importers.parallel_power_importer import (
+    ParallelPowerImporter,
+    find_powerset_dirs,
+)
+from app.data_import.importers.power_importer import PowerImporter
+from app.models import Archetype, Power, Powerset
+
+
+@pytest.fixture
+def blaster(db_session):
+    archetype = Archetype(name="blaster", display_name="Blaster")
+    db_session.add(archetype)
+    db_session.commit()
+    return archetype
+
+
+def _write_powerset(root, category, name, display_fullname, powers):
+    powerset_dir = root / category / name.lower()
+    powerset_dir.mkdir(parents=True)
+    prefix = f"{category.title()}.{name}"
+    (powerset_dir / "index.json").write_text(
+        json.dumps(
+            {
+                "name": name,
+                "display_name": name.replace("_", " "),
+                "display_fullname": display_fullname,
+                "source_file": f"DEFS/POWERS/{category}/{name}.POWERSETS".upper(),
+                "power_names": [f"{prefix}.{p}" for p in powers],
+            }
+        )
+    )
+    for power in powers:
+        (powerset_dir / f"{power.lower()}.json").write_text(
+            json.dumps(
+                {
+                    "name": power,
+                    "full_name": f"{prefix}.{power}",
+                    "display_name": power.replace("_", " "),
+                    "type": "Click",
+                    "available_level": 1,
+                    "accuracy": 1.0,
+                    "range": 80,
+                }
+            )
+        )
+
+
+@pytest.fixture
+def powers_root(tmp_path):
+    root = tmp_path / "powers"
+    _write_powerset(
+        root,
+        "blaster_ranged",
+        "Fire_Blast",
+        "Blaster Ranged.Fire Blast",
+        ["Flares", "Fire_Blast"],
+    )
+    # Same power name as in Fire_Blast, different full_name
+    _write_powerset(root, "pool", "Flight", "Pool.Flight", ["Hover", "Flares"])
+    return root
+
+
+def test_find_powerset_dirs(powers_root):
+    assert [d.name for d in find_powerset_dirs(powers_root)] == [
+        "fire_blast",
+        "flight",
+    ]
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_import_all(db_session, blaster, powers_root, workers):
+    importer = ParallelPowerImporter(db_session, workers=workers, batch_size=2)
+
+    result = importer.import_all(powers_root)
+
+    assert result["success"] is True
+    assert result["powersets_imported"] == 2
+    assert result["powers_imported"] == 4
+    assert result["errors"] == []
+
+    fire_blast = db_session.query(Powerset).filter_by(name="Fire_Blast").one()
+    assert fire_blast.archetype_id == blaster.id
+    assert fire_blast.source_file == "DEFS/POWERS/BLASTER_RANGED/FIRE_BLAST.POWERSETS"
+    flight = db_session.query(Powerset).filter_by(name="Flight").one()
+    assert flight.archetype_id is None
+
+    flares = db_session.query(Power).filter_by(full_name="Pool.Flight.Flares").one()
+    assert flares.powerset_id == flight.id
+    assert flares.power_data["range"] == 80
+    assert flares.source_metadata is None  # not a second copy of power_data
+    assert db_session.query(Power).count() == 4
+
+    stages = result["stages"]
+    assert stages["parse"]["items"] == 6  # 2 index.json + 4 powers
+    assert stages["write"]["items"] == 6
+    assert stages["total"]["seconds"] > 0
+
+
+def test_reimport_skips_existing(db_session, blaster, powers_root):
+    ParallelPowerImporter(db_session, workers=0).import_all(powers_root)
+
+    result = ParallelPowerImporter(db_session, workers=0).import_all(powers_root)
+
+    assert result["powersets_imported"] == 0
+    assert result["powers_imported"] == 0
+    assert result["skipped"] == 6
+    assert db_session.query(Power).count() == 4
+    assert db_session.query(Powerset).count() == 2
+
+
+def test_summary_view_refreshed_only_after_changes(
+    db_session, blaster, powers_root, monkeypatch
+):
+    refreshes = []
+    monkeypatch.setattr(
+        parallel_power_importer,
+        "refresh_power_build_summary",
+        lambda db: refreshes.append(db) or True,
+    )
+
+    first = ParallelPowerImporter(db_session, workers=0).import_all(powers_root)
+    second = ParallelPowerImporter(db_session, workers=0).import_all(powers_root)
+
+    assert first["summary_refreshed"] is True
+    assert second["summary_refreshed"] is False
+    assert refreshes == [db_session]
+
+
+def test_existing_powers_are_prefetched(db_session, blaster, powers_root):
+    powerset = Powerset(
+        name="Fire_Blast", archetype_id=blaster.id, powerset_type="primary"
+    )
+    db_session.add(powerset)
+    db_session.flush()
+    db_session.add(
+        Power(
+            name="Flares",
+            full_name="Blaster_Ranged.Fire_Blast.Flares",
+            powerset_id=powerset.id,
+        )
+    )
+    db_session.commit()
+
+    result = ParallelPowerImporter(db_session, workers=0).import_all(powers_root)
+
+    # Legacy powerset rows without source_file match on (name, archetype_id)
+    assert result["powersets_imported"] == 1
+    assert result["powers_imported"] == 3
+    assert db_session.query(Powerset).count() == 2
+    fire_blast = (
+        db_session.query(Power)
+        .filter_by(full_name="Blaster_Ranged.Fire_Blast.Fire_Blast")
+        .one()
+    )
+    assert fire_blast.powerset_id == powerset.id
+
+
+def test_parse_errors_are_reported(db_session, blaster, powers_root):
+    (powers_root / "pool" / "flight" / "broken.json").write_text("{not json")
+
+    result = ParallelPowerImporter(db_session, workers=0).import_all(powers_root)
+
+    assert result["success"] is False
+    assert len(result["errors"]) == 1
+    assert "broken.json" in result["errors"][0]
+    assert result["powers_imported"] == 4
+
+
+@pytest.mark.asyncio
+async def test_power_importer_delegates(db_session, blaster, powers_root):
+    result = await PowerImporter(db_session).import_all_powersets(
+        powers_root, workers=0
+    )
+
+    assert result["powersets_imported"] == 2
+    assert result["powers_imported"] == 4
+    assert "stages" in result
+
+
+def test_power_arrays_and_tags(db_session, blaster, powers_root):
+    tags_dir = powers_root.parent / "tags"
+    tags_dir.mkdir()
+    (tags_dir / "fire.json").write_text(
+        json.dumps(
+            {
+                "tag": "Fire",
+                "bears": [["Flares", "blaster_ranged.fire_blast.flares"]],
+                "affects": [],
+            }
+        )
+    )
+    flares_file = powers_root / "pool" / "flight" / "flares.json"
+    data = json.loads(flares_file.read_text())
+    flares_file.write_text(json.dumps({**data, "archetypes": ["blaster"]}))
+
+    ParallelPowerImporter(db_session, workers=0).import_all(powers_root)
+
+    fire_flares = (
+        db_session.query(Power)
+        .filter_by(full_name="Blaster_Ranged.Fire_Blast.Flares")
+        .one()
+    )
+    assert fire_flares.tags == ["Fire"]
+    pool_flares = (
+        db_session.query(Power).filter_by(full_name="Pool.Flight.Flares").one()
+    )
+    assert pool_flares.tags == []
+    assert pool_flares.archetypes == ["blaster"]
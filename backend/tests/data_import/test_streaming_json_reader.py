@@ -0,0 +1,150 @@
+"""Tests for the incremental StreamingJsonReader."""
+
+import json
+import tracemalloc
+
+import pytest
+
+from app.data_import import i12_streaming_parser
+from app.data_import.i12_streaming_parser import I12StreamingParser, StreamingJsonReader
+
+
+@pytest.fixture
+def records():
+    return [
+        {"Name": f"Power {i}", "Level": i, "Effects": [{"Scale": i / 10}]}
+        for i in range(25)
+    ] + [{"Name": "Flammenwerfer – ñ ✓", "Level": 50}]
+
+
+@pytest.fixture
+def json_file(tmp_path, records):
+    path = tmp_path / "powers.json"
+    path.write_text(json.dumps(records, indent=2, ensure_ascii=False), "utf-8")
+    return path
+
+
+def test_reads_all_records_in_chunks(json_file, records):
+    # A tiny read size forces records and multi-byte characters across reads
+    reader = StreamingJsonReader(chunk_size=10, read_size=7)
+
+    chunks = list(reader.read_chunks(json_file))
+
+    assert [len(c) for c in chunks] == [10, 10, 6]
+    assert [r for c in chunks for r in c] == records
+    assert reader.offset == json_file.stat().st_size
+
+
+def test_progress_is_reported_in_bytes(json_file):
+    reader = StreamingJsonReader(chunk_size=10)
+    calls = []
+
+    list(reader.read_chunks(json_file, progress_callback=lambda *a: calls.append(a)))
+
+    total = json_file.stat().st_size
+    assert [c[1] for c in calls] == [total] * 3
+    assert calls[0][0] < calls[1][0] < calls[2][0] == total
+    assert calls[-1][2] == 100.0
+
+
+def test_offsets_are_record_boundaries(json_file, records):
+    reader = StreamingJsonReader(read_size=16)
+    offsets = [end for _, end in reader.iter_records(json_file)]
+    data = json_file.read_bytes()
+
+    for offset in offsets[:-1]:
+        assert data[offset:].lstrip().startswith(b",")
+    assert data[offsets[-1] :].strip() == b"]"
+
+
+@pytest.mark.parametrize("read_size", [5, 1 << 16])
+def test_resume_from_checkpoint(json_file, records, read_size):
+    reader = StreamingJsonReader(chunk_size=10, read_size=read_size)
+    chunks = reader.read_chunks(json_file)
+    first = next(chunks)
+    checkpoint = reader.offset
+    chunks.close()  # simulate a crash after the first chunk
+
+    resumed = [
+        r for c in reader.read_chunks(json_file, start_offset=checkpoint) for r in c
+    ]
+
+    assert first + resumed == records
+
+    # Resuming from the final checkpoint reads nothing
+    assert list(reader.read_chunks(json_file, start_offset=reader.offset)) == []
+
+
+def test_memory_does_not_scale_with_file_size(tmp_path):
+    path = tmp_path / "many.json"
+    path.write_text(json.dumps([{"Name": "x" * 100, "Level": 1}] * 20000))
+    reader = StreamingJsonReader(chunk_size=100, read_size=4096)
+
+    tracemalloc.start()
+    try:
+        count = sum(len(c) for c in reader.read_chunks(path))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert count == 20000
+    # ~2.4 MB file; only one chunk and the read buffer are alive at a time
+    assert peak < path.stat().st_size / 4
+
+
+@pytest.mark.parametrize(
+    "content",
+    ["", "{}", '[{"a": 1} {"b": 2}]', '[{"a": 1},', '[{"a": ]', '[{"a": 1}] x'],
+)
+def test_malformed_json(tmp_path, content):
+    path = tmp_path / "bad.json"
+    path.write_text(content)
+
+    with pytest.raises(json.JSONDecodeError):
+        list(StreamingJsonReader().read_chunks(path))
+
+
+def test_empty_array(tmp_path):
+    path = tmp_path / "empty.json"
+    path.write_text(" [ ] \n")
+
+    assert list(StreamingJsonReader().read_chunks(path)) == []
+
+
+def test_scalar_records_are_not_truncated(tmp_path):
+    path = tmp_path / "numbers.json"
+    path.write_text("[123456789, 2]")
+
+    reader = StreamingJsonReader(read_size=4)
+    assert [r for r, _ in reader.iter_records(path)] == [123456789, 2]
+
+
+@pytest.mark.parametrize("read_size", [1, 2, 3, 4, 5])
+def test_numbers_split_at_read_boundary(tmp_path, read_size):
+    path = tmp_path / "numbers.json"
+    path.write_text("[1500.0, 2, -12.5e-3, 7E+2]")
+
+    reader = StreamingJsonReader(read_size=read_size)
+    assert [r for r, _ in reader.iter_records(path)] == [1500.0, 2, -12.5e-3, 7e2]
+
+
+@pytest.mark.parametrize("inserted, refreshes", [(True, 1), (False, 0)])
+def test_import_refreshes_summary_view(
+    tmp_path, json_file, monkeypatch, inserted, refreshes
+):
+    refreshed = []
+    monkeypatch.setattr(
+        i12_streaming_parser,
+        "refresh_power_build_summary",
+        lambda session: refreshed.append(session) or True,
+    )
+    parser = I12StreamingParser(f"sqlite:///{tmp_path / 'i12.db'}", chunk_size=10)
+    monkeypatch.setattr(parser.processor, "load_caches", lambda session: None)
+    monkeypatch.setattr(parser, "transform_data", lambda raw: raw)
+    monkeypatch.setattr(parser, "validate_data", lambda data: inserted)
+    monkeypatch.setattr(parser, "_batch_insert", lambda records: None)
+
+    parser.import_data(json_file)
+
+    assert len(refreshed) == refreshes
+    assert parser.summary_refreshed is inserted
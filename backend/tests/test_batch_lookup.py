@@ -0,0 +1,163 @@
+"""
+Tests for GET /api/powers?ids=... and POST /api/lookup.
+"""
+
+import pytest
+
+from app.models import Enhancement, EnhancementSet, Power
+from app.services import power_cache
+from app.services.batch_lookup import InvalidIdListError, parse_id_list
+
+
+@pytest.fixture
+def fresh_power_cache(client):
+    # The client fixture resets the global cache
+    return power_cache.get_power_cache()
+
+
+@pytest.fixture
+def build_data(db_session, sample_powerset):
+    powers = [
+        Power(
+            name=f"Power_{i}",
+            full_name=f"Fire_Blast.Fire_Blast.Power_{i}",
+            powerset_id=sample_powerset.id,
+            available_level=i + 1,
+            recharge_time=4.0,
+            tags=["Ranged"],
+            power_data={"effects": [{"tag": i}]},
+        )
+        for i in range(5)
+    ]
+    enhancement_set = EnhancementSet(name="Devastation", min_level=30)
+    db_session.add_all([*powers, enhancement_set])
+    db_session.flush()
+    enhancements = [
+        Enhancement(
+            name=f"Devastation_{i}",
+            boost_type="Enhance Damage",
+            set_id=enhancement_set.id,
+        )
+        for i in range(3)
+    ]
+    db_session.add_all(enhancements)
+    db_session.commit()
+    return {
+        "powers": [p.id for p in powers],
+        "powersets": [sample_powerset.id],
+        "enhancements": [e.id for e in enhancements],
+        "enhancement_sets": [enhancement_set.id],
+    }
+
+
+@pytest.mark.parametrize(
+    "ids, expected", [("1,2,3", [1, 2, 3]), (" 4, 5 ,", [4, 5]), ("", [])]
+)
+def test_parse_id_list(ids, expected):
+    assert parse_id_list(ids) == expected
+
+
+@pytest.mark.parametrize("ids", ["1,two", ",".join(["1"] * 1001)])
+def test_parse_id_list_rejects(ids):
+    with pytest.raises(InvalidIdListError):
+        parse_id_list(ids)
+
+
+class TestPowersByIds:
+    """GET /api/powers?ids=..."""
+
+    def test_returns_requested_order(self, client, build_data):
+        first, second, third = build_data["powers"][:3]
+
+        response = client.get(f"/api/powers?ids={third},99999,{first},{second},{third}")
+
+        assert response.status_code == 200
+        powers = response.json()
+        assert [p["id"] for p in powers] == [third, first, second]
+        assert powers[0]["recharge_time"] == 4.0
+        assert powers[0]["tags"] == ["Ranged"]
+        assert "power_data" not in powers[0]
+
+    def test_invalid_ids(self, client, build_data):
+        response = client.get("/api/powers?ids=1,x")
+
+        assert response.status_code == 400
+
+    def test_one_query_then_cached(
+        self, client, build_data, assert_max_queries, fresh_power_cache
+    ):
+        ids = ",".join(map(str, build_data["powers"]))
+
+        with assert_max_queries(1):
+            client.get(f"/api/powers?ids={ids}")
+        with assert_max_queries(0):
+            response = client.get(f"/api/powers?ids={ids}")
+
+        assert len(response.json()) == 5
+        assert fresh_power_cache.get_cache_stats()["total_db_queries"] == 1
+
+
+class TestLookup:
+    """POST /api/lookup."""
+
+    def test_normalized_map(self, client, build_data):
+        request = {
+            name: [*ids, 99999] if name == "enhancements" else ids
+            for name, ids in build_data.items()
+        }
+
+        response = client.post("/api/lookup", json=request)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert sorted(map(int, data["powers"])) == build_data["powers"]
+        assert sorted(map(int, data["enhancements"])) == build_data["enhancements"]
+        powerset_id = str(build_data["powersets"][0])
+        assert data["powersets"][powerset_id]["name"] == "Fire Blast"
+        set_id = str(build_data["enhancement_sets"][0])
+        assert data["enhancement_sets"][set_id]["name"] == "Devastation"
+        assert data["missing"] == {"enhancements": [99999]}
+
+        power = data["powers"][str(build_data["powers"][0])]
+        assert power["name"] == "Power_0"
+        assert power["power_data"] is None
+
+    def test_include_power_data(self, client, build_data, fresh_power_cache):
+        power_id = build_data["powers"][1]
+
+        response = client.post(
+            "/api/lookup", json={"powers": [power_id], "include_power_data": True}
+        )
+        assert response.json()["powers"][str(power_id)]["power_data"] == {
+            "effects": [{"tag": 1}]
+        }
+
+        # Leaving power_data out of a response doesn't drop it from the cache
+        client.post("/api/lookup", json={"powers": [power_id]})
+        response = client.post(
+            "/api/lookup", json={"powers": [power_id], "include_power_data": True}
+        )
+        assert response.json()["powers"][str(power_id)]["power_data"] is not None
+
+    def test_one_query_per_entity_type(self, client, build_data, assert_max_queries):
+        with assert_max_queries(4):
+            response = client.post("/api/lookup", json=build_data)
+
+        assert response.json()["missing"] == {}
+
+    def test_empty_request(self, client, assert_max_queries, db_session):
+        with assert_max_queries(0):
+            response = client.post("/api/lookup", json={})
+
+        assert response.json() == {
+            "powers": {},
+            "powersets": {},
+            "enhancements": {},
+            "enhancement_sets": {},
+            "missing": {},
+        }
+
+    def test_too_many_ids(self, client, db_session):
+        response = client.post("/api/lookup", json={"powers": list(range(1001))})
+
+        assert response.status_code == 422
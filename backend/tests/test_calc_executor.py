@@ -0,0 +1,123 @@
+"""
+Tests for the calculation executor (worker pools, backpressure, metrics).
+"""
+
+import asyncio
+import json
+import os
+import threading
+
+import pytest
+
+from app.services import calc_executor
+from app.services.calc_executor import CalcExecutor, ExecutorSaturatedError
+
+BUILDS = [
+    {"archetype": "Scrapper", "defense_bonuses": [{"bonuses": {"melee": 0.30}}]},
+    {"archetype": "Tanker", "resistance_bonuses": [{"bonuses": {"fire": 0.95}}]},
+    {"archetype": "Scrapper", "resistance_bonuses": [{"bonuses": {"cold": 0.10}}]},
+]
+
+
+@pytest.fixture
+def use_executor(monkeypatch):
+    """Install an executor as the global one for the duration of a test."""
+    executors = []
+
+    def install(executor: CalcExecutor) -> CalcExecutor:
+        executors.append(executor)
+        monkeypatch.setattr(calc_executor, "_calc_executor", executor)
+        return executor
+
+    yield install
+    for executor in executors:
+        executor.shutdown()
+
+
+async def test_light_calls_leave_the_event_loop():
+    executor = CalcExecutor(thread_workers=2, process_workers=0)
+    try:
+        thread_id = await executor.run_light("test", threading.get_ident)
+    finally:
+        executor.shutdown()
+
+    assert thread_id != threading.get_ident()
+    stats = executor.get_stats()
+    assert stats["endpoints"]["test"]["calls"] == 1
+    assert stats["pending"] == {"thread": 0, "process": 0}
+
+
+async def test_saturated_pool_rejects():
+    executor = CalcExecutor(thread_workers=1, process_workers=0, queue_size=1)
+    release = threading.Event()
+    try:
+        running = asyncio.ensure_future(executor.run_light("slow", release.wait))
+        queued = asyncio.ensure_future(executor.run_light("slow", release.wait))
+        await asyncio.sleep(0)
+
+        with pytest.raises(ExecutorSaturatedError):
+            await executor.run_light("slow", release.wait)
+        # Heavy calls share the thread pool when there are no processes
+        with pytest.raises(ExecutorSaturatedError):
+            executor.check_capacity(heavy=True)
+
+        release.set()
+        assert await asyncio.gather(running, queued) == [True, True]
+    finally:
+        release.set()
+        executor.shutdown()
+
+    metrics = executor.get_stats()["endpoints"]["slow"]
+    assert metrics["calls"] == 2
+    assert metrics["rejected"] == 1
+    assert metrics["max_queue_ms"] > 0
+    # Capacity is back once the calls finish
+    executor.check_capacity()
+
+
+async def test_heavy_calls_run_in_worker_processes():
+    executor = CalcExecutor(thread_workers=1, process_workers=1)
+    try:
+        pid = await executor.run_heavy("heavy", os.getpid)
+    finally:
+        executor.shutdown()
+
+    assert pid != os.getpid()
+    assert executor.get_stats()["endpoints"]["heavy"]["calls"] == 1
+
+
+def test_endpoints_return_503_when_saturated(client, use_executor):
+    use_executor(CalcExecutor(thread_workers=0, process_workers=0, queue_size=0))
+
+    response = client.post("/api/v1/calculations/build/totals", json=BUILDS[0])
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+    response = client.post("/api/v1/calculations/build/batch", json={"builds": BUILDS})
+    assert response.status_code == 503
+
+    stats = client.get("/ping/calc-executor").json()
+    assert stats["endpoints"]["build/totals"]["rejected"] == 1
+
+
+def test_batch_on_process_pool(client, use_executor):
+    use_executor(
+        CalcExecutor(
+            thread_workers=1, process_workers=1, preload=["app.routers.calculations"]
+        )
+    )
+
+    response = client.post(
+        "/api/v1/calculations/build/batch", json={"builds": BUILDS, "concurrency": 2}
+    )
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["index"] for line in lines] == [0, 1, 2]
+    for build, line in zip(BUILDS, lines, strict=True):
+        single = client.post("/api/v1/calculations/build/totals", json=build).json()
+        assert line["defense"] == single["defense"]
+        assert line["resistance"] == single["resistance"]
+
+    endpoints = client.get("/ping/calc-executor").json()["endpoints"]
+    assert endpoints["build/batch"]["calls"] == 2
+    assert endpoints["build/totals"]["calls"] == 3
@@ -0,0 +1,130 @@
+"""
+Tests for the async database layer and pool metrics.
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app import database
+from app.database import (
+    InstrumentedAsyncPool,
+    get_async_database_url,
+    get_pool_stats,
+)
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        (
+            "postgresql://user:pw@localhost:5432/mids",
+            "postgresql+asyncpg://user:pw@localhost:5432/mids",
+        ),
+        (
+            "postgresql+psycopg2://user:pw@db/mids",
+            "postgresql+asyncpg://user:pw@db/mids",
+        ),
+        ("sqlite:///./mids.db", "sqlite+aiosqlite:///./mids.db"),
+        ("sqlite+aiosqlite:///:memory:", "sqlite+aiosqlite:///:memory:"),
+    ],
+)
+def test_async_database_url(url, expected):
+    assert get_async_database_url(url) == expected
+
+
+class TestInstrumentedAsyncPool:
+    """Checkout metrics recorded by the instrumented async pool."""
+
+    @pytest.fixture
+    def metrics(self):
+        database.async_pool_metrics.reset()
+        yield database.async_pool_metrics
+        database.async_pool_metrics.reset()
+
+    @pytest.fixture
+    async def pooled_engine(self, tmp_path):
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+            poolclass=InstrumentedAsyncPool,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0.2,
+        )
+        yield engine
+        await engine.dispose()
+
+    async def test_checkout_counters(self, pooled_engine, metrics):
+        for _ in range(3):
+            async with pooled_engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+                assert pooled_engine.sync_engine.pool.checkedout() == 1
+
+        stats = metrics.as_dict()
+        assert stats["checkouts"] == 3
+        assert stats["peak_in_use"] == 1
+        assert stats["timeouts"] == 0
+        assert stats["max_wait_ms"] >= stats["avg_wait_ms"] >= 0
+
+    async def test_waits_for_busy_pool(self, pooled_engine, metrics):
+        async def hold(seconds):
+            async with pooled_engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+                await asyncio.sleep(seconds)
+
+        await asyncio.gather(hold(0.05), hold(0))
+
+        stats = metrics.as_dict()
+        assert stats["checkouts"] == 2
+        # The second checkout had to wait for the only connection
+        assert stats["max_wait_ms"] >= 40
+
+    async def test_timeout_is_counted(self, pooled_engine, metrics):
+        async with pooled_engine.connect():
+            with pytest.raises(exc.TimeoutError):
+                async with pooled_engine.connect():
+                    pass
+
+        assert metrics.as_dict()["timeouts"] == 1
+
+
+def test_pool_stats_endpoint(client):
+    response = client.get("/ping/db-pool")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert {"checkouts", "peak_in_use", "avg_wait_ms"} <= set(data["async"])
+    assert "pool" in data["sync"]
+    assert data == get_pool_stats() | {"async": data["async"]}
+
+
+class TestEnhancementRouters:
+    """Enhancement endpoints served through the AsyncSession layer."""
+
+    def test_enhancement_sets(self, client, sample_enhancement):
+        response = client.get("/api/enhancement-sets")
+        assert response.status_code == 200
+        assert [s["name"] for s in response.json()] == ["Devastation"]
+
+    def test_enhancement_set_with_enhancements(self, client, sample_enhancement):
+        set_id = sample_enhancement.set_id
+
+        data = client.get(f"/api/enhancement-sets/{set_id}").json()
+        assert [e["name"] for e in data["enhancements"]] == [
+            "Devastation: Accuracy/Damage"
+        ]
+
+        data = client.get(
+            f"/api/enhancement-sets/{set_id}?include_enhancements=false"
+        ).json()
+        assert data["enhancements"] == []
+
+    def test_enhancement(self, client, sample_enhancement):
+        response = client.get(f"/api/enhancements/{sample_enhancement.id}")
+        assert response.status_code == 200
+        assert response.json()["set_id"] == sample_enhancement.set_id
+
+        assert client.get("/api/enhancements/99999").status_code == 404
+        assert client.get("/api/enhancement-sets/99999").status_code == 404
@@ -0,0 +1,180 @@
+"""
+Tests for the memory-mapped game data bundle.
+"""
+
+import json
+import math
+import sys
+
+import pytest
+
+from app.services.game_data_bundle import (
+    BundleFormatError,
+    GameDataBundle,
+    compile_bundle,
+)
+
+
+def _write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2))
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """Small filtered_data-like tree."""
+    root = tmp_path / "filtered_data"
+    powerset_dir = root / "powers" / "blaster_ranged" / "fire_blast"
+    _write(
+        powerset_dir / "index.json",
+        {
+            "name": "fire_blast",
+            "display_name": "Fire Blast",
+            "power_names": [
+                "Blaster_Ranged.Fire_Blast.Flares",
+                "Blaster_Ranged.Fire_Blast.Fire_Blast",
+            ],
+        },
+    )
+    _write(
+        powerset_dir / "flares.json",
+        {
+            "full_name": "Blaster_Ranged.Fire_Blast.Flares",
+            "display_name": "Flares",
+            "accuracy": 1.2,
+            "recharge_time": 2,
+            "effects": [{"tag": "Fire", "scale": 0.5}],
+        },
+    )
+    _write(
+        powerset_dir / "fire_blast.json",
+        {
+            "full_name": "Blaster_Ranged.Fire_Blast.Fire_Blast",
+            "display_name": "Fire Blast é",
+            "accuracy": 1.0,
+        },
+    )
+    _write(
+        root / "archetypes" / "blaster.json",
+        {
+            "name": "blaster",
+            "display_name": "Blaster",
+            "named_tables": {
+                "melee_damage": {"name": "Melee_Damage", "values": [-1.0, -2.5]},
+                "ranged_damage": {"name": "Ranged_Damage", "values": [-0.5]},
+            },
+        },
+    )
+    _write(root / "archetypes" / "index.json", {"revision": "i25"})
+    _write(
+        root / "boost_sets" / "apocalypse.json",
+        {"name": "Apocalypse", "min_level": 50, "bonuses": []},
+    )
+    return root
+
+
+@pytest.fixture
+def bundle(data_dir, tmp_path):
+    path = tmp_path / "game_data.bundle"
+    compile_bundle(data_dir, path)
+    with GameDataBundle(path) as bundle:
+        yield bundle
+
+
+class TestGameDataBundle:
+    """Tests for compile_bundle and GameDataBundle."""
+
+    def test_compile_stats(self, data_dir, tmp_path):
+        stats = compile_bundle(data_dir, tmp_path / "out.bundle")
+
+        assert stats["counts"] == {
+            "powers": 2,
+            "powersets": 1,
+            "archetypes": 1,
+            "boost_sets": 1,
+        }
+        assert stats["tables"] == 2
+        assert stats["revision"] == "i25"
+        assert stats["bundle_bytes"] == (tmp_path / "out.bundle").stat().st_size
+
+    def test_documents_round_trip(self, bundle, data_dir):
+        source = json.loads(
+            (data_dir / "powers/blaster_ranged/fire_blast/flares.json").read_text()
+        )
+
+        assert bundle.get_power("Blaster_Ranged.Fire_Blast.Flares") == source
+        assert (
+            bundle.get_power("Blaster_Ranged.Fire_Blast.Fire_Blast")["display_name"]
+            == "Fire Blast é"
+        )
+        assert bundle.get("powersets", "Blaster_Ranged.Fire_Blast")["name"] == (
+            "fire_blast"
+        )
+        assert bundle.get("boost_sets", "Apocalypse")["min_level"] == 50
+        assert bundle.get_power("Blaster_Ranged.Fire_Blast.Missing") is None
+
+    def test_get_json_is_zero_copy(self, bundle):
+        view = bundle.get_json("powers", "Blaster_Ranged.Fire_Blast.Flares")
+
+        assert isinstance(view, memoryview)
+        assert view.readonly
+        assert json.loads(bytes(view))["display_name"] == "Flares"
+
+    def test_power_stats(self, bundle):
+        stats = bundle.get_power_stats("Blaster_Ranged.Fire_Blast.Flares")
+
+        assert stats["accuracy"] == 1.2
+        assert stats["recharge_time"] == 2.0
+        assert math.isnan(stats["radius"])
+        assert bundle.get_power_stats("Nope") is None
+
+    def test_powerset_power_names(self, bundle):
+        assert bundle.powerset_power_names("Blaster_Ranged.Fire_Blast") == [
+            "Blaster_Ranged.Fire_Blast.Fire_Blast",
+            "Blaster_Ranged.Fire_Blast.Flares",
+        ]
+        assert bundle.powerset_power_names("Blaster_Ranged.Fire") == []
+
+    def test_tables(self, bundle):
+        # named_tables are stored as numeric tables; the document keeps names
+        assert bundle.get("archetypes", "blaster")["named_tables"] == {
+            "melee_damage": "Melee_Damage",
+            "ranged_damage": "Ranged_Damage",
+        }
+        assert bundle.table_names("blaster") == ["Melee_Damage", "Ranged_Damage"]
+
+        table = bundle.get_table("blaster", "Melee_Damage")
+        assert table.format == "d"
+        assert table.tolist() == [-1.0, -2.5]
+        assert bundle.get_table("blaster", "Missing") is None
+
+    def test_archetype_round_trip(self, bundle, data_dir):
+        source = json.loads((data_dir / "archetypes/blaster.json").read_text())
+
+        assert bundle.get_archetype("blaster") == source
+        assert bundle.get_archetype("missing") is None
+
+    def test_rejects_other_files(self, tmp_path):
+        path = tmp_path / "not_a_bundle"
+        path.write_bytes(b"{}" * 32)
+
+        with pytest.raises(BundleFormatError):
+            GameDataBundle(path)
+
+    def test_rejects_other_format_versions(self, data_dir, tmp_path):
+        path = tmp_path / "game_data.bundle"
+        compile_bundle(data_dir, path)
+        data = bytearray(path.read_bytes())
+        data[8] = 99  # format version field
+        path.write_bytes(bytes(data))
+
+        with pytest.raises(BundleFormatError, match="format 99"):
+            GameDataBundle(path)
+
+    def test_rejects_big_endian_hosts(self, data_dir, tmp_path, monkeypatch):
+        path = tmp_path / "game_data.bundle"
+        compile_bundle(data_dir, path)
+        monkeypatch.setattr(sys, "byteorder", "big")
+
+        with pytest.raises(BundleFormatError, match="little-endian host"):
+            GameDataBundle(path)
@@ -0,0 +1,263 @@
+"""
+Tests for the in-memory game data snapshot.
+"""
+
+import pytest
+
+from app.models import ArchetypeModifierTable, EnhancementSet, Power
+from app.pagination import NEXT_CURSOR_HEADER
+from app.services import game_data_snapshot
+from app.services.game_data_snapshot import (
+    GameDataSnapshot,
+    get_game_data_snapshot,
+    load_game_data_snapshot,
+)
+
+
+@pytest.fixture
+def reset_snapshot():
+    """Make sure no snapshot leaks into other tests."""
+    yield
+    game_data_snapshot.set_game_data_snapshot(None)
+
+
+@pytest.fixture
+def game_data(db_session, sample_power):
+    """Sample power plus a second power and a modifier table."""
+    db_session.add(
+        Power(
+            name="Flares",
+            full_name="Blaster_Ranged.Fire_Blast.Flares",
+            powerset_id=sample_power.powerset_id,
+            available_level=0,
+        )
+    )
+    db_session.add(
+        ArchetypeModifierTable(
+            archetype_id=sample_power.powerset.archetype_id,
+            table_name="Melee_Damage",
+            values=[-1.0, -2.5],
+        )
+    )
+    db_session.commit()
+    return sample_power
+
+
+class TestGameDataSnapshot:
+    """Tests for GameDataSnapshot."""
+
+    def test_indexes(self, db_session, game_data):
+        snapshot = GameDataSnapshot.load(db_session)
+        powerset_id = game_data.powerset_id
+        archetype_id = game_data.powerset.archetype_id
+
+        assert snapshot.powers_by_id[game_data.id].name == "Fire Blast"
+        assert (
+            snapshot.powers_by_full_name["Blaster_Ranged.Fire_Blast.Flares"].name
+            == "Flares"
+        )
+        assert [p.name for p in snapshot.powers_by_powerset[powerset_id]] == [
+            "Fire Blast",
+            "Flares",
+        ]
+        assert len(snapshot.powers_by_archetype[archetype_id]) == 2
+        assert snapshot.powersets_by_archetype[archetype_id][0].id == powerset_id
+        assert snapshot.archetypes_by_name["Blaster"].id == archetype_id
+        assert snapshot.modifier_tables[archetype_id]["Melee_Damage"] == (-1.0, -2.5)
+
+    def test_immutable(self, db_session, game_data):
+        snapshot = GameDataSnapshot.load(db_session)
+        power = snapshot.powers_by_id[game_data.id]
+
+        with pytest.raises(AttributeError):
+            power.name = "Changed"
+        with pytest.raises(TypeError):
+            snapshot.powers_by_id[0] = power
+        with pytest.raises(AttributeError):
+            snapshot.powers = ()
+
+    def test_numeric_values_are_floats(self, db_session, game_data):
+        snapshot = GameDataSnapshot.load(db_session)
+
+        power = snapshot.powers_by_id[game_data.id]
+        assert type(power.accuracy) is float
+        assert power.as_dict()["recharge_time"] == float(game_data.recharge_time)
+
+    def test_stats(self, db_session, game_data):
+        stats = GameDataSnapshot.load(db_session).get_stats()
+
+        assert stats["powers"] == 2
+        assert stats["modifier_tables"] == 1
+        assert stats["load_ms"] >= 0
+        assert stats["memory_mb"] > 0
+
+    def test_hot_swap(self, db_session, game_data, reset_snapshot, monkeypatch):
+        def session_factory():
+            return db_session
+
+        # Keep the test transaction open across reloads
+        monkeypatch.setattr(db_session, "close", lambda: None)
+
+        first = load_game_data_snapshot(session_factory)
+        db_session.query(Power).filter(Power.id == game_data.id).update(
+            {"display_name": "Fire Blast II"}
+        )
+        second = load_game_data_snapshot(session_factory)
+
+        assert get_game_data_snapshot() is second
+        assert second.version == first.version + 1
+        # Readers holding the old snapshot keep their consistent view
+        assert first.powers_by_id[game_data.id].display_name == "Fire Blast"
+        assert second.powers_by_id[game_data.id].display_name == "Fire Blast II"
+
+
+class TestSnapshotReloadEndpoint:
+    """POST /admin/game-data-snapshot/reload swaps in a fresh snapshot."""
+
+    URL = "/admin/game-data-snapshot/reload"
+
+    def test_reload(self, client, db_session, game_data, reset_snapshot, monkeypatch):
+        monkeypatch.setenv("ADMIN_TOKEN", "secret")
+        monkeypatch.setenv("GAME_DATA_SNAPSHOT", "true")
+        monkeypatch.setattr("app.database.SessionLocal", lambda: db_session)
+        monkeypatch.setattr(db_session, "close", lambda: None)
+        first = load_game_data_snapshot(lambda: db_session)
+        db_session.query(Power).filter(Power.id == game_data.id).update(
+            {"display_name": "Fire Blast II"}
+        )
+
+        response = client.post(self.URL, headers={"X-Admin-Token": "secret"})
+
+        assert response.status_code == 200
+        assert response.json()["previous_version"] == first.version
+        assert response.json()["version"] == first.version + 1
+        snapshot = get_game_data_snapshot()
+        assert snapshot.powers_by_id[game_data.id].display_name == "Fire Blast II"
+
+    def test_requires_token(self, client, reset_snapshot, monkeypatch):
+        monkeypatch.delenv("ADMIN_TOKEN", raising=False)
+        assert client.post(self.URL).status_code == 404
+
+        monkeypatch.setenv("ADMIN_TOKEN", "secret")
+        assert client.post(self.URL).status_code == 403
+        assert (
+            client.post(self.URL, headers={"X-Admin-Token": "wrong"}).status_code == 403
+        )
+        assert get_game_data_snapshot() is None
+
+    def test_snapshot_disabled(self, client, reset_snapshot, monkeypatch):
+        monkeypatch.setenv("ADMIN_TOKEN", "secret")
+        monkeypatch.setenv("GAME_DATA_SNAPSHOT", "false")
+
+        response = client.post(self.URL, headers={"X-Admin-Token": "secret"})
+
+        assert response.status_code == 409
+
+
+class TestSnapshotRouters:
+    """Routers serve the same responses from the snapshot as from the DB."""
+
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "/api/archetypes",
+            "/api/archetypes/{archetype_id}",
+            "/api/archetypes/{archetype_id}/powersets",
+            "/api/powersets/{powerset_id}",
+            "/api/powersets/{powerset_id}/powers",
+            "/api/powersets/{powerset_id}/detailed",
+            "/api/powers/{power_id}",
+            "/api/powers?ids={power_id}",
+        ],
+    )
+    def test_same_response(self, client, db_session, game_data, reset_snapshot, path):
+        url = path.format(
+            archetype_id=game_data.powerset.archetype_id,
+            powerset_id=game_data.powerset_id,
+            power_id=game_data.id,
+        )
+        from_db = client.get(url)
+        assert from_db.status_code == 200
+
+        game_data_snapshot.set_game_data_snapshot(GameDataSnapshot.load(db_session))
+        from_snapshot = client.get(url)
+
+        assert from_snapshot.status_code == 200
+        assert from_snapshot.json() == from_db.json()
+
+    def test_same_lookup_response(self, client, db_session, game_data, reset_snapshot):
+        request = {
+            "powers": [game_data.id],
+            "powersets": [game_data.powerset_id, 99999],
+            "include_power_data": True,
+        }
+        from_db = client.post("/api/lookup", json=request)
+        assert from_db.json()["missing"] == {"powersets": [99999]}
+
+        game_data_snapshot.set_game_data_snapshot(GameDataSnapshot.load(db_session))
+        from_snapshot = client.post("/api/lookup", json=request)
+
+        assert from_snapshot.json() == from_db.json()
+
+    def test_same_enhancement_set_pages(
+        self, client, db_session, game_data, reset_snapshot
+    ):
+        db_session.add_all(
+            EnhancementSet(name=f"Set_{i}", min_level=level, group_name=group)
+            for i, (level, group) in enumerate(
+                [
+                    (30, "Stuns"),
+                    (None, "Stuns"),
+                    (10, "Holds"),
+                    (30, "Stuns"),
+                    (20, None),
+                ]
+            )
+        )
+        db_session.commit()
+
+        def pages(query):
+            results, cursor = [], None
+            while True:
+                url = f"/api/enhancement-sets?limit=2{query}"
+                response = client.get(url + (f"&cursor={cursor}" if cursor else ""))
+                assert response.status_code == 200
+                results.append(response.json())
+                cursor = response.headers.get(NEXT_CURSOR_HEADER)
+                if cursor is None:
+                    return results
+
+        from_db = [pages(""), pages("&group_name=Stuns")]
+        game_data_snapshot.set_game_data_snapshot(GameDataSnapshot.load(db_session))
+        from_snapshot = [pages(""), pages("&group_name=Stuns")]
+
+        assert len(from_db[0]) == 3
+        assert from_snapshot == from_db
+
+    def test_precomputed_list_etag(
+        self, client, db_session, game_data, reset_snapshot, assert_max_queries
+    ):
+        game_data_snapshot.set_game_data_snapshot(GameDataSnapshot.load(db_session))
+
+        with assert_max_queries(0):
+            first = client.get("/api/archetypes")
+            second = client.get("/api/archetypes")
+            revalidated = client.get(
+                "/api/archetypes", headers={"If-None-Match": first.headers["ETag"]}
+            )
+
+        assert first.content == second.content
+        assert first.headers["ETag"] == second.headers["ETag"]
+        assert revalidated.status_code == 304
+        assert revalidated.content == b""
+        assert (
+            client.get("/api/archetypes?skip=1").headers["ETag"]
+            != (first.headers["ETag"])
+        )
+
+    def test_not_found(self, client, db_session, game_data, reset_snapshot):
+        game_data_snapshot.set_game_data_snapshot(GameDataSnapshot.load(db_session))
+
+        assert client.get("/api/powers/99999").status_code == 404
+        assert client.get("/api/powersets/99999/powers").status_code == 404
+        assert client.get("/api/archetypes/99999").status_code == 404
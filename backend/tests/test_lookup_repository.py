@@ -0,0 +1,124 @@
+"""
+Tests for the prepared-statement lookup repository.
+"""
+
+import asyncpg
+import pytest
+
+from app import database
+from app.routers import archetypes, powersets
+from app.services import lookup_repository
+from app.services.lookup_repository import LookupRepository, get_lookup_repository
+
+
+def test_list_queries_select_schema_columns():
+    assert '"range"' in lookup_repository.POWERS_BY_POWERSET
+    assert "source_metadata" not in lookup_repository.POWERS_BY_POWERSET
+    assert "source_metadata" in lookup_repository.POWER_BY_ID
+    assert "= ANY($1::int[])" in lookup_repository.POWERS_BY_IDS
+
+
+def test_repository_follows_pool(monkeypatch):
+    monkeypatch.setattr(database, "_connection_pool", None)
+    assert get_lookup_repository() is None
+
+    pool = object()
+    monkeypatch.setattr(database, "_connection_pool", pool)
+    repository = get_lookup_repository()
+    assert repository.pool is pool
+    assert get_lookup_repository() is repository
+
+
+class FakeRepository:
+    """Canned repository results for the router fast path."""
+
+    def __init__(self, results):
+        self.results = results
+        self.calls = []
+
+    async def get_archetype_powersets(self, archetype_id, powerset_type=None):
+        self.calls.append((archetype_id, powerset_type))
+        return self.results
+
+    async def get_powers_by_powerset(self, powerset_id):
+        self.calls.append(powerset_id)
+        return self.results
+
+
+def test_routers_use_repository(client, monkeypatch, sample_powerset):
+    powerset = {
+        c.name: getattr(sample_powerset, c.name)
+        for c in sample_powerset.__table__.columns
+    }
+    repository = FakeRepository([powerset])
+    monkeypatch.setattr(archetypes, "get_lookup_repository", lambda: repository)
+
+    response = client.get("/api/archetypes/7/powersets?powerset_type=primary")
+
+    assert response.status_code == 200
+    assert response.json()[0]["name"] == "Fire Blast"
+    assert repository.calls == [(7, "primary")]
+
+
+def test_routers_map_missing_to_404(client, monkeypatch):
+    repository = FakeRepository(None)
+    monkeypatch.setattr(archetypes, "get_lookup_repository", lambda: repository)
+    monkeypatch.setattr(powersets, "get_lookup_repository", lambda: repository)
+
+    assert client.get("/api/archetypes/1/powersets").status_code == 404
+    assert client.get("/api/powersets/1/powers").status_code == 404
+
+
+@pytest.fixture
+async def repository(db):
+    url = db.get_bind().url
+    if url.get_backend_name() != "postgresql":
+        pytest.skip("prepared statements need PostgreSQL")
+    pool = await asyncpg.create_pool(
+        url.set(drivername="postgresql").render_as_string(hide_password=False),
+        min_size=1,
+        max_size=2,
+        init=database.init_connection,
+    )
+    yield LookupRepository(pool)
+    await pool.close()
+
+
+class TestLookupRepository:
+    """Queries against PostgreSQL (CI)."""
+
+    async def test_get_power(self, repository, sample_power):
+        power = await repository.get_power(sample_power.id)
+
+        assert power["full_name"] == "Fire_Blast.Fire_Blast.Fire_Blast"
+        assert power["range"] == 80.0
+        assert isinstance(power["recharge_time"], float)
+        assert await repository.get_power(999999) is None
+
+    async def test_get_powers_by_ids(self, repository, sample_power):
+        powers = await repository.get_powers([999999, sample_power.id])
+
+        assert [p["id"] for p in powers] == [sample_power.id]
+        assert "source_metadata" not in powers[0]
+        assert await repository.get_powers([]) == []
+
+    async def test_get_powers_by_powerset(self, repository, sample_power):
+        powers = await repository.get_powers_by_powerset(sample_power.powerset_id)
+
+        assert [p["id"] for p in powers] == [sample_power.id]
+        assert await repository.get_powers_by_powerset(999999) is None
+
+    async def test_get_archetype_powersets(self, repository, sample_powerset):
+        archetype_id = sample_powerset.archetype_id
+
+        powersets = await repository.get_archetype_powersets(archetype_id)
+        assert [p["id"] for p in powersets] == [sample_powerset.id]
+        assert await repository.get_archetype_powersets(archetype_id, "secondary") == []
+        assert await repository.get_archetype_powersets(999999) is None
+
+    async def test_get_powersets(self, repository, sample_powerset):
+        powerset = await repository.get_powerset(sample_powerset.id)
+        assert powerset["name"] == "Fire Blast"
+
+        powersets = await repository.get_powersets([sample_powerset.id, 999999])
+        assert [p["name"] for p in powersets] == ["Fire Blast"]
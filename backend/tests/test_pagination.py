@@ -0,0 +1,200 @@
+"""
+Tests for keyset pagination and search on the list endpoints.
+"""
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.models import Enhancement, EnhancementSet, Power
+from app.pagination import (
+    NEXT_CURSOR_HEADER,
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    keyset_paginate,
+)
+
+
+@pytest.mark.parametrize("level, row_id", [(1, 5), (None, 12), (-1, 3)])
+def test_cursor_round_trip(level, row_id):
+    cursor = encode_cursor(level, row_id)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (level, row_id)
+
+
+@pytest.mark.parametrize("cursor", ["", "not a cursor", encode_cursor(1, 2)[:-3]])
+def test_invalid_cursor(cursor):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
+
+
+@pytest.mark.parametrize("cursor", [None, encode_cursor(4, 9), encode_cursor(None, 9)])
+def test_keyset_selects_have_no_or(cursor):
+    selects = keyset_paginate(select(Power), Power.available_level, Power.id, cursor)
+
+    assert len(selects) == (1 if cursor and decode_cursor(cursor)[0] is None else 2)
+    for stmt in selects:
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert " OR " not in sql
+
+
+def _pages(client, url, limit):
+    """Follow X-Next-Cursor headers and return all pages of names."""
+    pages = []
+    cursor = None
+    while True:
+        params = {"limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get(url, params=params)
+        assert response.status_code == 200
+        pages.append([item["name"] for item in response.json()])
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if cursor is None:
+            return pages
+
+
+@pytest.fixture
+def powers(db_session, sample_powerset):
+    levels = [10, 1, None, 4, 1, -1, 22]
+    for i, level in enumerate(levels):
+        db_session.add(
+            Power(
+                name=f"Power_{i}",
+                full_name=f"Fire_Blast.Fire_Blast.Power_{i}",
+                display_name=f"Power {i}",
+                powerset_id=sample_powerset.id,
+                type="Toggle" if i % 2 else "Click",
+                available_level=level,
+            )
+        )
+    db_session.commit()
+    return levels
+
+
+class TestSearchPowers:
+    """GET /api/powers."""
+
+    def test_pages_follow_level_then_id(self, client, powers):
+        pages = _pages(client, "/api/powers", limit=3)
+
+        assert pages == [
+            ["Power_5", "Power_1", "Power_4"],
+            ["Power_3", "Power_0", "Power_6"],
+            ["Power_2"],  # NULL levels sort last
+        ]
+
+    @pytest.mark.parametrize("limit", [1, 2, 3, 4])
+    def test_pages_span_null_levels(self, client, db_session, powers, limit):
+        for i in (7, 8):
+            db_session.add(
+                Power(
+                    name=f"Power_{i}",
+                    full_name=f"Fire_Blast.Fire_Blast.Power_{i}",
+                    powerset_id=db_session.query(Power).first().powerset_id,
+                    available_level=None,
+                )
+            )
+        db_session.commit()
+
+        names = [name for page in _pages(client, "/api/powers", limit) for name in page]
+
+        assert names == [
+            "Power_5",
+            "Power_1",
+            "Power_4",
+            "Power_3",
+            "Power_0",
+            "Power_6",
+            "Power_2",
+            "Power_7",
+            "Power_8",
+        ]
+
+    def test_filters_apply_before_paging(self, client, powers):
+        response = client.get(
+            "/api/powers", params={"power_type": "Toggle", "min_level": 1, "limit": 2}
+        )
+
+        assert [p["name"] for p in response.json()] == ["Power_1", "Power_3"]
+        assert NEXT_CURSOR_HEADER not in response.headers
+
+    def test_level_range(self, client, powers):
+        response = client.get("/api/powers", params={"min_level": 2, "max_level": 20})
+
+        assert [p["name"] for p in response.json()] == ["Power_3", "Power_0"]
+
+    def test_name_search(self, client, powers):
+        # Matches the display name; "_" is a literal, not a LIKE wildcard
+        assert [p["name"] for p in client.get("/api/powers?name=power 4").json()] == [
+            "Power_4"
+        ]
+        assert [p["name"] for p in client.get("/api/powers?name=r_6").json()] == [
+            "Power_6"
+        ]
+        assert client.get("/api/powers?name=r%256").json() == []
+
+    def test_invalid_cursor(self, client, powers):
+        response = client.get("/api/powers", params={"cursor": "bogus"})
+
+        assert response.status_code == 400
+
+
+class TestEnhancementPages:
+    """GET /api/enhancements and /api/enhancement-sets."""
+
+    @pytest.fixture
+    def enhancements(self, db_session):
+        sets = [
+            EnhancementSet(name="Devastation", min_level=30, group_name="Melee"),
+            EnhancementSet(name="Apocalypse", min_level=50, group_name="Ranged"),
+            EnhancementSet(name="Decimation", min_level=30, group_name="Ranged"),
+        ]
+        db_session.add_all(sets)
+        db_session.flush()
+        for i, level in enumerate([30, 10, 50, 10]):
+            db_session.add(
+                Enhancement(
+                    name=f"Enh_{i}",
+                    boost_type="Enhance Damage" if i % 2 else "Enhance Accuracy",
+                    set_id=sets[i % 2].id,
+                    level_min=level,
+                )
+            )
+        db_session.commit()
+        return sets
+
+    def test_enhancement_pages(self, client, enhancements):
+        assert _pages(client, "/api/enhancements", limit=2) == [
+            ["Enh_1", "Enh_3"],
+            ["Enh_0", "Enh_2"],
+        ]
+
+    def test_enhancement_filters(self, client, enhancements):
+        response = client.get(
+            "/api/enhancements",
+            params={"boost_type": "Enhance Damage", "limit": 1},
+        )
+        assert [e["name"] for e in response.json()] == ["Enh_1"]
+        assert NEXT_CURSOR_HEADER in response.headers
+
+        response = client.get(
+            "/api/enhancements", params={"set_id": enhancements[0].id}
+        )
+        assert [e["name"] for e in response.json()] == ["Enh_0", "Enh_2"]
+
+    def test_enhancement_set_pages(self, client, enhancements):
+        assert _pages(client, "/api/enhancement-sets", limit=1) == [
+            ["Devastation"],
+            ["Decimation"],
+            ["Apocalypse"],
+        ]
+
+    def test_enhancement_set_filters(self, client, enhancements):
+        response = client.get(
+            "/api/enhancement-sets", params={"name": "CIM", "group_name": "Ranged"}
+        )
+
+        assert [s["name"] for s in response.json()] == ["Decimation"]
@@ -0,0 +1,587 @@
+"""
+Tests for the power cache service and its in-memory LRU/TTL layer.
+"""
+
+import asyncio
+import importlib.util
+import threading
+import time
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import text
+
+from app.services import build_summary_view, power_cache
+from app.services.cache_backends import InMemoryCacheBackend, create_cache_backend
+from app.services.cache_codecs import (
+    CacheCodec,
+    JsonSerializer,
+    MsgpackSerializer,
+    msgpack,
+    zstandard,
+)
+from app.services.memory_cache import LRUCache
+from app.services.power_cache import PowerCacheService, cached_power_query
+from app.services.single_flight import AsyncSingleFlight, SingleFlight
+
+needs_msgpack = pytest.mark.skipif(msgpack is None, reason="msgpack not installed")
+needs_zstd = pytest.mark.skipif(zstandard is None, reason="zstandard not installed")
+
+
+def _run_migration(session, filename):
+    """Apply one Alembic migration's upgrade() on the session's connection."""
+    path = Path(__file__).parent.parent / "alembic" / "versions" / filename
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+    with Operations.context(MigrationContext.configure(session.connection())):
+        migration.upgrade()
+    session.commit()
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLRUCache:
+    """Tests for LRUCache."""
+
+    def test_hit_refreshes_recency(self):
+        cache = LRUCache(max_entries=2)
+        cache.set("power:1", {"id": 1})
+        cache.set("power:2", {"id": 2})
+
+        # Touch power:1 so power:2 becomes least recently used
+        assert cache.get("power:1") == {"id": 1}
+        cache.set("power:3", {"id": 3})
+
+        assert "power:1" in cache
+        assert "power:2" not in cache
+        assert "power:3" in cache
+
+    def test_hit_returns_same_object(self):
+        cache = LRUCache()
+        value = {"id": 1, "effects": [{"magnitude": 1.0}]}
+        cache.set("power:1", value)
+
+        assert cache.get("power:1") is value
+
+    def test_per_entry_ttl(self):
+        clock = FakeClock()
+        cache = LRUCache(default_ttl=60, clock=clock)
+        cache.set("power:1", "long")
+        cache.set("powerset_powers:1", "short", ttl=10)
+
+        clock.now += 30
+        assert cache.get("power:1") == "long"
+        assert cache.get("powerset_powers:1") is None
+
+        clock.now += 31
+        assert cache.get("power:1") is None
+
+        stats = cache.get_stats()["by_prefix"]
+        assert stats["power"]["expirations"] == 1
+        assert stats["powerset_powers"]["expirations"] == 1
+
+    def test_byte_budget(self):
+        cache = LRUCache(max_entries=None, max_bytes=100, sizeof=len)
+        cache.set("power:1", "a" * 40)
+        cache.set("power:2", "b" * 40)
+        cache.set("power:3", "c" * 40)
+
+        assert len(cache) == 2
+        assert "power:1" not in cache
+        assert cache.current_bytes == 80
+
+        # Values larger than the whole budget are never cached
+        cache.set("power:4", "d" * 101)
+        assert "power:4" not in cache
+        assert cache.current_bytes == 80
+
+    def test_per_prefix_counters(self):
+        cache = LRUCache(max_entries=1)
+        cache.set("power:1", 1)
+        cache.get("power:1")
+        cache.get("power:2")
+        cache.set("powerset_powers:1", [1])
+
+        stats = cache.get_stats()["by_prefix"]
+        assert stats["power"]["hits"] == 1
+        assert stats["power"]["misses"] == 1
+        assert stats["power"]["evictions"] == 1
+        assert "powerset_powers" not in stats
+
+    def test_delete_prefix(self):
+        cache = LRUCache()
+        cache.set("powerset_powers:1:level=None", [])
+        cache.set("powerset_powers:1:level=10", [])
+        cache.set("powerset_powers:12:level=None", [])
+
+        assert cache.delete_prefix("powerset_powers:1:") == 2
+        assert list(cache) == ["powerset_powers:12:level=None"]
+
+    def test_stale_window(self):
+        clock = FakeClock()
+        cache = LRUCache(default_ttl=10, stale_ttl=20, clock=clock)
+        cache.set("power:1", "old")
+
+        assert cache.get_stale("power:1") is None  # still fresh
+
+        clock.now += 15
+        assert cache.get("power:1") is None
+        assert cache.get_stale("power:1") == "old"
+
+        clock.now += 20
+        assert cache.get_stale("power:1") is None
+        assert cache.get("power:1") is None
+        assert "power:1" not in list(cache)
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight."""
+
+    def test_concurrent_calls_share_one_load(self):
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def load():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return {"id": 1}
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(flight.do("k", load)))
+        leader.start()
+        started.wait(5)
+
+        followers = [
+            threading.Thread(target=lambda: results.append(flight.do("k", load)))
+            for _ in range(4)
+        ]
+        for t in followers:
+            t.start()
+        while flight.get_stats()["coalesced"] < 4:
+            time.sleep(0.001)
+        release.set()
+        for t in [leader, *followers]:
+            t.join(5)
+
+        assert calls == [1]
+        assert len(results) == 5
+        assert all(r is results[0] for r in results)
+        assert flight.get_stats() == {"loads": 1, "coalesced": 4, "in_flight": 0}
+
+    def test_errors_propagate_and_clear(self):
+        flight = SingleFlight()
+
+        def fail():
+            raise RuntimeError("boom")
+
+        try:
+            flight.do("k", fail)
+        except RuntimeError:
+            pass
+        assert not flight.in_flight("k")
+        assert flight.do("k", lambda: 2) == 2
+
+
+class TestAsyncSingleFlight:
+    """Tests for AsyncSingleFlight."""
+
+    async def test_cancelled_leader_hands_load_to_follower(self):
+        flight = AsyncSingleFlight()
+        started = asyncio.Event()
+        calls = []
+
+        async def load():
+            calls.append(1)
+            started.set()
+            await asyncio.sleep(0.05 if len(calls) == 1 else 0)
+            return len(calls)
+
+        leader = asyncio.create_task(flight.do("k", load))
+        await started.wait()
+        followers = [asyncio.create_task(flight.do("k", load)) for _ in range(3)]
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        # One follower reloads; the others coalesce onto it
+        assert await asyncio.gather(*followers) == [2, 2, 2]
+        assert calls == [1, 1]
+        assert not flight.in_flight("k")
+        # Only the two followers served by the second load coalesced
+        assert flight.get_stats() == {"loads": 2, "coalesced": 2, "in_flight": 0}
+
+    async def test_cancelled_follower_does_not_cancel_load(self):
+        flight = AsyncSingleFlight()
+        started = asyncio.Event()
+
+        async def load():
+            started.set()
+            await asyncio.sleep(0.01)
+            return "value"
+
+        leader = asyncio.create_task(flight.do("k", load))
+        await started.wait()
+        follower = asyncio.create_task(flight.do("k", load))
+        await asyncio.sleep(0)
+        follower.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await follower
+        assert await leader == "value"
+        assert flight.coalesced == 0
+
+
+class TestPowerCacheService:
+    """Tests for PowerCacheService memory-tier behaviour."""
+
+    def test_cache_stats_expose_prefix_counters(self):
+        cache = PowerCacheService(max_memory_cache_size=10)
+        cache._set_to_memory("power:1", {"id": 1}, cache.ttl_power_detail)
+        cache._get_from_memory("power:1")
+        cache._get_from_memory("power:2")
+
+        stats = cache.get_cache_stats()
+        assert stats["memory_cache_size"] == 1
+        assert stats["memory_hit_rate"] == 0.5
+        assert stats["memory"]["by_prefix"]["power"]["hits"] == 1
+        assert stats["memory"]["by_prefix"]["power"]["misses"] == 1
+
+    def test_byte_budget_replaces_entry_count(self):
+        cache = PowerCacheService(max_memory_cache_size=1, max_memory_bytes=1_000_000)
+        for i in range(5):
+            cache._set_to_memory(f"power:{i}", {"id": i}, cache.ttl_power_detail)
+
+        assert cache.get_cache_stats()["memory_cache_size"] == 5
+
+    def test_empty_results_are_cache_hits(self, monkeypatch):
+        monkeypatch.setattr(power_cache, "_power_cache_instance", PowerCacheService())
+        calls = []
+
+        @cached_power_query(ttl=60)
+        def load(powerset_id):
+            calls.append(powerset_id)
+            return []
+
+        assert load(1) == []
+        assert load(1) == []
+        assert calls == [1]
+
+    async def test_get_power_by_id(self, db_session, sample_power):
+        cache = PowerCacheService()
+
+        power = await cache.get_power_by_id(db_session, sample_power.id)
+        assert power["full_name"] == "Fire_Blast.Fire_Blast.Fire_Blast"
+        assert power["available_level"] == 1
+        assert power["recharge_time"] == 4.0
+
+        assert await cache.get_power_by_id(db_session, sample_power.id) is power
+        assert cache.get_cache_stats()["total_db_queries"] == 1
+
+        powers = await cache.get_powers_by_powerset(
+            db_session, sample_power.powerset_id
+        )
+        assert [p["id"] for p in powers] == [sample_power.id]
+
+    async def test_build_summary_fallback_logged_once(
+        self, db_session, sample_power, caplog
+    ):
+        cache = PowerCacheService()
+
+        with caplog.at_level("WARNING", logger=power_cache.__name__):
+            for max_level in (1, 2, 3):
+                rows = await cache.get_build_summary_data(
+                    db_session, max_level=max_level
+                )
+                assert [r["id"] for r in rows] == [sample_power.id]
+
+        assert cache._summary_view is False
+        assert rows[0]["powerset_name"] == sample_power.powerset.name
+        assert rows[0]["recharge_time"] == 4.0
+        assert len(caplog.records) == 1
+        assert "power_build_summary" in caplog.text
+
+    async def test_build_summary_view_failure(
+        self, db_session, sample_power, monkeypatch
+    ):
+        cache = PowerCacheService()
+        cache._summary_view = True
+
+        def failing_view_query(session, *args):
+            session.execute(text("SELECT * FROM power_build_summary"))
+
+        monkeypatch.setattr(cache, "_query_build_summary_view", failing_view_query)
+        sample_power.display_name = "Pending"
+
+        rows = await cache.get_build_summary_data(db_session)
+
+        # Falls back to the join, keeps the caller's pending change and checks
+        # the view again next time instead of disabling it for good
+        assert [r["display_name"] for r in rows] == ["Pending"]
+        assert sample_power.display_name == "Pending"
+        assert cache._summary_view is None
+
+    async def test_build_summary_view(self, db_session, sample_power):
+        if db_session.get_bind().dialect.name != "postgresql":
+            pytest.skip("Materialized views need PostgreSQL")
+        _run_migration(db_session, "e81b5d2c4f07_restore_power_build_summary_view.py")
+        try:
+            sample_power.recharge_time = 8.0
+            db_session.commit()
+            # Stale until refreshed
+            assert build_summary_view.refresh_power_build_summary(db_session)
+
+            cache = PowerCacheService()
+            rows = await cache.get_build_summary_data(db_session)
+
+            assert cache._summary_view is True
+            assert [r["id"] for r in rows] == [sample_power.id]
+            assert rows[0]["recharge_time"] == 8.0
+        finally:
+            db_session.rollback()
+            db_session.execute(text("DROP MATERIALIZED VIEW power_build_summary"))
+            db_session.commit()
+
+    def test_refresh_without_view(self, db_session):
+        if db_session.get_bind().dialect.name == "postgresql":
+            pytest.skip("Only databases without materialized views")
+        assert build_summary_view.refresh_power_build_summary(db_session) is False
+
+    def test_stale_while_revalidate(self):
+        clock = FakeClock()
+        cache = PowerCacheService(stale_ttl=60)
+        cache._memory_cache._clock = clock
+        refreshed = threading.Event()
+        versions = iter(["v1", "v2"])
+
+        def load():
+            return next(versions)
+
+        def refresh():
+            value = load()
+            refreshed.set()
+            return value
+
+        assert cache._get_or_load("query:x", 10, load, refresh) == "v1"
+
+        clock.now += 11
+        # Expired: the old value is served and one refresh runs in the background
+        assert cache._get_or_load("query:x", 10, load, refresh) == "v1"
+        assert refreshed.wait(5)
+        while cache._refreshing:
+            time.sleep(0.001)
+
+        assert cache._get_or_load("query:x", 10, load, refresh) == "v2"
+        stats = cache.get_cache_stats()["stats"]
+        assert stats["stale_hits"] == 1
+        assert stats["background_refreshes"] == 1
+
+    def test_decorator_coalesces_concurrent_misses(self, monkeypatch):
+        monkeypatch.setattr(power_cache, "_power_cache_instance", PowerCacheService())
+        release = threading.Event()
+        calls = []
+
+        @cached_power_query(ttl=60)
+        def load(powerset_id):
+            calls.append(powerset_id)
+            release.wait(5)
+            return [powerset_id]
+
+        threads = [threading.Thread(target=load, args=(7,)) for _ in range(5)]
+        for t in threads:
+            t.start()
+        cache = power_cache.get_power_cache()
+        while cache._single_flight.coalesced < 4:
+            time.sleep(0.001)
+        release.set()
+        for t in threads:
+            t.join(5)
+
+        assert calls == [7]
+        assert cache.get_cache_stats()["coalesced_loads"] == 4
+
+    async def test_async_decorator_coalesces_concurrent_misses(self, monkeypatch):
+        monkeypatch.setattr(power_cache, "_power_cache_instance", PowerCacheService())
+        calls = []
+
+        @cached_power_query(ttl=60)
+        async def load(powerset_id):
+            calls.append(powerset_id)
+            await asyncio.sleep(0.01)
+            return [powerset_id]
+
+        results = await asyncio.gather(*(load(3) for _ in range(5)))
+
+        assert calls == [3]
+        assert results == [[3]] * 5
+        assert power_cache.get_power_cache().get_cache_stats()["coalesced_loads"] == 4
+
+    async def test_async_stale_while_revalidate(self):
+        clock = FakeClock()
+        cache = PowerCacheService(stale_ttl=60)
+        cache._memory_cache._clock = clock
+        versions = iter(["v1", "v2"])
+
+        async def load():
+            return next(versions)
+
+        assert await cache._aget_or_load("query:y", 10, load, load) == "v1"
+
+        clock.now += 11
+        assert await cache._aget_or_load("query:y", 10, load, load) == "v1"
+        await asyncio.gather(*cache._refresh_tasks.values())
+
+        assert await cache._aget_or_load("query:y", 10, load, load) == "v2"
+        assert cache.get_cache_stats()["stats"]["background_refreshes"] == 1
+
+
+class TestCacheBackends:
+    """Tests for the async L2 backends and PowerCacheService's use of them."""
+
+    async def test_in_memory_backend_ttl_and_patterns(self):
+        clock = FakeClock()
+        backend = InMemoryCacheBackend(clock=clock)
+        await backend.mset({"power:1": b"a", "power:2": b"b"}, ttl=10)
+        await backend.set("powerset_powers:1:level=None", b"c", ttl=100)
+
+        assert await backend.mget(["power:1", "power:3", "power:2"]) == [
+            b"a",
+            None,
+            b"b",
+        ]
+
+        clock.now += 11
+        assert await backend.get("power:1") is None
+        assert await backend.delete_pattern("powerset_powers:1:*") == 1
+        assert len(backend) == 0
+
+    def test_create_cache_backend(self):
+        assert create_cache_backend(None) is None
+        assert isinstance(create_cache_backend("memory://"), InMemoryCacheBackend)
+
+    async def test_l2_shared_between_instances(self, db_session, sample_power):
+        backend = InMemoryCacheBackend()
+        first = PowerCacheService(backend=backend)
+        second = PowerCacheService(backend=backend)
+
+        power = await first.get_power_by_id(db_session, sample_power.id)
+        assert await second.get_power_by_id(db_session, sample_power.id) == power
+
+        stats = second.get_cache_stats()
+        assert stats["total_db_queries"] == 0
+        assert stats["l2_hit_rate"] == 1.0
+
+    async def test_get_powers_by_ids_batches_l2(self, db_session, sample_power):
+        backend = InMemoryCacheBackend()
+        writer = PowerCacheService(backend=backend)
+        found = await writer.get_powers_by_ids(db_session, [sample_power.id, 99999])
+        assert list(found) == [sample_power.id]
+
+        reader = PowerCacheService(backend=backend)
+        backend.round_trips = 0
+        found = await reader.get_powers_by_ids(
+            db_session, [sample_power.id, sample_power.id]
+        )
+
+        assert found[sample_power.id]["name"] == "Fire Blast"
+        assert backend.round_trips == 1  # one mget, no per-key gets
+        assert reader.get_cache_stats()["total_db_queries"] == 0
+
+    async def test_invalidation_uses_patterns(self):
+        backend = InMemoryCacheBackend()
+        cache = PowerCacheService(backend=backend)
+        await backend.set("powerset_powers:1:level=None", b"[]", 60)
+        await backend.set("powerset_powers:12:level=None", b"[]", 60)
+        await backend.set("power:5", b"{}", 60)
+
+        await cache.invalidate_powerset_cache(1)
+        assert await backend.get("powerset_powers:12:level=None") == b"[]"
+
+        await cache.clear_all_cache()
+        assert len(backend) == 0
+
+
+class TestCacheCodec:
+    """Tests for the L2 serialization codecs."""
+
+    POWER = {
+        "id": 1,
+        "name": "Fire Blast",
+        "accuracy": Decimal("1.20"),
+        "recharge_time": 4.0,
+        "tags": ["fire", "ranged"],
+        "power_data": {"effects": [{"scale": 0.1 * 3, "aspect": "Str"}] * 50},
+    }
+
+    @pytest.mark.parametrize(
+        "serializer",
+        [JsonSerializer, pytest.param(MsgpackSerializer, marks=needs_msgpack)],
+    )
+    def test_round_trip_normalizes_decimals(self, serializer):
+        codec = CacheCodec(serializer=serializer(), compression=None)
+        decoded = codec.decode(codec.encode(self.POWER))
+
+        assert decoded["accuracy"] == 1.2
+        assert isinstance(decoded["accuracy"], float)
+        # floats survive bit-for-bit
+        assert decoded["power_data"]["effects"][0]["scale"] == 0.1 * 3
+
+    @pytest.mark.parametrize(
+        "compression", [pytest.param("zstd", marks=needs_zstd), "zlib"]
+    )
+    def test_compression_above_threshold(self, compression):
+        codec = CacheCodec(compression=compression, compress_threshold=256)
+        small = codec.encode({"id": 1}, "power")
+        large = codec.encode(self.POWER, "power")
+
+        assert small[1] == 0
+        assert large[1] != 0
+        stats = codec.get_stats()["by_prefix"]["power"]
+        assert stats["compressed"] == 1
+        assert stats["encoded_bytes"] < stats["raw_bytes"]
+
+    @needs_msgpack
+    @needs_zstd
+    def test_decodes_payloads_from_other_configurations(self):
+        writer = CacheCodec(serializer=JsonSerializer(), compression="zlib")
+        reader = CacheCodec(serializer=MsgpackSerializer(), compression="zstd")
+
+        data = writer.encode(self.POWER)
+        assert reader.decode(data)["name"] == "Fire Blast"
+
+    async def test_service_reports_codec_stats(self, db_session, sample_power):
+        cache = PowerCacheService(backend=InMemoryCacheBackend())
+        await cache.get_power_by_id(db_session, sample_power.id)
+        reader = PowerCacheService(backend=cache.backend)
+        power = await reader.get_power_by_id(db_session, sample_power.id)
+
+        assert power["accuracy"] == 1.0
+        writer_stats = cache.get_cache_stats()["codec"]["by_prefix"]["power"]
+        reader_stats = reader.get_cache_stats()["codec"]["by_prefix"]["power"]
+        assert writer_stats["encodes"] == 1
+        assert writer_stats["encoded_bytes"] > 0
+        assert reader_stats["decodes"] == 1
+
+    async def test_corrupt_entries_are_misses(self, db_session, sample_power):
+        backend = InMemoryCacheBackend()
+        await backend.set(f"power:{sample_power.id}", b"\x09\x00junk", 60)
+        cache = PowerCacheService(backend=backend)
+
+        power = await cache.get_power_by_id(db_session, sample_power.id)
+        assert power["id"] == sample_power.id
+        assert cache.get_cache_stats()["total_db_queries"] == 1
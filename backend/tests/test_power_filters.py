@@ -0,0 +1,87 @@
+"""
+Tests for the archetype/tag/boostset category filters on /api/powers.
+"""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+
+from app import crud
+from app.models import Power
+
+
+@pytest.fixture
+def powers(db_session, sample_powerset):
+    rows = [
+        ("Jab", ["brute", "scrapper"], ["Melee"], ["Melee Damage", "Stuns"]),
+        ("Haymaker", ["brute"], ["Melee", "Knockback"], ["Melee Damage"]),
+        ("Flares", ["blaster"], ["Ranged"], ["Ranged Damage"]),
+        ("Rest", None, None, None),
+    ]
+    for name, archetypes, tags, categories in rows:
+        db_session.add(
+            Power(
+                name=name,
+                full_name=f"Test.Test.{name}",
+                powerset_id=sample_powerset.id,
+                available_level=1,
+                archetypes=archetypes,
+                tags=tags,
+                allowed_boostset_cats=categories,
+            )
+        )
+    db_session.commit()
+
+
+@pytest.mark.parametrize(
+    "params, expected",
+    [
+        ({"archetype": "Brute"}, ["Jab", "Haymaker"]),
+        ({"tag": "Melee"}, ["Jab", "Haymaker"]),
+        ({"tag": "Knockback"}, ["Haymaker"]),
+        ({"boostset_category": "Stuns"}, ["Jab"]),
+        ({"archetype": "brute", "boostset_category": "Ranged Damage"}, []),
+        ({"archetype": "blaster", "name": "flar"}, ["Flares"]),
+        # Containment matches whole elements, not substrings
+        ({"tag": "Mele"}, []),
+    ],
+)
+def test_filters(client, powers, params, expected):
+    response = client.get("/api/powers", params=params)
+
+    assert response.status_code == 200
+    assert [p["name"] for p in response.json()] == expected
+
+
+def test_arrays_are_returned(client, powers):
+    response = client.get("/api/powers", params={"tag": "Knockback"})
+
+    power = response.json()[0]
+    assert power["archetypes"] == ["brute"]
+    assert power["tags"] == ["Melee", "Knockback"]
+
+
+@pytest.mark.parametrize(
+    "filters, index",
+    [
+        ({"archetype": "brute"}, "idx_power_archetypes_gin"),
+        ({"tag": "Melee"}, "idx_power_tags_gin"),
+        ({"boostset_category": "Stuns"}, "idx_power_allowed_boostset_cats_gin"),
+    ],
+)
+def test_filters_use_gin_indexes(db_session, powers, filters, index):
+    if db_session.get_bind().dialect.name != "postgresql":
+        pytest.skip("GIN index plans need PostgreSQL")
+    query = crud.power_search_query("postgresql", **filters)
+    sql = query.compile(
+        dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+    )
+
+    db_session.execute(text("ANALYZE powers"))
+    # A handful of rows would otherwise always be a sequential scan
+    db_session.execute(text("SET LOCAL enable_seqscan = off"))
+    plan = "\n".join(row[0] for row in db_session.execute(text(f"EXPLAIN {sql}")))
+    db_session.rollback()
+
+    assert index in plan
+    assert "@>" in plan
@@ -2,7 +2,10 @@
 Tests for powerset API endpoints.
 """
 
-from app.models import Power
+from sqlalchemy import select
+from sqlalchemy.orm import undefer_group
+
+from app.models import POWER_BLOBS, Power
 
 
 def test_get_powerset_by_id(client, sample_powerset):
@@ -89,3 +92,34 @@ def test_get_powerset_powers_not_found(client):
     response = client.get("/api/powersets/999/powers")
     assert response.status_code == 404
     assert response.json()["detail"] == "Powerset not found"
+
+
+def test_power_data_is_opt_in(client, sample_power, db_session):
+    """power_data is only loaded and returned by the details endpoint."""
+    sample_power.power_data = {"effects": [{"attrib": "Fire_Dmg", "scale": 1.0}]}
+    db_session.commit()
+    powerset_id = sample_power.powerset_id
+
+    powers = client.get(f"/api/powersets/{powerset_id}/powers").json()
+    assert "power_data" not in powers[0]
+
+    response = client.get(f"/api/powersets/{powerset_id}/powers/details")
+    assert response.status_code == 200
+    assert response.json()[0]["power_data"]["effects"][0]["attrib"] == "Fire_Dmg"
+    assert client.get("/api/powersets/999/powers/details").status_code == 404
+
+    # The single-power endpoint still returns every column
+    power = client.get(f"/api/powers/{sample_power.id}").json()
+    assert power["power_data"] == sample_power.power_data
+    assert power["source_metadata"] is None
+
+
+def test_power_blobs_are_deferred():
+    """Plain Power queries do not select the JSON blob columns."""
+    sql = str(select(Power).compile())
+    assert "power_data" not in sql
+    assert "source_metadata" not in sql
+
+    sql = str(select(Power).options(undefer_group(POWER_BLOBS)).compile())
+    assert "power_data" in sql
+    assert "source_metadata" in sql
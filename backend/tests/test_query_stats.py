@@ -0,0 +1,120 @@
+"""
+Tests for SQL statement counting and the per-endpoint query budgets.
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.models import Enhancement, EnhancementSet, Power
+from app.query_stats import (
+    QUERY_COUNT_HEADER,
+    QUERY_TIME_HEADER,
+    QueryStatsMiddleware,
+    track_queries,
+)
+
+
+def test_track_queries(db_session):
+    with track_queries() as stats:
+        db_session.execute(text("SELECT 1"))
+        db_session.execute(text("SELECT 2"))
+    db_session.execute(text("SELECT 3"))
+
+    assert stats.count == 2
+    assert stats.statements == ["SELECT 1", "SELECT 2"]
+    assert stats.seconds > 0
+
+
+def test_nested_blocks_count_separately(db_session):
+    with track_queries() as outer:
+        db_session.execute(text("SELECT 1"))
+        with track_queries() as inner:
+            db_session.execute(text("SELECT 2"))
+
+    assert outer.count == 1
+    assert inner.count == 1
+
+
+def test_middleware_headers(db_session):
+    app = FastAPI()
+    app.add_middleware(QueryStatsMiddleware)
+
+    @app.get("/queries/{n}")
+    def run_queries(n: int):
+        for i in range(n):
+            db_session.execute(text(f"SELECT {i}"))
+        return {}
+
+    with TestClient(app) as client:
+        response = client.get("/queries/3")
+
+    assert response.headers[QUERY_COUNT_HEADER] == "3"
+    assert response.headers[QUERY_TIME_HEADER].endswith("ms")
+
+
+def test_budget_failure_lists_statements(db_session, assert_max_queries):
+    with pytest.raises(AssertionError, match="2 queries, expected at most 1"):
+        with assert_max_queries(1):
+            db_session.execute(text("SELECT 1"))
+            db_session.execute(text("SELECT 2"))
+
+
+@pytest.fixture
+def many_powers(db_session, sample_powerset):
+    for i in range(20):
+        db_session.add(
+            Power(
+                name=f"Power_{i}",
+                full_name=f"Fire_Blast.Fire_Blast.Power_{i}",
+                powerset_id=sample_powerset.id,
+                available_level=i + 1,
+            )
+        )
+    db_session.commit()
+    return sample_powerset
+
+
+@pytest.fixture
+def enhancement_set(db_session):
+    enhancement_set = EnhancementSet(name="Devastation", min_level=30)
+    db_session.add(enhancement_set)
+    db_session.flush()
+    for i in range(6):
+        db_session.add(
+            Enhancement(
+                name=f"Devastation_{i}",
+                boost_type="Enhance Damage",
+                set_id=enhancement_set.id,
+            )
+        )
+    db_session.commit()
+    return enhancement_set
+
+
+# Budgets are independent of the number of related rows: one query for the
+# parent plus one SELECT ... IN for its children
+@pytest.mark.parametrize(
+    "url, budget, items",
+    [
+        ("/api/powersets/{powerset}/detailed", 2, "powers"),
+        ("/api/powersets/{powerset}/powers", 2, None),
+        ("/api/powersets/{powerset}/powers/details", 2, None),
+        ("/api/enhancement-sets/{enhancement_set}", 2, "enhancements"),
+        ("/api/enhancement-sets/{enhancement_set}?include_enhancements=false", 1, None),
+    ],
+)
+def test_endpoint_query_budgets(
+    client, many_powers, enhancement_set, assert_max_queries, url, budget, items
+):
+    url = url.format(powerset=many_powers.id, enhancement_set=enhancement_set.id)
+
+    with assert_max_queries(budget):
+        response = client.get(url)
+
+    assert response.status_code == 200
+    if items == "powers":
+        assert len(response.json()["powers"]) == 20
+    elif items == "enhancements":
+        assert len(response.json()["enhancements"]) == 6
@@ -0,0 +1,87 @@
+"""
+Tests for the fast JSON response helpers and precomputed bodies.
+"""
+
+import datetime
+import json
+from decimal import Decimal
+
+import pytest
+
+from app import responses
+from app.responses import PrecomputedJSON, dumps, etag_matches
+from app.schemas.calculations import GameConstantsResponse
+
+VALUE = {
+    "accuracy": Decimal("1.20"),
+    "created_at": datetime.datetime(2024, 1, 2, 3, 4, 5),
+    "tags": ["Ranged"],
+    1: None,
+}
+EXPECTED = {
+    "accuracy": 1.2,
+    "created_at": "2024-01-02T03:04:05",
+    "tags": ["Ranged"],
+    "1": None,
+}
+
+
+def test_dumps():
+    assert json.loads(dumps(VALUE)) == EXPECTED
+
+
+def test_dumps_without_orjson(monkeypatch):
+    monkeypatch.setattr(responses, "orjson", None)
+
+    assert json.loads(dumps(VALUE)) == EXPECTED
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (None, False),
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"other", "abc"', True),
+        ("*", True),
+        ('"other"', False),
+    ],
+)
+def test_etag_matches(header, expected):
+    assert etag_matches(header, '"abc"') is expected
+
+
+def test_etag_follows_body():
+    first = PrecomputedJSON.from_content({"a": 1})
+
+    assert first.etag == PrecomputedJSON.from_content({"a": 1}).etag
+    assert first.etag != PrecomputedJSON.from_content({"a": 2}).etag
+
+
+@pytest.mark.parametrize(
+    "path", ["/api/v1/calculations/constants", "/api/v1/calculations/caps"]
+)
+def test_precomputed_endpoint_revalidation(client, path):
+    response = client.get(path)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+
+    revalidated = client.get(path, headers={"If-None-Match": response.headers["ETag"]})
+
+    assert revalidated.status_code == 304
+    assert revalidated.headers["ETag"] == response.headers["ETag"]
+
+
+def test_constants_body(client):
+    data = client.get("/api/v1/calculations/constants").json()
+
+    assert GameConstantsResponse(**data).model_dump() == data
+    assert data["rule_of_five_limit"] == 5
+
+
+def test_caps_body(client):
+    caps = client.get("/api/v1/calculations/caps").json()
+
+    assert caps["Brute"]["damage_cap"] == 7.75
+    assert caps["Tanker"]["resistance_cap"] == 0.9
+    assert "archetype" not in caps["Tanker"]
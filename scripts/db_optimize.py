@@ -15,9 +15,16 @@ def main():
     
     with engine.connect() as conn:
         try:
-            conn.execute(text('REFRESH MATERIALIZED VIEW power_build_summary'))
+            # CONCURRENTLY keeps the view readable, but needs it populated
+            populated = conn.execute(text(
+                "SELECT ispopulated FROM pg_matviews WHERE matviewname = 'power_build_summary'"
+            )).scalar()
+            mode = 'CONCURRENTLY ' if populated else ''
+            conn.execute(text(f'REFRESH MATERIALIZED VIEW {mode}power_build_summary'))
+            conn.commit()
             print('✅ Power build summary materialized view refreshed')
         except Exception as e:
+            conn.rollback()
             print(f'⚠️ Materialized view refresh failed: {e}')
         
         try: